@@ -0,0 +1,188 @@
+"""Measures the throughput of member access on aggregate objects.
+
+A synthetic symbol table is built containing list entries and a process
+structure (with integer, pointer, bitfield, array and nested structure
+members), and a buffer layer is filled with random data.  Members of
+objects constructed at successive offsets are then read:
+
+  * through ordinary attribute access on freshly constructed objects,
+  * the same, with aggregate buffering enabled,
+  * the same, with buffering and object interning enabled (so that later
+    repeats reuse the structures, and their buffers, built by earlier ones).
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from volatility3.framework import constants, contexts, interfaces
+from volatility3.framework.layers import physical
+from volatility3.framework.symbols import intermed
+
+TABLE_NAME = "benchmark"
+
+
+def base_type(size: int, signed: bool = False) -> Dict:
+    return {"kind": "int", "size": size, "signed": signed, "endian": "little"}
+
+
+def field(offset: int, type_dict: Dict) -> Dict:
+    return {"offset": offset, "type": type_dict}
+
+
+def make_isf() -> Dict:
+    unsigned_long = {"kind": "base", "name": "unsigned long"}
+    unsigned_long_long = {"kind": "base", "name": "unsigned long long"}
+    list_entry = {"kind": "struct", "name": "_LIST_ENTRY"}
+    list_entry_pointer = {"kind": "pointer", "subtype": list_entry}
+    return {
+        "metadata": {"format": "6.2.0"},
+        "symbols": {},
+        "enums": {},
+        "base_types": {
+            "char": base_type(1, True),
+            "unsigned char": base_type(1),
+            "unsigned short": base_type(2),
+            "long": base_type(4, True),
+            "unsigned long": base_type(4),
+            "unsigned int": base_type(4),
+            "int": base_type(4, True),
+            "long long": base_type(8, True),
+            "unsigned long long": base_type(8),
+            "pointer": base_type(8),
+        },
+        "user_types": {
+            "_LIST_ENTRY": {
+                "kind": "struct",
+                "size": 16,
+                "fields": {
+                    "Flink": field(0, list_entry_pointer),
+                    "Blink": field(8, list_entry_pointer),
+                },
+            },
+            "_PROCESS": {
+                "kind": "struct",
+                "size": 0x80,
+                "fields": {
+                    "UniqueProcessId": field(0x0, unsigned_long_long),
+                    "ActiveProcessLinks": field(0x8, list_entry),
+                    "Flags": field(0x18, unsigned_long),
+                    "Protected": field(
+                        0x1C,
+                        {
+                            "kind": "bitfield",
+                            "bit_position": 2,
+                            "bit_length": 3,
+                            "type": unsigned_long,
+                        },
+                    ),
+                    "CreateTime": field(0x20, unsigned_long_long),
+                    "ExitTime": field(0x28, unsigned_long_long),
+                    "Peb": field(0x30, {"kind": "pointer", "subtype": unsigned_long}),
+                    "InheritedFromUniqueProcessId": field(0x38, unsigned_long_long),
+                    "ImageFileName": field(
+                        0x40,
+                        {
+                            "kind": "array",
+                            "count": 15,
+                            "subtype": {"kind": "base", "name": "unsigned char"},
+                        },
+                    ),
+                    "ThreadListHead": field(0x50, list_entry),
+                    "ActiveThreads": field(0x60, unsigned_long),
+                    "Cookie": field(0x64, unsigned_long),
+                },
+            },
+        },
+    }
+
+
+MEMBERS = [
+    "UniqueProcessId",
+    "Flags",
+    "Protected",
+    "CreateTime",
+    "ExitTime",
+    "Peb",
+    "InheritedFromUniqueProcessId",
+    "ActiveThreads",
+    "Cookie",
+]
+
+
+def make_context(count: int) -> interfaces.context.ContextInterface:
+    context = contexts.Context()
+    data = random.randbytes(count * 0x80)
+    context.add_layer(physical.BufferDataLayer(context, "buffer", "memory", data))
+    table = intermed.Version8Format(context, "tables", TABLE_NAME, make_isf())
+    context.symbol_space.append(table)
+    return context
+
+
+def attribute_access(context: interfaces.context.ContextInterface, count: int) -> int:
+    total = 0
+    for index in range(count):
+        process = context.object(
+            TABLE_NAME + constants.BANG + "_PROCESS", "memory", index * 0x80
+        )
+        for member in MEMBERS:
+            total ^= getattr(process, member)
+        total ^= process.ActiveProcessLinks.Flink
+    return total
+
+
+def buffered_access(context: interfaces.context.ContextInterface, count: int) -> int:
+    constants.AGGREGATE_BUFFERING = True
+    try:
+        return attribute_access(context, count)
+    finally:
+        constants.AGGREGATE_BUFFERING = False
+
+
+def interned_access(context: interfaces.context.ContextInterface, count: int) -> int:
+    constants.CACHE_OBJECTS = True
+    try:
+        return buffered_access(context, count)
+    finally:
+        constants.CACHE_OBJECTS = False
+
+
+def run(count: int, repeats: int) -> None:
+    context = make_context(count)
+    modes: Dict[str, Callable[[interfaces.context.ContextInterface, int], int]] = {
+        "attribute": attribute_access,
+        "buffered": buffered_access,
+        "interned": interned_access,
+    }
+    accesses = count * (len(MEMBERS) + 1)
+    print(f"Reading {len(MEMBERS) + 1} members from each of {count} structures")
+    print(f"{'Mode':>10} {'Best (s)':>9} {'Members/s':>11}")
+    results: List[int] = []
+    for name, mode in modes.items():
+        best = None
+        for _ in range(repeats):
+            start = time.perf_counter()
+            result = mode(context, count)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        results.append(result)
+        print(f"{name:>10} {best:>9.3f} {accesses / best:>11,.0f}")
+    if len(set(results)) != 1:
+        print("WARNING: modes returned different results")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--count", type=int, default=5000, help="Number of structures to read"
+    )
+    parser.add_argument(
+        "--repeats", type=int, default=3, help="Number of times to repeat each mode"
+    )
+    args = parser.parse_args()
+    run(args.count, args.repeats)
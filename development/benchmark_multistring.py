@@ -0,0 +1,123 @@
+"""Compares the multi-string search engines available to MultiStringScanner.
+
+A synthetic buffer of the requested size is searched (in scanner sized chunks)
+for 10, 100 and 10,000 random patterns using the regular expression engine, the
+pure python Aho-Corasick automaton and, if installed, pyahocorasick.  Some of
+the patterns are planted in the data so every engine has finds to report.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Callable, Dict, Generator, List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from volatility3.framework.layers import scanners
+from volatility3.framework.layers.scanners import ahocorasick
+
+SearchFunction = Callable[[bytes], Generator[Tuple[int, bytes], None, None]]
+
+
+def regex_engine(patterns: List[bytes]) -> SearchFunction:
+    class RegexScanner(scanners.MultiStringScanner):
+        accelerated_threshold = automaton_threshold = len(patterns) + 1
+
+    return RegexScanner(patterns).search
+
+
+def automaton_engine(patterns: List[bytes], accelerated: bool) -> SearchFunction:
+    automaton = ahocorasick.AhoCorasick(accelerated)
+    for pattern in patterns:
+        automaton.add_pattern(pattern)
+    automaton.preprocess()
+    return automaton.search
+
+
+def make_chunk(size: int, patterns: List[bytes], plants: int) -> bytes:
+    data = bytearray(random.randbytes(size))
+    for _ in range(plants):
+        pattern = random.choice(patterns)
+        offset = random.randrange(0, size - len(pattern))
+        data[offset : offset + len(pattern)] = pattern
+    return bytes(data)
+
+
+def run(size: int, chunk_size: int, counts: List[int], pattern_length: int) -> None:
+    engines: Dict[str, Callable[[List[bytes]], SearchFunction]] = {
+        "regex": regex_engine,
+        "python": lambda p: automaton_engine(p, False),
+    }
+    if ahocorasick.HAS_PYAHOCORASICK:
+        engines["pyahocorasick"] = lambda p: automaton_engine(p, True)
+    else:
+        print("pyahocorasick is not installed, skipping the accelerated engine")
+
+    chunks = max(1, size // chunk_size)
+    print(
+        f"Searching {chunks * chunk_size:#x} bytes in {chunks} chunks of {chunk_size:#x}"
+    )
+    print(
+        f"{'Patterns':>10} {'Engine':>14} {'Build (s)':>10} {'Search (s)':>11}"
+        f" {'MB/s':>9} {'Finds':>8}"
+    )
+    for count in counts:
+        patterns = [random.randbytes(pattern_length) for _ in range(count)]
+        # The chunk is reused, so that generating the data isn't part of the benchmark
+        chunk = make_chunk(chunk_size, patterns, plants=1000)
+        reference = None
+        for name, engine in engines.items():
+            start = time.perf_counter()
+            search = engine(patterns)
+            build = time.perf_counter() - start
+
+            start = time.perf_counter()
+            finds = 0
+            for _ in range(chunks):
+                finds += sum(1 for _ in search(chunk))
+            elapsed = time.perf_counter() - start
+
+            if reference is None:
+                reference = finds
+            elif finds != reference:
+                print(f"WARNING: {name} found {finds} matches, regex found {reference}")
+            rate = (chunks * chunk_size) / (1024 * 1024) / elapsed
+            print(
+                f"{count:>10} {name:>14} {build:>10.3f} {elapsed:>11.3f}"
+                f" {rate:>9.1f} {finds:>8}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmarks the multi-string search engines"
+    )
+    parser.add_argument(
+        "--size",
+        type=int,
+        default=1024 * 1024 * 1024,
+        help="Total number of bytes to search for each engine",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=0x1000000,
+        help="Size of each block passed to the engine",
+    )
+    parser.add_argument(
+        "--patterns",
+        type=int,
+        nargs="+",
+        default=[10, 100, 10000],
+        help="Numbers of patterns to search for",
+    )
+    parser.add_argument(
+        "--pattern-length", type=int, default=8, help="Length of each pattern"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    run(args.size, args.chunk_size, args.patterns, args.pattern_length)
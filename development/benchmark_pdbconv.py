@@ -0,0 +1,80 @@
+"""Measures how long pdbconv takes to convert a PDB file to ISF, and how much
+memory the conversion needs.
+
+The conversion is timed several times within this process, and then run once
+more with allocation tracing enabled to find the peak memory used (tracing
+slows the conversion, so that run is not timed).  Pass ``--types`` to only
+convert the named types and the types they depend upon.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import List, Optional
+from urllib import request
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from volatility3.framework import contexts  # noqa: E402
+from volatility3.framework.symbols.windows import pdbconv  # noqa: E402
+
+
+def convert(location: str, type_names: Optional[List[str]]) -> dict:
+    return pdbconv.PdbReader(
+        contexts.Context(), location, type_names=type_names
+    ).get_json()
+
+
+def run(filename: str, repeats: int, type_names: Optional[List[str]]) -> None:
+    location = "file:" + request.pathname2url(os.path.abspath(filename))
+
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        json_output = convert(location, type_names)
+        timings.append(time.perf_counter() - start)
+    del json_output
+
+    tracemalloc.start()
+    json_output = convert(location, type_names)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"Converting {filename} over {repeats} runs")
+    print(
+        "  "
+        + ", ".join(
+            f"{len(json_output[section])} {section}"
+            for section in ["user_types", "enums", "symbols"]
+        )
+    )
+    print(f"{'Mean (s)':>10} {'Median (s)':>11} {'Min (s)':>9} {'Peak (MB)':>10}")
+    print(
+        f"{statistics.mean(timings):>10.3f} {statistics.median(timings):>11.3f}"
+        f" {min(timings):>9.3f} {peak / (1024 * 1024):>10.1f}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmarks the conversion of a PDB file to ISF"
+    )
+    parser.add_argument(
+        "-f", "--file", metavar="FILE", required=True, help="PDB file to convert"
+    )
+    parser.add_argument(
+        "--repeats", type=int, default=5, help="Number of conversions to time"
+    )
+    parser.add_argument(
+        "--types",
+        metavar="TYPE",
+        nargs="+",
+        default=None,
+        help="Only convert these types (and the types they depend upon)",
+    )
+    args = parser.parse_args()
+
+    run(args.file, args.repeats, args.types)
@@ -0,0 +1,74 @@
+"""Measures how long the command line takes to start up.
+
+Each invocation runs ``vol.py <plugin> --help``, which builds the whole parser
+but does no analysis, so the time taken is the start up cost that every run
+pays.  Runs are timed with the plugin manifest freshly rebuilt (as happens the
+first time, or after any plugin changes, and equivalent to importing every
+plugin) and with the manifest already in the cache.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List
+
+VOL_PATH = os.path.join(os.path.dirname(__file__), "..", "vol.py")
+MANIFEST_FILENAME = "plugin_manifest.cache"
+
+
+def time_invocation(arguments: List[str], cache_path: str) -> float:
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, VOL_PATH, "--cache-path", cache_path] + arguments,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return time.perf_counter() - start
+
+
+def run(plugin: str, repeats: int) -> None:
+    arguments = [plugin, "--help"]
+    with tempfile.TemporaryDirectory() as cache_path:
+        manifest_path = os.path.join(cache_path, MANIFEST_FILENAME)
+
+        rebuilt = []
+        for _ in range(repeats):
+            if os.path.exists(manifest_path):
+                os.unlink(manifest_path)
+            rebuilt.append(time_invocation(arguments, cache_path))
+
+        cached = [time_invocation(arguments, cache_path) for _ in range(repeats)]
+
+    print(f"Timing '{' '.join(arguments)}' over {repeats} runs")
+    print(f"{'Manifest':>10} {'Mean (s)':>10} {'Median (s)':>11} {'Min (s)':>9}")
+    for name, timings in [("rebuilt", rebuilt), ("cached", cached)]:
+        print(
+            f"{name:>10} {statistics.mean(timings):>10.3f}"
+            f" {statistics.median(timings):>11.3f} {min(timings):>9.3f}"
+        )
+    print(
+        f"Cached start up takes {statistics.median(cached) / statistics.median(rebuilt):.0%}"
+        " of the time taken when importing every plugin"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmarks the start up time of the command line"
+    )
+    parser.add_argument(
+        "--plugin",
+        default="windows.pslist.PsList",
+        help="Plugin whose help is requested on each run",
+    )
+    parser.add_argument(
+        "--repeats", type=int, default=10, help="Number of runs to time for each case"
+    )
+    args = parser.parse_args()
+
+    run(args.plugin, args.repeats)
@@ -0,0 +1,101 @@
+import unittest
+from unittest import mock
+
+from volatility3.framework import contexts
+from volatility3.framework.automagic import construct_layers, session
+from volatility3.framework.layers import physical
+from volatility3.framework.symbols import intermed
+from test.framework.layers.test_intel import make_layer
+
+BANNER = "Linux version 6.1.0 (test@example) #1 SMP\n"
+
+
+def write_physical(layer, offset: int, data: bytes) -> None:
+    layer.context.layers.write(layer.config["memory_layer"], offset, data)
+
+
+def kernel_module(layer, offset: int, banner_address: int):
+    isf = {
+        "metadata": {"format": "6.2.0"},
+        "symbols": {"linux_banner": {"address": banner_address}},
+        "enums": {},
+        "base_types": {},
+        "user_types": {},
+    }
+    context = layer.context
+    table = intermed.Version8Format(context, "tables", "kernel", isf)
+    context.symbol_space.append(table)
+    return context.module("kernel", layer.name, offset)
+
+
+class TestSessionValidation(unittest.TestCase):
+    def setUp(self):
+        # Virtual 2MB is mapped to physical 4MB by an aligned large page
+        self.layer = make_layer(0x600000)
+        write_physical(self.layer, 0x400000, b"MZ")
+        write_physical(self.layer, 0x400100, BANNER.encode("latin-1"))
+
+    def test_kernel_image_header(self):
+        validate = session.SessionRestore._layer_is_valid
+        self.layer.config["kernel_virtual_offset"] = 0x200000
+        self.assertTrue(validate(self.layer))
+        self.layer.config["kernel_virtual_offset"] = 0x200002
+        self.assertFalse(validate(self.layer))
+
+    def test_unmapped_kernel_is_invalid(self):
+        self.layer.config["kernel_virtual_offset"] = 0x10000000
+        context = self.layer.context
+        context.config["session.kernel"] = self.layer.name
+        requirement = session.requirements.TranslationLayerRequirement("kernel")
+        self.assertFalse(
+            session.SessionRestore._validate(context, "session.kernel", requirement)
+        )
+
+    def test_module_banner(self):
+        self.layer.config["kernel_banner"] = BANNER
+        validate = session.SessionRestore._module_is_valid
+        module = kernel_module(self.layer, 0x1000, 0x200100 - 0x1000)
+        self.assertTrue(validate(self.layer.context, module))
+        module = kernel_module(self.layer, 0x2000, 0x200100 - 0x1000)
+        self.assertFalse(validate(self.layer.context, module))
+
+    def test_module_image_header(self):
+        validate = session.SessionRestore._module_is_valid
+        module = self.layer.context.module("kernel", self.layer.name, 0x200000)
+        self.assertTrue(validate(self.layer.context, module))
+        module = self.layer.context.module("kernel", self.layer.name, 0x201000)
+        self.assertFalse(validate(self.layer.context, module))
+
+    def test_banner_layer_page_map(self):
+        self.layer.config["kernel_banner"] = BANNER
+        self.assertTrue(session.SessionRestore._layer_is_valid(self.layer))
+        self.layer.config["page_map_offset"] = 0x500000
+        self.assertFalse(session.SessionRestore._layer_is_valid(self.layer))
+
+
+class TestSessionRestore(unittest.TestCase):
+    def test_failed_construction_is_rolled_back(self):
+        context = contexts.Context()
+        context.config["plugin.kernel"] = "original"
+
+        def construct(self, context, config_path, requirement, *args, **kwargs):
+            context.add_layer(
+                physical.BufferDataLayer(context, "stale", "stale", b"\x00" * 16)
+            )
+            raise ValueError("Stale session")
+
+        restore = session.SessionRestore(context, "automagic.SessionRestore")
+        requirement = session.requirements.TranslationLayerRequirement("kernel")
+        with mock.patch.object(
+            construct_layers.ConstructionMagic, "__call__", construct
+        ):
+            restored = restore._restore(
+                context,
+                "plugin.kernel",
+                requirement,
+                {"memory_layer": "memory"},
+            )
+        self.assertFalse(restored)
+        self.assertNotIn("stale", context.layers)
+        self.assertEqual(context.config["plugin.kernel"], "original")
+        self.assertNotIn("plugin.kernel.memory_layer", context.config)
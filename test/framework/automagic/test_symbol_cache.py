@@ -0,0 +1,104 @@
+import json
+import os
+import pathlib
+import tempfile
+import unittest
+from unittest import mock
+
+from volatility3.framework import constants, contexts
+from volatility3.framework.automagic import symbol_cache
+from volatility3.framework.layers import physical
+from volatility3.framework.symbols import intermed
+
+
+class TestSqliteCacheUpdate(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.locations = []
+        patcher = mock.patch.object(
+            intermed.IntermediateSymbolTable,
+            "file_symbol_url",
+            side_effect=lambda *args, **kwargs: iter(self.locations),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(constants, "OFFLINE", True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.cache = symbol_cache.SqliteCache(
+            os.path.join(self.directory.name, "identifiers.cache")
+        )
+
+    def tearDown(self):
+        self.cache._database.close()
+        self.directory.cleanup()
+
+    def add_isf(self, name: str, banner: str) -> str:
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w") as isf:
+            json.dump(
+                {
+                    "metadata": {"format": "6.2.0"},
+                    "base_types": {},
+                    "user_types": {},
+                    "enums": {},
+                    "symbols": {
+                        "linux_banner": {"address": 0, "constant_data": banner}
+                    },
+                },
+                isf,
+            )
+        location = pathlib.Path(path).as_uri()
+        self.locations.append(location)
+        return location
+
+    def test_update_tracks_files(self):
+        first = self.add_isf("first.json", "TGludXggdmVyc2lvbiAx")
+        self.add_isf("second.json", "TGludXggdmVyc2lvbiAy")
+        self.cache.update()
+        self.assertEqual(
+            set(self.cache.get_identifier_dictionary().values()), set(self.locations)
+        )
+        self.locations.remove(first)
+        self.cache.update()
+        self.assertEqual(
+            set(self.cache.get_identifier_dictionary().values()), set(self.locations)
+        )
+
+    def test_files_are_identified_outside_a_transaction(self):
+        stale = self.add_isf("stale.json", "TGludXggdmVyc2lvbiAx")
+        self.cache.update()
+        self.locations.remove(stale)
+        self.add_isf("fresh.json", "TGludXggdmVyc2lvbiAy")
+
+        identify_locations = self.cache._identify_locations
+        transactions = []
+
+        def identify(files_to_process):
+            transactions.append(self.cache._database.in_transaction)
+            yield from identify_locations(files_to_process)
+
+        with mock.patch.object(self.cache, "_identify_locations", identify):
+            self.cache.update()
+        self.assertEqual(transactions, [False])
+        self.assertEqual(
+            set(self.cache.get_identifier_dictionary().values()), set(self.locations)
+        )
+
+
+class TestBannerIndex(unittest.TestCase):
+    def test_repeated_banners_are_looked_up_once(self):
+        banner = b"Linux version 6.1.0\x00"
+        data = (banner + b"\x00" * 12) * 50 + b"Linux version 5.0\x00"
+        context = contexts.Context()
+        context.add_layer(physical.BufferDataLayer(context, "buffer", "memory", data))
+        cache = mock.Mock(spec=symbol_cache.CacheManagerInterface)
+        cache.get_identifier_summary.return_value = ([b"Linux version"], [len(banner)])
+        cache.find_identifier.side_effect = lambda data, lengths, os: (
+            (banner, "file:///linux.json") if data.startswith(banner) else None
+        )
+        index = symbol_cache.BannerIndex(cache, "linux")
+        found = list(index.scan(context, "memory"))
+        self.assertEqual(len(found), 50)
+        self.assertEqual(found[1], (32, banner, "file:///linux.json"))
+        self.assertEqual(cache.find_identifier.call_count, 2)
@@ -0,0 +1,97 @@
+import itertools
+import unittest
+from unittest import mock
+
+from volatility3.framework import contexts
+
+MODULES = [
+    ("kernel", 0x1000, 0x1000),
+    ("nested", 0x1400, 0x100),
+    ("adjacent", 0x2000, 0x800),
+    ("empty", 0x3000, 0),
+    ("duplicate", 0x1000, 0x1000),
+    ("distant", 0x10000, 0x10),
+]
+
+
+def make_context(modules=MODULES):
+    context = contexts.Context()
+    for name, offset, size in modules:
+        contexts.SizedModule.create(
+            context, name, "layer", offset, size=size, symbol_table_name="table"
+        )
+    return context
+
+
+def expected_modules(collection, offset, size):
+    """The modules overlapping a range, as found by checking each module in turn"""
+    return [
+        module.name
+        for module in collection.values()
+        if offset <= module.offset + module.size and offset + size >= module.offset
+    ]
+
+
+class TestModuleCollectionIndex(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(
+            contexts.SizedModule, "get_symbols_by_absolute_location", return_value=[]
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def found_modules(self, collection, offset, size=0):
+        return [
+            name
+            for name, _ in collection.get_module_symbols_by_absolute_location(
+                offset, size
+            )
+        ]
+
+    def test_matches_linear_search(self):
+        collection = make_context().modules
+        boundaries = sorted(
+            {point for _, offset, size in MODULES for point in (offset, offset + size)}
+        )
+        offsets = {0} | {point + delta for point in boundaries for delta in (-1, 0, 1)}
+        for offset, size in itertools.product(sorted(offsets), [0, 1, 0x3FF, 0x1000]):
+            with self.subTest(offset=hex(offset), size=hex(size)):
+                self.assertEqual(
+                    self.found_modules(collection, offset, size),
+                    expected_modules(collection, offset, size),
+                )
+
+    def test_boundaries_are_inclusive(self):
+        collection = make_context().modules
+        self.assertEqual(
+            self.found_modules(collection, 0x2000), ["kernel", "adjacent", "duplicate"]
+        )
+        self.assertEqual(self.found_modules(collection, 0x3000), ["empty"])
+        self.assertEqual(self.found_modules(collection, 0x2FFF, 1), ["empty"])
+        self.assertEqual(self.found_modules(collection, 0xFFF), [])
+        self.assertEqual(
+            self.found_modules(collection, 0xFFF, 1), ["kernel", "duplicate"]
+        )
+        self.assertEqual(self.found_modules(collection, 0x10011), [])
+
+    def test_contained_module_behind_larger_module(self):
+        # The larger module starts first, so the search must continue past the nested module
+        collection = make_context(
+            [("outer", 0, 0x10000), ("inner", 0x100, 0x10), ("later", 0x200, 0x10)]
+        ).modules
+        self.assertEqual(self.found_modules(collection, 0x8000), ["outer"])
+        self.assertEqual(self.found_modules(collection, 0x105), ["outer", "inner"])
+
+    def test_index_follows_changes(self):
+        context = make_context()
+        self.assertEqual(self.found_modules(context.modules, 0x20000), [])
+        contexts.SizedModule.create(
+            context, "late", "layer", 0x20000, size=0x10, symbol_table_name="table"
+        )
+        self.assertEqual(self.found_modules(context.modules, 0x20000), ["late"])
+        del context.modules["late"]
+        self.assertEqual(self.found_modules(context.modules, 0x20000), [])
+
+    def test_negative_size(self):
+        with self.assertRaises(ValueError):
+            list(make_context().modules.get_module_symbols_by_absolute_location(0, -1))
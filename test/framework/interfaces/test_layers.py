@@ -0,0 +1,335 @@
+import tempfile
+import unittest
+from unittest import mock
+
+from volatility3.framework import constants, contexts, exceptions, interfaces
+from volatility3.framework.layers import physical, scanners, segmented
+
+BLOCK_SIZE = interfaces.layers.ReadCache.block_size
+
+
+class IdentityLayer(segmented.SegmentedLayer):
+    """Maps the whole of its base layer onto itself, so that reads go
+    through the translation (and read cache) machinery."""
+
+    def _load_segments(self) -> None:
+        size = self.context.layers[self._base_layer].maximum_address + 1
+        self._segments = [(0, 0, size, size)]
+
+
+def make_context(data: bytes) -> interfaces.context.ContextInterface:
+    context = contexts.Context()
+    context.add_layer(physical.BufferDataLayer(context, "buffer", "memory", data))
+    context.config["identity.base_layer"] = "memory"
+    context.add_layer(IdentityLayer(context, "identity", "identity"))
+    return context
+
+
+class BlockReader:
+    """Serves blocks from a fixed buffer, counting each block read."""
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.reads = []
+
+    def __call__(self, offset: int, length: int) -> bytes:
+        self.reads.append(offset)
+        if offset + length > len(self.data):
+            raise exceptions.InvalidAddressException("test", offset, "Out of bounds")
+        return self.data[offset : offset + length]
+
+
+class TestReadCache(unittest.TestCase):
+    def setUp(self):
+        self.data = bytes(range(256)) * (8 * BLOCK_SIZE // 256)
+        self.reader = BlockReader(self.data)
+
+    def test_read_matches_data(self):
+        cache = interfaces.layers.ReadCache(max_size=4 * BLOCK_SIZE)
+        for offset, length in [
+            (0, 1),
+            (10, 100),
+            (BLOCK_SIZE - 3, 7),
+            (5, 3 * BLOCK_SIZE),
+        ]:
+            self.assertEqual(
+                cache.read("test", offset, length, self.reader),
+                self.data[offset : offset + length],
+            )
+
+    def test_repeated_reads_are_cached(self):
+        cache = interfaces.layers.ReadCache(max_size=4 * BLOCK_SIZE)
+        cache.read("test", 16, 8, self.reader)
+        cache.read("test", 32, 8, self.reader)
+        self.assertEqual(self.reader.reads, [0])
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_least_recently_used_block_is_evicted(self):
+        cache = interfaces.layers.ReadCache(max_size=2 * BLOCK_SIZE)
+        cache.read("test", 0, 1, self.reader)
+        cache.read("test", BLOCK_SIZE, 1, self.reader)
+        cache.read("test", 0, 1, self.reader)
+        cache.read("test", 2 * BLOCK_SIZE, 1, self.reader)
+        self.assertEqual(cache.size, 2 * BLOCK_SIZE)
+        self.assertEqual(cache.evictions, 1)
+        # Block 0 was used more recently than block 1, so block 1 was evicted
+        cache.read("test", 0, 1, self.reader)
+        cache.read("test", BLOCK_SIZE, 1, self.reader)
+        self.assertEqual(self.reader.reads, [0, BLOCK_SIZE, 2 * BLOCK_SIZE, BLOCK_SIZE])
+
+    def test_zero_size_disables_cache(self):
+        cache = interfaces.layers.ReadCache(max_size=0)
+        self.assertIsNone(cache.read("test", 0, 1, self.reader))
+        self.assertEqual(self.reader.reads, [])
+
+    def test_large_and_invalid_reads_bypass_cache(self):
+        cache = interfaces.layers.ReadCache(max_size=64 * BLOCK_SIZE)
+        length = cache.max_blocks_per_read * BLOCK_SIZE + 1
+        self.assertIsNone(cache.read("test", 0, length, self.reader))
+        self.assertIsNone(cache.read("test", len(self.data) - 1, 2, self.reader))
+        # Only the readable final block is kept
+        self.assertEqual(cache.size, BLOCK_SIZE)
+
+    def test_invalidate_layer(self):
+        cache = interfaces.layers.ReadCache(max_size=4 * BLOCK_SIZE)
+        cache.read("first", 0, 1, self.reader)
+        cache.read("second", 0, 1, self.reader)
+        cache.invalidate("first")
+        self.assertEqual(cache.size, BLOCK_SIZE)
+        cache.read("first", 0, 1, self.reader)
+        cache.read("second", 0, 1, self.reader)
+        self.assertEqual(self.reader.reads, [0, 0, 0])
+
+    def test_write_invalidates_cached_reads(self):
+        context = make_context(b"\x00" * (2 * BLOCK_SIZE))
+        self.assertEqual(context.layers.read("identity", 8, 4), b"\x00" * 4)
+        self.assertGreater(context.layers.cache.size, 0)
+        context.layers.write("memory", 8, b"abcd")
+        self.assertEqual(context.layers.cache.size, 0)
+        self.assertEqual(context.layers.read("identity", 8, 4), b"abcd")
+
+
+class WrappingScanner(interfaces.layers.ScannerInterface):
+    """Delegates to a string scanner it holds, as the pool scanner does."""
+
+    thread_safe = True
+
+    def __init__(self, patterns) -> None:
+        super().__init__()
+        self._subscanner = scanners.MultiStringScanner(patterns)
+
+    def __call__(self, data, data_offset):
+        yield from self._subscanner(data, data_offset)
+
+
+class TestScannerGroup(unittest.TestCase):
+    def test_nested_scanners_share_chunking(self):
+        small = WrappingScanner([b"needle"])
+        small.chunk_size = small._subscanner.chunk_size = 0x100
+        large = scanners.BytesScanner(b"other")
+        large.chunk_size = 0x2000
+        group = interfaces.layers.ScannerGroup([small, large])
+        for scanner in [small, small._subscanner, large]:
+            self.assertEqual(scanner.chunk_size, 0x2000)
+            self.assertEqual(scanner.overlap, group.overlap)
+
+    def test_results_beyond_nested_chunk_size(self):
+        data = bytearray(0x4000)
+        data[0x1800:0x1806] = b"needle"
+        data[0x3000:0x3005] = b"other"
+        context = make_context(bytes(data))
+        small = WrappingScanner([b"needle"])
+        small.chunk_size = small._subscanner.chunk_size = 0x100
+        large = scanners.BytesScanner(b"other")
+        large.chunk_size = 0x2000
+        results = list(
+            context.layers["memory"].scan(
+                context, interfaces.layers.ScannerGroup([small, large])
+            )
+        )
+        self.assertEqual(results, [(0, (0x1800, b"needle")), (1, 0x3000)])
+
+
+class ContextResult:
+    """A scan result that refers to the context it was found in"""
+
+    def __init__(self, context, offset):
+        self.context = context
+        self.offset = offset
+
+
+class TestScanCache(unittest.TestCase):
+    def test_results_are_restored_against_the_replaying_context(self):
+        original, replaying = contexts.Context(), contexts.Context()
+        with tempfile.TemporaryDirectory() as cache_path, mock.patch.object(
+            constants, "CACHE_PATH", cache_path
+        ):
+            interfaces.layers.ScanResultCache.store(
+                "key", [ContextResult(original, 0x1000)], original
+            )
+            results = interfaces.layers.ScanResultCache.load("key", replaying)
+        self.assertEqual(len(results), 1)
+        self.assertIs(results[0].context, replaying)
+        self.assertEqual(results[0].offset, 0x1000)
+
+    def test_fingerprint_failure_scans_without_cache(self):
+        data = bytearray(0x4000)
+        data[0x2000:0x2006] = b"needle"
+        context = make_context(bytes(data))
+        fingerprint = mock.PropertyMock(side_effect=OSError("Unreadable"))
+        with mock.patch.object(
+            constants, "CACHE_SCAN_RESULTS", True
+        ), mock.patch.object(
+            physical.BufferDataLayer, "fingerprint", fingerprint
+        ), mock.patch.object(
+            interfaces.layers.ScanResultCache, "store"
+        ) as store:
+            results = list(
+                context.layers["memory"].scan(context, scanners.BytesScanner(b"needle"))
+            )
+        self.assertEqual(results, [0x2000])
+        fingerprint.assert_called()
+        store.assert_not_called()
+
+
+def make_chain(
+    nodes, last, size=0x10000, pointer_offset=0, pointer_size=8, byteorder="little"
+):
+    """Builds a buffer in which each node points to the next, and the final node to last"""
+    data = bytearray(size)
+    for node, target in zip(nodes, nodes[1:] + [last]):
+        position = node + pointer_offset
+        data[position : position + pointer_size] = target.to_bytes(
+            pointer_size, byteorder
+        )
+    return physical.BufferDataLayer(contexts.Context(), "buffer", "memory", data)
+
+
+class TestWalkPointers(unittest.TestCase):
+    def test_cycle_to_start(self):
+        nodes = [0x100, 0x2200, 0x40, 0x5008]
+        layer = make_chain(nodes, nodes[0])
+        self.assertEqual(list(layer.walk_pointers(nodes[0])), nodes)
+
+    def test_cycle_to_middle(self):
+        nodes = [0x100, 0x2200, 0x40, 0x5008]
+        layer = make_chain(nodes, nodes[1])
+        self.assertEqual(list(layer.walk_pointers(nodes[0])), nodes)
+
+    def test_self_reference(self):
+        layer = make_chain([0x100], 0x100)
+        self.assertEqual(list(layer.walk_pointers(0x100)), [0x100])
+
+    def test_stop_offsets_are_not_returned(self):
+        nodes = [0x100, 0x2200, 0x40, 0x5008]
+        layer = make_chain(nodes, 0x8000)
+        self.assertEqual(list(layer.walk_pointers(nodes[0], stop=[0x40])), nodes[:2])
+        self.assertEqual(list(layer.walk_pointers(nodes[0], stop=[nodes[0]])), [])
+
+    def test_unreadable_pointer_ends_walk(self):
+        nodes = [0x100, 0x2200]
+        layer = make_chain(nodes, 0xFFFFF)
+        self.assertEqual(
+            list(layer.walk_pointers(nodes[0], mask=0xFFFFFFFF)), nodes + [0xFFFFF]
+        )
+
+    def test_pointer_layout(self):
+        nodes = [0x100, 0x2200, 0x40]
+        layer = make_chain(
+            nodes, 0x8000, pointer_offset=0x10, pointer_size=4, byteorder="big"
+        )
+        self.assertEqual(
+            list(
+                layer.walk_pointers(
+                    nodes[0],
+                    pointer_offset=0x10,
+                    pointer_size=4,
+                    byteorder="big",
+                    stop=[0x8000],
+                )
+            ),
+            nodes,
+        )
+        self.assertEqual(
+            list(
+                layer.walk_pointers(
+                    nodes[0],
+                    pointer_offset=0x10,
+                    pointer_size=4,
+                    byteorder="big",
+                    mask=0xF00,
+                )
+            )[:2],
+            [0x100, 0x200],
+        )
+
+    def test_walk_is_lazy(self):
+        nodes = [0x100, 0x2200, 0x40, 0x5008]
+        layer = make_chain(nodes, nodes[0])
+        with mock.patch.object(layer, "read", wraps=layer.read) as read:
+            walk = layer.walk_pointers(nodes[0])
+            self.assertEqual(next(walk), nodes[0])
+            read.assert_not_called()
+            self.assertEqual(next(walk), nodes[1])
+            self.assertEqual(read.call_count, 1)
+
+    def test_nodes_on_separate_pages_are_read_individually(self):
+        nodes = [0x100, 0x2200, 0x40, 0x5008, 0x3010]
+        layer = make_chain(nodes, nodes[0])
+        with mock.patch.object(layer, "read", wraps=layer.read) as read:
+            self.assertEqual(list(layer.walk_pointers(nodes[0])), nodes)
+        self.assertEqual([call.args[1] for call in read.call_args_list], [8] * 5)
+
+    def test_nodes_sharing_a_page_are_read_together(self):
+        nodes = [0x100 + index * 0x20 for index in range(32)] + [0x3000]
+        layer = make_chain(nodes, nodes[0])
+        with mock.patch.object(layer, "read", wraps=layer.read) as read:
+            self.assertEqual(list(layer.walk_pointers(nodes[0])), nodes)
+        self.assertEqual(
+            [call.args for call in read.call_args_list],
+            [(0x100, 8), (0, layer.walk_block_size), (0x3000, 8)],
+        )
+
+    def test_layer_container(self):
+        nodes = [0x100, 0x2200, 0x40]
+        layer = make_chain(nodes, nodes[0])
+        context = layer.context
+        context.add_layer(layer)
+        self.assertEqual(list(context.layers.walk_pointers("memory", 0x100)), nodes)
+
+    @unittest.skipUnless(interfaces.layers.HAS_NUMPY, "numpy is not installed")
+    def test_as_array(self):
+        nodes = [0x100, 0x2200, 0x40, 0x5008]
+        layer = make_chain(nodes, nodes[0])
+        array = layer.walk_pointers(nodes[0], as_array=True)
+        self.assertEqual(str(array.dtype), "uint64")
+        self.assertEqual(array.tolist(), nodes)
+
+
+class SwappedLayer(segmented.SegmentedLayer):
+    """Maps the two halves of the first 0x2000 bytes of its base layer in
+    swapped order, so that reads across the middle are not contiguous."""
+
+    def _load_segments(self) -> None:
+        self._segments = [(0, 0x1000, 0x1000, 0x1000), (0x1000, 0, 0x1000, 0x1000)]
+
+
+class TestLinearReadView(unittest.TestCase):
+    def setUp(self):
+        self.data = bytes(range(256)) * 32
+        self.context = make_context(self.data)
+        self.context.config["swapped.base_layer"] = "memory"
+        self.layer = SwappedLayer(self.context, "swapped", "swapped")
+        self.context.add_layer(self.layer)
+
+    def test_contiguous_view(self):
+        view = self.layer.read_view(0x10, 0x20)
+        self.assertEqual(bytes(view), self.data[0x1010:0x1030])
+
+    def test_non_contiguous_view_maps_once(self):
+        with mock.patch.object(
+            self.layer, "mapping", wraps=self.layer.mapping
+        ) as mapping:
+            view = self.layer.read_view(0xFF0, 0x20)
+        self.assertEqual(bytes(view), self.data[0x1FF0:0x2000] + self.data[:0x10])
+        self.assertEqual(mapping.call_count, 1)
@@ -0,0 +1,104 @@
+import gc
+import struct
+import unittest
+from unittest import mock
+
+from volatility3.framework import constants, contexts, interfaces
+from volatility3.framework.layers import physical
+from volatility3.framework.symbols import intermed
+
+from test.framework.interfaces.test_symbols import TABLE_NAME, make_isf
+
+PAIR = TABLE_NAME + constants.BANG + "pair"
+
+
+class Interned:
+    """A stand-in for a constructed object, which can be weakly referenced"""
+
+
+def key(layer_name, offset, native_layer_name=None):
+    return (layer_name, offset, native_layer_name or layer_name, "template")
+
+
+class TestObjectCache(unittest.TestCase):
+    def test_add_and_get(self):
+        cache = interfaces.objects.ObjectCache(max_size=4)
+        value = Interned()
+        self.assertIs(cache.add(key("memory", 0), value), value)
+        self.assertIs(cache.get(key("memory", 0)), value)
+        self.assertIsNone(cache.get(key("memory", 8)))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_first_object_is_kept(self):
+        cache = interfaces.objects.ObjectCache(max_size=4)
+        first, second = Interned(), Interned()
+        cache.add(key("memory", 0), first)
+        self.assertIs(cache.add(key("memory", 0), second), first)
+
+    def test_unreferenced_objects_are_released(self):
+        cache = interfaces.objects.ObjectCache(max_size=2)
+        for offset in range(4):
+            cache.add(key("memory", offset), Interned())
+        gc.collect()
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get(key("memory", 0)))
+        self.assertIsNotNone(cache.get(key("memory", 3)))
+
+    def test_invalidate_layer(self):
+        cache = interfaces.objects.ObjectCache(max_size=8)
+        values = {
+            key("memory", 0): Interned(),
+            key("virtual", 0): Interned(),
+            key("virtual", 8, "memory"): Interned(),
+            key("other", 0): Interned(),
+        }
+        for entry, value in values.items():
+            cache.add(entry, value)
+        cache.invalidate("memory")
+        self.assertIsNone(cache.get(key("memory", 0)))
+        self.assertIsNone(cache.get(key("virtual", 8, "memory")))
+        self.assertIs(cache.get(key("virtual", 0)), values[key("virtual", 0)])
+        self.assertIs(cache.get(key("other", 0)), values[key("other", 0)])
+        cache.invalidate()
+        self.assertEqual(len(cache), 0)
+        self.assertIsNone(cache.get(key("other", 0)))
+
+
+class TestInternedObjects(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(constants, "CACHE_OBJECTS", True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.context = contexts.Context()
+        self.context.add_layer(
+            physical.BufferDataLayer(
+                self.context, "buffer", "memory", struct.pack("<II", 1, 2)
+            )
+        )
+        self.context.symbol_space.append(
+            intermed.Version8Format(self.context, "tables", TABLE_NAME, make_isf())
+        )
+
+    def test_objects_are_interned(self):
+        pair = self.context.object(PAIR, "memory", 0)
+        self.assertIs(self.context.object(PAIR, "memory", 0), pair)
+        self.assertIsNot(self.context.object(PAIR, "memory", 0, size=8), pair)
+
+    def test_write_invalidates_objects(self):
+        pair = self.context.object(PAIR, "memory", 0)
+        self.assertEqual(pair.first, 1)
+        self.context.layers.write("memory", 0, struct.pack("<I", 3))
+        updated = self.context.object(PAIR, "memory", 0)
+        self.assertIsNot(updated, pair)
+        self.assertEqual(updated.first, 3)
+
+    def test_removing_layer_invalidates_objects(self):
+        self.context.object(PAIR, "memory", 0)
+        self.assertEqual(len(self.context.layers.object_cache), 1)
+        self.context.layers.del_layer("memory")
+        self.assertEqual(len(self.context.layers.object_cache), 0)
+
+    def test_disabled_cache(self):
+        with mock.patch.object(constants, "CACHE_OBJECTS", False):
+            pair = self.context.object(PAIR, "memory", 0)
+            self.assertIsNot(self.context.object(PAIR, "memory", 0), pair)
@@ -0,0 +1,80 @@
+import struct
+import unittest
+
+from volatility3.framework import constants, contexts, exceptions, interfaces, symbols
+from volatility3.framework.layers import physical
+from volatility3.framework.symbols import intermed
+
+TABLE_NAME = "table"
+
+
+def make_isf():
+    unsigned_int = {"kind": "base", "name": "unsigned int"}
+    return {
+        "metadata": {"format": "6.2.0"},
+        "symbols": {},
+        "enums": {},
+        "base_types": {
+            "unsigned int": {
+                "kind": "int",
+                "size": 4,
+                "signed": False,
+                "endian": "little",
+            },
+            "pointer": {"kind": "int", "size": 8, "signed": False, "endian": "little"},
+        },
+        "user_types": {
+            "pair": {
+                "kind": "struct",
+                "size": 8,
+                "fields": {
+                    "first": {"offset": 0, "type": unsigned_int},
+                    "second": {"offset": 4, "type": unsigned_int},
+                },
+            }
+        },
+    }
+
+
+class ExternalSymbolSpace(symbols.SymbolSpace):
+    """A symbol space written before member accessors existed"""
+
+    get_type_accessor = interfaces.symbols.SymbolSpaceInterface.get_type_accessor
+
+
+def make_context(symbol_space=None):
+    context = contexts.Context()
+    if symbol_space is not None:
+        context._symbol_space = symbol_space
+    data = struct.pack("<II", 0x1234, 0x5678)
+    context.add_layer(physical.BufferDataLayer(context, "buffer", "memory", data))
+    context.symbol_space.append(
+        intermed.Version8Format(context, "tables", TABLE_NAME, make_isf())
+    )
+    return context
+
+
+class TestTypeAccessor(unittest.TestCase):
+    type_name = TABLE_NAME + constants.BANG + "pair"
+
+    def test_accessor_is_not_abstract(self):
+        self.assertNotIn(
+            "get_type_accessor",
+            interfaces.symbols.SymbolSpaceInterface.__abstractmethods__,
+        )
+
+    def test_default_accessor_raises(self):
+        with self.assertRaises(exceptions.SymbolError):
+            ExternalSymbolSpace().get_type_accessor(self.type_name)
+
+    def test_members_without_shared_accessors(self):
+        context = make_context(ExternalSymbolSpace())
+        pair = context.object(self.type_name, "memory", 0)
+        self.assertEqual((pair.first, pair.second), (0x1234, 0x5678))
+
+    def test_accessors_are_shared(self):
+        context = make_context()
+        accessor = context.symbol_space.get_type_accessor(self.type_name)
+        self.assertIs(context.symbol_space.get_type_accessor(self.type_name), accessor)
+        pair = context.object(self.type_name, "memory", 0)
+        self.assertEqual((pair.first, pair.second), (0x1234, 0x5678))
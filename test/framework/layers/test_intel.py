@@ -0,0 +1,79 @@
+import struct
+import unittest
+from unittest import mock
+
+from volatility3.framework import contexts, exceptions
+from volatility3.framework.layers import intel, physical
+
+PAGE_SIZE = 0x1000
+LARGE_PAGE_SIZE = 0x200000
+PRESENT = 0x1
+PSE = 0x80
+
+
+def make_layer(large_frame: int) -> intel.Intel32e:
+    """Builds a space mapping a few small pages, an aligned large page and a
+    large page at large_frame (at virtual 0, 2MB and 4MB respectively)."""
+    memory = bytearray(0x800000)
+
+    def set_entry(table: int, index: int, value: int) -> None:
+        struct.pack_into("<Q", memory, table + index * 8, value)
+
+    set_entry(0x1000, 0, 0x2000 | PRESENT)
+    set_entry(0x2000, 0, 0x3000 | PRESENT)
+    set_entry(0x3000, 0, 0x4000 | PRESENT)
+    for index in range(4):
+        set_entry(0x4000, index, (0x100000 + index * PAGE_SIZE) | PRESENT)
+    set_entry(0x4000, 5, 0x300000 | PRESENT)
+    set_entry(0x3000, 1, 0x400000 | PSE | PRESENT)
+    set_entry(0x3000, 2, large_frame | PSE | PRESENT)
+
+    context = contexts.Context()
+    context.add_layer(
+        physical.BufferDataLayer(context, "buffer", "memory", bytes(memory))
+    )
+    context.config["primary.memory_layer"] = "memory"
+    context.config["primary.page_map_offset"] = 0x1000
+    layer = intel.Intel32e(context, "primary", "primary")
+    context.add_layer(layer)
+    return layer
+
+
+def page_map(layer: intel.Intel32e, mappings) -> dict:
+    """Expands mappings into a dictionary of virtual page to physical page."""
+    result = {}
+    for offset, length, mapped_offset, _, _ in mappings:
+        for page_offset in range(0, length, PAGE_SIZE):
+            result[offset + page_offset] = mapped_offset + page_offset
+    return result
+
+
+class TestTranslationIndex(unittest.TestCase):
+    length = 3 * LARGE_PAGE_SIZE
+
+    def check_index(self, large_frame: int) -> None:
+        layer = make_layer(large_frame)
+        walked = page_map(layer, layer._mapping(0, self.length, ignore_errors=True))
+        translated = {
+            offset: layer.translate(offset + 8)[0] for offset in walked.keys()
+        }
+        layer.build_translation_index()
+        indexed = page_map(
+            layer, layer._indexed_mapping(0, self.length, ignore_errors=True)
+        )
+        self.assertEqual(indexed, walked)
+        self.assertEqual(len(indexed), 5 + 2 * LARGE_PAGE_SIZE // PAGE_SIZE)
+        for offset, mapped_offset in translated.items():
+            self.assertEqual(layer.translate(offset + 8)[0], mapped_offset)
+        with self.assertRaises(exceptions.PagedInvalidAddressException):
+            list(layer.mapping(4 * PAGE_SIZE, PAGE_SIZE))
+
+    def test_aligned_large_page(self):
+        self.check_index(0x600000)
+
+    def test_malformed_large_page(self):
+        self.check_index(0x202000)
+
+    def test_malformed_large_page_without_numpy(self):
+        with mock.patch.object(intel, "HAS_NUMPY", False):
+            self.check_index(0x202000)
@@ -0,0 +1,92 @@
+import gzip
+import os
+import pathlib
+import tempfile
+import unittest
+from unittest import mock
+
+from volatility3.framework import contexts
+from volatility3.framework.layers import physical
+
+
+def file_layer(path: str) -> physical.FileLayer:
+    context = contexts.Context()
+    context.config["file.location"] = pathlib.Path(path).as_uri()
+    layer = physical.FileLayer(context, "file", "file")
+    context.add_layer(layer)
+    return layer
+
+
+class TestFileLayerFingerprint(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "image.raw")
+        with open(self.path, "wb") as image:
+            image.write(os.urandom(0x40000))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_fingerprint_is_stable(self):
+        fingerprint = file_layer(self.path).fingerprint
+        self.assertIsNotNone(fingerprint)
+        self.assertEqual(file_layer(self.path).fingerprint, fingerprint)
+
+    def test_modified_file_changes_fingerprint(self):
+        fingerprint = file_layer(self.path).fingerprint
+        stat = os.stat(self.path)
+        # Change an unsampled byte, keeping the size but not the modification time
+        with open(self.path, "r+b") as image:
+            image.seek(0x10000 + 0x1234)
+            image.write(b"\x00\x01")
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+        self.assertNotEqual(file_layer(self.path).fingerprint, fingerprint)
+
+    def test_replaced_file_changes_fingerprint(self):
+        fingerprint = file_layer(self.path).fingerprint
+        stat = os.stat(self.path)
+        replacement = self.path + ".new"
+        with open(self.path, "rb") as image, open(replacement, "wb") as new_image:
+            new_image.write(image.read())
+        os.utime(replacement, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.replace(replacement, self.path)
+        self.assertNotEqual(file_layer(self.path).fingerprint, fingerprint)
+
+    def test_compressed_file_has_no_fingerprint(self):
+        compressed = self.path + ".gz"
+        with open(self.path, "rb") as image:
+            data = image.read()
+        with gzip.open(compressed, "wb") as output:
+            output.write(data)
+        layer = file_layer(compressed)
+        self.assertEqual(layer.read(0, 0x10), data[:0x10])
+        self.assertIsNone(layer.fingerprint)
+
+
+class TestFileLayerRead(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "image.raw")
+        self.data = os.urandom(0x4000)
+        with open(self.path, "wb") as image:
+            image.write(self.data)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def check_reads(self, layer):
+        self.assertEqual(layer.read(0x100, 0x20), self.data[0x100:0x120])
+        self.assertIsInstance(layer.read(0x100, 0x20), bytes)
+        self.assertEqual(bytes(layer.read_view(0x100, 0x20)), self.data[0x100:0x120])
+        self.assertIsInstance(layer.read_view(0x100, 0x20), memoryview)
+
+    def test_memory_mapped_reads(self):
+        self.check_reads(file_layer(self.path))
+
+    def test_unmapped_reads_are_not_copied(self):
+        layer = file_layer(self.path)
+        layer._use_mmap = False
+        self.check_reads(layer)
+        with mock.patch.object(layer, "read_view") as read_view:
+            layer.read(0, 0x10)
+        read_view.assert_not_called()
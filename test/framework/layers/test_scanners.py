@@ -0,0 +1,110 @@
+import random
+import unittest
+from unittest import mock
+
+from volatility3.framework.layers import scanners
+from volatility3.framework.layers.scanners import ahocorasick
+
+
+def regex_scanner(patterns):
+    """Returns a multi-string scanner that is forced to use a regular expression"""
+    with mock.patch.object(
+        scanners.MultiStringScanner, "accelerated_threshold", len(patterns) + 1
+    ), mock.patch.object(
+        scanners.MultiStringScanner, "automaton_threshold", len(patterns) + 1
+    ):
+        scanner = scanners.MultiStringScanner(patterns)
+    assert scanner._automaton is None
+    return scanner
+
+
+def automaton(patterns, accelerated: bool) -> ahocorasick.AhoCorasick:
+    result = ahocorasick.AhoCorasick(accelerated=accelerated)
+    for pattern in patterns:
+        result.add_pattern(pattern)
+    result.preprocess()
+    return result
+
+
+class TestAhoCorasick(unittest.TestCase):
+    accelerated = False
+
+    def setUp(self):
+        if self.accelerated and not ahocorasick.HAS_PYAHOCORASICK:
+            self.skipTest("pyahocorasick is not installed")
+
+    def assert_matches_regex(self, patterns, haystack):
+        expected = list(regex_scanner(patterns).search(haystack))
+        found = list(automaton(patterns, self.accelerated).search(haystack))
+        self.assertEqual(found, expected)
+
+    def test_prefixes_and_overlaps(self):
+        patterns = [b"he", b"she", b"his", b"hers", b"h", b"ushe"]
+        self.assert_matches_regex(patterns, b"ushers hishe shehers h")
+
+    def test_failed_longer_match(self):
+        # A longer pattern fails part way, leaving shorter matches behind it
+        self.assert_matches_regex([b"abcd", b"bc", b"c"], b"abcabcdbcc")
+
+    def test_no_matches(self):
+        self.assert_matches_regex([b"needle", b"pin"], b"haystack" * 10)
+        self.assertEqual(
+            list(automaton([b"needle"], self.accelerated).search(memoryview(b"x"))),
+            [],
+        )
+
+    def test_random_patterns(self):
+        generator = random.Random(1234)
+        for _ in range(50):
+            patterns = list(
+                {
+                    bytes(generator.choices(b"abc\x00\xff", k=generator.randint(1, 5)))
+                    for _ in range(generator.randint(1, 40))
+                }
+            )
+            haystack = bytes(generator.choices(b"abc\x00\xff", k=500))
+            self.assert_matches_regex(patterns, haystack)
+
+    def test_matches_across_blocks(self):
+        generator = random.Random(5678)
+        patterns = [b"abcab", b"bca", b"ca", b"a\xff\x00"]
+        haystack = bytes(generator.choices(b"abc\x00\xff", k=300))
+        with mock.patch.object(ahocorasick.AhoCorasick, "_block_size", 7):
+            self.assert_matches_regex(patterns, haystack)
+
+    def test_matches_are_yielded_lazily(self):
+        haystack = b"needle" + b"\x00" * 0x40000 + b"needle"
+        search = automaton([b"needle", b"needles"], self.accelerated).search(haystack)
+        self.assertEqual(next(search), (0, b"needle"))
+        self.assertEqual(list(search), [(0x40006, b"needle")])
+
+    def test_invalid_use(self):
+        with self.assertRaises(ValueError):
+            ahocorasick.AhoCorasick().add_pattern(b"")
+        with self.assertRaises(ValueError):
+            list(ahocorasick.AhoCorasick(self.accelerated).search(b"data"))
+        with self.assertRaises(TypeError):
+            list(automaton([b"a"], self.accelerated).search("data"))
+
+
+class TestAcceleratedAhoCorasick(TestAhoCorasick):
+    accelerated = True
+
+
+class TestMultiStringScanner(unittest.TestCase):
+    def test_large_pattern_sets_use_automaton(self):
+        patterns = [b"pattern%04d" % index for index in range(300)]
+        scanner = scanners.MultiStringScanner(patterns)
+        self.assertIsNotNone(scanner._automaton)
+        data = b"..pattern0001..pattern0299pattern0042"
+        self.assertEqual(
+            list(scanner(data, 0x1000)),
+            [
+                (0x1002, b"pattern0001"),
+                (0x100F, b"pattern0299"),
+                (0x101A, b"pattern0042"),
+            ],
+        )
+        self.assertEqual(
+            list(scanner.search(data)), list(regex_scanner(patterns).search(data))
+        )
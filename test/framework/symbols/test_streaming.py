@@ -0,0 +1,166 @@
+import io
+import json
+import unittest
+
+from volatility3.framework.symbols import streaming
+
+DOCUMENT = {
+    "metadata": {"format": "6.2.0", "producer": {"name": "dwarf2json"}},
+    "base_types": {
+        "int": {"kind": "int", "size": 4, "signed": True, "endian": "little"},
+        "pointer": {"kind": "int", "size": 8, "signed": False, "endian": "little"},
+    },
+    "user_types": {
+        "task_struct": {
+            "kind": "struct",
+            "size": 9792,
+            "fields": {
+                "pid": {"offset": 2456, "type": {"kind": "base", "name": "int"}},
+                "comm": {
+                    "offset": 2984,
+                    "type": {
+                        "kind": "array",
+                        "count": 16,
+                        "subtype": {"kind": "base", "name": "char"},
+                    },
+                },
+            },
+        },
+        "empty": {"kind": "struct", "size": 0, "fields": {}},
+    },
+    "enums": {"state": {"size": 4, "base": "int", "constants": {"A": -1, "B": 2}}},
+    "symbols": {
+        "linux_banner": {
+            "address": 18446744071600000000,
+            "constant_data": "TGludXggdmVyc2lvbg==",
+        },
+        "unicode_é中\U0001f600": {"address": 1.5e-3, "type": None},
+        'escaped_"\\/\n\t': {"address": 12345678901234567890123, "list": [True]},
+    },
+}
+
+
+class ShortReader:
+    """Returns at most chunk_size bytes from each read"""
+
+    def __init__(self, data: bytes, chunk_size: int):
+        self._data = io.BytesIO(data)
+        self._chunk_size = chunk_size
+
+    def read(self, size=-1):
+        return self._data.read(min(self._chunk_size, size if size >= 0 else 1 << 30))
+
+
+def encodings(document):
+    yield json.dumps(document).encode("utf-8")
+    yield json.dumps(document, indent=2, ensure_ascii=False).encode("utf-8")
+    yield json.dumps(document, separators=(",", ":")).encode("utf-8")
+
+
+class TestJSONStream(unittest.TestCase):
+    chunk_sizes = [1, 2, 3, 7, 64, 0x100000]
+
+    def test_read_value_matches_json_load(self):
+        for data in encodings(DOCUMENT):
+            for chunk_size in self.chunk_sizes:
+                with self.subTest(chunk_size=chunk_size, length=len(data)):
+                    stream = streaming.JSONStream(io.BytesIO(data), chunk_size)
+                    self.assertEqual(stream.read_value(), json.loads(data))
+                    self.assertEqual(stream.peek(), "")
+
+    def test_members_yield_every_name(self):
+        for data in encodings(DOCUMENT):
+            for chunk_size in self.chunk_sizes:
+                with self.subTest(chunk_size=chunk_size, length=len(data)):
+                    stream = streaming.JSONStream(io.BytesIO(data), chunk_size)
+                    result = {}
+                    for name in stream.members():
+                        result[name] = stream.read_value()
+                    self.assertEqual(result, DOCUMENT)
+
+    def test_numbers_split_across_chunks(self):
+        for text in ["1234567890", "-0.5e+10", "98765432109876543210"]:
+            data = f'{{"value": {text}}}'.encode()
+            for chunk_size in range(1, len(data) + 1):
+                with self.subTest(text=text, chunk_size=chunk_size):
+                    stream = streaming.JSONStream(io.BytesIO(data), chunk_size)
+                    for name in stream.members():
+                        self.assertEqual(name, "value")
+                        self.assertEqual(stream.read_value(), json.loads(text))
+
+    def test_truncated_document_raises(self):
+        data = json.dumps(DOCUMENT).encode()[:-10]
+        for chunk_size in self.chunk_sizes:
+            with self.subTest(chunk_size=chunk_size):
+                stream = streaming.JSONStream(io.BytesIO(data), chunk_size)
+                with self.assertRaises(ValueError):
+                    stream.read_value()
+
+
+class TestReadSections(unittest.TestCase):
+    chunk_sizes = [1, 2, 5, 64, 0x100000]
+
+    def read_sections(self, data, chunk_size, wanted, count_entries=False):
+        return streaming.read_sections(
+            ShortReader(data, chunk_size),
+            wanted,
+            count_entries=count_entries,
+        )
+
+    def test_whole_sections(self):
+        wanted = {"metadata": None, "user_types": None, "symbols": None}
+        for data in encodings(DOCUMENT):
+            for chunk_size in self.chunk_sizes:
+                with self.subTest(chunk_size=chunk_size, length=len(data)):
+                    result, counts = self.read_sections(data, chunk_size, wanted)
+                    self.assertEqual(
+                        result, {section: DOCUMENT[section] for section in wanted}
+                    )
+                    self.assertEqual(counts, {})
+
+    def test_selected_entries(self):
+        wanted = {
+            "symbols": ["linux_banner", "unicode_é中\U0001f600", "missing"],
+            "enums": None,
+        }
+        expected = {
+            "symbols": {
+                name: DOCUMENT["symbols"][name]
+                for name in wanted["symbols"]
+                if name in DOCUMENT["symbols"]
+            },
+            "enums": DOCUMENT["enums"],
+        }
+        for data in encodings(DOCUMENT):
+            for chunk_size in self.chunk_sizes:
+                with self.subTest(chunk_size=chunk_size, length=len(data)):
+                    result, _ = self.read_sections(data, chunk_size, wanted)
+                    self.assertEqual(result, expected)
+
+    def test_count_entries(self):
+        wanted = {"metadata": None, "symbols": ["linux_banner"]}
+        expected_counts = {
+            section: len(DOCUMENT[section])
+            for section in ("metadata", "base_types", "user_types", "enums", "symbols")
+        }
+        for data in encodings(DOCUMENT):
+            for chunk_size in self.chunk_sizes:
+                with self.subTest(chunk_size=chunk_size, length=len(data)):
+                    result, counts = self.read_sections(
+                        data, chunk_size, wanted, count_entries=True
+                    )
+                    self.assertEqual(
+                        result,
+                        {
+                            "metadata": DOCUMENT["metadata"],
+                            "symbols": {
+                                "linux_banner": DOCUMENT["symbols"]["linux_banner"]
+                            },
+                        },
+                    )
+                    self.assertEqual(counts, expected_counts)
+
+    def test_stops_reading_once_found(self):
+        data = json.dumps({"metadata": {"format": "6.2.0"}}).encode()[:-1] + b", ["
+        result, _ = streaming.read_sections(io.BytesIO(data), {"metadata": None})
+        self.assertEqual(result, {"metadata": {"format": "6.2.0"}})
@@ -0,0 +1,118 @@
+import json
+import os
+import pathlib
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from volatility3 import schemas
+from volatility3.framework import constants
+from volatility3.framework.symbols import compiled, intermed, validations
+
+
+class TestValidations(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        patcher = mock.patch.object(constants, "CACHE_PATH", self.directory.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.isf_path = os.path.join(self.directory.name, "table.json")
+        with open(self.isf_path, "w") as isf:
+            isf.write("{}")
+        self.isf_url = pathlib.Path(self.isf_path).as_uri()
+
+    def tearDown(self):
+        if validations._connection is not None:
+            validations._connection[2].close()
+            validations._connection = None
+        self.directory.cleanup()
+
+    def test_record_validation(self):
+        file_hash = validations.get_file_hash(self.isf_url)
+        self.assertEqual(file_hash, validations.hash_file(self.isf_url))
+        self.assertFalse(validations.is_validated(file_hash))
+        validations.record_validation(file_hash)
+        self.assertTrue(validations.is_validated(file_hash))
+
+    def test_unchanged_files_are_not_rehashed(self):
+        with mock.patch.object(
+            validations, "hash_file", wraps=validations.hash_file
+        ) as hash_file:
+            file_hash = validations.get_file_hash(self.isf_url)
+            self.assertEqual(validations.get_file_hash(self.isf_url), file_hash)
+            hash_file.assert_called_once()
+            with open(self.isf_path, "w") as isf:
+                isf.write('{"changed": true}')
+            self.assertNotEqual(validations.get_file_hash(self.isf_url), file_hash)
+            self.assertEqual(hash_file.call_count, 2)
+
+    def test_unchecked_validation(self):
+        file_hash = validations.get_file_hash(self.isf_url)
+        with mock.patch.object(schemas, "validation_available", return_value=False):
+            validations.record_validation(file_hash)
+            self.assertTrue(validations.is_validated(file_hash))
+        # Once validation is available, files accepted without it must be checked
+        with mock.patch.object(schemas, "validation_available", return_value=True):
+            self.assertFalse(validations.is_validated(file_hash))
+            validations.record_validation(file_hash)
+        with mock.patch.object(schemas, "validation_available", return_value=False):
+            self.assertTrue(validations.is_validated(file_hash))
+
+    def test_compiled_isf_used_without_jsonschema(self):
+        isf = {
+            "metadata": {"format": "6.2.0"},
+            "symbols": {"banner": {"address": 0x1000}},
+            "enums": {},
+            "base_types": {},
+            "user_types": {},
+        }
+        with open(self.isf_path, "w") as isf_file:
+            json.dump(isf, isf_file)
+        with mock.patch.dict(sys.modules, {"jsonschema": None}), mock.patch.object(
+            constants, "COMPILED_ISF_MINIMUM_SIZE", 0
+        ), mock.patch.object(
+            compiled.CompiledISF, "open", wraps=compiled.CompiledISF.open
+        ) as open_compiled:
+            self.assertFalse(schemas.validation_available())
+            first = intermed.IntermediateSymbolTable._load_json(self.isf_url, True)
+            open_compiled.assert_not_called()
+            second = intermed.IntermediateSymbolTable._load_json(self.isf_url, True)
+        open_compiled.assert_called_once()
+        self.assertIsInstance(second, compiled.CompiledISF)
+        self.assertEqual(second["symbols"], first["symbols"])
+
+    def test_connection_is_shared(self):
+        validations.is_validated("0" * 64)
+        database = validations._database()
+        validations.is_validated("0" * 64)
+        self.assertIs(validations._database(), database)
+
+    def test_connection_follows_cache_path(self):
+        database = validations._database()
+        with tempfile.TemporaryDirectory() as other:
+            with mock.patch.object(constants, "CACHE_PATH", other):
+                self.assertIsNot(validations._database(), database)
+                validations._connection[2].close()
+                validations._connection = None
+
+    def test_non_local_files_have_no_hash(self):
+        self.assertIsNone(validations.get_file_hash("https://example.com/table.json"))
+        self.assertIsNone(
+            validations.get_file_hash(pathlib.Path(self.isf_path + ".missing").as_uri())
+        )
+
+    def test_intermed_does_not_import_automagic(self):
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys; import volatility3.framework.symbols.intermed; "
+                "print('volatility3.framework.automagic' in sys.modules)",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(result.stdout.strip(), "False")
@@ -0,0 +1,107 @@
+import gc
+import unittest
+import weakref
+
+from volatility3.framework import contexts
+from volatility3.framework.layers import physical
+from volatility3.framework.symbols.windows import extensions
+
+
+def record(offset, start, end):
+    return extensions.VadRecord(
+        offset=offset,
+        type_name="nt!_MMVAD_SHORT",
+        start=start,
+        end=end,
+        protection=None,
+        tag=None,
+        file_pointer=None,
+        commit_charge=None,
+    )
+
+
+RECORDS = [
+    record(0x100, 0x10000, 0x1FFFF),
+    record(0x200, 0x2000, 0x2FFF),
+    record(0x300, 0x1000, 0x1FFF),
+    record(0x400, 0x11000, 0x11FFF),
+    record(0x500, None, 0x50000),
+    record(0x600, 0x40000, 0x40000),
+    record(0x700, 0x30000, None),
+]
+
+
+def make_index(records=RECORDS):
+    return extensions.VadIndex(contexts.Context(), "layer", "layer", records)
+
+
+def expected_record(records, address):
+    """The VAD starting closest below an address that contains it, found by checking each record"""
+    containing = [
+        vad
+        for vad in records
+        if vad.start is not None
+        and vad.end is not None
+        and vad.start <= address <= vad.end
+    ]
+    if not containing:
+        return None
+    return max(containing, key=lambda vad: vad.start)
+
+
+class TestVadIndex(unittest.TestCase):
+    def test_matches_linear_search(self):
+        index = make_index()
+        boundaries = {0}
+        for vad in RECORDS:
+            for point in (vad.start, vad.end):
+                if point is not None:
+                    boundaries.update((point - 1, point, point + 1))
+        for address in sorted(boundaries):
+            with self.subTest(address=hex(address)):
+                self.assertEqual(index.find(address), expected_record(RECORDS, address))
+
+    def test_boundaries_are_inclusive(self):
+        index = make_index()
+        self.assertEqual(index.find(0x1000).offset, 0x300)
+        self.assertEqual(index.find(0x1FFF).offset, 0x300)
+        self.assertEqual(index.find(0x2000).offset, 0x200)
+        self.assertEqual(index.find(0x40000).offset, 0x600)
+        self.assertIsNone(index.find(0xFFF))
+        self.assertIsNone(index.find(0x3000))
+        self.assertIsNone(index.find(0x40001))
+
+    def test_nested_vads(self):
+        index = make_index()
+        self.assertEqual(index.find(0x11000).offset, 0x400)
+        self.assertEqual(index.find(0x12000).offset, 0x100)
+        self.assertEqual(index.find(0x1FFFF).offset, 0x100)
+
+    def test_incomplete_records_are_not_indexed(self):
+        index = make_index()
+        self.assertEqual(len(index), len(RECORDS))
+        self.assertIsNone(index.find(0x30000))
+        self.assertIsNone(index.find(0x4FFFF))
+
+    def test_empty_index(self):
+        self.assertIsNone(make_index([]).find(0x1000))
+
+
+class TestVadIndexCache(unittest.TestCase):
+    def test_cached_index_does_not_keep_layer_alive(self):
+        context = contexts.Context()
+        layer = physical.BufferDataLayer(context, "buffer", "memory", b"\x00" * 0x10)
+        context.add_layer(layer)
+        extensions.EPROCESS._vad_indices.setdefault(layer, {})[("nt!_EPROCESS", 0)] = (
+            extensions.VadIndex(context, "memory", "memory", RECORDS)
+        )
+        layer_ref = weakref.ref(layer)
+        del context, layer
+        gc.collect()
+        self.assertIsNone(layer_ref())
+
+    def test_index_outliving_context(self):
+        index = make_index()
+        gc.collect()
+        with self.assertRaises(ReferenceError):
+            index.get_vad(RECORDS[0])
@@ -0,0 +1,302 @@
+import copy
+import math
+import os
+import pathlib
+import struct
+import tempfile
+import unittest
+
+from volatility3.framework import contexts
+from volatility3.framework.symbols.windows import pdbconv
+
+PAGE_SIZE = 0x100
+GUID = bytes(range(16))
+
+
+def record(leaf_type: int, body: bytes) -> bytes:
+    return struct.pack("<HH", len(body) + 2, leaf_type) + body
+
+
+def structure(name: bytes, fields: int, size: int, forward: bool = False) -> bytes:
+    properties = pdbconv.FORWARD_REFERENCE if forward else 0
+    body = struct.pack("<HHIIIH", 0, properties, fields, 0, 0, size)
+    return record(pdbconv.LeafType.LF_STRUCTURE, body + name + b"\x00")
+
+
+def member(name: bytes, field_type: int, offset: int) -> bytes:
+    data = struct.pack("<HHIH", pdbconv.LeafType.LF_MEMBER, 3, field_type, offset)
+    data += name + b"\x00"
+    # Fields are padded to four bytes, with the padding marked by the number of bytes remaining
+    padding = -len(data) % 4
+    return data + bytes(0xF0 + remaining for remaining in range(padding, 0, -1))
+
+
+def enumerate_value(name: bytes, value: int) -> bytes:
+    data = struct.pack("<HHH", pdbconv.LeafType.LF_ENUMERATE, 3, value)
+    return data + name + b"\x00"
+
+
+# The type records, from type index 0x1000 onwards
+TYPES = [
+    # 0x1000: A forward reference to the element of an array, at the very first type index
+    structure(b"_ELEMENT", 0, 0, forward=True),
+    # 0x1001: An array of three forward referenced elements
+    record(pdbconv.LeafType.LF_ARRAY, struct.pack("<IIH", 0x1000, 0x23, 48) + b"\x00"),
+    # 0x1002
+    record(
+        pdbconv.LeafType.LF_FIELDLIST,
+        member(b"Value", 0x23, 0) + member(b"Count", 0x75, 8),
+    ),
+    # 0x1003
+    structure(b"_ELEMENT", 0x1002, 16),
+    # 0x1004: A 64-bit pointer to an element
+    record(pdbconv.LeafType.LF_POINTER, struct.pack("<II", 0x1003, 0x0C | 8 << 13)),
+    # 0x1005
+    record(pdbconv.LeafType.LF_BITFIELD, struct.pack("<IBB", 0x75, 3, 1)),
+    # 0x1006
+    record(
+        pdbconv.LeafType.LF_FIELDLIST,
+        enumerate_value(b"KindA", 0) + enumerate_value(b"KindB", 5),
+    ),
+    # 0x1007
+    record(
+        pdbconv.LeafType.LF_ENUM,
+        struct.pack("<HHII", 2, 0, 0x74, 0x1006) + b"_KIND\x00",
+    ),
+    # 0x1008
+    record(
+        pdbconv.LeafType.LF_FIELDLIST,
+        member(b"Elements", 0x1001, 0)
+        + member(b"Next", 0x1004, 48)
+        + member(b"Flags", 0x1005, 56)
+        + member(b"Kind", 0x1007, 60),
+    ),
+    # 0x1009
+    structure(b"_CONTAINER", 0x1008, 64),
+    # 0x100a: A structure that nothing refers to
+    record(pdbconv.LeafType.LF_FIELDLIST, member(b"Unused", 0x74, 0)),
+    # 0x100b
+    structure(b"_UNRELATED", 0x100A, 4),
+]
+
+SECTIONS = [0x1000, 0x5000]
+
+# Public symbols, as (name, segment, offset)
+SYMBOLS = [
+    (b"_KiSystemCall64", 1, 0x10),
+    (b"LastSectionSymbol", 2, 0x20),
+    (b"NoSectionSymbol", 3, 0x30),
+]
+
+ISF_TYPES = {
+    "user_types": {
+        "_ELEMENT": {
+            "kind": "struct",
+            "size": 16,
+            "fields": {
+                "Value": {
+                    "offset": 0,
+                    "type": {"kind": "base", "name": "unsigned long long"},
+                },
+                "Count": {
+                    "offset": 8,
+                    "type": {"kind": "base", "name": "unsigned int"},
+                },
+            },
+        },
+        "_CONTAINER": {
+            "kind": "struct",
+            "size": 64,
+            "fields": {
+                "Elements": {
+                    "offset": 0,
+                    "type": {
+                        "count": 3,
+                        "kind": "array",
+                        "subtype": {"kind": "struct", "name": "_ELEMENT"},
+                    },
+                },
+                "Next": {
+                    "offset": 48,
+                    "type": {
+                        "kind": "pointer",
+                        "subtype": {"kind": "struct", "name": "_ELEMENT"},
+                    },
+                },
+                "Flags": {
+                    "offset": 56,
+                    "type": {
+                        "kind": "bitfield",
+                        "type": {"kind": "base", "name": "unsigned int"},
+                        "bit_length": 3,
+                        "bit_position": 1,
+                    },
+                },
+                "Kind": {"offset": 60, "type": {"kind": "enum", "name": "_KIND"}},
+            },
+        },
+        "_UNRELATED": {
+            "kind": "struct",
+            "size": 4,
+            "fields": {
+                "Unused": {"offset": 0, "type": {"kind": "base", "name": "int"}}
+            },
+        },
+    },
+    "enums": {
+        "_KIND": {"base": "int", "size": 4, "constants": {"KindA": 0, "KindB": 5}}
+    },
+    "base_types": {
+        "unsigned long long": {
+            "endian": "little",
+            "kind": "int",
+            "signed": False,
+            "size": 8,
+        },
+        "unsigned int": {"endian": "little", "kind": "int", "signed": False, "size": 4},
+        "int": {"endian": "little", "kind": "int", "signed": True, "size": 4},
+        "pointer": {"endian": "little", "kind": "int", "signed": False, "size": 8},
+    },
+    "symbols": {
+        "KiSystemCall64": {"address": 0x1010, "linkage_name": "_KiSystemCall64"},
+        "LastSectionSymbol": {"address": 0x5020},
+    },
+}
+
+ISF_METADATA = {
+    "format": "6.1.0",
+    "windows": {
+        "pdb": {
+            "GUID": "030201000504070608090A0B0C0D0E0F",
+            "age": 2,
+            "database": "synthetic.pdb",
+            "machine_type": 0x8664,
+        }
+    },
+}
+
+
+def tpi_stream() -> bytes:
+    data = b"".join(TYPES)
+    header = struct.pack("<4I", 20040203, 56, 0x1000, 0x1000 + len(TYPES))
+    return header + struct.pack("<I", len(data)).ljust(56 - len(header), b"\x00") + data
+
+
+def dbi_stream(symrec_stream: int, section_stream: int) -> bytes:
+    header = bytearray(64)
+    struct.pack_into("<I", header, 8, 2)
+    struct.pack_into("<H", header, 20, symrec_stream)
+    struct.pack_into("<H", header, 58, 0x8664)
+    debug_streams = [-1] * 11
+    debug_streams[5] = section_stream
+    return bytes(header) + struct.pack("<11h", *debug_streams)
+
+
+def section_stream() -> bytes:
+    return b"".join(
+        struct.pack("<8sII24s", b".text", 0x1000, address, b"") for address in SECTIONS
+    )
+
+
+def symbol_stream() -> bytes:
+    data = b""
+    for name, segment, offset in SYMBOLS:
+        body = struct.pack("<HIIH", 0x110E, 0, offset, segment) + name + b"\x00"
+        data += struct.pack("<H", len(body)) + body
+    return data
+
+
+def msf_file(streams) -> bytes:
+    """Lays out streams within a MultiStream Format 7.00 file"""
+    pages = [b""]
+    directory = struct.pack("<I", len(streams))
+    directory += b"".join(struct.pack("<I", len(stream)) for stream in streams)
+    for stream in streams:
+        # Each stream's pages are laid out in reverse, so that they are not contiguous
+        stream_pages = [
+            stream[start : start + PAGE_SIZE]
+            for start in range(0, len(stream), PAGE_SIZE)
+        ]
+        first_page = len(pages)
+        for index in range(len(stream_pages)):
+            directory += struct.pack("<I", first_page + len(stream_pages) - 1 - index)
+        pages.extend(reversed(stream_pages))
+    directory_pages = []
+    for start in range(0, len(directory), PAGE_SIZE):
+        directory_pages.append(len(pages))
+        pages.append(directory[start : start + PAGE_SIZE])
+    index_page = len(pages)
+    pages.append(struct.pack(f"<{len(directory_pages)}I", *directory_pages))
+    header = b"Microsoft C/C++ MSF 7.00\r\n\x1a\x44\x53\x00\x00\x00"
+    header += struct.pack(
+        "<5I", PAGE_SIZE, 1, len(pages), len(directory), 0
+    ) + struct.pack("<I", index_page)
+    pages[0] = header
+    return b"".join(page.ljust(PAGE_SIZE, b"\x00") for page in pages)
+
+
+def synthetic_pdb() -> bytes:
+    pdb_info = struct.pack("<III", 20000404, 0, 2) + GUID
+    streams = [
+        b"",
+        pdb_info,
+        tpi_stream(),
+        dbi_stream(5, 6),
+        b"",
+        symbol_stream(),
+        section_stream(),
+    ]
+    return msf_file(streams)
+
+
+class TestPdbReader(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        path = os.path.join(self.directory.name, "synthetic.pdb")
+        with open(path, "wb") as pdb:
+            pdb.write(synthetic_pdb())
+        self.location = pathlib.Path(path).as_uri()
+
+    def convert(self, type_names=None):
+        reader = pdbconv.PdbReader(
+            contexts.Context(),
+            self.location,
+            database_name="synthetic.pdb",
+            type_names=type_names,
+        )
+        json_output = reader.get_json()
+        producer = json_output["metadata"].pop("producer")
+        self.assertEqual(producer["name"], "volatility3")
+        return json_output
+
+    def test_multi_stream_file(self):
+        pdb = pdbconv.MultiStreamFile(self.location, synthetic_pdb())
+        self.assertEqual(len(pdb), 7)
+        self.assertEqual(pdb.stream(6), section_stream())
+        self.assertIsNone(pdb.stream(4))
+        self.assertIsNone(pdb.stream(7))
+        # The type stream spans several (reversed) pages
+        self.assertGreater(math.ceil(len(tpi_stream()) / PAGE_SIZE), 1)
+        self.assertEqual(pdb.stream(2), tpi_stream())
+
+    def test_conversion(self):
+        expected = dict(ISF_TYPES, metadata=ISF_METADATA)
+        self.assertEqual(self.convert(), expected)
+
+    def test_forward_referenced_array_at_first_index(self):
+        elements = self.convert()["user_types"]["_CONTAINER"]["fields"]["Elements"]
+        self.assertEqual(elements["type"]["count"], 3)
+
+    def test_symbols_in_last_section(self):
+        symbols = self.convert()["symbols"]
+        self.assertEqual(symbols["LastSectionSymbol"], {"address": 0x5020})
+        self.assertNotIn("NoSectionSymbol", symbols)
+
+    def test_requested_types(self):
+        expected = copy.deepcopy(ISF_TYPES)
+        del expected["user_types"]["_UNRELATED"]
+        json_output = self.convert(["_CONTAINER"])
+        self.assertEqual(json_output["user_types"], expected["user_types"])
+        self.assertEqual(json_output["enums"], expected["enums"])
+        self.assertEqual(json_output["base_types"], expected["base_types"])
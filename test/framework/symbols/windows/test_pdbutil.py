@@ -0,0 +1,81 @@
+import multiprocessing
+import unittest
+from unittest import mock
+
+from volatility3 import symbols
+from volatility3.framework import constants, contexts
+from volatility3.framework.symbols.windows import pdbutil
+
+PDB = ("0123456789ABCDEF0123456789ABCDEF", 1, "ntkrnlmp.pdb")
+
+
+def _worker_settings(_):
+    return (
+        constants.WINDOWS_SYMBOL_SERVERS,
+        constants.OFFLINE,
+        constants.CACHE_PATH,
+        list(symbols.__path__),
+    )
+
+
+class TestDownloadPdbIsfs(unittest.TestCase):
+    def setUp(self):
+        for name, value in [
+            ("_open_cache", None),
+            ("_find_isf", None),
+            ("download_pdb_isf", False),
+        ]:
+            patcher = mock.patch.object(pdbutil.PDBUtility, name, return_value=value)
+            setattr(self, name, patcher.start())
+            self.addCleanup(patcher.stop)
+
+    def test_batch_requests_each_pdb_once(self):
+        other = (PDB[0].lower(), PDB[1], PDB[2] + "\x00")
+        locations = pdbutil.PDBUtility.download_pdb_isfs(
+            contexts.Context(), [PDB, other, PDB]
+        )
+        self.assertEqual(locations, {PDB: None})
+        self.assertEqual(self.download_pdb_isf.call_count, 1)
+
+    def test_unavailable_pdbs_are_retried_by_later_batches(self):
+        context = contexts.Context()
+        pdbutil.PDBUtility.download_pdb_isfs(context, [PDB])
+        self.download_pdb_isf.return_value = True
+        self._find_isf.side_effect = [None, "file:///ntkrnlmp.json.xz"]
+        locations = pdbutil.PDBUtility.download_pdb_isfs(context, [PDB])
+        self.assertEqual(locations, {PDB: "file:///ntkrnlmp.json.xz"})
+        self.assertEqual(self.download_pdb_isf.call_count, 2)
+
+
+class TestDownloadWorkers(unittest.TestCase):
+    def test_spawned_workers_receive_settings(self):
+        settings = {
+            "symbol_servers": ["http://symbols.invalid/store"],
+            "offline": True,
+            "cache_path": "/nonexistent/cache",
+            "symbol_paths": ["/nonexistent/symbols"],
+        }
+        with multiprocessing.get_context("spawn").Pool(
+            1, initializer=pdbutil._download_pdb_isf_initializer, initargs=(settings,)
+        ) as pool:
+            result = pool.map(_worker_settings, [None])[0]
+        self.assertEqual(
+            result,
+            (
+                settings["symbol_servers"],
+                settings["offline"],
+                settings["cache_path"],
+                settings["symbol_paths"],
+            ),
+        )
+
+    def test_settings_reflect_runtime_changes(self):
+        with mock.patch.object(
+            constants, "WINDOWS_SYMBOL_SERVERS", ["http://mirror.invalid"]
+        ), mock.patch.object(constants, "OFFLINE", True), mock.patch.object(
+            symbols, "__path__", ["/nonexistent/symbols"]
+        ):
+            settings = pdbutil._download_settings()
+        self.assertEqual(settings["symbol_servers"], ["http://mirror.invalid"])
+        self.assertTrue(settings["offline"])
+        self.assertEqual(settings["symbol_paths"], ["/nonexistent/symbols"])
@@ -33,7 +33,7 @@ from volatility3.cli import text_filter
 import volatility3.plugins
 import volatility3.symbols
 from volatility3 import framework
-from volatility3.cli import text_renderer, volargparse
+from volatility3.cli import manifest, text_renderer, volargparse
 from volatility3.framework import (
     automagic,
     configuration,
@@ -43,7 +43,7 @@ from volatility3.framework import (
     interfaces,
     plugins,
 )
-from volatility3.framework.automagic import stacker
+from volatility3.framework.automagic import stacker, symbol_cache
 from volatility3.framework.configuration import requirements
 
 # Make sure we log everything
@@ -229,12 +229,48 @@ class CommandLine:
             default=False,
             action="store_true",
         )
+        parser.add_argument(
+            "--update-symbol-cache-only",
+            help="Updates the symbol cache with any new, changed or removed symbol files, then exits",
+            default=False,
+            action="store_true",
+        )
         parser.add_argument(
             "--cache-path",
             help=f"Change the default path ({constants.CACHE_PATH}) used to store the cache",
             default=constants.CACHE_PATH,
             type=str,
         )
+        parser.add_argument(
+            "--cache-size",
+            help=f"Maximum amount of layer data to cache in memory, such as 512M or 2G (defaults to {constants.LAYER_CACHE_SIZE // (1024 * 1024)}M)",
+            default=constants.LAYER_CACHE_SIZE,
+            type=volargparse.size_argument,
+        )
+        parser.add_argument(
+            "--buffer-structures",
+            help="Read each structure whole, and decode its members from that data rather than reading them individually",
+            default=False,
+            action="store_true",
+        )
+        parser.add_argument(
+            "--intern-objects",
+            help="Share structures constructed with the same type at the same location, rather than constructing them afresh each time",
+            default=False,
+            action="store_true",
+        )
+        parser.add_argument(
+            "--scan-cache",
+            help="Store the results of scans in the cache, and replay them when the same image is scanned again",
+            default=False,
+            action="store_true",
+        )
+        parser.add_argument(
+            "--session-cache",
+            help="Store the configuration automagic found for each image in the cache, and restore it when the same image is used again",
+            default=False,
+            action="store_true",
+        )
         isf_group = parser.add_mutually_exclusive_group()
         isf_group.add_argument(
             "--offline",
@@ -250,6 +286,13 @@ class CommandLine:
             default=constants.REMOTE_ISF_URL,
             type=str,
         )
+        parser.add_argument(
+            "--symbol-server",
+            metavar="URL",
+            help="Symbol server (or mirrored symbol store) to download missing PDB files from, may be given more than once",
+            default=[],
+            action="append",
+        )
         parser.add_argument(
             "--filters",
             help="List of filters to apply to the output (in the form of [+-]columname,pattern[!])",
@@ -328,16 +371,35 @@ class CommandLine:
         if partial_args.clear_cache:
             framework.clear_cache()
 
+        constants.LAYER_CACHE_SIZE = partial_args.cache_size
+        if partial_args.buffer_structures:
+            constants.AGGREGATE_BUFFERING = True
+        if partial_args.intern_objects:
+            constants.CACHE_OBJECTS = True
+        if partial_args.scan_cache:
+            constants.CACHE_SCAN_RESULTS = True
+        if partial_args.session_cache:
+            constants.CACHE_AUTOMAGIC_SESSIONS = True
+
         if partial_args.offline:
             constants.OFFLINE = partial_args.offline
         elif partial_args.remote_isf_url:
             constants.REMOTE_ISF_URL = partial_args.remote_isf_url
+        if partial_args.symbol_server:
+            constants.WINDOWS_SYMBOL_SERVERS = partial_args.symbol_server
+
+        if partial_args.update_symbol_cache_only:
+            self.update_symbol_cache(
+                MuteProgress() if partial_args.quiet else PrintedProgress()
+            )
+            return None
 
         # Do the initialization
         ctx = contexts.Context()  # Construct a blank context
-        failures = framework.import_files(
-            volatility3.plugins, True
+        plugin_manifest = manifest.PluginManifest(
+            volatility3.plugins
         )  # Will not log as console's default level is WARNING
+        failures = plugin_manifest.failures
         if failures:
             parser.epilog = (
                 "The following plugins could not be loaded (use -vv to see why): "
@@ -346,8 +408,6 @@ class CommandLine:
             vollog.info(parser.epilog)
         automagics = automagic.available(ctx)
 
-        plugin_list = framework.list_plugins()
-
         seen_automagics = set()
         chosen_configurables_list = {}
         for amagic in automagics:
@@ -366,13 +426,13 @@ class CommandLine:
             action=volargparse.HelpfulSubparserAction,
             metavar="PLUGIN",
         )
-        for plugin in sorted(plugin_list):
+        for plugin in plugin_manifest.plugins:
             plugin_parser = subparser.add_parser(
                 plugin,
-                help=plugin_list[plugin].__doc__,
-                description=plugin_list[plugin].__doc__,
+                help=plugin_manifest.description(plugin),
+                description=plugin_manifest.description(plugin),
             )
-            self.populate_requirements_argparse(plugin_parser, plugin_list[plugin])
+            manifest.add_arguments(plugin_parser, plugin_manifest.arguments(plugin))
 
         ###
         # PASS TO UI
@@ -394,7 +454,7 @@ class CommandLine:
             constants.LOGLEVEL_VVV, f"Cache directory used: {constants.CACHE_PATH}"
         )
 
-        plugin = plugin_list[args.plugin]
+        plugin = plugin_manifest.load_plugin(args.plugin)
         chosen_configurables_list[args.plugin] = plugin
         base_config_path = "plugins"
         plugin_config_path = interfaces.configuration.path_join(
@@ -505,6 +565,22 @@ class CommandLine:
                 renderer.render(grid)
         except exceptions.VolatilityException as excp:
             self.process_exceptions(excp)
+        vollog.debug(f"Layer read cache statistics: {ctx.layers.cache}")
+
+    def update_symbol_cache(self, progress_callback: PrintedProgress) -> None:
+        """Updates the symbol cache and reports the identifiers held within it"""
+        cache = symbol_cache.SqliteCache(
+            os.path.join(constants.CACHE_PATH, constants.IDENTIFIERS_FILENAME)
+        )
+        cache.update(progress_callback)
+        sys.stderr.write("\n")
+        for operating_system in constants.OS_CATEGORIES:
+            identifiers = [
+                identifier
+                for identifier in cache.get_identifiers(operating_system)
+                if identifier
+            ]
+            print(f"{operating_system}: {len(identifiers)} identifiers")
 
     @classmethod
     def location_from_file(cls, filename: str) -> str:
@@ -857,58 +933,7 @@ class CommandLine:
             parser: The parser to add the plugin's (simple) requirements to
             configurable: The plugin object to pull the requirements from
         """
-        if not issubclass(configurable, interfaces.configuration.ConfigurableInterface):
-            raise TypeError(
-                f"Expected ConfigurableInterface type, not: {type(configurable)}"
-            )
-
-        # Construct an argparse group
-
-        for requirement in configurable.get_requirements():
-            additional: Dict[str, Any] = {}
-            if not isinstance(
-                requirement, interfaces.configuration.RequirementInterface
-            ):
-                raise TypeError(
-                    "Plugin contains requirements that are not RequirementInterfaces: {}".format(
-                        configurable.__name__
-                    )
-                )
-            if isinstance(requirement, interfaces.configuration.SimpleTypeRequirement):
-                additional["type"] = requirement.instance_type
-                if isinstance(requirement, requirements.IntRequirement):
-                    additional["type"] = lambda x: int(x, 0)
-                if isinstance(requirement, requirements.BooleanRequirement):
-                    additional["action"] = "store_true"
-                    if "type" in additional:
-                        del additional["type"]
-            elif isinstance(
-                requirement,
-                volatility3.framework.configuration.requirements.ListRequirement,
-            ):
-                # Allow a list of integers, specified with the convenient 0x hexadecimal format
-                if requirement.element_type == int:
-                    additional["type"] = lambda x: int(x, 0)
-                else:
-                    additional["type"] = requirement.element_type
-                nargs = "*" if requirement.optional else "+"
-                additional["nargs"] = nargs
-            elif isinstance(
-                requirement,
-                volatility3.framework.configuration.requirements.ChoiceRequirement,
-            ):
-                additional["type"] = str
-                additional["choices"] = requirement.choices
-            else:
-                continue
-            parser.add_argument(
-                "--" + requirement.name.replace("_", "-"),
-                help=requirement.description,
-                default=requirement.default,
-                dest=requirement.name,
-                required=not requirement.optional,
-                **additional,
-            )
+        manifest.add_arguments(parser, manifest.describe_requirements(configurable))
 
 
 def main():
@@ -0,0 +1,290 @@
+# This file is Copyright 2024 Volatility Foundation and licensed under the Volatility Software License 1.0
+# which is available at https://www.volatilityfoundation.org/license/vsl-v1.0
+#
+"""Records the plugins available to the command line, so that the parser can
+be built without importing every plugin each time the command line starts.
+
+The manifest holds each plugin's module, class, description, version and the
+arguments its simple requirements add to the parser.  It is stored in the
+cache directory and is rebuilt (by importing every plugin) whenever any file
+on the plugin path changes, or a dependency that previously stopped a plugin
+from importing becomes available.  Only the module of the chosen plugin (and
+whatever that module imports itself) is then imported to run it.
+"""
+
+import argparse
+import importlib
+import importlib.util
+import json
+import logging
+import os
+import sys
+import tempfile
+from typing import Any, Dict, List, Optional, Type, Union
+
+from volatility3 import framework
+from volatility3.framework import constants, interfaces
+from volatility3.framework.configuration import requirements
+
+vollog = logging.getLogger(__name__)
+
+ARGUMENT_TYPES = {clazz.__name__: clazz for clazz in (bool, bytes, float, int, str)}
+"""Types that requirement arguments can have and still be recorded in the manifest"""
+
+
+def integer(value: str) -> int:
+    """Converts an argument into an integer, allowing for the 0x hexadecimal format"""
+    return int(value, 0)
+
+
+def describe_requirements(
+    configurable: Type[interfaces.configuration.ConfigurableInterface],
+) -> List[Dict[str, Any]]:
+    """Describes the arguments that a configurable's simple requirements add
+    to an argument parser.
+
+    Args:
+        configurable: The configurable class to pull the requirements from
+
+    Returns:
+        A list of argument descriptions, suitable for :func:`add_arguments`
+    """
+    if not issubclass(configurable, interfaces.configuration.ConfigurableInterface):
+        raise TypeError(
+            f"Expected ConfigurableInterface type, not: {type(configurable)}"
+        )
+
+    descriptions = []
+    for requirement in configurable.get_requirements():
+        if not isinstance(requirement, interfaces.configuration.RequirementInterface):
+            raise TypeError(
+                "Plugin contains requirements that are not RequirementInterfaces: {}".format(
+                    configurable.__name__
+                )
+            )
+        description: Dict[str, Any] = {
+            "name": requirement.name,
+            "description": requirement.description,
+            "default": requirement.default,
+            "optional": requirement.optional,
+        }
+        if isinstance(requirement, interfaces.configuration.SimpleTypeRequirement):
+            if isinstance(requirement, requirements.BooleanRequirement):
+                description["kind"] = "flag"
+            elif isinstance(requirement, requirements.IntRequirement):
+                description["kind"] = "integer"
+            else:
+                description["kind"] = "value"
+                description["type"] = _type_name(requirement.instance_type)
+        elif isinstance(requirement, requirements.ListRequirement):
+            description["kind"] = "list"
+            description["type"] = _type_name(requirement.element_type)
+        elif isinstance(requirement, requirements.ChoiceRequirement):
+            description["kind"] = "choice"
+            description["choices"] = requirement.choices
+        else:
+            continue
+        descriptions.append(description)
+    return descriptions
+
+
+def _type_name(clazz: Type) -> Union[str, Type]:
+    """Returns the name of a type that can be recorded, or the type itself if it cannot"""
+    if ARGUMENT_TYPES.get(getattr(clazz, "__name__", None)) is clazz:
+        return clazz.__name__
+    return clazz
+
+
+def add_arguments(
+    parser: Union[argparse.ArgumentParser, argparse._ArgumentGroup],
+    descriptions: List[Dict[str, Any]],
+) -> None:
+    """Adds the arguments produced by :func:`describe_requirements` to a parser"""
+    for description in descriptions:
+        additional: Dict[str, Any] = {}
+        argument_type = description.get("type")
+        if isinstance(argument_type, str):
+            argument_type = ARGUMENT_TYPES[argument_type]
+        kind = description["kind"]
+        if kind == "flag":
+            additional["action"] = "store_true"
+        elif kind == "integer":
+            additional["type"] = integer
+        elif kind == "value":
+            additional["type"] = argument_type
+        elif kind == "list":
+            # Allow a list of integers, specified with the convenient 0x hexadecimal format
+            additional["type"] = integer if argument_type == int else argument_type
+            additional["nargs"] = "*" if description["optional"] else "+"
+        elif kind == "choice":
+            additional["type"] = str
+            additional["choices"] = description["choices"]
+        parser.add_argument(
+            "--" + description["name"].replace("_", "-"),
+            help=description["description"],
+            default=description["default"],
+            dest=description["name"],
+            required=not description["optional"],
+            **additional,
+        )
+
+
+class PluginManifest:
+    """The plugins available beneath a plugin namespace module, recorded so
+    that they need not all be imported."""
+
+    def __init__(self, base_module) -> None:
+        self._base_module = base_module
+        self._plugins: Dict[str, Dict[str, Any]] = {}
+        self._failures: Dict[str, Optional[str]] = {}
+        self._imported = False
+
+        signature = self._signature()
+        if not (constants.CACHE_PLUGIN_MANIFEST and self._load(signature)):
+            self._build(signature)
+
+    @property
+    def plugins(self) -> List[str]:
+        """The names of all available plugins"""
+        return sorted(self._plugins)
+
+    @property
+    def failures(self) -> List[str]:
+        """The modules beneath the plugin namespace that could not be imported"""
+        return sorted(self._failures)
+
+    def description(self, name: str) -> Optional[str]:
+        """Returns the docstring of the named plugin"""
+        return self._plugins[name]["doc"]
+
+    def arguments(self, name: str) -> List[Dict[str, Any]]:
+        """Returns the argument descriptions of the named plugin, importing the
+        plugin if they could not be recorded in the manifest."""
+        arguments = self._plugins[name]["arguments"]
+        if arguments is None:
+            arguments = describe_requirements(self.load_plugin(name))
+        return arguments
+
+    def load_plugin(self, name: str) -> Type[interfaces.plugins.PluginInterface]:
+        """Imports and returns the named plugin, along with anything its module imports"""
+        entry = self._plugins[name]
+        try:
+            module = importlib.import_module(entry["module"])
+            plugin = getattr(module, entry["class"])
+            if issubclass(plugin, interfaces.plugins.PluginInterface):
+                return plugin
+        except (ImportError, AttributeError, TypeError) as excp:
+            vollog.debug(f"Unable to import {name} directly: {excp}")
+        # Plugins within zip files can only be found once their zip is on the path
+        self._import_all()
+        return framework.list_plugins()[name]
+
+    def _import_all(self) -> List[str]:
+        if not self._imported:
+            self._imported = True
+            return framework.import_files(self._base_module, True)
+        return []
+
+    def _signature(self) -> Dict[str, Any]:
+        """Identifies the plugin files (and the framework) the manifest was built from"""
+        files = {}
+        for path in self._base_module.__path__:
+            for root, _, filenames in os.walk(path, followlinks=True):
+                if root.endswith("__pycache__"):
+                    continue
+                for filename in filenames:
+                    full_path = os.path.join(root, filename)
+                    try:
+                        stat_result = os.stat(full_path)
+                    except OSError:
+                        continue
+                    files[full_path] = [stat_result.st_mtime_ns, stat_result.st_size]
+        return {
+            "version": constants.PACKAGE_VERSION,
+            "python": list(sys.version_info[:2]),
+            "paths": list(self._base_module.__path__),
+            "files": files,
+        }
+
+    def _filename(self) -> str:
+        return os.path.join(constants.CACHE_PATH, constants.PLUGIN_MANIFEST_FILENAME)
+
+    def _load(self, signature: Dict[str, Any]) -> bool:
+        """Loads the manifest from the cache, provided it matches the signature"""
+        try:
+            with open(self._filename()) as manifest_file:
+                manifest = json.load(manifest_file)
+        except (OSError, ValueError):
+            return False
+        if not isinstance(manifest, dict) or manifest.get("signature") != signature:
+            vollog.log(constants.LOGLEVEL_VVV, "Plugin manifest is out of date")
+            return False
+        for module_name, dependency in manifest["failures"].items():
+            if dependency and self._importable(dependency):
+                vollog.log(
+                    constants.LOGLEVEL_VVV,
+                    f"Dependency {dependency} of {module_name} is now available",
+                )
+                return False
+        self._plugins = manifest["plugins"]
+        self._failures = manifest["failures"]
+        return True
+
+    @staticmethod
+    def _importable(module_name: str) -> bool:
+        try:
+            return importlib.util.find_spec(module_name) is not None
+        except (ImportError, ValueError):
+            return False
+
+    def _build(self, signature: Dict[str, Any]) -> None:
+        """Imports every plugin to record it, then stores the manifest in the cache"""
+        vollog.log(constants.LOGLEVEL_VVV, "Building plugin manifest")
+        for module_name in self._import_all():
+            # Retry the import to find out which dependency (if any) was missing
+            try:
+                importlib.import_module(module_name)
+            except ImportError as excp:
+                self._failures[module_name] = excp.name
+            except Exception:
+                self._failures[module_name] = None
+
+        for name, plugin in framework.list_plugins().items():
+            arguments: Optional[List[Dict[str, Any]]] = describe_requirements(plugin)
+            try:
+                # Arguments that will not survive storage are described afresh each time
+                if json.loads(json.dumps(arguments)) != arguments:
+                    arguments = None
+            except (TypeError, ValueError):
+                arguments = None
+            self._plugins[name] = {
+                "module": plugin.__module__,
+                "class": plugin.__name__,
+                "doc": plugin.__doc__,
+                "version": list(plugin.version),
+                "arguments": arguments,
+            }
+
+        if not constants.CACHE_PLUGIN_MANIFEST:
+            return None
+        manifest = {
+            "signature": signature,
+            "plugins": self._plugins,
+            "failures": self._failures,
+        }
+        try:
+            # Write atomically, since many instances may start up at once
+            descriptor, temporary_name = tempfile.mkstemp(
+                dir=constants.CACHE_PATH, suffix=".tmp"
+            )
+            try:
+                with os.fdopen(descriptor, "w") as manifest_file:
+                    json.dump(manifest, manifest_file)
+                os.replace(temporary_name, self._filename())
+            except BaseException:
+                os.unlink(temporary_name)
+                raise
+        except (OSError, TypeError, ValueError) as excp:
+            vollog.log(
+                constants.LOGLEVEL_VVVV, f"Unable to write plugin manifest: {excp}"
+            )
@@ -15,6 +15,17 @@ from typing import List, Optional, Sequence, Any, Union
 # HelpfulArgParser gives the list of choices when no arguments are provided to a choice option whilst still using a
 
 
+def size_argument(value: str) -> int:
+    """Converts a human readable size (such as 512M or 2G) into a number of
+    bytes, for use as an argparse type."""
+    match = re.fullmatch(r"\s*(\d+)\s*([kmgt]?)i?b?\s*", value, re.IGNORECASE)
+    if not match:
+        raise argparse.ArgumentTypeError(f"invalid size: {value!r}")
+    number, unit = match.groups()
+    multiplier = 1024 ** ("kmgt".index(unit.lower()) + 1) if unit else 1
+    return int(number) * multiplier
+
+
 class HelpfulSubparserAction(argparse._SubParsersAction):
     """Class to either select a unique plugin based on a substring, or identify
     the alternatives."""
@@ -11,6 +11,7 @@ import sys
 import volatility3.plugins
 import volatility3.symbols
 from volatility3 import cli, framework
+from volatility3.cli import volargparse
 from volatility3.cli.volshell import generic, linux, mac, windows
 from volatility3.framework import (
     automagic,
@@ -159,6 +160,36 @@ class VolShell(cli.CommandLine):
             default=constants.CACHE_PATH,
             type=str,
         )
+        parser.add_argument(
+            "--cache-size",
+            help=f"Maximum amount of layer data to cache in memory, such as 512M or 2G (defaults to {constants.LAYER_CACHE_SIZE // (1024 * 1024)}M)",
+            default=constants.LAYER_CACHE_SIZE,
+            type=volargparse.size_argument,
+        )
+        parser.add_argument(
+            "--buffer-structures",
+            help="Read each structure whole, and decode its members from that data rather than reading them individually",
+            default=False,
+            action="store_true",
+        )
+        parser.add_argument(
+            "--intern-objects",
+            help="Share structures constructed with the same type at the same location, rather than constructing them afresh each time",
+            default=False,
+            action="store_true",
+        )
+        parser.add_argument(
+            "--scan-cache",
+            help="Store the results of scans in the cache, and replay them when the same image is scanned again",
+            default=False,
+            action="store_true",
+        )
+        parser.add_argument(
+            "--session-cache",
+            help="Store the configuration automagic found for each image in the cache, and restore it when the same image is used again",
+            default=False,
+            action="store_true",
+        )
         isf_group = parser.add_mutually_exclusive_group()
         isf_group.add_argument(
             "--offline",
@@ -174,6 +205,13 @@ class VolShell(cli.CommandLine):
             default=constants.REMOTE_ISF_URL,
             type=str,
         )
+        parser.add_argument(
+            "--symbol-server",
+            metavar="URL",
+            help="Symbol server (or mirrored symbol store) to download missing PDB files from, may be given more than once",
+            default=[],
+            action="append",
+        )
 
         # Volshell specific flags
         os_specific = parser.add_mutually_exclusive_group(required=False)
@@ -243,10 +281,22 @@ class VolShell(cli.CommandLine):
         if partial_args.clear_cache:
             framework.clear_cache()
 
+        constants.LAYER_CACHE_SIZE = partial_args.cache_size
+        if partial_args.buffer_structures:
+            constants.AGGREGATE_BUFFERING = True
+        if partial_args.intern_objects:
+            constants.CACHE_OBJECTS = True
+        if partial_args.scan_cache:
+            constants.CACHE_SCAN_RESULTS = True
+        if partial_args.session_cache:
+            constants.CACHE_AUTOMAGIC_SESSIONS = True
+
         if partial_args.offline:
             constants.OFFLINE = partial_args.offline
         elif partial_args.remote_isf_url:
             constants.REMOTE_ISF_URL = partial_args.remote_isf_url
+        if partial_args.symbol_server:
+            constants.WINDOWS_SYMBOL_SERVERS = partial_args.symbol_server
 
         # Do the initialization
         ctx = contexts.Context()  # Construct a blank context
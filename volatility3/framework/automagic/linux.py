@@ -36,8 +36,8 @@ class LinuxIntelStacker(interfaces.automagic.StackerLayerInterface):
         if isinstance(layer, intel.Intel):
             return None
 
-        linux_banners = symbol_cache.load_cache_manager().get_identifier_dictionary(
-            operating_system="linux"
+        linux_banners = symbol_cache.BannerIndex(
+            symbol_cache.load_cache_manager(), operating_system="linux"
         )
         # If we have no banners, don't bother scanning
         if not linux_banners:
@@ -46,14 +46,12 @@ class LinuxIntelStacker(interfaces.automagic.StackerLayerInterface):
             )
             return None
 
-        mss = scanners.MultiStringScanner([x for x in linux_banners if x is not None])
-        for _, banner in layer.scan(
-            context=context, scanner=mss, progress_callback=progress_callback
+        for _, banner, isf_path in linux_banners.scan(
+            context, layer_name, progress_callback=progress_callback
         ):
             dtb = None
             vollog.debug(f"Identified banner: {repr(banner)}")
 
-            isf_path = linux_banners.get(banner, None)
             if isf_path:
                 table_name = context.symbol_space.free_table_name("LintelStacker")
                 table = linux.LinuxKernelIntermedSymbols(
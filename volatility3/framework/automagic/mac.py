@@ -38,8 +38,8 @@ class MacIntelStacker(interfaces.automagic.StackerLayerInterface):
         if isinstance(layer, intel.Intel):
             return None
 
-        mac_banners = symbol_cache.load_cache_manager().get_identifier_dictionary(
-            operating_system="mac"
+        mac_banners = symbol_cache.BannerIndex(
+            symbol_cache.load_cache_manager(), operating_system="mac"
         )
         # If we have no banners, don't bother scanning
         if not mac_banners:
@@ -48,14 +48,12 @@ class MacIntelStacker(interfaces.automagic.StackerLayerInterface):
             )
             return None
 
-        mss = scanners.MultiStringScanner([x for x in mac_banners if x])
-        for banner_offset, banner in layer.scan(
-            context=context, scanner=mss, progress_callback=progress_callback
+        for banner_offset, banner, isf_path in mac_banners.scan(
+            context, layer_name, progress_callback=progress_callback
         ):
             dtb = None
             vollog.debug(f"Identified banner: {repr(banner)}")
 
-            isf_path = mac_banners.get(banner, None)
             if isf_path:
                 table_name = context.symbol_space.free_table_name("MacintelStacker")
                 table = mac.MacKernelIntermedSymbols(
@@ -0,0 +1,364 @@
+# This file is Copyright 2024 Volatility Foundation and licensed under the Volatility Software License 1.0
+# which is available at https://www.volatilityfoundation.org/license/vsl-v1.0
+#
+"""An automagic module that remembers the configuration other automagic
+produced for an image, so that later runs against the same image need not
+stack layers or locate the kernel again.
+
+Sessions are keyed by the fingerprint of the image provided as the single
+location, along with the kind of requirement they fulfilled.  A restored
+session is only kept if it fully satisfies its requirement and the kernel it
+describes can still be found in the image (by checking the kernel banner or
+image header at the stored location through the restored page tables),
+otherwise it is discarded and the remaining automagic runs as normal.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+from typing import Any, Dict, List, Optional, Tuple
+
+from volatility3.framework import constants, contexts, exceptions, interfaces
+from volatility3.framework.automagic import construct_layers
+from volatility3.framework.configuration import requirements
+from volatility3.framework.layers import intel, physical
+
+vollog = logging.getLogger(__name__)
+
+SESSION_REQUIREMENTS = (
+    requirements.ModuleRequirement,
+    requirements.TranslationLayerRequirement,
+)
+
+BANNER_SYMBOLS = ["linux_banner", "version"]
+"""The symbols (for linux and mac kernels) at which the banner a layer was stacked with should be found"""
+
+
+class SessionCache:
+    """Stores the configuration branches produced by automagic within the
+    cache directory."""
+
+    @classmethod
+    def _connect(cls) -> sqlite3.Connection:
+        database = sqlite3.connect(
+            os.path.join(constants.CACHE_PATH, constants.SESSION_CACHE_FILENAME),
+            timeout=30,
+        )
+        database.execute(
+            "CREATE TABLE IF NOT EXISTS sessions (key TEXT PRIMARY KEY, location TEXT, config TEXT, cached DATETIME)"
+        )
+        return database
+
+    @classmethod
+    def load(cls, key: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Returns the location and configuration stored against key, or None"""
+        try:
+            database = cls._connect()
+            try:
+                row = database.execute(
+                    "SELECT location, config FROM sessions WHERE key = ? "
+                    f"AND cached >= datetime('now', '{constants.SQLITE_CACHE_PERIOD}')",
+                    (key,),
+                ).fetchone()
+            finally:
+                database.close()
+            if row is None:
+                return None
+            return row[0], json.loads(row[1])
+        except (sqlite3.Error, ValueError) as excp:
+            vollog.log(constants.LOGLEVEL_VVVV, f"Unable to read session cache: {excp}")
+            return None
+
+    @classmethod
+    def store(cls, key: str, location: str, config: Dict[str, Any]) -> None:
+        """Stores the configuration against key, removing any expired entries"""
+        try:
+            data = json.dumps(config, sort_keys=True)
+        except (TypeError, ValueError) as excp:
+            vollog.log(constants.LOGLEVEL_VVVV, f"Unable to serialize session: {excp}")
+            return None
+        try:
+            database = cls._connect()
+            try:
+                with database:
+                    database.execute(
+                        "DELETE FROM sessions WHERE cached < "
+                        f"datetime('now', '{constants.SQLITE_CACHE_PERIOD}')"
+                    )
+                    database.execute(
+                        "INSERT OR REPLACE INTO sessions VALUES (?, ?, ?, datetime('now'))",
+                        (key, location, data),
+                    )
+            finally:
+                database.close()
+        except sqlite3.Error as excp:
+            vollog.log(
+                constants.LOGLEVEL_VVVV, f"Unable to write session cache: {excp}"
+            )
+
+    @classmethod
+    def invalidate(cls, key: str) -> None:
+        """Removes any configuration stored against key"""
+        try:
+            database = cls._connect()
+            try:
+                with database:
+                    database.execute("DELETE FROM sessions WHERE key = ?", (key,))
+            finally:
+                database.close()
+        except sqlite3.Error as excp:
+            vollog.log(
+                constants.LOGLEVEL_VVVV, f"Unable to write session cache: {excp}"
+            )
+
+
+def session_location(context: interfaces.context.ContextInterface) -> Optional[str]:
+    """Returns the single location the user provided, if any"""
+    return context.config.get(
+        interfaces.configuration.path_join(
+            constants.AUTOMAGIC_CONFIG_PATH, "LayerStacker", "single_location"
+        ),
+        None,
+    )
+
+
+def image_identity(context: interfaces.context.ContextInterface) -> Optional[Tuple]:
+    """Identifies the image provided as the single location (and any swap
+    locations provided alongside it), or returns None if there is no single
+    location or it cannot be fingerprinted."""
+    location = session_location(context)
+    if not location:
+        return None
+    scratch = contexts.Context()
+    scratch.config["session.location"] = location
+    try:
+        layer = physical.FileLayer(scratch, "session", "session")
+        fingerprint = layer.fingerprint
+        layer.destroy()
+    except (OSError, ValueError) as excp:
+        vollog.log(constants.LOGLEVEL_VVVV, f"Unable to fingerprint {location}: {excp}")
+        return None
+    if fingerprint is None:
+        return None
+    swap_locations = context.config.get(
+        interfaces.configuration.path_join(
+            constants.AUTOMAGIC_CONFIG_PATH, "WinSwapLayers", "single_swap_locations"
+        ),
+        None,
+    )
+    return constants.PACKAGE_VERSION, fingerprint, swap_locations
+
+
+def session_key(
+    identity: Tuple, requirement: interfaces.configuration.RequirementInterface
+) -> str:
+    """Determines the key for the session of a requirement against an image"""
+    requirement_identity = (requirement.__class__.__name__, requirement.name)
+    return hashlib.sha256(
+        repr((identity, requirement_identity)).encode("utf-8")
+    ).hexdigest()
+
+
+def _top_level(
+    found: List[Tuple[str, interfaces.configuration.RequirementInterface]],
+) -> List[Tuple[str, interfaces.configuration.RequirementInterface]]:
+    """Filters out requirements that live beneath another requirement in the list"""
+    paths = [path for path, _ in found]
+    return [
+        (path, requirement)
+        for path, requirement in found
+        if not any(
+            path.startswith(other + interfaces.configuration.CONFIG_SEPARATOR)
+            for other in paths
+        )
+    ]
+
+
+class SessionRestore(interfaces.automagic.AutomagicInterface):
+    """Restores the configuration that automagic previously produced for the
+    same image, before any layer stacking takes place."""
+
+    priority = 5
+
+    def __call__(
+        self,
+        context: interfaces.context.ContextInterface,
+        config_path: str,
+        requirement: interfaces.configuration.RequirementInterface,
+        progress_callback: constants.ProgressCallback = None,
+    ) -> None:
+        if not constants.CACHE_AUTOMAGIC_SESSIONS:
+            return None
+        unsatisfied = self.find_requirements(
+            context, config_path, requirement, SESSION_REQUIREMENTS
+        )
+        if not unsatisfied:
+            return None
+        identity = image_identity(context)
+        if identity is None:
+            return None
+        location = session_location(context)
+        for sub_config_path, sub_requirement in unsatisfied:
+            key = session_key(identity, sub_requirement)
+            entry = SessionCache.load(key)
+            if entry is None:
+                continue
+            stored_location, config = entry
+            # The image may have moved since the session was stored
+            config = {
+                name: location if value == stored_location else value
+                for name, value in config.items()
+            }
+            if self._restore(context, sub_config_path, sub_requirement, config):
+                vollog.info(f"Restored {sub_config_path} from the session cache")
+            else:
+                vollog.info(f"Discarding stale session for {sub_config_path}")
+                SessionCache.invalidate(key)
+
+    def _restore(
+        self,
+        context: interfaces.context.ContextInterface,
+        sub_config_path: str,
+        requirement: interfaces.configuration.RequirementInterface,
+        config: Dict[str, Any],
+    ) -> bool:
+        """Splices the stored configuration in and constructs it, undoing any
+        changes if the requirement is still not satisfied afterwards."""
+        parent_path = interfaces.configuration.parent_path(sub_config_path)
+        layers = set(context.layers)
+        tables = set(context.symbol_space)
+        modules = set(context.modules)
+        original_config = context.config.branch(sub_config_path).clone()
+        original_value = context.config.get(sub_config_path, None)
+
+        context.config.splice(
+            sub_config_path, interfaces.configuration.HierarchicalDict(config)
+        )
+        try:
+            constructor = construct_layers.ConstructionMagic(
+                context,
+                interfaces.configuration.path_join(
+                    self.config_path, "ConstructionMagic"
+                ),
+            )
+            constructor(context, parent_path, requirement)
+            if not requirement.unsatisfied(context, parent_path) and self._validate(
+                context, sub_config_path, requirement
+            ):
+                return True
+        except Exception as excp:
+            # A stale session can fail in any number of ways, all of which just mean it cannot be used
+            vollog.log(
+                constants.LOGLEVEL_VVV,
+                f"Unable to restore session for {sub_config_path}: {excp}",
+            )
+
+        for module_name in set(context.modules) - modules:
+            del context.modules[module_name]
+        for table_name in set(context.symbol_space) - tables:
+            context.symbol_space.remove(table_name)
+        for layer_name in reversed(list(context.layers)):
+            if layer_name not in layers:
+                context.layers.del_layer(layer_name)
+        context.config.splice(sub_config_path, original_config)
+        if original_value is None:
+            if sub_config_path in context.config:
+                del context.config[sub_config_path]
+        else:
+            context.config[sub_config_path] = original_value
+        return False
+
+    @classmethod
+    def _validate(
+        cls,
+        context: interfaces.context.ContextInterface,
+        sub_config_path: str,
+        requirement: interfaces.configuration.RequirementInterface,
+    ) -> bool:
+        """Confirms that the restored configuration matches the image, rather
+        than merely being complete, by finding the kernel where it says."""
+        value = context.config.get(sub_config_path, None)
+        try:
+            if isinstance(requirement, requirements.ModuleRequirement):
+                return cls._module_is_valid(context, context.modules[value])
+            return cls._layer_is_valid(context.layers[value])
+        except (KeyError, exceptions.VolatilityException) as excp:
+            vollog.log(
+                constants.LOGLEVEL_VVV,
+                f"Unable to validate session for {sub_config_path}: {excp}",
+            )
+            return False
+
+    @classmethod
+    def _module_is_valid(
+        cls,
+        context: interfaces.context.ContextInterface,
+        module: interfaces.context.ModuleInterface,
+    ) -> bool:
+        """Checks for the banner the module's layer was stacked with at the
+        module's banner symbol, or the kernel's image header at the module's
+        offset if the layer has no banner."""
+        layer = context.layers[module.layer_name]
+        banner = layer.config.get("kernel_banner", None)
+        if banner is None:
+            return layer.read(module.offset, 2) == b"MZ"
+        for symbol_name in BANNER_SYMBOLS:
+            if module.has_symbol(symbol_name):
+                expected = banner.encode("latin-1")
+                address = module.get_absolute_symbol_address(symbol_name)
+                return layer.read(address, len(expected)) == expected
+        return cls._layer_is_valid(layer)
+
+    @classmethod
+    def _layer_is_valid(cls, layer: interfaces.layers.DataLayerInterface) -> bool:
+        """Checks that a page table layer maps the kernel's image header at its
+        kernel virtual offset, or (when stacked by banner, and so without
+        symbols to check) that its page map is at least a valid table."""
+        if not isinstance(layer, intel.Intel):
+            return True
+        kernel_virtual_offset = layer.config.get("kernel_virtual_offset", None)
+        if layer.config.get("kernel_banner", None) is None:
+            if kernel_virtual_offset is None:
+                return True
+            return layer.read(kernel_virtual_offset, 2) == b"MZ"
+        page_map = layer.config["page_map_offset"] & ~(layer.page_size - 1)
+        table = layer.context.layers.read(
+            layer.config["memory_layer"], page_map, layer.page_size
+        )
+        return table != table[:1] * len(table)
+
+
+class SessionStore(interfaces.automagic.AutomagicInterface):
+    """Stores the configuration that automagic produced for an image, once all
+    other automagic has run."""
+
+    priority = 200
+
+    def __call__(
+        self,
+        context: interfaces.context.ContextInterface,
+        config_path: str,
+        requirement: interfaces.configuration.RequirementInterface,
+        progress_callback: constants.ProgressCallback = None,
+    ) -> None:
+        if not constants.CACHE_AUTOMAGIC_SESSIONS:
+            return None
+        identity = image_identity(context)
+        if identity is None:
+            return None
+        location = session_location(context)
+        for sub_config_path, sub_requirement in _top_level(
+            self.find_requirements(
+                context, config_path, requirement, SESSION_REQUIREMENTS, shortcut=False
+            )
+        ):
+            parent_path = interfaces.configuration.parent_path(sub_config_path)
+            if sub_requirement.unsatisfied(context, parent_path):
+                continue
+            SessionCache.store(
+                session_key(identity, sub_requirement),
+                location,
+                dict(context.config.branch(sub_config_path)),
+            )
@@ -2,33 +2,109 @@
 # which is available at https://www.volatilityfoundation.org/license/vsl-v1.0
 #
 import base64
-import datetime
+import functools
 import json
 import logging
+import multiprocessing
 import os
 import sqlite3
 import urllib
 import urllib.parse
 import urllib.request
 from abc import abstractmethod
-from typing import Dict, Generator, Iterable, List, Optional, Tuple
-
-from volatility3 import framework, schemas
+from typing import (
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
+
+from volatility3 import framework
 from volatility3.framework import constants, interfaces
 from volatility3.framework.configuration import requirements
-from volatility3.framework.layers import resources
-from volatility3.framework.symbols import intermed
+from volatility3.framework.layers import resources, scanners
+from volatility3.framework.symbols import intermed, streaming, validations
 
 vollog = logging.getLogger(__name__)
 
 BannersType = Dict[bytes, List[str]]
 
 
+def identify_location(
+    idextractors: List[Type["IdentifierProcessor"]],
+    file_to_process: Tuple[str, Tuple[Optional[int], Optional[int]]],
+) -> Tuple[str, Tuple[Optional[int], Optional[int]], Optional[Tuple], Optional[str]]:
+    """Extracts the identifier, hash and statistics of an ISF file.
+
+    This runs within worker processes, so only the (small) metadata is
+    returned rather than the parsed file, along with the reason it could not
+    be extracted if it is None.
+
+    Args:
+        idextractors: The identifier processors to try against the file
+        file_to_process: The location of the file, along with its size and modification time
+
+    Returns:
+        The location, its size and modification time, a tuple of the identifier, operating system, hash and
+        statistics (or None), and an error message (or None)
+    """
+    location, file_stat = file_to_process
+    # Only the sections holding identifiers are kept, unless a processor needs the whole file
+    wanted: Optional[Dict[str, Optional[Set[str]]]] = {}
+    for idextractor in idextractors:
+        if idextractor.isf_sections is None:
+            wanted = None
+            break
+        for section, names in idextractor.isf_sections.items():
+            if names is None or (section in wanted and wanted[section] is None):
+                wanted[section] = None
+            else:
+                wanted[section] = wanted.get(section, set()).union(names)
+    try:
+        with resources.ResourceAccessor().open(location) as fp:
+            if wanted is None:
+                json_obj = json.load(fp)
+                counts = {
+                    section: len(json_obj.get(section, {}))
+                    for section in ("base_types", "user_types", "enums", "symbols")
+                }
+            else:
+                json_obj, counts = streaming.read_sections(
+                    fp, wanted, count_entries=True
+                )
+        identifier = operating_system = None
+        for idextractor in idextractors:
+            identifier = idextractor.get_identifier(json_obj)
+            if identifier is not None:
+                operating_system = idextractor.operating_system
+                break
+        metadata = (
+            identifier,
+            operating_system,
+            validations.hash_file(location),
+            counts.get("base_types", 0),
+            counts.get("user_types", 0),
+            counts.get("enums", 0),
+            counts.get("symbols", 0),
+        )
+    except Exception as excp:
+        return location, file_stat, None, str(excp)
+    return location, file_stat, metadata, None
+
+
 ### Identifiers
 
 
 class IdentifierProcessor:
     operating_system = None
+    isf_sections: Optional[Dict[str, Optional[List[str]]]] = None
+    """The sections of an ISF file (and the entries within them, or None for the whole section) that the identifier
+    is found in, so that only those need be read.  If None, the whole file is read."""
 
     def __init__(self):
         pass
@@ -48,6 +124,7 @@ class IdentifierProcessor:
 
 class WindowsIdentifier(IdentifierProcessor):
     operating_system = "windows"
+    isf_sections = {"metadata": None}
     separator = "|"
 
     @classmethod
@@ -69,6 +146,7 @@ class WindowsIdentifier(IdentifierProcessor):
 
 class MacIdentifier(IdentifierProcessor):
     operating_system = "mac"
+    isf_sections = {"symbols": ["version"]}
 
     @classmethod
     def get_identifier(cls, json) -> Optional[bytes]:
@@ -82,6 +160,7 @@ class MacIdentifier(IdentifierProcessor):
 
 class LinuxIdentifier(IdentifierProcessor):
     operating_system = "linux"
+    isf_sections = {"symbols": ["linux_banner"]}
 
     @classmethod
     def get_identifier(cls, json) -> Optional[bytes]:
@@ -97,6 +176,9 @@ class LinuxIdentifier(IdentifierProcessor):
 
 
 class CacheManagerInterface(interfaces.configuration.VersionableInterface):
+    identifier_prefix_length = 16
+    """The number of bytes from the start of each identifier that are searched for when locating identifiers"""
+
     def __init__(self, filename: str):
         super().__init__()
         self._filename = filename
@@ -155,6 +237,28 @@ class CacheManagerInterface(interfaces.configuration.VersionableInterface):
         """Returns all identifiers for a particular operating system"""
         pass
 
+    def get_identifier_summary(
+        self, operating_system: Optional[str]
+    ) -> Tuple[List[bytes], List[int]]:
+        """Returns the distinct prefixes of the identifiers for an operating
+        system, along with their distinct lengths (longest first).
+
+        The summary is only recalculated after the identifiers change.
+        """
+        return [], []
+
+    def find_identifier(
+        self, data: bytes, lengths: Iterable[int], operating_system: Optional[str]
+    ) -> Optional[Tuple[bytes, str]]:
+        """Returns the longest identifier (and its location) that the data starts with, or None
+
+        Args:
+            data: The bytes that may start with an identifier
+            lengths: The lengths of identifier to check for, as returned by :meth:`get_identifier_summary`
+            operating_system: optional string to restrict identifiers to just those for a particular operating system
+        """
+        return None
+
     def get_location_statistics(
         self, location: str
     ) -> Optional[Tuple[int, int, int, int]]:
@@ -165,12 +269,24 @@ class CacheManagerInterface(interfaces.configuration.VersionableInterface):
         """
 
     def get_hash(self, location: str) -> Optional[str]:
-        """Returns the hash of the JSON from within a location ISF"""
+        """Returns the hash of the raw contents of a location ISF"""
+
+    def get_file_hash(self, location: str) -> Optional[str]:
+        """Returns the hash of the raw contents of a location ISF, only
+        rehashing the file if it has changed since it was cached"""
+        return validations.hash_file(location)
+
+    def is_validated(self, file_hash: str) -> bool:
+        """Determines whether the file with the given hash has been validated against its schema"""
+        return False
+
+    def record_validation(self, file_hash: str) -> None:
+        """Records that the file with the given hash has been validated against its schema"""
 
 
 class SqliteCache(CacheManagerInterface):
     _required_framework_version = (2, 0, 0)
-    _version = (1, 0, 0)
+    _version = (1, 2, 0)
 
     def __init__(self, filename: str):
         super().__init__(filename)
@@ -211,9 +327,17 @@ class SqliteCache(CacheManagerInterface):
             return self._connect_storage(path)
         database.cursor().execute(
             "CREATE TABLE IF NOT EXISTS cache (location TEXT UNIQUE NOT NULL, identifier TEXT, operating_system TEXT, hash TEXT,"
-            "stats_base_types INT DEFAULT 0, stats_types INT DEFAULT 0, stats_enums INT DEFAULT 0, stats_symbols INT DEFAULT 0, local BOOL, cached DATETIME)"
+            "stats_base_types INT DEFAULT 0, stats_types INT DEFAULT 0, stats_enums INT DEFAULT 0, stats_symbols INT DEFAULT 0, local BOOL, cached DATETIME,"
+            "size INT, mtime INT)"
+        )
+        database.cursor().execute(
+            "CREATE INDEX IF NOT EXISTS cache_identifier ON cache (identifier)"
+        )
+        database.cursor().execute(
+            "CREATE TABLE IF NOT EXISTS identifier_summaries (operating_system TEXT PRIMARY KEY, summary TEXT)"
         )
         database.commit()
+        validations.create_tables(database)
         return database
 
     def find_location(
@@ -294,160 +418,243 @@ class SqliteCache(CacheManagerInterface):
             return row["hash"]
         return None
 
+    def get_file_hash(self, location: str) -> Optional[str]:
+        return validations.get_file_hash(location, self._database)
+
+    def is_validated(self, file_hash: str) -> bool:
+        return validations.is_validated(file_hash, self._database)
+
+    def record_validation(self, file_hash: str) -> None:
+        validations.record_validation(file_hash, self._database)
+
     def update(self, progress_callback=None):
         """Locates all files under the symbol directories.  Updates the cache with additions, modifications and removals.
         This also updates remote locations based on a cache timeout.
 
+        Files are only reprocessed when their size or modification time differs from that recorded in the cache,
+        and large numbers of files are processed by a pool of worker processes.
         """
-        on_disk_locations = set(
-            [
-                filename
-                for filename in intermed.IntermediateSymbolTable.file_symbol_url("")
-            ]
-        )
-        cached_locations = set(self.get_local_locations())
-
-        new_locations = on_disk_locations.difference(cached_locations)
-        missing_locations = cached_locations.difference(on_disk_locations)
-
-        # Missing entries
-        if missing_locations:
-            self._database.cursor().execute(
-                f"DELETE FROM cache WHERE location IN ({','.join(['?'] * len(missing_locations))})",
-                [x for x in missing_locations],
-            )
-            self._database.commit()
-
-        cache_update = set()
-        files_to_timestamp = on_disk_locations.intersection(cached_locations)
-        if files_to_timestamp:
-            result = self._database.cursor().execute(
-                "SELECT location, cached FROM cache WHERE local = 1 "
-                f"AND cached < date('now', '{self.cache_period}');"
+        on_disk_locations = set(intermed.IntermediateSymbolTable.file_symbol_url(""))
+        cached_locations = {}
+        cached_identifiers = {}
+        for row in self._database.cursor().execute(
+            "SELECT location, identifier, operating_system, size, mtime FROM cache WHERE local = 1"
+        ):
+            cached_locations[row["location"]] = (row["size"], row["mtime"])
+            cached_identifiers[row["location"]] = (
+                row["identifier"],
+                row["operating_system"],
             )
-            for row in result:
-                location = row["location"]
-                stored_timestamp = datetime.datetime.fromisoformat(row["cached"])
-                timestamp = stored_timestamp  # Default to requiring update
-
-                # See if the file is a local URL type we can handle:
-                parsed = urllib.parse.urlparse(location)
-                pathname = None
-                if parsed.scheme == "file":
-                    pathname = urllib.request.url2pathname(parsed.path)
-                if parsed.scheme == "jar":
-                    inner_url = urllib.parse.urlparse(parsed.path)
-                    if inner_url.scheme == "file":
-                        pathname = inner_url.path.split("!")[0]
-
-                if pathname and os.path.exists(pathname):
-                    timestamp = datetime.datetime.fromtimestamp(
-                        os.stat(pathname).st_mtime
-                    )
-                else:
-                    vollog.log(
-                        constants.LOGLEVEL_VVVV,
-                        "File location in database classed as local but not file/jar URL",
+        missing_locations = set(cached_locations).difference(on_disk_locations)
+
+        # Files within the same zip file share a single stat
+        file_stats: Dict[str, Tuple[Optional[int], Optional[int]]] = {}
+        files_to_process = []
+        for location in on_disk_locations:
+            pathname = validations.local_path(location)
+            if pathname is not None and pathname not in file_stats:
+                try:
+                    stat_result = os.stat(pathname)
+                    file_stats[pathname] = (
+                        stat_result.st_size,
+                        stat_result.st_mtime_ns,
                     )
-
-                # If we're supposed to include it, and our last check is older than (or equal to) the file timestamp
-                if (
-                    row["location"] in files_to_timestamp
-                    and stored_timestamp < timestamp
-                ):
-                    cache_update.add(row["location"])
-
-        idextractors = list(framework.class_subclasses(IdentifierProcessor))
-
-        # New or not recently updated
-
-        files_to_process = new_locations.union(cache_update)
+                except OSError:
+                    file_stats[pathname] = (None, None)
+            file_stat = file_stats.get(pathname, (None, None))
+            if None in file_stat or cached_locations.get(location) != file_stat:
+                files_to_process.append((location, file_stat))
+
+        # The files are identified before the transaction is opened, so that worker processes
+        # are never forked while the database is locked
         number_files_to_process = len(files_to_process)
-        cursor = self._database.cursor()
-        try:
-            for counter, location in enumerate(files_to_process):
-                # Open location
+        records = []
+        identifiers_changed = bool(missing_locations)
+        for counter, (location, file_stat, metadata, error) in enumerate(
+            self._identify_locations(files_to_process)
+        ):
+            if progress_callback:
                 progress_callback(
                     counter * 100 / number_files_to_process,
                     f"Updating caches for {number_files_to_process} files...",
                 )
-                try:
-                    with resources.ResourceAccessor().open(location) as fp:
-                        json_obj = json.load(fp)
-                        hash = schemas.create_json_hash(json_obj)
-                        identifier = None
-
-                        # Get stats
-                        stats_base_types = len(json_obj.get("base_types", {}))
-                        stats_types = len(json_obj.get("user_types", {}))
-                        stats_enums = len(json_obj.get("enums", {}))
-                        stats_symbols = len(json_obj.get("symbols", {}))
-
-                        operating_system = None
-                        for idextractor in idextractors:
-                            identifier = idextractor.get_identifier(json_obj)
-                            if identifier is not None:
-                                operating_system = idextractor.operating_system
-                                break
-
-                        # We don't try to validate schemas here, we do that on first use
-                        # Store in database
-                        cursor.execute(
-                            "INSERT OR REPLACE INTO cache (location, identifier, operating_system, hash,"
-                            "stats_base_types, stats_types, stats_enums, stats_symbols, "
-                            "local, cached) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'))",
-                            (
-                                location,
-                                identifier,
-                                operating_system,
-                                hash,
-                                stats_base_types,
-                                stats_types,
-                                stats_enums,
-                                stats_symbols,
-                                self.is_url_local(location),
-                            ),
-                        )
-                        if identifier is not None:
-                            vollog.log(
-                                constants.LOGLEVEL_VV,
-                                f"Identified {location} as {identifier}",
-                            )
-                        else:
-                            vollog.log(
-                                constants.LOGLEVEL_VVVV,
-                                f"No identifier found for {location}",
-                            )
-                except Exception as excp:
-                    vollog.log(constants.LOGLEVEL_VVVV, excp)
-        finally:
-            self._database.commit()
+            if metadata is None:
+                vollog.log(
+                    constants.LOGLEVEL_VVVV,
+                    f"Unable to process {location}: {error}",
+                )
+                continue
+            identifier, operating_system = metadata[:2]
+            if cached_identifiers.get(location) != (identifier, operating_system):
+                identifiers_changed = True
+            if identifier is not None:
+                vollog.log(
+                    constants.LOGLEVEL_VV,
+                    f"Identified {location} as {identifier}",
+                )
+            else:
+                vollog.log(
+                    constants.LOGLEVEL_VVVV,
+                    f"No identifier found for {location}",
+                )
+            # We don't try to validate schemas here, we do that on first use
+            records.append(
+                (location,) + metadata + (self.is_url_local(location),) + file_stat
+            )
+
+        with self._database:
+            # Missing entries
+            if missing_locations:
+                self._database.executemany(
+                    "DELETE FROM cache WHERE location = ?",
+                    [(location,) for location in missing_locations],
+                )
+            # New or modified
+            self._store_records(records)
+            if identifiers_changed:
+                self._clear_identifier_summaries()
 
         # Remote Entries
 
         if not constants.OFFLINE and constants.REMOTE_ISF_URL:
-            progress_callback(0, "Reading remote ISF list")
-            cursor = self._database.cursor()
-            cursor.execute(
-                f"SELECT cached FROM cache WHERE local = 0 and cached < datetime('now', '{self.cache_period}')"
+            fresh = (
+                self._database.cursor()
+                .execute(
+                    "SELECT location FROM cache WHERE local = 0 "
+                    f"AND cached >= datetime('now', '{self.cache_period}') LIMIT 1"
+                )
+                .fetchone()
             )
-            remote_identifiers = RemoteIdentifierFormat(constants.REMOTE_ISF_URL)
-            progress_callback(50, "Reading remote ISF list")
-            for operating_system in constants.OS_CATEGORIES:
-                identifiers = remote_identifiers.process(
-                    {}, operating_system=operating_system
+            if fresh is None:
+                self._update_remote(progress_callback)
+
+    def _identify_locations(
+        self, files_to_process: List[Tuple[str, Tuple[Optional[int], Optional[int]]]]
+    ) -> Iterator[
+        Tuple[str, Tuple[Optional[int], Optional[int]], Optional[Tuple], Optional[str]]
+    ]:
+        """Yields the metadata of each location (and its size and modification
+        time), using a pool of worker processes if there are enough locations"""
+        identify = functools.partial(
+            identify_location, list(framework.class_subclasses(IdentifierProcessor))
+        )
+        processes = min(
+            os.cpu_count() or 1,
+            len(files_to_process) // constants.SYMBOL_CACHE_FILES_PER_PROCESS,
+        )
+        if processes > 1:
+            chunksize = max(1, min(16, len(files_to_process) // (processes * 4)))
+            with multiprocessing.Pool(processes) as pool:
+                yield from pool.imap_unordered(
+                    identify, files_to_process, chunksize=chunksize
                 )
-                for identifier, location in identifiers:
-                    identifier = identifier.rstrip()
-                    identifier = (
-                        identifier[:-1] if identifier.endswith(b"\x00") else identifier
-                    )  # Linux banners dumped by dwarf2json end with "\x00\n". If not stripped, the banner cannot match.
-                    cursor.execute(
-                        "INSERT OR REPLACE INTO cache(identifier, location, operating_system, local, cached) VALUES (?, ?, ?, ?, datetime('now'))",
-                        (identifier, location, operating_system, False),
-                    )
+        else:
+            yield from map(identify, files_to_process)
+
+    def _store_records(self, records: List[Tuple]) -> None:
+        self._database.executemany(
+            "INSERT OR REPLACE INTO cache (location, identifier, operating_system, hash,"
+            "stats_base_types, stats_types, stats_enums, stats_symbols, "
+            "local, cached, size, mtime) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'), ?, ?)",
+            records,
+        )
+
+    def _update_remote(self, progress_callback=None) -> None:
+        """Refreshes the identifiers listed by the remote ISF list"""
+        if progress_callback:
+            progress_callback(0, "Reading remote ISF list")
+        remote_identifiers = RemoteIdentifierFormat(constants.REMOTE_ISF_URL)
+        if progress_callback:
+            progress_callback(50, "Reading remote ISF list")
+        records = []
+        for operating_system in constants.OS_CATEGORIES:
+            identifiers = remote_identifiers.process(
+                {}, operating_system=operating_system
+            )
+            for identifier, location in identifiers:
+                identifier = identifier.rstrip()
+                identifier = (
+                    identifier[:-1] if identifier.endswith(b"\x00") else identifier
+                )  # Linux banners dumped by dwarf2json end with "\x00\n". If not stripped, the banner cannot match.
+                records.append((identifier, location, operating_system, False))
+        with self._database:
+            self._database.executemany(
+                "INSERT OR REPLACE INTO cache(identifier, location, operating_system, local, cached) VALUES (?, ?, ?, ?, datetime('now'))",
+                records,
+            )
+            self._clear_identifier_summaries()
+        if progress_callback:
             progress_callback(100, "Reading remote ISF list")
-            self._database.commit()
+
+    def _clear_identifier_summaries(self) -> None:
+        """Discards the identifier summaries, which are rebuilt when next requested"""
+        self._database.execute("DELETE FROM identifier_summaries")
+
+    def get_identifier_summary(
+        self, operating_system: Optional[str]
+    ) -> Tuple[List[bytes], List[int]]:
+        constraint = "identifier IS NOT NULL AND length(identifier) > 0"
+        parameters: Tuple = ()
+        if operating_system:
+            constraint += " AND operating_system = ?"
+            parameters = (operating_system,)
+        row = (
+            self._database.cursor()
+            .execute(
+                "SELECT summary FROM identifier_summaries WHERE operating_system = ?",
+                (operating_system or "",),
+            )
+            .fetchone()
+        )
+        if row is not None:
+            summary = json.loads(row["summary"])
+            return [bytes.fromhex(prefix) for prefix in summary["prefixes"]], summary[
+                "lengths"
+            ]
+        prefixes = [
+            row[0]
+            for row in self._database.execute(
+                f"SELECT DISTINCT substr(identifier, 1, {self.identifier_prefix_length}) FROM cache WHERE {constraint}",
+                parameters,
+            )
+        ]
+        lengths = [
+            row[0]
+            for row in self._database.execute(
+                f"SELECT DISTINCT length(identifier) FROM cache WHERE {constraint} ORDER BY 1 DESC",
+                parameters,
+            )
+        ]
+        summary = {
+            "prefixes": [bytes(prefix).hex() for prefix in prefixes],
+            "lengths": lengths,
+        }
+        with self._database:
+            self._database.execute(
+                "INSERT OR REPLACE INTO identifier_summaries VALUES (?, ?)",
+                (operating_system or "", json.dumps(summary)),
+            )
+        return [bytes(prefix) for prefix in prefixes], lengths
+
+    def find_identifier(
+        self, data: bytes, lengths: Iterable[int], operating_system: Optional[str]
+    ) -> Optional[Tuple[bytes, str]]:
+        candidates = list({data[:length] for length in lengths if length <= len(data)})
+        found: Dict[bytes, str] = {}
+        # Limit the number of parameters per statement, for older versions of sqlite
+        for index in range(0, len(candidates), 500):
+            batch = candidates[index : index + 500]
+            statement = f"SELECT identifier, location FROM cache WHERE identifier IN ({', '.join(['?'] * len(batch))})"
+            if operating_system:
+                statement += " AND operating_system = ?"
+                batch.append(operating_system)
+            for row in self._database.execute(statement + " ORDER BY rowid", batch):
+                if row["location"]:
+                    found[bytes(row["identifier"])] = row["location"]
+        if not found:
+            return None
+        identifier = max(found, key=len)
+        return identifier, found[identifier]
 
     def get_identifier_dictionary(
         self, operating_system: Optional[str] = None, local_only: bool = False
@@ -507,6 +714,69 @@ def load_cache_manager(cache_file: Optional[str] = None) -> CacheManagerInterfac
     return SqliteCache(cache_file)
 
 
+class BannerIndex:
+    """Locates the identifiers of an operating system within a layer.
+
+    Rather than searching for every identifier, only the distinct prefixes of
+    the identifiers are searched for.  Each prefix found is then confirmed by
+    looking up the data that follows it in the cache, so nothing proportional
+    to the number of identifiers need be built before the scan can start, and
+    the scan can be abandoned as soon as a confirmed identifier is found.
+    """
+
+    lookup_limit = 0x1000
+    """The number of distinct lookups remembered during a scan"""
+
+    def __init__(
+        self, cache: CacheManagerInterface, operating_system: Optional[str]
+    ) -> None:
+        self._cache = cache
+        self._operating_system = operating_system
+        self._prefixes, self._lengths = cache.get_identifier_summary(operating_system)
+
+    def __bool__(self) -> bool:
+        return bool(self._prefixes)
+
+    def find(self, identifier: bytes) -> Optional[str]:
+        """Returns the location for exactly the identifier provided, or None"""
+        found = self._cache.find_identifier(
+            identifier, [len(identifier)], self._operating_system
+        )
+        return found[1] if found else None
+
+    def scan(
+        self,
+        context: interfaces.context.ContextInterface,
+        layer_name: str,
+        progress_callback: constants.ProgressCallback = None,
+    ) -> Generator[Tuple[int, bytes, str], None, None]:
+        """Scans a layer for identifiers, yielding the offset, identifier and
+        location of each that is found"""
+        if not self._prefixes:
+            return None
+        layer = context.layers[layer_name]
+        scanner = scanners.MultiStringScanner(self._prefixes)
+        # Prefixes are often found many times followed by the same data, so each distinct lookup is only made once
+        lookups: Dict[bytes, Optional[Tuple[bytes, str]]] = {}
+        for offset, _ in layer.scan(
+            context=context, scanner=scanner, progress_callback=progress_callback
+        ):
+            data = layer.read(
+                offset,
+                min(self._lengths[0], layer.maximum_address - offset + 1),
+                pad=True,
+            )
+            if data not in lookups:
+                if len(lookups) >= self.lookup_limit:
+                    lookups.clear()
+                lookups[data] = self._cache.find_identifier(
+                    data, self._lengths, self._operating_system
+                )
+            found = lookups[data]
+            if found is not None:
+                yield (offset,) + found
+
+
 ### Automagic
 
 
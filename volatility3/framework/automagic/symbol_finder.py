@@ -4,12 +4,11 @@
 
 import logging
 import os
-from typing import Any, Callable, Iterable, List, Optional, Tuple
+from typing import Callable, Iterable, List, Optional, Tuple
 
 from volatility3.framework import constants, interfaces, layers
 from volatility3.framework.automagic import symbol_cache
 from volatility3.framework.configuration import requirements
-from volatility3.framework.layers import scanners
 
 vollog = logging.getLogger(__name__)
 
@@ -32,6 +31,7 @@ class SymbolFinder(interfaces.automagic.AutomagicInterface):
             Tuple[str, interfaces.configuration.RequirementInterface]
         ] = []
         self._banners: symbol_cache.BannersType = {}
+        self._banner_index: Optional[symbol_cache.BannerIndex] = None
 
     @classmethod
     def get_requirements(cls) -> List[interfaces.configuration.RequirementInterface]:
@@ -39,7 +39,7 @@ class SymbolFinder(interfaces.automagic.AutomagicInterface):
             requirements.VersionRequirement(
                 name="SQLiteCache",
                 component=symbol_cache.SqliteCache,
-                version=(1, 0, 0),
+                version=(1, 2, 0),
             )
         ]
 
@@ -57,6 +57,18 @@ class SymbolFinder(interfaces.automagic.AutomagicInterface):
             )
         return self._banners
 
+    @property
+    def banner_index(self) -> symbol_cache.BannerIndex:
+        """The index used to locate the banners of the operating system"""
+        if self._banner_index is None:
+            identifiers_path = os.path.join(
+                constants.CACHE_PATH, constants.IDENTIFIERS_FILENAME
+            )
+            self._banner_index = symbol_cache.BannerIndex(
+                symbol_cache.SqliteCache(identifiers_path), self.operating_system
+            )
+        return self._banner_index
+
     def __call__(
         self,
         context: interfaces.context.ContextInterface,
@@ -119,31 +131,30 @@ class SymbolFinder(interfaces.automagic.AutomagicInterface):
         constructed layer_name and scans the layer for banners."""
 
         # Bomb out early if there's no banners
-        if not self.banners:
+        if not self.banner_index:
             return None
 
-        mss = scanners.MultiStringScanner([x for x in self.banners if x is not None])
-
         layer = context.layers[layer_name]
 
         # Check if the Stacker has already found what we're looking for
         if layer.config.get(self.banner_config_key, None):
-            banner_list = [
-                (0, bytes(layer.config[self.banner_config_key], "raw_unicode_escape"))
-            ]  # type: Iterable[Any]
+            banner = bytes(layer.config[self.banner_config_key], "raw_unicode_escape")
+            banner_list: Iterable[Tuple[int, bytes, Optional[str]]] = [
+                (0, banner, self.banner_index.find(banner))
+            ]
         else:
             # Swap to the physical layer for scanning
             # Only traverse down a layer if it's an intel layer
             # TODO: Fix this so it works for layers other than just Intel
             if isinstance(layer, layers.intel.Intel):
                 layer = context.layers[layer.config["memory_layer"]]
-            banner_list = layer.scan(
-                context=context, scanner=mss, progress_callback=progress_callback
+            # The scan is lazy, and stops when the loop below breaks after using a banner with a symbol file
+            banner_list = self.banner_index.scan(
+                context, layer.name, progress_callback=progress_callback
             )
 
-        for _, banner in banner_list:
+        for _, banner, symbols_file in banner_list:
             vollog.debug(f"Identified banner: {banner!r}")
-            symbols_file = self.banners.get(banner, None)
             if symbols_file:
                 isf_path = symbols_file
                 vollog.debug(f"Using symbol library: {symbols_file}")
@@ -85,9 +85,54 @@ os.makedirs(CACHE_PATH, exist_ok=True)
 IDENTIFIERS_FILENAME = "identifier.cache"
 """Default location to record information about available identifiers"""
 
-CACHE_SQLITE_SCHEMA_VERSION = 1
+CACHE_SQLITE_SCHEMA_VERSION = 2
 """Version for the sqlite3 cache schema"""
 
+SYMBOL_CACHE_FILES_PER_PROCESS = 32
+"""Minimum number of symbol files each worker process must have to justify using a pool when updating the symbol cache"""
+
+PDB_DOWNLOAD_PROCESSES = 4
+"""Maximum number of worker processes used to download and convert missing PDB files at once"""
+
+SCAN_CACHE_FILENAME = "scan_results.cache"
+"""Default location to record the results of scans, for replaying against unchanged images"""
+
+CACHE_SCAN_RESULTS = False
+"""Whether the results of cacheable scans are stored in, and replayed from, the scan cache"""
+
+SESSION_CACHE_FILENAME = "session.cache"
+"""Default location to record the configuration automagic produced for each image"""
+
+CACHE_AUTOMAGIC_SESSIONS = False
+"""Whether the configuration produced by automagic is stored in, and restored from, the session cache"""
+
+PLUGIN_MANIFEST_FILENAME = "plugin_manifest.cache"
+"""Default location to record the plugins available to the command line, so they need not all be imported"""
+
+CACHE_PLUGIN_MANIFEST = True
+"""Whether the command line builds its parser from the plugin manifest, rather than by importing every plugin"""
+
+COMPILED_ISF_FILENAME = "compiled_isf.cache"
+"""Default location to record pre-parsed symbol tables, so that large ISF files need not be parsed on each use"""
+
+COMPILED_ISF_MINIMUM_SIZE = 0x100000
+"""Size in bytes below which ISF files are parsed directly, rather than compiled into the cache"""
+
+CACHE_COMPILED_ISF = True
+"""Whether large ISF files are compiled into, and read from, the cache"""
+
+SCAN_CACHE_MAX_RESULTS = 0x100000
+"""Maximum number of results a scan may produce and still be stored in the scan cache"""
+
+FINGERPRINT_HEADER_SIZE = 0x10000
+"""Number of bytes from the start of a layer included in its fingerprint"""
+
+FINGERPRINT_SAMPLES = 64
+"""Number of evenly spaced blocks of a layer included in its fingerprint"""
+
+FINGERPRINT_SAMPLE_SIZE = 0x1000
+"""Size of each block sampled for a layer's fingerprint"""
+
 BUG_URL = "https://github.com/volatilityfoundation/volatility3/issues"
 
 ProgressCallback = Optional[Callable[[float, str], None]]
@@ -108,6 +153,27 @@ class Parallelism(enum.IntEnum):
 PARALLELISM = Parallelism.Off
 """Default value to the parallelism setting used throughout volatility"""
 
+SCAN_WINDOW_PER_WORKER = 2
+"""Number of chunks per worker that a parallel scan keeps in flight, bounding the memory held by the scan"""
+
+LAYER_CACHE_SIZE = 0x4000000
+"""Default maximum number of bytes of layer data to hold in each context's read cache"""
+
+AGGREGATE_BUFFERING = False
+"""Whether structures read their whole contents once, and decode their members from that data rather than reading each member from the layer"""
+
+AGGREGATE_BUFFER_MAXIMUM_SIZE = 0x4000
+"""Size in bytes above which structures are not buffered, even when aggregate buffering is enabled"""
+
+CACHE_OBJECTS = False
+"""Whether structures constructed at the same location with the same type are interned and shared, rather than constructed afresh each time"""
+
+OBJECT_CACHE_SIZE = 0x1000
+"""Number of recently used interned objects kept alive by each context's object cache, even when nothing else refers to them"""
+
+TRANSLATION_INDEX_THRESHOLD: Optional[int] = 0x10000
+"""Number of pages a page-table layer must be asked to map before it builds a complete translation index (None disables the index)"""
+
 ISF_MINIMUM_SUPPORTED = (2, 0, 0)
 """The minimum supported version of the Intermediate Symbol Format"""
 ISF_MINIMUM_DEPRECATED = (3, 9, 9)
@@ -118,6 +184,9 @@ OFFLINE = False
 REMOTE_ISF_URL = None  # 'http://localhost:8000/banners.json'
 """Remote URL to query for a list of ISF addresses"""
 
+WINDOWS_SYMBOL_SERVERS = ["http://msdl.microsoft.com/download/symbols"]
+"""Symbol servers (or mirrored symbol stores) to try, in order, when downloading missing PDB files"""
+
 ###
 # DEPRECATED VALUES
 ###
@@ -8,12 +8,13 @@ This has been made an object to allow quick swapping and changing of
 contexts, to allow a plugin to act on multiple different contexts
 without them interfering with each other.
 """
+import bisect
 import functools
 import hashlib
 import logging
 from typing import Callable, Iterable, List, Optional, Set, Tuple, Union
 
-from volatility3.framework import constants, interfaces, symbols, exceptions
+from volatility3.framework import constants, interfaces, objects, symbols, exceptions
 from volatility3.framework.objects import templates
 
 vollog = logging.getLogger(__name__)
@@ -101,6 +102,10 @@ class Context(interfaces.context.ContextInterface):
         Looks up the layername in the context, finds the object template based on the symbol,
         and constructs an object using the object template on the layer at the offset.
 
+        When constants.CACHE_OBJECTS is enabled, structures requested without additional
+        arguments are interned in the layers' object cache, and any existing object of the
+        same type at the same location is returned instead of a new one.
+
         Args:
             object_type: The name (or template) of the symbol type on which to construct the object.  If this is a name, it should contain an explicit table name.
             layer_name: The name of the layer on which to construct the object
@@ -110,6 +115,8 @@ class Context(interfaces.context.ContextInterface):
         Returns:
             A fully constructed object
         """
+        object_cache = self._memory.object_cache
+        cacheable = object_cache.enabled and not arguments
         if not isinstance(object_type, interfaces.objects.Template):
             try:
                 object_template = self._symbol_space.get_type(object_type)
@@ -122,9 +129,21 @@ class Context(interfaces.context.ContextInterface):
             # Ensure that if a pre-constructed type is provided we just instantiate it
             arguments.update(object_template.vol)
 
+        if cacheable:
+            offset &= self._memory[layer_name].address_mask
+            key = (
+                layer_name,
+                offset,
+                native_layer_name or layer_name,
+                object_template,
+            )
+            result = object_cache.get(key)
+            if result is not None:
+                return result
+
         object_template = object_template.clone()
         object_template.update_vol(**arguments)
-        return object_template(
+        result = object_template(
             context=self,
             object_info=interfaces.objects.ObjectInformation(
                 layer_name=layer_name,
@@ -133,6 +152,9 @@ class Context(interfaces.context.ContextInterface):
                 size=object_template.size,
             ),
         )
+        if cacheable and isinstance(result, objects.AggregateType):
+            result = object_cache.add(key, result)
+        return result
 
     def module(
         self,
@@ -390,8 +412,19 @@ class ModuleCollection(interfaces.context.ModuleContainer):
         self, modules: Optional[List[interfaces.context.ModuleInterface]] = None
     ) -> None:
         self._prefix_count = {}
+        self._module_index: Optional[
+            Tuple[List[int], List[int], List[int], List[Tuple[int, SizedModule]]]
+        ] = None
         super().__init__(modules)
 
+    def add_module(self, module: interfaces.context.ModuleInterface) -> None:
+        super().add_module(module)
+        self._module_index = None
+
+    def __delitem__(self, name: str) -> None:
+        super().__delitem__(name)
+        self._module_index = None
+
     def deduplicate(self) -> "ModuleCollection":
         """Returns a new deduplicated ModuleCollection featuring no repeated
         modules (based on data hash)
@@ -435,16 +468,49 @@ class ModuleCollection(interfaces.context.ModuleContainer):
         provided."""
         if size < 0:
             raise ValueError("Size must be strictly non-negative")
-        for module_name in self._modules:
-            module = self._modules[module_name]
-            if isinstance(module, SizedModule):
-                if (offset <= module.offset + module.size) and (
-                    offset + size >= module.offset
-                ):
-                    yield (
-                        module.name,
-                        module.get_symbols_by_absolute_location(offset, size),
-                    )
+        starts, ends, max_ends, modules = self._get_module_index()
+        matches = []
+        # Only modules starting before the end of the range can overlap it, and
+        # max_ends allows the search to stop once no earlier module reaches the range
+        index = bisect.bisect_right(starts, offset + size) - 1
+        while index >= 0 and max_ends[index] >= offset:
+            if ends[index] >= offset:
+                matches.append(modules[index])
+            index -= 1
+        # Report the modules in the order they were added to the collection
+        for _, module in sorted(matches, key=lambda match: match[0]):
+            yield (
+                module.name,
+                module.get_symbols_by_absolute_location(offset, size),
+            )
+
+    def _get_module_index(
+        self,
+    ) -> Tuple[List[int], List[int], List[int], List[Tuple[int, SizedModule]]]:
+        """Returns the start, end and greatest end so far of each sized module
+        (ordered by start), along with the modules and their position in the
+        collection."""
+        if self._module_index is None:
+            sized_modules = sorted(
+                (
+                    (module.offset, module.offset + module.size, position, module)
+                    for position, module in enumerate(self._modules.values())
+                    if isinstance(module, SizedModule)
+                ),
+                key=lambda entry: entry[:3],
+            )
+            max_ends = []
+            max_end = -1
+            for _, end, _, _ in sized_modules:
+                max_end = max(max_end, end)
+                max_ends.append(max_end)
+            self._module_index = (
+                [start for start, _, _, _ in sized_modules],
+                [end for _, end, _, _ in sized_modules],
+                max_ends,
+                [(position, module) for _, _, position, module in sized_modules],
+            )
+        return self._module_index
 
 
 class ConfigurableModule(Module, interfaces.configuration.ConfigurableInterface):
@@ -6,17 +6,47 @@
 One layer may combine other layers, map data based on the data itself,
 or map a procedure (such as decryption) across another layer of data.
 """
+import atexit
 import collections.abc
 import functools
+import hashlib
+import io
 import logging
 import math
 import multiprocessing
 import multiprocessing.managers
+import multiprocessing.pool
+import os
+import pickle
+import sqlite3
+import sys
 import threading
 import traceback
-import types
+import uuid
+import zlib
 from abc import ABCMeta, abstractmethod
-from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+from multiprocessing import resource_tracker, shared_memory
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+try:
+    import numpy
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
 
 from volatility3.framework import constants, exceptions, interfaces
 
@@ -53,9 +83,18 @@ class ScannerInterface(
     Scanners can mark themselves as thread_safe, if they do not require state
     in either their own class or the context.  This will allow the scanner to be run
     in parallel against multiple blocks.
+
+    Scanners can mark themselves as accepts_views, if they can operate on any
+    bytes-like object (such as a memoryview) rather than requiring bytes.  This allows
+    the data to be handed to the scanner without being copied.
+
+    Scanners whose results depend only on the data scanned and their own parameters
+    (and can be pickled) can provide a :attr:`cache_key`, allowing the results of
+    scanning an unchanged image to be replayed from the on-disk scan cache.
     """
 
     thread_safe = False
+    accepts_views = False
 
     _required_framework_version = (2, 0, 0)
 
@@ -86,17 +125,119 @@ class ScannerInterface(
         needs to access the layer."""
         self._layer_name = layer_name
 
+    @property
+    def cache_key(self) -> Optional[Tuple]:
+        """A tuple identifying the parameters of this scanner, used to cache
+        the results of scans, or None if the results cannot be cached."""
+        return None
+
+    @property
+    def scanner_identity(self) -> Optional[Tuple]:
+        """The class, version and cache key of the scanner, or None if its
+        results cannot be cached."""
+        cache_key = self.cache_key
+        if cache_key is None:
+            return None
+        return (
+            self.__class__.__module__ + "." + self.__class__.__qualname__,
+            self.version,
+            cache_key,
+        )
+
     @abstractmethod
     def __call__(self, data: bytes, data_offset: int) -> Iterable[Any]:
         """Searches through a chunk of data for a particular value/pattern/etc
         Always returns an iterator of the same type of object (need not be a
         volatility object)
 
-        data is the chunk of data to search through data_offset is the
-        offset within the layer that the data being searched starts at
+        data is the chunk of data to search through (a memoryview if the scanner
+        accepts_views) data_offset is the offset within the layer that the data
+        being searched starts at
         """
 
 
+class ScannerGroup(ScannerInterface):
+    """A scanner that runs several scanners over each chunk of data, so that
+    the data need only be read once for all of them.
+
+    Each result is returned as a tuple of the index of the scanner (within the
+    list provided) that produced it, and the result itself.  The chunk size and
+    overlap used are the largest of those required by the scanners, and each
+    scanner (along with any scanner it holds and delegates to) is set to use
+    them, so that results are not lost or duplicated between chunks.
+    """
+
+    _required_framework_version = (2, 0, 0)
+
+    def __init__(self, scanners: List[ScannerInterface]) -> None:
+        super().__init__()
+        if not scanners:
+            raise ValueError("ScannerGroup requires at least one scanner")
+        self._scanners = list(scanners)
+        self.chunk_size = max(scanner.chunk_size for scanner in self._scanners)
+        self.overlap = max(scanner.overlap for scanner in self._scanners)
+        for scanner in self._scanners:
+            self._set_chunking(scanner, self.chunk_size, self.overlap)
+        self.thread_safe = all(scanner.thread_safe for scanner in self._scanners)
+        self.accepts_views = True
+
+    @classmethod
+    def _set_chunking(
+        cls, scanner: ScannerInterface, chunk_size: int, overlap: int
+    ) -> None:
+        """Sets the chunk size and overlap of scanner, and of any scanners it
+        holds (such as a pool scanner's string scanner), since those filter
+        their results on their own chunk size."""
+        scanner.chunk_size = chunk_size
+        scanner.overlap = overlap
+        for value in vars(scanner).values():
+            if isinstance(value, ScannerInterface):
+                cls._set_chunking(value, chunk_size, overlap)
+            elif isinstance(value, list):
+                for item in value:
+                    if isinstance(item, ScannerInterface):
+                        cls._set_chunking(item, chunk_size, overlap)
+
+    @property
+    def scanners(self) -> List[ScannerInterface]:
+        """The scanners within the group"""
+        return self._scanners
+
+    @ScannerInterface.context.setter
+    def context(self, ctx: "interfaces.context.ContextInterface") -> None:
+        self._context = ctx
+        for scanner in self._scanners:
+            scanner.context = ctx
+
+    @ScannerInterface.layer_name.setter
+    def layer_name(self, layer_name: str) -> None:
+        self._layer_name = layer_name
+        for scanner in self._scanners:
+            scanner.layer_name = layer_name
+
+    @property
+    def cache_key(self) -> Optional[Tuple]:
+        keys = tuple(scanner.scanner_identity for scanner in self._scanners)
+        if any(key is None for key in keys):
+            return None
+        return keys
+
+    def __call__(
+        self, data: Union[bytes, memoryview], data_offset: int
+    ) -> Iterable[Tuple[int, Any]]:
+        data_bytes = data if isinstance(data, bytes) else None
+        for index, scanner in enumerate(self._scanners):
+            if scanner.accepts_views:
+                scanner_data = data
+            else:
+                # Only copy the data once, however many scanners need bytes
+                if data_bytes is None:
+                    data_bytes = bytes(data)
+                scanner_data = data_bytes
+            for result in scanner(scanner_data, data_offset):
+                yield index, result
+
+
 class DataLayerInterface(
     interfaces.configuration.ConfigurableInterface, metaclass=ABCMeta
 ):
@@ -172,6 +313,126 @@ class DataLayerInterface(
             The bytes read from the layer, starting at offset for length bytes
         """
 
+    def read_view(self, offset: int, length: int, pad: bool = False) -> memoryview:
+        """Reads an offset for length bytes and returns a read-only memoryview of
+        length size.
+
+        Layers that can provide their data without copying it (such as memory mapped
+        files) should override this method, by default it wraps the result of :meth:`read`.
+
+        Args:
+            offset: The offset at which to being reading within the layer
+            length: The number of bytes to read within the layer
+            pad: A boolean indicating whether exceptions should be raised or bad bytes replaced with null characters
+
+        Returns:
+            A view of the data read from the layer, starting at offset for length bytes
+        """
+        return memoryview(self.read(offset, length, pad))
+
+    walk_block_size = 0x1000
+    """The size of the blocks read (and held for the duration of the walk) by :meth:`walk_pointers`"""
+
+    walk_max_blocks = 64
+    """The number of blocks :meth:`walk_pointers` holds before discarding them"""
+
+    def walk_pointers(
+        self,
+        offset: int,
+        pointer_offset: int = 0,
+        pointer_size: int = 8,
+        byteorder: str = "little",
+        mask: Optional[int] = None,
+        stop: Iterable[int] = (),
+        as_array: bool = False,
+    ) -> Union[Iterator[int], "numpy.ndarray"]:
+        """Follows a chain of pointers (such as the links of a linked list)
+        without constructing any objects.
+
+        Starting with the node at offset, the pointer stored pointer_offset bytes
+        into each node gives the offset of the next node.  The walk ends when a
+        node's pointer cannot be read, or when the next node has already been
+        visited (or is in stop).  Each offset is yielded before the node's
+        pointer is read, so a walk that is abandoned early reads no further.
+        Once two consecutive nodes are found within the same block, the block
+        is read whole and held, so that later nodes within it need no reads.
+
+        Args:
+            offset: The offset of the first node
+            pointer_offset: The offset of the pointer to the next node within each node
+            pointer_size: The size in bytes of each pointer
+            byteorder: The byte order of each pointer
+            mask: A mask to apply to each pointer (defaults to the layer's address mask)
+            stop: Offsets that end the walk when reached, without being returned
+            as_array: Whether to walk the whole chain and return the offsets as a numpy array of unsigned 64-bit integers
+
+        Returns:
+            An iterator over the offsets of the nodes visited, in order, starting with offset
+        """
+        nodes = self._walk_pointers(
+            offset,
+            pointer_offset,
+            pointer_size,
+            byteorder,
+            self.address_mask if mask is None else mask,
+            stop,
+        )
+        if as_array:
+            if not HAS_NUMPY:
+                raise ImportError(
+                    "numpy is required to return walked pointers as an array"
+                )
+            return numpy.fromiter(nodes, dtype=numpy.uint64)
+        return nodes
+
+    def _walk_pointers(
+        self,
+        offset: int,
+        pointer_offset: int,
+        pointer_size: int,
+        byteorder: str,
+        mask: int,
+        stop: Iterable[int],
+    ) -> Iterator[int]:
+        block_size = self.walk_block_size
+        blocks: Dict[int, Optional[bytes]] = {}
+        seen = set(stop)
+        previous_block_offset = None
+        node = offset
+        while node not in seen:
+            seen.add(node)
+            yield node
+            position = node + pointer_offset
+            block_offset = position - (position % block_size)
+            block = blocks.get(block_offset, None)
+            if (
+                block is None
+                and block_offset == previous_block_offset
+                and block_offset not in blocks
+                and position + pointer_size <= block_offset + block_size
+            ):
+                # Consecutive nodes share this block, so later ones probably will too
+                if len(blocks) >= self.walk_max_blocks:
+                    blocks.clear()
+                try:
+                    block = self.read(block_offset, block_size)
+                    if len(block) != block_size:
+                        block = None
+                except exceptions.InvalidAddressException:
+                    block = None
+                blocks[block_offset] = block
+            previous_block_offset = block_offset
+            try:
+                if block is None:
+                    data = self.read(position, pointer_size)
+                else:
+                    data = block[
+                        position - block_offset : position - block_offset + pointer_size
+                    ]
+            except exceptions.InvalidAddressException:
+                return None
+            node = int.from_bytes(data, byteorder=byteorder) & mask
+
     @abstractmethod
     def write(self, offset: int, data: bytes) -> None:
         """Writes a chunk of data at offset.
@@ -204,6 +465,43 @@ class DataLayerInterface(
         """
         return []
 
+    @property
+    def fingerprint(self) -> Optional[str]:
+        """A string identifying the data held by the layer, which changes if
+        the data does, or None if the layer cannot identify its data.
+
+        This is used to key results that are cached between runs, such as scans.
+        """
+        return None
+
+    def _sampled_fingerprint(self, *identity: Any) -> str:
+        """Computes a fingerprint from the size of the layer, its header and a
+        deterministic sample of blocks spread evenly across it, so that the
+        whole of a (potentially very large) layer need not be read.
+
+        Args:
+            identity: Any additional values that should form part of the fingerprint
+
+        Returns:
+            A hex digest identifying the data within the layer
+        """
+        digest = hashlib.sha256(repr(identity).encode("utf-8"))
+        start, end = self.minimum_address, self.maximum_address + 1
+        digest.update(f"{start:x}-{end:x}".encode("latin-1"))
+
+        sample_size = constants.FINGERPRINT_SAMPLE_SIZE
+        samples = [(start, min(constants.FINGERPRINT_HEADER_SIZE, end - start))]
+        span = end - start - sample_size
+        if span > 0:
+            for index in range(1, constants.FINGERPRINT_SAMPLES + 1):
+                offset = start + (span * index) // constants.FINGERPRINT_SAMPLES
+                samples.append((offset - (offset % sample_size), sample_size))
+        for offset, length in samples:
+            length = min(length, end - offset)
+            if length > 0:
+                digest.update(self.read_view(offset, length, pad=True))
+        return digest.hexdigest()
+
     # ## General scanning methods
 
     def scan(
@@ -239,44 +537,42 @@ class DataLayerInterface(
 
         sections = list(self._coalesce_sections(sections))
 
+        cache_key = None
+        cached_results = None
+        if constants.CACHE_SCAN_RESULTS:
+            try:
+                cache_key = self._scan_cache_key(scanner, sections)
+                if cache_key is not None:
+                    cached_results = ScanResultCache.load(cache_key, context)
+            except Exception as excp:
+                # Identifying the scan can read from the layer, any failure just means no cache
+                vollog.log(constants.LOGLEVEL_VVVV, f"Unable to use scan cache: {excp}")
+                cache_key = cached_results = None
+        if cached_results is not None:
+            vollog.log(
+                constants.LOGLEVEL_VV,
+                f"Replaying cached results of {scanner.__class__.__name__} on {self.name}",
+            )
+            if progress_callback:
+                progress_callback(
+                    100,
+                    f"Scanning {self.name} using {scanner.__class__.__name__}",
+                )
+            yield from cached_results
+            return None
+
+        results: Optional[List[Any]] = [] if cache_key is not None else None
         try:
-            progress: ProgressValue = DummyProgress()
-            scan_iterator = functools.partial(self._scan_iterator, scanner, sections)
-            scan_metric = self._scan_metric(scanner, sections)
-            if (
-                not scanner.thread_safe
-                or constants.PARALLELISM == constants.Parallelism.Off
+            for result in self._scan_sections(
+                context, scanner, progress_callback, sections
             ):
-                progress = DummyProgress()
-                scan_chunk = functools.partial(self._scan_chunk, scanner, progress)
-                for value in scan_iterator():
-                    if progress_callback:
-                        progress_callback(
-                            scan_metric(progress.value),
-                            f"Scanning {self.name} using {scanner.__class__.__name__}",
-                        )
-                    yield from scan_chunk(value)
-            else:
-                progress = multiprocessing.Manager().Value("Q", 0)
-                parallel_module: types.ModuleType = multiprocessing
-                if constants.PARALLELISM == constants.Parallelism.Threading:
-                    progress = DummyProgress()
-                    parallel_module = threading
-                scan_chunk = functools.partial(self._scan_chunk, scanner, progress)
-                with parallel_module.Pool() as pool:
-                    result = pool.map_async(scan_chunk, scan_iterator())
-                    while not result.ready():
-                        if progress_callback:
-                            # Run the progress_callback
-                            progress_callback(
-                                scan_metric(progress.value),
-                                f"Scanning {self.name} using {scanner.__class__.__name__}",
-                            )
-                        # Ensures we don't burn CPU cycles going round in a ready waiting loop
-                        # without delaying the user too long between progress updates/results
-                        result.wait(0.1)
-                    for result_value in result.get():
-                        yield from result_value
+                if results is not None:
+                    results.append(result)
+                    if len(results) > constants.SCAN_CACHE_MAX_RESULTS:
+                        results = None
+                yield result
+            if cache_key is not None and results is not None:
+                ScanResultCache.store(cache_key, results, context)
         except Exception as e:
             # We don't care the kind of exception, so catch and report on everything, yielding nothing further
             vollog.debug(f"Scan Failure: {str(e)}")
@@ -287,6 +583,148 @@ class DataLayerInterface(
                 ),
             )
 
+    def _scan_cache_key(
+        self, scanner: ScannerInterface, sections: List[Tuple[int, int]]
+    ) -> Optional[str]:
+        """Returns the key under which the results of a scan are cached, or
+        None if the scan cannot be cached."""
+        scanner_identity = scanner.scanner_identity
+        if scanner_identity is None:
+            return None
+        fingerprint = self.fingerprint
+        if fingerprint is None:
+            return None
+        identity = repr(
+            (constants.PACKAGE_VERSION, fingerprint, sections, scanner_identity)
+        )
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+    def _scan_sections(
+        self,
+        context: interfaces.context.ContextInterface,
+        scanner: ScannerInterface,
+        progress_callback: constants.ProgressCallback,
+        sections: List[Tuple[int, int]],
+    ) -> Iterable[Any]:
+        """Runs the scanner over the (coalesced) sections, according to the
+        parallelism in use."""
+        progress: ProgressValue = DummyProgress()
+        scan_iterator = functools.partial(self._scan_iterator, scanner, sections)
+        scan_metric = self._scan_metric(scanner, sections)
+
+        def update_progress() -> None:
+            if progress_callback:
+                progress_callback(
+                    scan_metric(progress.value),
+                    f"Scanning {self.name} using {scanner.__class__.__name__}",
+                )
+
+        if (
+            not scanner.thread_safe
+            or constants.PARALLELISM == constants.Parallelism.Off
+        ):
+            progress = DummyProgress()
+            scan_chunk = functools.partial(self._scan_chunk, scanner, progress)
+            for value in scan_iterator():
+                update_progress()
+                yield from scan_chunk(value)
+        elif constants.PARALLELISM == constants.Parallelism.Threading:
+            processes = os.cpu_count() or 1
+            # Progress is tracked here as results arrive, so the workers need not share a value
+            scan_chunk = functools.partial(self._scan_chunk, scanner, DummyProgress())
+            with multiprocessing.pool.ThreadPool(processes) as pool:
+                for chunk_end, chunk_results in self._scan_in_pool(
+                    pool,
+                    processes,
+                    scan_chunk,
+                    scan_iterator(),
+                    update_progress,
+                ):
+                    yield from chunk_results
+                    progress.value = chunk_end
+        else:
+            pool, processes = ScanWorkerPool.get_pool()
+            with ScanPayload(self, scanner) as payload:
+                scan_chunk = functools.partial(
+                    _scan_worker_chunk, payload.scan_id, payload.name
+                )
+                for chunk_end, chunk_results in self._scan_in_pool(
+                    pool,
+                    processes,
+                    scan_chunk,
+                    scan_iterator(),
+                    update_progress,
+                ):
+                    yield from ContextUnpickler(
+                        io.BytesIO(chunk_results), context
+                    ).load()
+                    progress.value = chunk_end
+
+    @staticmethod
+    def _scan_in_pool(
+        pool: multiprocessing.pool.Pool,
+        processes: int,
+        scan_chunk: Callable[[IteratorValue], Any],
+        scan_values: Iterable[IteratorValue],
+        update_progress: Callable[[], Any],
+    ) -> Iterable[Tuple[int, Any]]:
+        """Runs scan_chunk over each of scan_values within pool, yielding the
+        end of each chunk and its results in order as they complete.
+
+        Only a bounded window of chunks are held in flight at any one time, so
+        the memory used is proportional to the number of workers rather than the
+        size of the layer.
+        """
+        in_flight: Deque[Tuple[int, multiprocessing.pool.AsyncResult]] = (
+            collections.deque()
+        )
+        scan_values = iter(scan_values)
+        exhausted = False
+        while not exhausted or in_flight:
+            while not exhausted and len(in_flight) < (
+                processes * constants.SCAN_WINDOW_PER_WORKER
+            ):
+                value = next(scan_values, None)
+                if value is None:
+                    exhausted = True
+                else:
+                    _, chunk_end = value
+                    in_flight.append(
+                        (chunk_end, pool.apply_async(scan_chunk, (value,)))
+                    )
+            if not in_flight:
+                break
+            chunk_end, result = in_flight.popleft()
+            while not result.ready():
+                update_progress()
+                # Ensures we don't burn CPU cycles going round in a ready waiting loop
+                # without delaying the user too long between progress updates/results
+                result.wait(0.1)
+            yield chunk_end, result.get()
+
+    def scan_multiple(
+        self,
+        context: interfaces.context.ContextInterface,
+        scanners: List[ScannerInterface],
+        progress_callback: constants.ProgressCallback = None,
+        sections: Iterable[Tuple[int, int]] = None,
+    ) -> Iterable[Tuple[int, Any]]:
+        """Scans the layer with several scanners at once, reading each chunk
+        of the layer only once.
+
+        Args:
+             context: The context containing the data layer
+             scanners: The constructed Scanner objects to be applied
+             progress_callback: Method that is called periodically during scanning to update progress
+             sections: A list of (start, size) tuples defining the portions of the layer to scan
+
+        Returns:
+             An iterable of tuples of the index of the scanner (within scanners) and the output it produced
+        """
+        yield from self.scan(
+            context, ScannerGroup(scanners), progress_callback, sections
+        )
+
     def _coalesce_sections(
         self, sections: Iterable[Tuple[int, int]]
     ) -> Iterable[Tuple[int, int]]:
@@ -355,10 +793,12 @@ class DataLayerInterface(
         iterator_value: IteratorValue,
     ) -> List[Any]:
         data_to_scan, chunk_end = iterator_value
-        data = b""
+        views: List[memoryview] = []
         for layer_name, address, chunk_size in data_to_scan:
             try:
-                data += self.context.layers[layer_name].read(address, chunk_size)
+                views.append(
+                    self.context.layers[layer_name].read_view(address, chunk_size)
+                )
             except exceptions.InvalidAddressException:
                 vollog.debug(
                     "Invalid address in layer {} found scanning {} at address {:x}".format(
@@ -366,6 +806,13 @@ class DataLayerInterface(
                     )
                 )
 
+        data: Union[bytes, memoryview]
+        if len(views) == 1 and scanner.accepts_views:
+            # A single contiguous block can be handed straight to the scanner without copying
+            data = views[0]
+        else:
+            data = b"".join(views)
+
         if len(data) > scanner.chunk_size + scanner.overlap:
             vollog.debug(f"Scan chunk too large: {hex(len(data))}")
 
@@ -434,6 +881,25 @@ class TranslationLayerInterface(DataLayerInterface, metaclass=ABCMeta):
         """Returns a list of layer names that this layer translates onto."""
         return []
 
+    @property
+    def fingerprint(self) -> Optional[str]:
+        """Combines the fingerprints of the layers this layer translates onto
+        with the layer's own configuration."""
+        fingerprints = []
+        for layer_name in self.dependencies:
+            fingerprint = self.context.layers[layer_name].fingerprint
+            if fingerprint is None:
+                return None
+            fingerprints.append(fingerprint)
+        identity = repr(
+            (
+                self.__class__.__module__ + "." + self.__class__.__name__,
+                sorted((key, repr(value)) for key, value in self.config.items()),
+                fingerprints,
+            )
+        )
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
     def _decode_data(
         self, data: bytes, mapped_offset: int, offset: int, output_length: int
     ) -> bytes:
@@ -468,10 +934,23 @@ class TranslationLayerInterface(DataLayerInterface, metaclass=ABCMeta):
 
     # ## Read/Write functions for mapped pages
 
-    @functools.lru_cache(maxsize=512)
     def read(self, offset: int, length: int, pad: bool = False) -> bytes:
         """Reads an offset for length bytes and returns 'bytes' (not 'str') of
-        length size."""
+        length size.
+
+        Small reads are served from the context's shared :class:`ReadCache`
+        where possible, otherwise they are read through the mapping.
+        """
+        data = self._context.layers.cache.read(
+            self.name, offset, length, self._read_uncached
+        )
+        if data is None:
+            data = self._read_uncached(offset, length, pad)
+        return data
+
+    def _read_uncached(self, offset: int, length: int, pad: bool = False) -> bytes:
+        """Reads an offset for length bytes through the layer's mapping,
+        without consulting the read cache."""
         current_offset = offset
         output: bytes = b""
         for (
@@ -615,11 +1094,239 @@ class TranslationLayerInterface(DataLayerInterface, metaclass=ABCMeta):
                 yield output, chunk_position
 
 
+class ReadCache:
+    """A byte-budgeted cache of fixed-size blocks read from translation layers.
+
+    A single cache is shared by every layer within a :class:`LayerContainer`,
+    so the budget applies to the whole layer stack.  Blocks are keyed on the
+    layer name and block-aligned offset, meaning overlapping reads of different
+    lengths will hit the same cached blocks.  The least recently used blocks are
+    evicted once the budget is exceeded.
+
+    Only blocks that could be read in their entirety are cached, any read that
+    touches an invalid block is left to the layer to handle (and pad) itself.
+    """
+
+    block_size = 0x1000
+    """The size of each cached block"""
+
+    max_blocks_per_read = 16
+    """The largest read (in blocks) that will be served from the cache, larger reads (such as scan chunks) bypass it"""
+
+    def __init__(self, max_size: Optional[int] = None) -> None:
+        self._max_size = max_size
+        self._blocks: "collections.OrderedDict[Tuple[str, int], bytes]" = (
+            collections.OrderedDict()
+        )
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def max_size(self) -> int:
+        """The maximum number of bytes to hold in the cache (defaults to constants.LAYER_CACHE_SIZE)"""
+        if self._max_size is None:
+            return constants.LAYER_CACHE_SIZE
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value: Optional[int]) -> None:
+        self._max_size = value
+        with self._lock:
+            self._evict()
+
+    @property
+    def size(self) -> int:
+        """The number of bytes currently held in the cache"""
+        return self._size
+
+    def read(
+        self,
+        layer_name: str,
+        offset: int,
+        length: int,
+        read_block: Callable[[int, int], bytes],
+    ) -> Optional[bytes]:
+        """Returns length bytes from offset in layer_name, reading any uncached
+        blocks with read_block.
+
+        Args:
+            layer_name: The name of the layer the data is read from
+            offset: The offset at which to begin reading
+            length: The number of bytes to read
+            read_block: A callable taking an offset and length that reads (unpadded) data from the layer
+
+        Returns:
+            The requested data, or None if the read could not be served from the cache
+        """
+        if length <= 0 or self.max_size <= 0:
+            return None
+        first_block = offset - (offset % self.block_size)
+        last_block = (offset + length - 1) - ((offset + length - 1) % self.block_size)
+        if (last_block - first_block) // self.block_size >= self.max_blocks_per_read:
+            return None
+
+        blocks = []
+        for block_offset in range(first_block, last_block + 1, self.block_size):
+            key = (layer_name, block_offset)
+            with self._lock:
+                block = self._blocks.get(key)
+                if block is not None:
+                    self._blocks.move_to_end(key)
+                    self.hits += 1
+                else:
+                    self.misses += 1
+            if block is None:
+                try:
+                    block = read_block(block_offset, self.block_size)
+                except exceptions.InvalidAddressException:
+                    return None
+                if len(block) != self.block_size:
+                    return None
+                self._store(key, block)
+            blocks.append(block)
+
+        start = offset - first_block
+        if len(blocks) == 1:
+            return blocks[0][start : start + length]
+        return b"".join(blocks)[start : start + length]
+
+    def _store(self, key: Tuple[str, int], block: bytes) -> None:
+        with self._lock:
+            previous = self._blocks.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._blocks[key] = block
+            self._size += len(block)
+            self._evict()
+
+    def _evict(self) -> None:
+        """Removes the least recently used blocks until the cache is within
+        budget (the lock must be held)"""
+        max_size = max(self.max_size, 0)
+        while self._size > max_size and self._blocks:
+            _, block = self._blocks.popitem(last=False)
+            self._size -= len(block)
+            self.evictions += 1
+
+    def invalidate(self, layer_name: Optional[str] = None) -> None:
+        """Removes all cached blocks for layer_name, or every block if no
+        layer_name is provided."""
+        with self._lock:
+            if layer_name is None:
+                self._blocks.clear()
+                self._size = 0
+                return None
+            for key in [key for key in self._blocks if key[0] == layer_name]:
+                self._size -= len(self._blocks.pop(key))
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Do not copy cached data or the lock when cloning or pickling."""
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state["_blocks"] = collections.OrderedDict()
+        state["_size"] = 0
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__}: {self._size} bytes of {self.max_size},"
+            f" {self.hits} hits, {self.misses} misses, {self.evictions} evictions>"
+        )
+
+
+class ScanResultCache:
+    """Stores the results of scans on disk, within the cache directory, so
+    that identical scans of an unchanged image can be replayed rather than
+    rerun.
+
+    Entries are keyed by a hash of the scanned layer's fingerprint, the sections
+    scanned and the scanner's cache key, and expire after the cache period.
+    Results that refer to the context (such as constructed objects) are
+    restored against the context of the scan replaying them.
+    """
+
+    @classmethod
+    def _connect(cls) -> sqlite3.Connection:
+        database = sqlite3.connect(
+            os.path.join(constants.CACHE_PATH, constants.SCAN_CACHE_FILENAME),
+            timeout=30,
+        )
+        database.execute(
+            "CREATE TABLE IF NOT EXISTS scans (key TEXT PRIMARY KEY, results BLOB, cached DATETIME)"
+        )
+        return database
+
+    @classmethod
+    def load(
+        cls, key: str, context: "interfaces.context.ContextInterface"
+    ) -> Optional[List[Any]]:
+        """Returns the results stored against key, or None if there are none"""
+        try:
+            database = cls._connect()
+            try:
+                row = database.execute(
+                    "SELECT results FROM scans WHERE key = ? "
+                    f"AND cached >= datetime('now', '{constants.SQLITE_CACHE_PERIOD}')",
+                    (key,),
+                ).fetchone()
+            finally:
+                database.close()
+            if row is None:
+                return None
+            return ContextUnpickler(io.BytesIO(zlib.decompress(row[0])), context).load()
+        except (sqlite3.Error, pickle.UnpicklingError, zlib.error, EOFError) as excp:
+            vollog.log(constants.LOGLEVEL_VVVV, f"Unable to read scan cache: {excp}")
+            return None
+
+    @classmethod
+    def store(
+        cls,
+        key: str,
+        results: List[Any],
+        context: "interfaces.context.ContextInterface",
+    ) -> None:
+        """Stores results against key, removing any expired entries"""
+        try:
+            output = io.BytesIO()
+            ContextPickler(output, context).dump(results)
+            data = zlib.compress(output.getvalue())
+        except (pickle.PicklingError, TypeError, AttributeError) as excp:
+            vollog.log(
+                constants.LOGLEVEL_VVVV, f"Unable to pickle scan results: {excp}"
+            )
+            return None
+        try:
+            database = cls._connect()
+            try:
+                with database:
+                    database.execute(
+                        "DELETE FROM scans WHERE cached < "
+                        f"datetime('now', '{constants.SQLITE_CACHE_PERIOD}')"
+                    )
+                    database.execute(
+                        "INSERT OR REPLACE INTO scans VALUES (?, ?, datetime('now'))",
+                        (key, data),
+                    )
+            finally:
+                database.close()
+        except sqlite3.Error as excp:
+            vollog.log(constants.LOGLEVEL_VVVV, f"Unable to write scan cache: {excp}")
+
+
 class LayerContainer(collections.abc.Mapping):
     """Container for multiple layers of data."""
 
     def __init__(self) -> None:
         self._layers: Dict[str, DataLayerInterface] = {}
+        self.cache = ReadCache()
+        self.object_cache = interfaces.objects.ObjectCache()
 
     def read(self, layer: str, offset: int, length: int, pad: bool = False) -> bytes:
         """Reads from a particular layer at offset for length bytes.
@@ -637,11 +1344,68 @@ class LayerContainer(collections.abc.Mapping):
         """
         return self[layer].read(offset, length, pad)
 
+    def read_view(
+        self, layer: str, offset: int, length: int, pad: bool = False
+    ) -> memoryview:
+        """Reads from a particular layer at offset for length bytes, returning a
+        read-only memoryview of the data (avoiding copies where the layer permits).
+
+        Args:
+            layer: The name of the layer to read from
+            offset: Where to begin reading within the layer
+            length: How many bytes to read from the layer
+            pad: Whether to raise exceptions or return null bytes when errors occur
+
+        Returns:
+            A view of the result of reading from the requested layer
+        """
+        return self[layer].read_view(offset, length, pad)
+
+    def walk_pointers(
+        self,
+        layer: str,
+        offset: int,
+        pointer_offset: int = 0,
+        pointer_size: int = 8,
+        byteorder: str = "little",
+        mask: Optional[int] = None,
+        stop: Iterable[int] = (),
+        as_array: bool = False,
+    ) -> Union[Iterator[int], "numpy.ndarray"]:
+        """Follows a chain of pointers within a particular layer, yielding the
+        offset of each node visited (see :meth:`DataLayerInterface.walk_pointers`)
+
+        Args:
+            layer: The name of the layer to walk within
+            offset: The offset of the first node
+            pointer_offset: The offset of the pointer to the next node within each node
+            pointer_size: The size in bytes of each pointer
+            byteorder: The byte order of each pointer
+            mask: A mask to apply to each pointer (defaults to the layer's address mask)
+            stop: Offsets that end the walk when reached, without being returned
+            as_array: Whether to walk the whole chain and return the offsets as a numpy array of unsigned 64-bit integers
+
+        Returns:
+            An iterator over the offsets of the nodes visited, in order, starting with offset
+        """
+        return self[layer].walk_pointers(
+            offset,
+            pointer_offset=pointer_offset,
+            pointer_size=pointer_size,
+            byteorder=byteorder,
+            mask=mask,
+            stop=stop,
+            as_array=as_array,
+        )
+
     def __eq__(self, other):
         return dict(self) == dict(other)
 
     def write(self, layer: str, offset: int, data: bytes) -> None:
         """Writes to a particular layer at offset for length bytes."""
+        # Any layer built upon this one may have cached the old data
+        self.cache.invalidate()
+        self.object_cache.invalidate()
         self[layer].write(offset, data)
 
     def add_layer(self, layer: DataLayerInterface) -> None:
@@ -686,6 +1450,8 @@ class LayerContainer(collections.abc.Mapping):
         # Otherwise, wipe out the layer
         self._layers[name].destroy()
         del self._layers[name]
+        self.cache.invalidate(name)
+        self.object_cache.invalidate(name)
 
     def free_layer_name(self, prefix: str = "layer") -> str:
         """Returns an unused layer name to ensure no collision occurs when
@@ -721,6 +1487,126 @@ class LayerContainer(collections.abc.Mapping):
         raise NotImplementedError("Cycle checking has not yet been implemented")
 
 
+class ContextPickler(pickle.Pickler):
+    """A pickler that stores references to a particular context, rather than
+    the context itself, so that objects can be passed between processes that
+    each hold an equivalent context."""
+
+    def __init__(
+        self, file: IO[bytes], context: "interfaces.context.ContextInterface"
+    ) -> None:
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self._context = context
+
+    def persistent_id(self, obj: Any) -> Optional[str]:
+        if obj is self._context:
+            return "context"
+        return None
+
+
+class ContextUnpickler(pickle.Unpickler):
+    """An unpickler that restores the references recorded by a
+    :class:`ContextPickler` to a particular context."""
+
+    def __init__(
+        self, file: IO[bytes], context: "interfaces.context.ContextInterface"
+    ) -> None:
+        super().__init__(file)
+        self._context = context
+
+    def persistent_load(self, pid: Any) -> Any:
+        if pid == "context":
+            return self._context
+        raise pickle.UnpicklingError(f"Unsupported persistent id: {pid}")
+
+
+class ScanPayload:
+    """Holds a pickled layer and scanner in shared memory for the duration of a
+    scan, so that each worker process unpickles them once per scan rather than
+    once per chunk."""
+
+    def __init__(self, layer: DataLayerInterface, scanner: ScannerInterface) -> None:
+        self.scan_id = uuid.uuid4().hex
+        data = pickle.dumps((layer, scanner), pickle.HIGHEST_PROTOCOL)
+        self._memory = shared_memory.SharedMemory(create=True, size=len(data))
+        self._memory.buf[: len(data)] = data
+
+    @property
+    def name(self) -> str:
+        """The name of the shared memory block holding the payload"""
+        return self._memory.name
+
+    def __enter__(self) -> "ScanPayload":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._memory.close()
+        self._memory.unlink()
+
+
+# The scan identifier, layer and scanner of the current scan, as unpickled within a worker process
+_worker_scan: Optional[Tuple[str, DataLayerInterface, ScannerInterface]] = None
+
+
+def _scan_worker_chunk(
+    scan_id: str, payload_name: str, iterator_value: IteratorValue
+) -> bytes:
+    """Scans a single chunk within a worker process, returning the pickled results.
+
+    The layer and scanner for the scan are loaded from the shared memory
+    payload the first time the worker sees a chunk from the scan.  Only the
+    most recent scan is kept, so each worker holds at most one copy of the
+    context however many scans are run.
+    """
+    global _worker_scan
+    if _worker_scan is None or _worker_scan[0] != scan_id:
+        # Release the previous scan's context before loading the next one
+        _worker_scan = None
+        memory = shared_memory.SharedMemory(name=payload_name)
+        if sys.platform != "win32":
+            # The parent process owns (and will unlink) the block, don't let this process' tracker claim it
+            resource_tracker.unregister(memory._name, "shared_memory")  # type: ignore
+        try:
+            layer, scanner = pickle.loads(memory.buf)
+        finally:
+            memory.close()
+        _worker_scan = (scan_id, layer, scanner)
+    _, layer, scanner = _worker_scan
+    results = layer._scan_chunk(scanner, DummyProgress(), iterator_value)
+    output = io.BytesIO()
+    ContextPickler(output, layer.context).dump(results)
+    return output.getvalue()
+
+
+class ScanWorkerPool:
+    """A long-lived pool of worker processes used for multiprocessing scans.
+
+    The pool is created on first use and shared by every scan for the lifetime
+    of the process, so consecutive scans (such as automagic followed by plugins)
+    do not each pay for starting up the worker processes.
+    """
+
+    _pool: Optional[multiprocessing.pool.Pool] = None
+    _processes = 0
+
+    @classmethod
+    def get_pool(cls) -> Tuple[multiprocessing.pool.Pool, int]:
+        """Returns the worker pool (creating it if necessary) and the number of processes within it"""
+        if cls._pool is None:
+            cls._processes = os.cpu_count() or 1
+            cls._pool = multiprocessing.Pool(cls._processes)
+            atexit.register(cls.shutdown)
+        return cls._pool, cls._processes
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Terminates the worker pool, if one has been created"""
+        if cls._pool is not None:
+            cls._pool.terminate()
+            cls._pool.join()
+            cls._pool = None
+
+
 class DummyProgress(object):
     """A class to emulate Multiprocessing/threading Value objects."""
 
@@ -8,7 +8,9 @@ import collections
 import collections.abc
 import contextlib
 import logging
-from typing import Any, Dict, List, Mapping, Optional
+import threading
+import weakref
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 from volatility3.framework import constants, interfaces
 
@@ -380,3 +382,119 @@ class Template:
         object_info: ObjectInformation,
     ) -> ObjectInterface:
         """Constructs the object."""
+
+
+class ObjectCache:
+    """Interns constructed objects so that repeated requests for the same
+    object return the same instance.
+
+    Objects are keyed on the layer they live in, their offset, their native
+    layer and the (unmodified) template used to construct them.  Entries are
+    held by weak reference, so an object stays interned for as long as anything
+    else refers to it; the most recently used objects are additionally held by
+    a bounded strong reference list so that short-lived objects (such as those
+    produced by walking a list) survive between uses.
+
+    Interned objects are shared, so their `vol.parent` is that of whichever
+    request first constructed them.  The cache is only consulted when
+    constants.CACHE_OBJECTS is enabled.
+    """
+
+    def __init__(self, max_size: Optional[int] = None) -> None:
+        self._max_size = max_size
+        self._objects: "weakref.WeakValueDictionary[Tuple, ObjectInterface]" = (
+            weakref.WeakValueDictionary()
+        )
+        self._recent: "collections.OrderedDict[Tuple, ObjectInterface]" = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def max_size(self) -> int:
+        """The number of recently used objects held by strong reference (defaults to constants.OBJECT_CACHE_SIZE)"""
+        if self._max_size is None:
+            return constants.OBJECT_CACHE_SIZE
+        return self._max_size
+
+    @property
+    def enabled(self) -> bool:
+        """Whether objects should be looked up in and added to the cache"""
+        return constants.CACHE_OBJECTS
+
+    def get(self, key: Tuple) -> Optional[ObjectInterface]:
+        """Returns the object interned under key, or None if there is no such
+        object."""
+        with self._lock:
+            result = self._objects.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            if key in self._recent:
+                self._recent.move_to_end(key)
+            else:
+                self._remember(key, result)
+        return result
+
+    def add(self, key: Tuple, value: ObjectInterface) -> ObjectInterface:
+        """Interns value under key, returning the object that should be used
+        (which may be an equivalent object that was interned first).
+
+        Objects that cannot be weakly referenced are returned without being
+        cached.
+        """
+        with self._lock:
+            existing = self._objects.get(key)
+            if existing is not None:
+                return existing
+            try:
+                self._objects[key] = value
+            except TypeError:
+                return value
+            self._remember(key, value)
+        return value
+
+    def _remember(self, key: Tuple, value: ObjectInterface) -> None:
+        """Holds a strong reference to value, dropping the least recently used
+        references beyond max_size (the lock must be held)"""
+        self._recent[key] = value
+        while len(self._recent) > max(self.max_size, 0):
+            self._recent.popitem(last=False)
+
+    def invalidate(self, layer_name: Optional[str] = None) -> None:
+        """Removes all objects constructed on (or natively referencing)
+        layer_name, or every object if no layer_name is provided."""
+        with self._lock:
+            if layer_name is None:
+                self._objects.clear()
+                self._recent.clear()
+                return None
+            for key in [key for key in self._objects.keys() if layer_name in key[:3:2]]:
+                self._objects.pop(key, None)
+                self._recent.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Do not copy interned objects or the lock when cloning or pickling."""
+        state = self.__dict__.copy()
+        for key in ["_lock", "_objects", "_recent"]:
+            del state[key]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._objects = weakref.WeakValueDictionary()
+        self._recent = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__}: {len(self._objects)} objects,"
+            f" {len(self._recent)} held of {self.max_size},"
+            f" {self.hits} hits, {self.misses} misses>"
+        )
@@ -102,7 +102,7 @@ class BaseSymbolTableInterface:
             table_mapping = {}
         self.table_mapping = table_mapping
         self._native_types = native_types
-        self._sort_symbols: List[Tuple[int, str]] = []
+        self._sort_symbols: Optional[Tuple[List[int], List[str]]] = None
 
         # Set any provisioned class_types
         if class_types:
@@ -235,22 +235,25 @@ class BaseSymbolTableInterface:
         particular offset."""
         if size < 0:
             raise ValueError("Size must be strictly non-negative")
-        if not self._sort_symbols:
-            self._sort_symbols = sorted(
-                [(self.get_symbol(sn).address, sn) for sn in self.symbols]
+        if self._sort_symbols is None:
+            sort_symbols = sorted(self._symbol_locations())
+            self._sort_symbols = (
+                [address for address, _ in sort_symbols],
+                [name for _, name in sort_symbols],
             )
-        sort_symbols = self._sort_symbols
-        result = bisect.bisect_left(sort_symbols, (offset, ""))
-        while result < len(sort_symbols) and (
-            sort_symbols[result][0] >= offset
-            and sort_symbols[result][0] <= offset + size
-        ):
-            yield sort_symbols[result][1]
-            result += 1
+        addresses, names = self._sort_symbols
+        start = bisect.bisect_left(addresses, offset)
+        end = bisect.bisect_right(addresses, offset + size, start)
+        yield from names[start:end]
+
+    def _symbol_locations(self) -> Iterable[Tuple[int, str]]:
+        """Returns the address and name of every symbol in the table, used to
+        build the index for :meth:`get_symbols_by_location`"""
+        return ((self.get_symbol(sn).address, sn) for sn in self.symbols)
 
     def clear_symbol_cache(self) -> None:
         """Clears the symbol cache of this symbol table."""
-        pass
+        self._sort_symbols = None
 
 
 class SymbolSpaceInterface(collections.abc.Mapping):
@@ -280,6 +283,20 @@ class SymbolSpaceInterface(collections.abc.Mapping):
     def get_type(self, type_name: str) -> objects.Template:
         """Look-up a type name across all the contained symbol tables."""
 
+    def get_type_accessor(self, type_name: str) -> Any:
+        """Returns the compiled member accessor for an aggregate type within
+        the contained symbol tables.
+
+        Symbol spaces that do not share accessors between objects need not
+        override this, in which case each aggregate compiles its own.
+
+        Raises:
+            SymbolError: If no shared accessor is available for the type
+        """
+        raise exceptions.SymbolError(
+            type_name, None, f"No member accessor available for: {type_name}"
+        )
+
     @abstractmethod
     def get_symbol(self, symbol_name: str) -> SymbolInterface:
         """Look-up a symbol name across all the contained symbol tables."""
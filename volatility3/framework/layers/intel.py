@@ -7,8 +7,16 @@ import functools
 import logging
 import math
 import struct
+from bisect import bisect_right
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+try:
+    import numpy
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 from volatility3 import classproperty
 from volatility3.framework import exceptions, interfaces, constants
 from volatility3.framework.configuration import requirements
@@ -77,6 +85,13 @@ class Intel(linear.LinearlyMappedLayer):
             math.ceil(math.log2(struct.calcsize(self._entry_format)))
         )
 
+        # The translation index is built on demand, once enough of the space has been mapped
+        self._virtual_mask = (1 << (self._initial_position + 1)) - 1
+        self._translation_index: Optional[List[Tuple[int, int, int, int]]] = None
+        self._translation_index_starts: List[int] = []
+        self._translation_index_walks: List[Tuple[int, int]] = []
+        self._translation_index_pressure = 0
+
     @classproperty
     @functools.lru_cache()
     def page_shift(cls) -> int:
@@ -162,6 +177,16 @@ class Intel(linear.LinearlyMappedLayer):
         translated address lives in and the layer_name that the address
         lives in
         """
+        if self._translation_index is not None:
+            run = self._find_translation_run(offset & self._virtual_mask)
+            if run is not None:
+                run_start, _, mapped_start, page_size = run
+                return (
+                    mapped_start + (offset & self._virtual_mask) - run_start,
+                    page_size,
+                    self._base_layer,
+                )
+
         entry, position = self._translate_entry(offset)
 
         # Now we're done
@@ -279,6 +304,321 @@ class Intel(linear.LinearlyMappedLayer):
             return None
         return table
 
+    ### Translation index
+
+    def _use_translation_index(self, length: int) -> bool:
+        """Determines whether the translation index should be used for a mapping
+        request of length bytes, building it if enough of the layer has been
+        requested."""
+        if self._translation_index is not None:
+            return True
+        threshold = constants.TRANSLATION_INDEX_THRESHOLD
+        if threshold is None or self.config.get("swap_layers", False):
+            # Swapped pages are only found by walking the tables, so they cannot be indexed
+            return False
+        self._translation_index_pressure += length >> self._page_size_in_bits
+        if self._translation_index_pressure < threshold:
+            return False
+        self.build_translation_index()
+        return True
+
+    def build_translation_index(self) -> None:
+        """Walks every table reachable from the page map offset once, building
+        a sorted index of (virtual start, length, physical start, page size)
+        runs that allows translation and mapping to be carried out with a binary
+        search rather than a walk of the tables for each page."""
+        vollog.log(
+            constants.LOGLEVEL_VVV,
+            f"Building translation index for {self.name} at {hex(self._page_map_offset)}",
+        )
+        runs: List[List[int]] = []
+        self._translation_index_walks = []
+        if HAS_NUMPY:
+            self._index_table_bulk(
+                self._initial_entry, self._initial_position, 0, 0, runs
+            )
+        else:
+            self._index_table(self._initial_entry, self._initial_position, 0, 0, runs)
+        self._translation_index = [
+            (run_start, length, mapped_start, page_size)
+            for run_start, length, mapped_start, page_size in runs
+        ]
+        self._translation_index_starts = [run[0] for run in self._translation_index]
+        self._translation_index_walks.sort()
+        vollog.log(
+            constants.LOGLEVEL_VVV,
+            f"Translation index for {self.name} contains {len(runs)} runs",
+        )
+
+    def _index_table(
+        self,
+        entry: int,
+        position: int,
+        level: int,
+        virtual_offset: int,
+        runs: List[List[int]],
+    ) -> None:
+        """Adds the runs mapped by entry (which covers the address bits at and
+        below position, starting at virtual_offset) to runs, following the same
+        rules as :meth:`_translate_entry`."""
+        if not self._page_is_valid(entry):
+            return None
+        if level < len(self._structure):
+            name, size, large_page = self._structure[level]
+            if not (large_page and (entry & self._PAGE_PSE)):
+                position -= size
+                base_address = self._mask(
+                    entry, self._maxphyaddr - 1, size + self._index_shift
+                )
+                try:
+                    table = self._context.layers.read_view(
+                        self._base_layer, base_address, self.page_size
+                    )
+                except exceptions.InvalidAddressException:
+                    return None
+                entries = struct.unpack(self._table_format, table)
+                # Tables of entirely duplicate entries are invalid (see _get_valid_table)
+                if entries.count(entries[0]) == len(entries):
+                    return None
+                for index in range(1 << size):
+                    if entries[index]:
+                        self._index_table(
+                            entries[index],
+                            position,
+                            level + 1,
+                            virtual_offset | (index << (position + 1)),
+                            runs,
+                        )
+                return None
+            if entry & self._PAGE_PAT_LARGE:
+                entry -= self._PAGE_PAT_LARGE
+
+        page_size = 1 << (position + 1)
+        mapped_offset = self._pte_pfn(entry) << self.page_shift
+        if mapped_offset & (page_size - 1):
+            # Leave malformed large pages to be handled by walking the tables
+            self._translation_index_walks.append((virtual_offset, page_size))
+            return None
+        if runs:
+            last_run = runs[-1]
+            if (
+                last_run[0] + last_run[1] == virtual_offset
+                and last_run[2] + last_run[1] == mapped_offset
+                and last_run[3] == page_size
+            ):
+                last_run[1] += page_size
+                return None
+        runs.append([virtual_offset, page_size, mapped_offset, page_size])
+
+    def _index_table_bulk(
+        self,
+        entry: int,
+        position: int,
+        level: int,
+        virtual_offset: int,
+        runs: List[List[int]],
+    ) -> None:
+        """Adds the runs mapped by the table that entry points to, as
+        :meth:`_index_table` does, but processing each table as a numpy array
+        so that only present entries are visited individually.
+
+        The entry must be valid and must point to a table (not a large page).
+        """
+        _, size, _ = self._structure[level]
+        position -= size
+        base_address = self._mask(entry, self._maxphyaddr - 1, size + self._index_shift)
+        try:
+            table = self._context.layers.read_view(
+                self._base_layer, base_address, self.page_size
+            )
+        except exceptions.InvalidAddressException:
+            return None
+        entries = numpy.frombuffer(table, dtype=self._entry_format).astype(numpy.uint64)
+        # Tables of entirely duplicate entries are invalid (see _get_valid_table)
+        if (entries == entries[0]).all():
+            return None
+        entries = entries[: 1 << size]
+
+        valid = self._pages_are_valid(entries)
+        if level + 1 >= len(self._structure):
+            leaves = valid
+        else:
+            _, _, large_page = self._structure[level + 1]
+            leaves = valid & ((entries & self._PAGE_PSE) != 0) if large_page else None
+        page_size = 1 << (position + 1)
+
+        leaf_indices = numpy.nonzero(leaves)[0] if leaves is not None else []
+        table_indices = numpy.nonzero(valid if leaves is None else valid & ~leaves)[0]
+        leaf_start = 0
+        for table_index in table_indices.tolist():
+            # Add any leaves that come before this table, to keep the runs in order
+            leaf_end = numpy.searchsorted(leaf_indices, table_index)
+            if leaf_end > leaf_start:
+                self._index_leaves_bulk(
+                    entries,
+                    leaf_indices[leaf_start:leaf_end],
+                    level + 1 < len(self._structure),
+                    page_size,
+                    virtual_offset,
+                    runs,
+                )
+                leaf_start = leaf_end
+            self._index_table_bulk(
+                int(entries[table_index]),
+                position,
+                level + 1,
+                virtual_offset | (table_index << (position + 1)),
+                runs,
+            )
+        if len(leaf_indices) > leaf_start:
+            self._index_leaves_bulk(
+                entries,
+                leaf_indices[leaf_start:],
+                level + 1 < len(self._structure),
+                page_size,
+                virtual_offset,
+                runs,
+            )
+
+    def _index_leaves_bulk(
+        self,
+        entries: "numpy.ndarray",
+        indices: "numpy.ndarray",
+        large_pages: bool,
+        page_size: int,
+        virtual_offset: int,
+        runs: List[List[int]],
+    ) -> None:
+        """Adds the pages mapped by the entries at indices to runs,
+        coalescing contiguous pages."""
+        leaf_entries = entries[indices]
+        if large_pages:
+            # Mask off the PAT bit
+            leaf_entries = leaf_entries & ~numpy.uint64(self._PAGE_PAT_LARGE)
+        mapped_offsets = self._pte_pfns(leaf_entries) << numpy.uint64(self.page_shift)
+        virtual_offsets = numpy.uint64(virtual_offset) | (
+            indices.astype(numpy.uint64) * numpy.uint64(page_size)
+        )
+        # Leave malformed large pages to be handled by walking the tables
+        aligned = (mapped_offsets & numpy.uint64(page_size - 1)) == 0
+        self._translation_index_walks.extend(
+            (walk_start, page_size) for walk_start in virtual_offsets[~aligned].tolist()
+        )
+        mapped_offsets = mapped_offsets[aligned]
+        virtual_offsets = virtual_offsets[aligned]
+        if not len(virtual_offsets):
+            return None
+
+        # Find where the contiguous runs of pages break
+        breaks = numpy.ones(len(virtual_offsets), dtype=bool)
+        breaks[1:] = (numpy.diff(virtual_offsets) != page_size) | (
+            numpy.diff(mapped_offsets) != page_size
+        )
+        starts = numpy.nonzero(breaks)[0]
+        lengths = numpy.diff(numpy.append(starts, len(virtual_offsets))) * page_size
+        for run_start, length, mapped_offset in zip(
+            virtual_offsets[starts].tolist(),
+            lengths.tolist(),
+            mapped_offsets[starts].tolist(),
+        ):
+            if runs:
+                last_run = runs[-1]
+                if (
+                    last_run[0] + last_run[1] == run_start
+                    and last_run[2] + last_run[1] == mapped_offset
+                    and last_run[3] == page_size
+                ):
+                    last_run[1] += length
+                    continue
+            runs.append([run_start, length, mapped_offset, page_size])
+
+    @staticmethod
+    def _pages_are_valid(entries: "numpy.ndarray") -> "numpy.ndarray":
+        """Returns an array of whether each page is valid, based on an array
+        of entries (see :meth:`_page_is_valid`)."""
+        return (entries & numpy.uint64(1)) != 0
+
+    def _pte_pfns(self, entries: "numpy.ndarray") -> "numpy.ndarray":
+        """Extracts the page frame numbers from an array of page table entries
+        (see :meth:`_pte_pfn`)."""
+        return (entries & numpy.uint64((1 << self._maxphyaddr) - 1)) >> numpy.uint64(
+            self.page_shift
+        )
+
+    @functools.cached_property
+    def _table_format(self) -> str:
+        return self._entry_format[0] + str(self._entry_number) + self._entry_format[1:]
+
+    def _find_translation_run(self, offset: int) -> Optional[Tuple[int, int, int, int]]:
+        """Returns the index run containing offset, if there is one"""
+        if self._translation_index is None:
+            return None
+        index = bisect_right(self._translation_index_starts, offset) - 1
+        if index >= 0:
+            run = self._translation_index[index]
+            if offset < run[0] + run[1]:
+                return run
+        return None
+
+    def _index_walks(self, start: int, end: int) -> Iterable[Tuple[int, int]]:
+        """Yields the (start, end) ranges between start and end that were left
+        out of the translation index to be handled by walking the tables"""
+        walks = self._translation_index_walks
+        index = max(bisect_right(walks, (start,)) - 1, 0)
+        for walk_start, walk_size in walks[index:]:
+            if walk_start >= end:
+                break
+            overlap_start = max(walk_start, start)
+            overlap_end = min(walk_start + walk_size, end)
+            if overlap_start < overlap_end:
+                yield overlap_start, overlap_end
+
+    def _indexed_mapping(
+        self, offset: int, length: int, ignore_errors: bool = False
+    ) -> Iterable[Tuple[int, int, int, int, str]]:
+        """Returns the same mappings as :meth:`_mapping`, but using the
+        translation index, only walking the tables to produce the appropriate
+        exceptions for any unmapped regions."""
+        if self._translation_index is None:
+            return None
+        virtual_offset = offset & self._virtual_mask
+        # Mappings are reported relative to the (possibly canonicalized) offset requested
+        delta = offset - virtual_offset
+        end = virtual_offset + length
+        base_layer = self._context.layers[self._base_layer]
+        index = max(bisect_right(self._translation_index_starts, virtual_offset) - 1, 0)
+        current = virtual_offset
+        while current < end:
+            if index < len(self._translation_index):
+                run_start, run_length, mapped_start, _ = self._translation_index[index]
+            else:
+                run_start = run_length = mapped_start = end
+            if run_start + run_length <= current:
+                index += 1
+                continue
+            if run_start > current:
+                # There's a hole in the index, let the table walk determine the appropriate error
+                gap_end = min(run_start, end)
+                if not ignore_errors:
+                    yield from self._mapping(current + delta, gap_end - current)
+                else:
+                    # Only pages left out of the index need walking for mappings
+                    for walk_start, walk_end in self._index_walks(current, gap_end):
+                        yield from self._mapping(
+                            walk_start + delta, walk_end - walk_start, ignore_errors
+                        )
+                current = gap_end
+                continue
+            chunk_end = min(end, run_start + run_length)
+            chunk_size = chunk_end - current
+            mapped_offset = mapped_start + current - run_start
+            if base_layer.is_valid(mapped_offset, chunk_size):
+                yield current + delta, chunk_size, mapped_offset, chunk_size, self._base_layer
+            else:
+                yield from self._mapping(current + delta, chunk_size, ignore_errors)
+            current = chunk_end
+            index += 1
+
     def is_valid(self, offset: int, length: int = 1) -> bool:
         """Returns whether the address offset can be translated to a valid
         address."""
@@ -307,7 +647,14 @@ class Intel(linear.LinearlyMappedLayer):
         stashed_offset = stashed_mapped_offset = stashed_size = stashed_mapped_size = (
             stashed_map_layer
         ) = None
-        for offset, size, mapped_offset, mapped_size, map_layer in self._mapping(
+        mappings = self._mapping
+        if (
+            length > 0
+            and (offset & self._virtual_mask) + length <= self._virtual_mask + 1
+            and self._use_translation_index(length)
+        ):
+            mappings = self._indexed_mapping
+        for offset, size, mapped_offset, mapped_size, map_layer in mappings(
             offset, length, ignore_errors
         ):
             if (
@@ -458,6 +805,15 @@ class WindowsMixin(Intel):
         """
         return bool((entry & 1) or ((entry & 1 << 11) and not entry & 1 << 10))
 
+    @staticmethod
+    def _pages_are_valid(entries: "numpy.ndarray") -> "numpy.ndarray":
+        """Returns an array of whether each page is valid, including transition
+        pages (see :meth:`_page_is_valid`)."""
+        return ((entries & numpy.uint64(1)) != 0) | (
+            ((entries & numpy.uint64(1 << 11)) != 0)
+            & ((entries & numpy.uint64(1 << 10)) == 0)
+        )
+
     def _translate_swap(
         self, layer: Intel, offset: int, bit_offset: int
     ) -> Tuple[int, int, str]:
@@ -562,6 +918,13 @@ class LinuxMixin(Intel):
         # Overrides the Intel static method with the Linux-specific implementation
         return self._is_pte_present(entry)
 
+    def _pages_are_valid(self, entries: "numpy.ndarray") -> "numpy.ndarray":
+        return (
+            entries
+            & numpy.uint64(self._pte_flags_mask)
+            & numpy.uint64(self._PAGE_PRESENT | self._PAGE_PROTNONE)
+        ) != 0
+
     def _pte_needs_invert(self, entry) -> bool:
         # Entries that were set to PROT_NONE (PAGE_PRESENT) are inverted
         # A clear PTE shouldn't be inverted. See f19f5c4
@@ -576,6 +939,15 @@ class LinuxMixin(Intel):
         pfn = entry ^ self._protnone_mask(entry)
         return (pfn & self._pte_pfn_mask) >> self.page_shift
 
+    def _pte_pfns(self, entries: "numpy.ndarray") -> "numpy.ndarray":
+        inverted = (entries != 0) & ((entries & numpy.uint64(self._PAGE_PRESENT)) == 0)
+        pfns = numpy.where(
+            inverted, entries ^ numpy.uint64(self._register_mask), entries
+        )
+        return (pfns & numpy.uint64(self._pte_pfn_mask)) >> numpy.uint64(
+            self.page_shift
+        )
+
 
 class LinuxIntel(LinuxMixin, Intel):
     pass
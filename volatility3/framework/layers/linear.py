@@ -2,8 +2,7 @@
 # which is available at https://www.volatilityfoundation.org/license/vsl-v1.0
 #
 
-import functools
-from typing import List, Optional, Tuple, Iterable
+from typing import Iterable, List, Optional, Tuple, Union
 
 from volatility3.framework import exceptions, interfaces
 
@@ -36,15 +35,25 @@ class LinearlyMappedLayer(interfaces.layers.TranslationLayerInterface):
     # ## Read/Write functions for mapped pages
     # Redefine read here for speed reasons (so we don't call a processing method
 
-    @functools.lru_cache(maxsize=512)
-    def read(self, offset: int, length: int, pad: bool = False) -> bytes:
+    def _read_uncached(self, offset: int, length: int, pad: bool = False) -> bytes:
         """Reads an offset for length bytes and returns 'bytes' (not 'str') of
         length size."""
+        return self._read_mapped(
+            offset, length, pad, self.mapping(offset, length, ignore_errors=pad)
+        )
+
+    def _read_mapped(
+        self,
+        offset: int,
+        length: int,
+        pad: bool,
+        mapping: Iterable[Tuple[int, int, int, int, str]],
+    ) -> bytes:
+        """Reads an offset for length bytes using a mapping of the range that
+        has already been determined."""
         current_offset = offset
-        output: List[bytes] = []
-        for offset, _, mapped_offset, mapped_length, layer in self.mapping(
-            offset, length, ignore_errors=pad
-        ):
+        output: List[Union[bytes, memoryview]] = []
+        for offset, _, mapped_offset, mapped_length, layer in mapping:
             if not pad and offset > current_offset:
                 raise exceptions.InvalidAddressException(
                     self.name,
@@ -59,13 +68,28 @@ class LinearlyMappedLayer(interfaces.layers.TranslationLayerInterface):
                     self.name, "Mapping returned an overlapping element"
                 )
             if mapped_length > 0:
+                # Views are joined below, so avoid copying the lower layer's data twice
                 output += [
-                    self._context.layers.read(layer, mapped_offset, mapped_length, pad)
+                    self._context.layers.read_view(
+                        layer, mapped_offset, mapped_length, pad
+                    )
                 ]
             current_offset += mapped_length
         recovered_data = b"".join(output)
         return recovered_data + b"\x00" * (length - len(recovered_data))
 
+    def read_view(self, offset: int, length: int, pad: bool = False) -> memoryview:
+        """Reads an offset for length bytes, returning a view of the lower
+        layer's data directly if it maps onto a single contiguous block."""
+        mapping = list(self.mapping(offset, length, ignore_errors=pad))
+        if len(mapping) == 1:
+            mapped_start, _, mapped_offset, mapped_length, layer = mapping[0]
+            if mapped_start == offset and mapped_length == length:
+                return self._context.layers.read_view(
+                    layer, mapped_offset, mapped_length, pad
+                )
+        return memoryview(self._read_mapped(offset, length, pad, mapping))
+
     def write(self, offset: int, value: bytes) -> None:
         """Writes a value at offset, distributing the writing across any
         underlying mapping."""
@@ -1,8 +1,13 @@
 # This file is Copyright 2019 Volatility Foundation and licensed under the Volatility Software License 1.0
 # which is available at https://www.volatilityfoundation.org/license/vsl-v1.0
 #
+import hashlib
+import io
 import logging
+import mmap
+import os
 import threading
+import urllib.response
 from typing import Any, Dict, IO, List, Optional, Union
 
 from volatility3.framework import constants, exceptions, interfaces
@@ -57,6 +62,17 @@ class BufferDataLayer(interfaces.layers.DataLayerInterface):
             )
         return self._buffer[address : address + length]
 
+    def read_view(self, address: int, length: int, pad: bool = False) -> memoryview:
+        """Returns a view onto the buffer without copying the data."""
+        if not self.is_valid(address, length):
+            return memoryview(self.read(address, length, pad))
+        return memoryview(self._buffer)[address : address + length]
+
+    @property
+    def fingerprint(self) -> Optional[str]:
+        """Identifies the buffer by a hash of its entire contents."""
+        return hashlib.sha256(self._buffer).hexdigest()
+
     def write(self, address: int, data: bytes):
         """Writes the data from to the buffer."""
         self._buffer = (
@@ -84,7 +100,14 @@ class DummyLock:
 
 
 class FileLayer(interfaces.layers.DataLayerInterface):
-    """a DataLayer backed by a file on the filesystem."""
+    """a DataLayer backed by a file on the filesystem.
+
+    Where the underlying file is a plain local file, the data is accessed through
+    a read-only memory map (so that :meth:`read_view` can return data without copying),
+    falling back to positional reads (``os.pread``) which need no lock between threads.
+    Only when neither is possible (such as compressed or remote files) are reads
+    serialized through a seek/read pair.
+    """
 
     def __init__(
         self,
@@ -101,8 +124,11 @@ class FileLayer(interfaces.layers.DataLayerInterface):
         self._location = self.config["location"]
         self._accessor = resources.ResourceAccessor()
         self._file_: Optional[IO[Any]] = None
+        self._mmap_: Optional[mmap.mmap] = None
+        self._use_mmap = True
         self._size: Optional[int] = None
         self._maximum_address: Optional[int] = None
+        self._fingerprint: Optional[str] = None
         # Construct the lock now (shared if made before threading) in case we ever need it
         self._lock: Union[DummyLock, threading.Lock] = DummyLock()
         if constants.PARALLELISM == constants.Parallelism.Threading:
@@ -115,6 +141,33 @@ class FileLayer(interfaces.layers.DataLayerInterface):
         """Returns the location on which this Layer abstracts."""
         return self._location
 
+    @property
+    def fingerprint(self) -> Optional[str]:
+        """Identifies a plain local file by its location, size, modification
+        time and inode, along with its header and a sample of its contents.
+
+        Files that cannot be read at random (such as compressed or remote
+        files) have no fingerprint, since their contents cannot be identified
+        without reading them in their entirety.
+        """
+        if self._fingerprint is None:
+            fileno = self._fileno
+            if fileno is None:
+                return None
+            try:
+                stat = os.fstat(fileno)
+            except OSError:
+                return None
+            self._fingerprint = self._sampled_fingerprint(
+                self.__class__.__name__,
+                self._location,
+                stat.st_size,
+                stat.st_mtime_ns,
+                stat.st_ino,
+                stat.st_dev,
+            )
+        return self._fingerprint
+
     @property
     def _file(self) -> IO[Any]:
         """Property to prevent the initializer storing an unserializable open
@@ -124,12 +177,51 @@ class FileLayer(interfaces.layers.DataLayerInterface):
         self._file_ = self._file_ or self._accessor.open(self._location, mode)
         return self._file_
 
+    @property
+    def _fileno(self) -> Optional[int]:
+        """Returns the operating system file descriptor for the file, if the
+        data read through the descriptor is the same as the data read through
+        the file object (ie, the file is not compressed or remote)"""
+        raw_file = self._file
+        if isinstance(raw_file, urllib.response.addbase):
+            raw_file = raw_file.fp
+        if not isinstance(raw_file, (io.BufferedReader, io.BufferedRandom, io.FileIO)):
+            return None
+        try:
+            return raw_file.fileno()
+        except (OSError, ValueError):
+            return None
+
+    @property
+    def _mapped(self) -> Optional[mmap.mmap]:
+        """Property to prevent the initializer storing an unserializable memory
+        map (for context cloning)"""
+        if self._mmap_ is None and self._use_mmap:
+            fileno = self._fileno
+            try:
+                if fileno is None:
+                    raise ValueError("File has no usable file descriptor")
+                self._mmap_ = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError, OverflowError) as excp:
+                # Empty files, 32-bit address spaces and special files cannot be mapped
+                vollog.log(
+                    constants.LOGLEVEL_VVVV,
+                    f"Unable to memory map {self._location}: {excp}",
+                )
+                self._use_mmap = False
+        return self._mmap_
+
     @property
     def maximum_address(self) -> int:
         """Returns the largest available address in the space."""
         # Zero based, so we return the size of the file minus 1
         if self._maximum_address:
             return self._maximum_address
+        mapped = self._mapped
+        if mapped is not None:
+            self._size = len(mapped)
+            self._maximum_address = self._size - 1
+            return self._maximum_address
         with self._lock:
             orig = self._file.tell()
             self._file.seek(0, 2)
@@ -154,6 +246,22 @@ class FileLayer(interfaces.layers.DataLayerInterface):
 
     def read(self, offset: int, length: int, pad: bool = False) -> bytes:
         """Reads from the file at offset for length."""
+        data = self._read_data(offset, length, pad)
+        if isinstance(data, memoryview):
+            return data.tobytes()
+        return data
+
+    def read_view(self, offset: int, length: int, pad: bool = False) -> memoryview:
+        """Reads from the file at offset for length, returning a view onto the
+        memory mapped file where possible to avoid copying the data."""
+        return memoryview(self._read_data(offset, length, pad))
+
+    def _read_data(
+        self, offset: int, length: int, pad: bool = False
+    ) -> Union[bytes, memoryview]:
+        """Reads from the file at offset for length, as a view onto the memory
+        mapped file if there is one, or as the bytes read from the file
+        otherwise."""
         if not self.is_valid(offset, length):
             invalid_address = offset
             if self.minimum_address < offset <= self.maximum_address:
@@ -162,14 +270,23 @@ class FileLayer(interfaces.layers.DataLayerInterface):
                 self.name, invalid_address, "Offset outside of the buffer boundaries"
             )
 
-        # TODO: implement locking for multi-threading
-        with self._lock:
-            self._file.seek(offset)
-            data = self._file.read(length)
+        data: Union[bytes, memoryview]
+        mapped = self._mapped
+        if mapped is not None:
+            data = memoryview(mapped)[offset : offset + length]
+        else:
+            fileno = self._fileno
+            if fileno is not None and hasattr(os, "pread"):
+                # Positional reads do not move a shared file pointer, so need no lock
+                data = os.pread(fileno, length, offset)
+            else:
+                with self._lock:
+                    self._file.seek(offset)
+                    data = self._file.read(length)
 
         if len(data) < length:
             if pad:
-                data += b"\x00" * (length - len(data))
+                data = bytes(data) + b"\x00" * (length - len(data))
             else:
                 raise exceptions.InvalidAddressException(
                     self.name,
@@ -200,6 +317,8 @@ class FileLayer(interfaces.layers.DataLayerInterface):
         with self._lock:
             self._file.seek(offset)
             self._file.write(data)
+        # The memory map is read-only, ensure it is remapped to see the written data
+        self._release_mmap()
 
     def __getstate__(self) -> Dict[str, Any]:
         """Do not store the open _file_ attribute, our property will ensure the
@@ -208,10 +327,22 @@ class FileLayer(interfaces.layers.DataLayerInterface):
         This is necessary for multi-processing
         """
         self._file_ = None
+        self._mmap_ = None
         return self.__dict__
 
+    def _release_mmap(self) -> None:
+        """Closes the memory map, if it is not still referenced by outstanding views."""
+        if self._mmap_ is not None:
+            try:
+                self._mmap_.close()
+            except BufferError:
+                # Views are still held onto the map, it will be closed when they're released
+                pass
+            self._mmap_ = None
+
     def destroy(self) -> None:
         """Closes the file handle."""
+        self._release_mmap()
         self._file.close()
 
     def __exit__(self, type, value, traceback) -> None:
@@ -1,7 +1,6 @@
 # This file is Copyright 2020 Volatility Foundation and licensed under the Volatility Software License 1.0
 # which is available at https://www.volatilityfoundation.org/license/vsl-v1.0
 #
-import functools
 import json
 import logging
 import re
@@ -466,10 +465,6 @@ class QemuSuspendLayer(segmented.NonLinearlySegmentedLayer):
         result = data[offset - start_offset : output_length + offset - start_offset]
         return result
 
-    @functools.lru_cache(maxsize=512)
-    def read(self, offset: int, length: int, pad: bool = False) -> bytes:
-        return super().read(offset, length, pad)
-
 
 class QemuStacker(interfaces.automagic.StackerLayerInterface):
     stack_order = 10
@@ -2,10 +2,10 @@
 # which is available at https://www.volatilityfoundation.org/license/vsl-v1.0
 #
 import re
-from typing import Generator, List, Tuple, Dict, Optional
+from typing import Dict, Generator, List, Optional, Tuple, Union
 
 from volatility3.framework.interfaces import layers
-from volatility3.framework.layers.scanners import multiregexp
+from volatility3.framework.layers.scanners import ahocorasick, multiregexp
 
 
 class BytesScanner(layers.ScannerInterface):
@@ -17,6 +17,10 @@ class BytesScanner(layers.ScannerInterface):
         super().__init__()
         self.needle = needle
 
+    @property
+    def cache_key(self) -> Optional[Tuple]:
+        return (self.needle,)
+
     def __call__(self, data: bytes, data_offset: int) -> Generator[int, None, None]:
         """Runs through the data looking for the needle, and yields all offsets
         where the needle is found."""
@@ -37,6 +41,7 @@ class RegExScanner(layers.ScannerInterface):
     have no specific significance in such searches"""
 
     thread_safe = True
+    accepts_views = True
 
     _required_framework_version = (2, 0, 0)
 
@@ -44,6 +49,10 @@ class RegExScanner(layers.ScannerInterface):
         super().__init__()
         self.regex = re.compile(pattern, flags)
 
+    @property
+    def cache_key(self) -> Optional[Tuple]:
+        return (self.regex.pattern, self.regex.flags)
+
     def __call__(self, data: bytes, data_offset: int) -> Generator[int, None, None]:
         """Runs through the data looking for the needle, and yields all offsets
         where the needle is found."""
@@ -55,17 +64,47 @@ class RegExScanner(layers.ScannerInterface):
 
 
 class MultiStringScanner(layers.ScannerInterface):
+    """A scanner that searches for any of a list of byte strings, reporting the
+    offset and the pattern of each find.
+
+    Small sets of patterns are searched for using a single regular expression,
+    larger ones (where the regular expression becomes slow) using an Aho-Corasick
+    automaton, accelerated by pyahocorasick if it is installed."""
+
     thread_safe = True
+    accepts_views = True
 
     _required_framework_version = (2, 0, 0)
 
+    accelerated_threshold = 32
+    """The number of patterns from which to use an automaton if pyahocorasick is available"""
+    automaton_threshold = 256
+    """The number of patterns from which to use the pure python automaton"""
+
     def __init__(self, patterns: List[bytes]) -> None:
         super().__init__()
         self._pattern_trie: Optional[Dict[int, Optional[Dict]]] = {}
+        self._automaton: Optional[ahocorasick.AhoCorasick] = None
+        self._regex = b""
+        unique_patterns = set(patterns)
+        self._patterns = tuple(sorted(unique_patterns))
+        if (
+            ahocorasick.HAS_PYAHOCORASICK
+            and len(unique_patterns) >= self.accelerated_threshold
+        ) or len(unique_patterns) >= self.automaton_threshold:
+            self._automaton = ahocorasick.AhoCorasick()
+            for pattern in unique_patterns:
+                self._automaton.add_pattern(pattern)
+            self._automaton.preprocess()
+            return None
         for pattern in patterns:
             self._process_pattern(pattern)
         self._regex = self._process_trie(self._pattern_trie)
 
+    @property
+    def cache_key(self) -> Optional[Tuple]:
+        return self._patterns
+
     def _process_pattern(self, value: bytes) -> None:
         trie = self._pattern_trie
         if trie is None:
@@ -127,9 +166,14 @@ class MultiStringScanner(layers.ScannerInterface):
             if offset < self.chunk_size:
                 yield offset + data_offset, pattern
 
-    def search(self, haystack: bytes) -> Generator[Tuple[int, bytes], None, None]:
-        if not isinstance(haystack, bytes):
+    def search(
+        self, haystack: Union[bytes, memoryview]
+    ) -> Generator[Tuple[int, bytes], None, None]:
+        if not isinstance(haystack, (bytes, memoryview)):
             raise TypeError("Search haystack must be a byte string")
+        if self._automaton is not None:
+            yield from self._automaton.search(haystack)
+            return None
         if not self._regex:
             raise ValueError(
                 "MultiRegexp cannot be used with an empty set of search strings"
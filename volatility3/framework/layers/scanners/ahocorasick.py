@@ -0,0 +1,186 @@
+# This file is Copyright 2024 Volatility Foundation and licensed under the Volatility Software License 1.0
+# which is available at https://www.volatilityfoundation.org/license/vsl-v1.0
+#
+
+import collections
+import heapq
+import re
+from typing import Dict, Generator, Iterable, List, Optional, Tuple, Union
+
+try:
+    import ahocorasick as pyahocorasick
+
+    HAS_PYAHOCORASICK = True
+except ImportError:
+    HAS_PYAHOCORASICK = False
+
+
+class AhoCorasick(object):
+    """Algorithm for multi-string matching using an Aho-Corasick automaton.
+
+    Matches are reported leftmost-longest and non-overlapping, the same as
+    a regular expression alternation of the patterns would report them.
+    When the pyahocorasick library is installed it is used to run the
+    automaton, otherwise a pure python implementation is used.
+    """
+
+    _block_size = 0x10000
+
+    def __init__(self, accelerated: bool = True) -> None:
+        self._pattern_strings: List[bytes] = []
+        self._accelerated = accelerated and HAS_PYAHOCORASICK
+        self._automaton: Optional["pyahocorasick.Automaton"] = None
+        # Pure python automaton
+        self._goto: List[Dict[int, int]] = []
+        self._fail: List[int] = []
+        self._output: List[List[bytes]] = []
+        self._first_bytes: Optional[re.Pattern] = None
+        self._longest = 0
+
+    @property
+    def accelerated(self) -> bool:
+        """Whether the automaton is run using the pyahocorasick library"""
+        return self._accelerated
+
+    def add_pattern(self, pattern: bytes) -> None:
+        if not pattern:
+            raise ValueError("Empty patterns cannot be searched for")
+        self._pattern_strings.append(pattern)
+
+    def preprocess(self) -> None:
+        if not self._pattern_strings:
+            raise ValueError("No strings to compile into an automaton")
+        self._longest = max(len(pattern) for pattern in self._pattern_strings)
+        if self._accelerated:
+            self._automaton = pyahocorasick.Automaton()
+            for pattern in self._pattern_strings:
+                self._automaton.add_word(pattern.decode("latin-1"), pattern)
+            self._automaton.make_automaton()
+        else:
+            self._build()
+
+    def _build(self) -> None:
+        """Constructs the trie and failure links of the pure python automaton"""
+        self._goto = [{}]
+        self._output = [[]]
+        for pattern in self._pattern_strings:
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto.append({})
+                    self._output.append([])
+                    self._goto[state][char] = next_state
+                state = next_state
+            if pattern not in self._output[state]:
+                self._output[state].append(pattern)
+
+        # Breadth first, so that each state's failure state has already been computed
+        self._fail = [0] * len(self._goto)
+        queue = collections.deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(char, 0)
+                self._fail[next_state] = fail if fail != next_state else 0
+                self._output[next_state].extend(self._output[self._fail[next_state]])
+
+        # Used to skip quickly over data that cannot begin a match
+        self._first_bytes = re.compile(
+            b"[" + b"".join(re.escape(bytes([c])) for c in self._goto[0]) + b"]"
+        )
+
+    def search(
+        self, haystack: Union[bytes, memoryview]
+    ) -> Generator[Tuple[int, bytes], None, None]:
+        if not isinstance(haystack, (bytes, memoryview)):
+            raise TypeError("Search haystack must be a byte string")
+        if not self._pattern_strings:
+            raise ValueError(
+                "AhoCorasick cannot be used with an empty set of search strings"
+            )
+        if self._automaton is None and self._first_bytes is None:
+            self.preprocess()
+        if self._automaton is not None:
+            matches = self._search_accelerated(self._automaton, haystack)
+        else:
+            matches = self._search_all(haystack)
+        yield from self._leftmost_longest(matches)
+
+    def _search_accelerated(
+        self, automaton: "pyahocorasick.Automaton", haystack: Union[bytes, memoryview]
+    ) -> Generator[Tuple[int, bytes], None, None]:
+        """Yields every (possibly overlapping) match found by the pyahocorasick
+        automaton, ordered by the end of the match
+
+        The automaton only accepts strings, so the haystack is decoded a block
+        at a time and fed to a single search iterator, which carries its state
+        (and its offsets) on from one block to the next.
+        """
+        # iter_long misses matches that follow a failed longer match, so all matches are resolved by the caller
+        view = memoryview(haystack)
+        search = automaton.iter("")
+        for start in range(0, len(view), self._block_size):
+            search.set(str(view[start : start + self._block_size], "latin-1"), False)
+            for end, pattern in search:
+                yield end - len(pattern) + 1, pattern
+
+    def _search_all(
+        self, haystack: Union[bytes, memoryview]
+    ) -> Generator[Tuple[int, bytes], None, None]:
+        """Yields every (possibly overlapping) match, ordered by the end of the match"""
+        goto, fail, output = self._goto, self._fail, self._output
+        first_bytes = self._first_bytes
+        if first_bytes is None:
+            return None
+        state = 0
+        position = 0
+        length = len(haystack)
+        while position < length:
+            if not state:
+                # Nothing is partially matched, so jump to the next byte that could start a match
+                match = first_bytes.search(haystack, position)
+                if match is None:
+                    return None
+                position = match.start()
+            char = haystack[position]
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for pattern in output[state]:
+                yield position - len(pattern) + 1, pattern
+            position += 1
+
+    def _leftmost_longest(
+        self, matches: Iterable[Tuple[int, bytes]]
+    ) -> Generator[Tuple[int, bytes], None, None]:
+        """Reduces all matches, ordered by the end of each match, to the
+        leftmost-longest, non-overlapping ones
+
+        A match cannot be chosen until no later match could start at or before
+        it, which is only certain once the matches end more than the longest
+        pattern's length beyond its start, so only those few candidates are
+        held at any one time.
+        """
+        candidates: List[Tuple[int, int, bytes]] = []
+        cursor = 0
+        for offset, pattern in matches:
+            # Every match from here on starts at or after the earliest start of this one
+            earliest = offset + len(pattern) - self._longest
+            while candidates and candidates[0][0] < earliest:
+                candidate_offset, _, candidate = heapq.heappop(candidates)
+                if candidate_offset >= cursor:
+                    yield candidate_offset, candidate
+                    cursor = candidate_offset + len(candidate)
+            if offset >= cursor:
+                heapq.heappush(candidates, (offset, -len(pattern), pattern))
+        while candidates:
+            candidate_offset, _, candidate = heapq.heappop(candidates)
+            if candidate_offset >= cursor:
+                yield candidate_offset, candidate
+                cursor = candidate_offset + len(candidate)
@@ -1,6 +1,7 @@
 # This file is Copyright 2019 Volatility Foundation and licensed under the Volatility Software License 1.0
 # which is available at https://www.volatilityfoundation.org/license/vsl-v1.0
 #
+import hashlib
 from abc import ABCMeta, abstractmethod
 from bisect import bisect_right
 from typing import Any, Dict, Iterable, List, Optional, Tuple
@@ -57,6 +58,19 @@ class NonLinearlySegmentedLayer(
         except exceptions.InvalidAddressException:
             return False
 
+    @property
+    def fingerprint(self) -> Optional[str]:
+        """Combines the fingerprint of the underlying layers with the segment
+        table."""
+        fingerprint = super().fingerprint
+        if fingerprint is None:
+            return None
+        if not self._segments:
+            self._load_segments()
+        digest = hashlib.sha256(fingerprint.encode("latin-1"))
+        digest.update(repr(self._segments).encode("latin-1"))
+        return digest.hexdigest()
+
     def _find_segment(
         self, offset: int, next: bool = False
     ) -> Tuple[int, int, int, int]:
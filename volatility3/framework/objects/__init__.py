@@ -4,6 +4,7 @@
 
 import collections
 import collections.abc
+import functools
 import logging
 import struct
 from typing import (
@@ -19,7 +20,7 @@ from typing import (
     overload,
 )
 
-from volatility3.framework import constants, interfaces
+from volatility3.framework import constants, exceptions, interfaces
 from volatility3.framework.objects import templates
 
 vollog = logging.getLogger(__name__)
@@ -100,6 +101,77 @@ def convert_value_to_data(
     return struct.pack(struct_format, value)
 
 
+@functools.lru_cache(maxsize=None)
+def _integer_unpacker(data_format: DataFormatInfo) -> Optional[struct.Struct]:
+    """Returns a precompiled unpacker for an integer data format, if struct
+    supports its length."""
+    code = {1: "b", 2: "h", 4: "i", 8: "q"}.get(data_format.length, None)
+    if code is None:
+        return None
+    if not data_format.signed:
+        code = code.upper()
+    return struct.Struct(("<" if data_format.byteorder == "little" else ">") + code)
+
+
+def _read_data(
+    context: interfaces.context.ContextInterface,
+    object_info: interfaces.objects.ObjectInformation,
+    length: int,
+) -> Tuple[bytes, int]:
+    """Returns a buffer containing the data of an object, and the offset of
+    the object's data within that buffer.
+
+    When aggregate buffering is enabled and the object lies within a buffered
+    aggregate that it belongs to (directly, or through arrays), the
+    aggregate's buffer is returned rather than reading from the layer.
+    """
+    layer_name, offset = object_info["layer_name"], object_info["offset"]
+    if constants.AGGREGATE_BUFFERING:
+        parent = object_info["parent"]
+        while isinstance(parent, Array):
+            parent = parent._vol["parent"]
+        if isinstance(parent, AggregateType):
+            buffer = _aggregate_buffer(parent)
+            if buffer is not None and parent._vol["layer_name"] == layer_name:
+                relative_offset = offset - parent._vol["offset"]
+                if 0 <= relative_offset and relative_offset + length <= len(buffer):
+                    return buffer, relative_offset
+    return context.layers.read(layer_name, offset, length), 0
+
+
+def _aggregate_buffer(aggregate: "AggregateType") -> Optional[bytes]:
+    """Returns the complete data of an aggregate, reading it on first use.
+
+    The data is taken from the buffer of an enclosing aggregate when there is
+    one, so that nested structures are only read once.  Aggregates that are
+    too large, or that cannot be read in their entirety, are not buffered.
+    """
+    buffer = aggregate._buffer
+    if buffer is None:
+        buffer = b""
+        size = aggregate._vol["size"]
+        if 0 < size <= constants.AGGREGATE_BUFFER_MAXIMUM_SIZE:
+            try:
+                data, relative_offset = _read_data(
+                    aggregate._context, aggregate._vol, size
+                )
+                buffer = data[relative_offset : relative_offset + size]
+            except exceptions.InvalidAddressException:
+                pass
+        aggregate._buffer = buffer
+    return buffer or None
+
+
+def _invalidate_buffers(object_info: interfaces.objects.ObjectInformation) -> None:
+    """Discards the buffers of every aggregate containing an object, after
+    the object has been written."""
+    parent = object_info.parent
+    while isinstance(parent, (Array, AggregateType)):
+        if isinstance(parent, AggregateType):
+            parent._buffer = None
+        parent = parent.vol.parent
+
+
 class Void(interfaces.objects.ObjectInterface):
     """Returns an object to represent void/unknown types."""
 
@@ -199,9 +271,12 @@ class PrimitiveObject(interfaces.objects.ObjectInterface):
         # Don't try to lookup a 0 length data format, incase it's at an invalid offset.  Length 0 means b''
         data = b""
         if data_format.length > 0:
-            data = context.layers.read(
-                object_info.layer_name, object_info.offset, data_format.length
-            )
+            buffer, offset = _read_data(context, object_info, data_format.length)
+            if cls._struct_type == int:
+                unpacker = _integer_unpacker(data_format)
+                if unpacker is not None:
+                    return unpacker.unpack_from(buffer, offset)[0]
+            data = buffer[offset : offset + data_format.length]
         return convert_data_to_value(data, cls._struct_type, data_format)
 
     class VolTemplateProxy(interfaces.objects.ObjectInterface.VolTemplateProxy):
@@ -217,6 +292,7 @@ class PrimitiveObject(interfaces.objects.ObjectInterface):
         offset."""
         data = convert_value_to_data(value, self._struct_type, self._data_format)
         self._context.layers.write(self.vol.layer_name, self.vol.offset, data)
+        _invalidate_buffers(self.vol)
         return self.cast(self.vol.type_name)
 
 
@@ -405,8 +481,10 @@ class Pointer(Integer):
         if signed:
             raise ValueError("Pointers cannot have signed values")
         mask = context.layers[object_info.native_layer_name].address_mask
-        data = context.layers.read(object_info.layer_name, object_info.offset, length)
-        value = int.from_bytes(data, byteorder=endian, signed=signed)
+        buffer, offset = _read_data(context, object_info, length)
+        value = int.from_bytes(
+            buffer[offset : offset + length], byteorder=endian, signed=signed
+        )
         return value & mask
 
     def dereference(
@@ -422,21 +500,29 @@ class Pointer(Integer):
         # Do our own caching because lru_cache doesn't seem to memoize correctly across multiple uses
         # Cache clearing should be done by a cast (we can add a specific method to reset a pointer,
         # but hopefully it's not necessary)
+        # Structures are also shared through the context's object cache, when enabled
         if layer_name is None:
             layer_name = self.vol.native_layer_name
         if self._cache.get(layer_name, None) is None:
             layer_name = layer_name or self.vol.native_layer_name
-            mask = self._context.layers[layer_name].address_mask
-            offset = self & mask
-            self._cache[layer_name] = self.vol.subtype(
-                context=self._context,
-                object_info=interfaces.objects.ObjectInformation(
-                    layer_name=layer_name,
-                    offset=offset,
-                    parent=self,
-                    size=self.vol.subtype.size,
-                ),
-            )
+            layers = self._context.layers
+            offset = self & layers[layer_name].address_mask
+            object_cache = layers.object_cache
+            key = (layer_name, offset, layer_name, self.vol.subtype)
+            result = object_cache.get(key) if object_cache.enabled else None
+            if result is None:
+                result = self.vol.subtype(
+                    context=self._context,
+                    object_info=interfaces.objects.ObjectInformation(
+                        layer_name=layer_name,
+                        offset=offset,
+                        parent=self,
+                        size=self.vol.subtype.size,
+                    ),
+                )
+                if object_cache.enabled and isinstance(result, AggregateType):
+                    result = object_cache.add(key, result)
+            self._cache[layer_name] = result
         return self._cache[layer_name]
 
     def is_readable(self, layer_name: Optional[str] = None) -> bool:
@@ -832,6 +918,11 @@ class AggregateType(interfaces.objects.ObjectInterface):
         )
         # self._check_members(members)
         self._concrete_members: Dict[str, Dict] = {}
+        # The complete data of the aggregate, when aggregate buffering is enabled
+        # (None until it is first needed, and empty if it could not be read)
+        self._buffer: Optional[bytes] = None
+        # The compiled member access for the type, determined on first member access
+        self._accessor: Optional[MemberAccessor] = None
 
     def has_member(self, member_name: str) -> bool:
         """Returns whether the object would contain a member called
@@ -939,24 +1030,26 @@ class AggregateType(interfaces.objects.ObjectInterface):
     def __getattr__(self, attr: str) -> Any:
         """Method for accessing members of the type."""
 
-        if attr in ["_concrete_members", "vol"]:
+        if attr in ["_concrete_members", "_buffer", "_accessor", "vol"]:
             raise AttributeError("Object has not been properly initialized")
         if attr in self._concrete_members:
             return self._concrete_members[attr]
         if attr.startswith("_") and not attr.startswith("__") and "__" in attr:
             attr = attr[attr.find("__", 1) :]  # See issue #522
-        if attr in self.vol.members:
-            mask = self._context.layers[self.vol.layer_name].address_mask
-            relative_offset, template = self.vol.members[attr]
-            if isinstance(template, templates.ReferenceTemplate):
-                template = self._context.symbol_space.get_type(template.vol.type_name)
+        if self._accessor is None:
+            self._accessor = _member_accessor(self)
+        entry = self._accessor.entry(attr)
+        if entry is not None:
+            vol = self._vol
+            mask = self._context.layers[vol["layer_name"]].address_mask
+            relative_offset, template, size = entry
             object_info = interfaces.objects.ObjectInformation(
-                layer_name=self.vol.layer_name,
-                offset=mask & (self.vol.offset + relative_offset),
+                layer_name=vol["layer_name"],
+                offset=mask & (vol["offset"] + relative_offset),
                 member_name=attr,
                 parent=self,
-                native_layer_name=self.vol.native_layer_name,
-                size=template.size,
+                native_layer_name=vol["native_layer_name"],
+                size=size,
             )
             member = template(context=self._context, object_info=object_info)
             self._concrete_members[attr] = member
@@ -996,6 +1089,77 @@ class AggregateType(interfaces.objects.ObjectInterface):
         )
 
 
+class MemberAccessor:
+    """Compiled member access for a single aggregate type.
+
+    Each member's relative offset, resolved template and size is determined
+    the first time the member is accessed, and reused by every object of the
+    type.  Accessors
+    for types within a symbol space are created and memoised by
+    :meth:`~volatility3.framework.symbols.SymbolSpace.get_type_accessor`.
+    """
+
+    __slots__ = ("_symbol_space", "type_name", "members", "_entries")
+
+    def __init__(
+        self,
+        symbol_space: interfaces.symbols.SymbolSpaceInterface,
+        type_name: str,
+        members: Dict[str, Tuple[int, interfaces.objects.Template]],
+    ) -> None:
+        self._symbol_space = symbol_space
+        self.type_name = type_name
+        self.members = members
+        self._entries: Dict[str, Tuple[int, interfaces.objects.Template, int]] = {}
+
+    def entry(
+        self, attr: str
+    ) -> Optional[Tuple[int, interfaces.objects.Template, int]]:
+        """Returns the relative offset, resolved template and size of a
+        member, or None if the type has no such member."""
+        entry = self._entries.get(attr, None)
+        if entry is None:
+            if attr not in self.members:
+                return None
+            relative_offset, template = self.members[attr]
+            if isinstance(template, templates.ReferenceTemplate):
+                template = self._symbol_space.get_type(template.vol.type_name)
+            entry = relative_offset, template, template.size
+            self._entries[attr] = entry
+        return entry
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Do not copy compiled entries when cloning or pickling."""
+        return {
+            "_symbol_space": self._symbol_space,
+            "type_name": self.type_name,
+            "members": self.members,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for key, value in state.items():
+            setattr(self, key, value)
+        self._entries = {}
+
+
+def _member_accessor(aggregate: "AggregateType") -> MemberAccessor:
+    """Returns the accessor for an aggregate, shared with every other object
+    of its type where the aggregate's members match those of its type in the
+    symbol space."""
+    vol = aggregate._vol
+    type_name, members = vol["type_name"], vol["members"]
+    symbol_space = aggregate._context.symbol_space
+    table_name, _, _ = type_name.partition(constants.BANG)
+    if table_name in symbol_space:
+        try:
+            accessor = symbol_space.get_type_accessor(type_name)
+            if accessor.members is members:
+                return accessor
+        except exceptions.SymbolError:
+            pass
+    return MemberAccessor(symbol_space, type_name, members)
+
+
 class StructType(AggregateType):
     pass
 
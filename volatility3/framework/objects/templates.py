@@ -3,7 +3,7 @@
 #
 import functools
 import logging
-from typing import Any, ClassVar, Dict, List, Type
+from typing import Any, ClassVar, Dict, List, Optional, Type
 
 from volatility3.framework import interfaces, exceptions, constants
 
@@ -30,6 +30,8 @@ class ObjectTemplate(interfaces.objects.Template):
     ) -> None:
         arguments["object_class"] = object_class
         super().__init__(type_name=type_name, **arguments)
+        # The arguments passed to the object class, gathered on first use
+        self._arguments: Optional[Dict[str, Any]] = None
 
         proxy_cls = self.vol.object_class.VolTemplateProxy
         for method_name in proxy_cls._methods:
@@ -89,14 +91,20 @@ class ObjectTemplate(interfaces.objects.Template):
 
         Returns: an object adhering to the :class:`~volatility3.framework.interfaces.objects.ObjectInterface`
         """
-        arguments: Dict[str, Any] = {}
-        for arg in self.vol:
-            if arg != "object_class":
-                arguments[arg] = self.vol[arg]
-        return self.vol.object_class(
+        arguments = self._arguments
+        if arguments is None:
+            arguments = {
+                arg: value for arg, value in self._vol.items() if arg != "object_class"
+            }
+            self._arguments = arguments
+        return self._vol["object_class"](
             context=context, object_info=object_info, **arguments
         )
 
+    def update_vol(self, **new_arguments) -> None:
+        super().update_vol(**new_arguments)
+        self._arguments = None
+
 
 class ReferenceTemplate(interfaces.objects.Template):
     """Factory class that produces objects based on a delayed reference type.
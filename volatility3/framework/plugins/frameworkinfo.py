@@ -4,9 +4,12 @@
 
 from typing import List
 
+import volatility3.plugins
 from volatility3 import framework
 from volatility3.framework import interfaces, renderers
+from volatility3.framework.automagic import stacker
 from volatility3.framework.interfaces import plugins
+from volatility3.framework.layers import physical
 
 
 class FrameworkInfo(plugins.PluginInterface):
@@ -29,10 +32,37 @@ class FrameworkInfo(plugins.PluginInterface):
             "Renderer": interfaces.renderers.Renderer,
         }
 
+        # The user interface may not have imported every plugin
+        framework.import_files(volatility3.plugins, True)
         for category, module_interface in categories.items():
             yield (0, (category,))
             for clazz in framework.class_subclasses(module_interface):
                 yield (1, (clazz.__name__,))
 
+        location = self.context.config.get(
+            "automagic.LayerStacker.single_location", None
+        )
+        if location:
+            yield (0, ("Fingerprint",))
+            for layer in self._stack_location(location):
+                fingerprint = layer.fingerprint or "Unavailable"
+                yield (1, (f"{layer.__class__.__name__}: {fingerprint}",))
+
+    def _stack_location(
+        self, location: str
+    ) -> List[interfaces.layers.DataLayerInterface]:
+        """Stacks the layers that can be found in the file at location, returning them from highest to lowest"""
+        context = self.context.clone()
+        layer_name = context.layers.free_layer_name("FileLayer")
+        config_path = interfaces.configuration.path_join(
+            self.config_path, "stack", layer_name
+        )
+        context.config[interfaces.configuration.path_join(config_path, "location")] = (
+            location
+        )
+        context.add_layer(physical.FileLayer(context, config_path, layer_name))
+        stacked_layers = stacker.LayerStacker.stack_layer(context, layer_name) or []
+        return [context.layers[name] for name in stacked_layers]
+
     def run(self):
         return renderers.TreeGrid([("Data", str)], self._generator())
@@ -22,7 +22,7 @@ class IsfInfo(plugins.PluginInterface):
     """Determines information about the currently available ISF files, or a specific one"""
 
     _required_framework_version = (2, 0, 0)
-    _version = (2, 0, 0)
+    _version = (2, 0, 1)
 
     @classmethod
     def get_requirements(cls) -> List[interfaces.configuration.RequirementInterface]:
@@ -48,7 +48,7 @@ class IsfInfo(plugins.PluginInterface):
             requirements.VersionRequirement(
                 name="SQLiteCache",
                 component=symbol_cache.SqliteCache,
-                version=(1, 0, 0),
+                version=(1, 1, 0),
             ),
             requirements.BooleanRequirement(
                 name="live",
@@ -161,8 +161,8 @@ class IsfInfo(plugins.PluginInterface):
                     num_symbols,
                 ) = cache.get_location_statistics(location)
                 if identifier:
-                    json_hash = cache.get_hash(location)
-                    if json_hash and json_hash in schemas.cached_validations:
+                    file_hash = cache.get_hash(location)
+                    if file_hash and cache.is_validated(file_hash):
                         valid = "True (cached)"
                     if self.config["validate"]:
                         # Even if we're not live, if we've been explicitly asked to validate, then do-so
@@ -11,6 +11,7 @@ import logging
 import traceback
 from typing import Generator, Iterable, List, Optional, Tuple, Type
 
+import volatility3.plugins
 from volatility3 import framework
 from volatility3.framework import automagic, exceptions, interfaces, plugins, renderers
 from volatility3.framework.configuration import requirements
@@ -55,7 +56,8 @@ class Timeliner(interfaces.plugins.PluginInterface):
 
     @classmethod
     def get_usable_plugins(cls, selected_list: List[str] = None) -> List[Type]:
-        # Initialize for the run
+        # Initialize for the run, the user interface may not have imported every plugin
+        framework.import_files(volatility3.plugins, True)
         plugin_list = list(framework.class_subclasses(TimeLinerInterface))
 
         # Get the filter from the configuration
@@ -24,7 +24,7 @@ class CmdScan(interfaces.plugins.PluginInterface):
     """Looks for Windows Command History lists"""
 
     _required_framework_version = (2, 4, 0)
-    _version = (1, 0, 0)
+    _version = (1, 0, 1)
 
     @classmethod
     def get_requirements(cls):
@@ -73,10 +73,12 @@ class CmdScan(interfaces.plugins.PluginInterface):
             vad_base: the base address
             vad_size: the size of the VAD
         """
-        for vad in conhost_proc.get_vad_root().traverse():
-            base = vad.get_start()
-            if vad.get_size() < size_filter:
-                yield (base, vad.get_size())
+        for record in conhost_proc.get_vad_index():
+            if record.start is None or record.end is None:
+                continue
+            size = record.end - record.start + 1
+            if size < size_filter:
+                yield (record.start, size)
 
     @classmethod
     def get_command_history(
@@ -29,7 +29,7 @@ class Consoles(interfaces.plugins.PluginInterface):
     """Looks for Windows console buffers"""
 
     _required_framework_version = (2, 4, 0)
-    _version = (1, 0, 0)
+    _version = (1, 0, 1)
 
     @classmethod
     def get_requirements(cls):
@@ -115,7 +115,7 @@ class Consoles(interfaces.plugins.PluginInterface):
             conhostexe_base: the base address of conhost.exe
             conhostexe_size: the size of the VAD for conhost.exe
         """
-        for vad in conhost_proc.get_vad_root().traverse():
+        for vad in conhost_proc.get_vad_index().get_vads():
             filename = vad.get_file_name()
             if isinstance(filename, str) and filename.lower().endswith("conhost.exe"):
                 base = vad.get_start()
@@ -53,7 +53,7 @@ class DirectSystemCalls(interfaces.plugins.PluginInterface):
     """Detects the Direct System Call technique used to bypass EDRs"""
 
     _required_framework_version = (2, 4, 0)
-    _version = (1, 0, 0)
+    _version = (1, 0, 1)
 
     # DLLs that are expected to host system call invocations
     valid_syscall_handlers = ("ntdll.dll", "win32u.dll")
@@ -302,9 +302,7 @@ class DirectSystemCalls(interfaces.plugins.PluginInterface):
         # scan regions under 10MB
         scan_max = 10 * 1000 * 1000
 
-        vad_root = task.get_vad_root()
-
-        for vad in vad_root.traverse():
+        for vad in task.get_vad_index().get_vads():
             if vad.get_size() < scan_max:
                 vads.append((vad.get_start(), vad.get_size(), vad.get_file_name()))
 
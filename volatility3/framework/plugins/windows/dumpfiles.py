@@ -28,7 +28,7 @@ class DumpFiles(interfaces.plugins.PluginInterface):
     """Dumps cached file contents from Windows memory samples."""
 
     _required_framework_version = (2, 0, 0)
-    _version = (1, 0, 0)
+    _version = (1, 0, 1)
 
     @classmethod
     def get_requirements(cls) -> List[interfaces.configuration.RequirementInterface]:
@@ -286,7 +286,7 @@ class DumpFiles(interfaces.plugins.PluginInterface):
                 # Pull file objects from the VADs. This will produce DLLs and EXEs that are
                 # mapped into the process as images, but that the process doesn't have an
                 # explicit handle remaining open to those files on disk.
-                for vad in proc.get_vad_root().traverse():
+                for vad in proc.get_vad_index().get_vads():
                     try:
                         if vad.has_member("ControlArea"):
                             # Windows xp and 2003
@@ -74,7 +74,7 @@ class HollowProcesses(interfaces.plugins.PluginInterface):
 
         kernel = self.context.modules[self.config["kernel"]]
 
-        for vad in proc.get_vad_root().traverse():
+        for vad in proc.get_vad_index().get_vads():
             protection_string = vad.get_protection(
                 vadinfo.VadInfo.protect_values(
                     self.context, kernel.layer_name, kernel.symbol_table_name
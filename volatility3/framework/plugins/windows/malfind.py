@@ -114,7 +114,7 @@ class Malfind(interfaces.plugins.PluginInterface):
 
         proc_layer = context.layers[proc_layer_name]
 
-        for vad in proc.get_vad_root().traverse():
+        for vad in proc.get_vad_index().get_vads():
             protection_string = vad.get_protection(
                 vadinfo.VadInfo.protect_values(
                     context, kernel_layer_name, symbol_table
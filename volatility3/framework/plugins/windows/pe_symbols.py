@@ -2,6 +2,7 @@
 # which is available at https://www.volatilityfoundation.org/license/vsl-v1.0
 
 import copy
+import functools
 import io
 import logging
 import ntpath
@@ -49,6 +50,12 @@ collected_module_instance = Tuple[str, int, int]
 collected_modules_info = List[collected_module_instance]
 collected_modules_type = Dict[str, collected_modules_info]
 
+# the PDB file found in each collected module instance, keyed by (layer name, range start)
+# Tuple of ((GUID, age, PDB name), location of the ISF file or None if it is not available)
+prefetched_pdbs_type = Dict[
+    Tuple[str, int], Tuple[pdbutil.PdbIdentifier, Optional[str]]
+]
+
 PESymbolFinders = Union[interfaces.context.ModuleInterface, pefile.ExportDirData]
 
 
@@ -244,7 +251,7 @@ class PESymbols(interfaces.plugins.PluginInterface):
 
     _required_framework_version = (2, 7, 0)
 
-    _version = (1, 0, 0)
+    _version = (1, 1, 2)
 
     # used for special handling of the kernel PDB file. See later notes
     os_module_name = "ntoskrnl.exe"
@@ -265,7 +272,7 @@ class PESymbols(interfaces.plugins.PluginInterface):
                 name="modules", component=modules.Modules, version=(2, 0, 0)
             ),
             requirements.VersionRequirement(
-                name="pdbutil", component=pdbutil.PDBUtility, version=(1, 0, 0)
+                name="pdbutil", component=pdbutil.PDBUtility, version=(1, 1, 0)
             ),
             requirements.ChoiceRequirement(
                 name="source",
@@ -503,12 +510,125 @@ class PESymbols(interfaces.plugins.PluginInterface):
             pe_module.DIRECTORY_ENTRY_EXPORT.symbols,
         )
 
+    @staticmethod
+    def _pdb_names_for_module(mod_name: str) -> List[str]:
+        """
+        Returns the names the PDB file of the mod_name module may have
+
+        Args:
+            mod_name: lower case name of the module
+        """
+        # the PDB name of the kernel file is not consistent for an exe, for example,
+        # a `ntoskrnl.exe` can have an internal PDB name of any of the ones in the following list
+        # The code attempts to find all possible PDBs to ensure the best chance of recovery
+        if mod_name == PESymbols.os_module_name:
+            return [fn + ".pdb" for fn in KERNEL_MODULE_NAMES]
+
+        # for non-kernel files, replace the exe, sys, or dll extension with pdb
+        # in testing we found where some DLLs, such amsi.dll, have its PDB string as Amsi.dll
+        # in certain Windows versions
+        pdb_name = mod_name[:-3] + "pdb"
+        return [pdb_name, pdb_name[0].upper() + pdb_name[1:]]
+
+    @staticmethod
+    def _prefetch_pdbs(
+        context: interfaces.context.ContextInterface,
+        wanted_modules: PESymbolFinder.cached_value_dict,
+        collected_modules: collected_modules_type,
+    ) -> prefetched_pdbs_type:
+        """
+        Finds the PDB file of every instance of the wanted modules, and downloads any
+        missing symbols for them as a single batch, rather than one module at a time
+
+        Args:
+            wanted_modules: the dictionary of modules and symbols to resolve
+            collected_modules: return value from `get_kernel_modules` or `get_process_modules`
+        Returns:
+            prefetched_pdbs_type: The PDB file found in each module instance, and the location of its symbols
+        """
+        found_pdbs: Dict[Tuple[str, int], pdbutil.PdbIdentifier] = {}
+        for mod_name in wanted_modules:
+            pdb_names = [
+                bytes(pdb_name, "latin-1")
+                for pdb_name in PESymbols._pdb_names_for_module(mod_name)
+            ]
+            for layer_name, module_start, module_size in collected_modules.get(
+                mod_name, []
+            ):
+                for result in pdbutil.PDBUtility.pdbname_scan(
+                    context,
+                    layer_name,
+                    context.layers[layer_name].page_size,
+                    pdb_names,
+                    start=module_start,
+                    end=module_start + module_size,
+                ):
+                    found_pdbs[(layer_name, module_start)] = (
+                        result["GUID"],
+                        result["age"],
+                        result["pdb_name"],
+                    )
+                    break
+
+        if not found_pdbs:
+            return {}
+
+        locations = pdbutil.PDBUtility.download_pdb_isfs(context, found_pdbs.values())
+        prefetched: prefetched_pdbs_type = {}
+        for module_key, (guid, age, pdb_name) in found_pdbs.items():
+            pdb = (guid.upper(), age, pdb_name.strip("\x00"))
+            prefetched[module_key] = (pdb, locations.get(pdb))
+        return prefetched
+
+    @staticmethod
+    def _load_prefetched_pdb(
+        context: interfaces.context.ContextInterface,
+        config_path: str,
+        module_info: collected_module_instance,
+        prefetched_pdbs: prefetched_pdbs_type,
+    ) -> Optional[str]:
+        """
+        Loads the symbols of the PDB file found in a module by `_prefetch_pdbs`
+
+        Args:
+            module_info: (layer_name, module_start, module_size) of the module to examine
+            prefetched_pdbs: return value from `_prefetch_pdbs`
+
+        Returns:
+            Optional[str]: The name of the symbol table, if the PDB file was found and its symbols are available
+        """
+        layer_name, module_start, _ = module_info
+        prefetched = prefetched_pdbs.get((layer_name, module_start))
+        if prefetched is None or prefetched[1] is None:
+            return None
+
+        guid, age, pdb_name = prefetched[0]
+        try:
+            return pdbutil.PDBUtility.load_windows_symbol_table(
+                context,
+                guid,
+                age,
+                pdb_name,
+                "volatility3.framework.symbols.intermed.IntermediateSymbolTable",
+                config_path=config_path,
+            )
+        # this exception is expected when the symbols can't be loaded
+        except exceptions.VolatilityException:
+            return None
+        # this is not expected - it means pdbconv broke when parsing the PDB
+        except TypeError as e:
+            vollog.error(
+                f"Unable to parse PDB file for module {pdb_name} -> {e}. Please file a bug on the GitHub issue tracker."
+            )
+            return None
+
     @staticmethod
     def _get_pdb_module(
         context: interfaces.context.ContextInterface,
         config_path: str,
         mod_name: str,
         module_info: collected_module_instance,
+        prefetched_pdbs: Optional[prefetched_pdbs_type] = None,
     ) -> Optional[PDBSymbolFinder]:
         """
         Attempts to locate symbols based on PDB analysis through each layer where the mod_name module was found
@@ -516,6 +636,7 @@ class PESymbols(interfaces.plugins.PluginInterface):
         Args:
             mod_name: lower case name of the module to resolve symbols in
             module_info: (layer_name, module_start, module_size) of the module to examine
+            prefetched_pdbs: return value from `_prefetch_pdbs`, if the modules have already been scanned
 
         Returns:
             Optional[PDBSymbolFinder]: If the export table can be resolved, then the ExportSymbolFinder
@@ -525,44 +646,42 @@ class PESymbols(interfaces.plugins.PluginInterface):
 
         layer_name, module_start, module_size = module_info
 
-        # the PDB name of the kernel file is not consistent for an exe, for example,
-        # a `ntoskrnl.exe` can have an internal PDB name of any of the ones in the following list
-        # The code attempts to find all possible PDBs to ensure the best chance of recovery
-        if mod_name == PESymbols.os_module_name:
-            pdb_names = [fn + ".pdb" for fn in KERNEL_MODULE_NAMES]
-
-        # for non-kernel files, replace the exe, sys, or dll extension with pdb
-        else:
-            # in testing we found where some DLLs, such amsi.dll, have its PDB string as Amsi.dll
-            # in certain Windows versions
+        pdb_names = PESymbols._pdb_names_for_module(mod_name)
+        if mod_name != PESymbols.os_module_name:
             mod_name = mod_name[:-3] + "pdb"
-            first_upper = mod_name[0].upper() + mod_name[1:]
-            pdb_names = [mod_name, first_upper]
 
-        # loop through each PDB name (all the kernel names or the dll name as lower() + first char upper case)
-        for pdb_name in pdb_names:
-            try:
-                mod_symbols = pdbutil.PDBUtility.symbol_table_from_pdb(
-                    context,
-                    interfaces.configuration.path_join(config_path, mod_name),
-                    layer_name,
-                    pdb_name,
-                    module_start,
-                    module_size,
-                )
+        mod_config_path = interfaces.configuration.path_join(config_path, mod_name)
 
-                if mod_symbols:
-                    break
+        if prefetched_pdbs is not None:
+            # the module has already been scanned, so only the symbols found by the scan can be loaded
+            mod_symbols = PESymbols._load_prefetched_pdb(
+                context, mod_config_path, module_info, prefetched_pdbs
+            )
+        else:
+            # loop through each PDB name (all the kernel names or the dll name as lower() + first char upper case)
+            for pdb_name in pdb_names:
+                try:
+                    mod_symbols = pdbutil.PDBUtility.symbol_table_from_pdb(
+                        context,
+                        mod_config_path,
+                        layer_name,
+                        pdb_name,
+                        module_start,
+                        module_size,
+                    )
+
+                    if mod_symbols:
+                        break
 
-            # this exception is expected when the PDB can't be found or downloaded
-            except exceptions.VolatilityException:
-                continue
+                # this exception is expected when the PDB can't be found or downloaded
+                except exceptions.VolatilityException:
+                    continue
 
-            # this is not expected - it means pdbconv broke when parsing the PDB
-            except TypeError as e:
-                vollog.error(
-                    f"Unable to parse PDB file for module {pdb_name} -> {e}. Please file a bug on the GitHub issue tracker."
-                )
+                # this is not expected - it means pdbconv broke when parsing the PDB
+                except TypeError as e:
+                    vollog.error(
+                        f"Unable to parse PDB file for module {pdb_name} -> {e}. Please file a bug on the GitHub issue tracker."
+                    )
 
         # cannot do anything without the symbols
         if not mod_symbols:
@@ -580,6 +699,7 @@ class PESymbols(interfaces.plugins.PluginInterface):
         config_path: str,
         module_instances: collected_modules_info,
         mod_name: str,
+        prefetched_pdbs: Optional[prefetched_pdbs_type] = None,
     ) -> Generator[PDBSymbolFinder, None, None]:
         """
         Attempts to resolve the symbols in `mod_name` through PDB analysis
@@ -587,12 +707,13 @@ class PESymbols(interfaces.plugins.PluginInterface):
         Args:
             module_instances: the set of layers in which the module was found
             mod_name: name of the module to resolve symbols in
+            prefetched_pdbs: return value from `_prefetch_pdbs`, if the modules have already been scanned
         Returns:
             Generator[PDBSymbolFinder]: a PDBSymbolFinder instance for each layer in which the module was found
         """
         for module_info in module_instances:
             mod_module = PESymbols._get_pdb_module(
-                context, config_path, mod_name, module_info
+                context, config_path, mod_name, module_info, prefetched_pdbs
             )
             if mod_module:
                 yield mod_module
@@ -675,6 +796,7 @@ class PESymbols(interfaces.plugins.PluginInterface):
         module_instances: collected_modules_info,
         wanted_modules: PESymbolFinder.cached_value_dict,
         mod_name: str,
+        prefetched_pdbs: Optional[prefetched_pdbs_type] = None,
     ) -> Tuple[found_symbols_module, PESymbolFinder.cached_module_lists]:
         """
         Attempts to resolve every wanted symbol in `mod_name`
@@ -684,11 +806,14 @@ class PESymbols(interfaces.plugins.PluginInterface):
             module_instances: the set of layers in which the module was found
             wanted_modules: The symbols to resolve tied to their module names
             mod_name: name of the module to resolve symbols in
+            prefetched_pdbs: return value from `_prefetch_pdbs`, if the modules have already been scanned
         Returns:
             Tuple[found_symbols_module, PESymbolFinder.cached_module_lists]: The set of found symbols and the ones that could not be resolved
         """
         symbol_resolving_methods = [
-            PESymbols._find_symbols_through_pdb,
+            functools.partial(
+                PESymbols._find_symbols_through_pdb, prefetched_pdbs=prefetched_pdbs
+            ),
             PESymbols._find_symbols_through_exports,
         ]
 
@@ -753,6 +878,10 @@ class PESymbols(interfaces.plugins.PluginInterface):
         found_symbols: found_symbols_type = {}
         missing_symbols: PESymbolFinder.cached_value_dict = {}
 
+        prefetched_pdbs = PESymbols._prefetch_pdbs(
+            context, wanted_modules, collected_modules
+        )
+
         for mod_name in wanted_modules:
             if mod_name not in collected_modules:
                 continue
@@ -764,7 +893,12 @@ class PESymbols(interfaces.plugins.PluginInterface):
                 found_in_module,
                 missing_in_module,
             ) = PESymbols._resolve_symbols_through_methods(
-                context, config_path, module_instances, wanted_modules, mod_name
+                context,
+                config_path,
+                module_instances,
+                wanted_modules,
+                mod_name,
+                prefetched_pdbs,
             )
 
             if found_in_module:
@@ -881,11 +1015,11 @@ class PESymbols(interfaces.plugins.PluginInterface):
         vads: ranges_type = []
 
         try:
-            vad_root = proc.get_vad_root()
+            vad_index = proc.get_vad_index()
         except exceptions.InvalidAddressException:
             return vads
 
-        for vad in vad_root.traverse():
+        for vad in vad_index.get_vads():
             filepath = vad.get_file_name()
 
             if not isinstance(filepath, str) or filepath.count("\\") == 0:
@@ -72,6 +72,37 @@ class PoolHeaderScanner(interfaces.layers.ScannerInterface):
             [c for c in constraint_lookup.keys()]
         )
 
+    @property
+    def cache_key(self) -> Optional[Tuple]:
+        # The headers found are constructed from the module's symbol table, so the results are only valid for that table
+        symbol_table = self._module.context.symbol_space[self._module.symbol_table_name]
+        if not isinstance(symbol_table, configuration.ConfigurableInterface):
+            return None
+        isf_url = symbol_table.config.get("isf_url")
+        if isf_url is None:
+            return None
+        constraints = tuple(
+            (
+                tag,
+                constraint.type_name,
+                constraint.object_type,
+                None if constraint.page_type is None else int(constraint.page_type),
+                constraint.size,
+                constraint.index,
+                constraint.alignment,
+                constraint.skip_type_test,
+                tuple(constraint.additional_structures or []),
+            )
+            for tag, constraint in sorted(self._constraint_lookup.items())
+        )
+        return (
+            self._module.layer_name,
+            self._module.symbol_table_name,
+            isf_url,
+            self._alignment,
+            constraints,
+        )
+
     def __call__(self, data: bytes, data_offset: int):
         for offset, pattern in self._subscanner(data, data_offset):
             header = self._module.object(
@@ -127,7 +158,7 @@ class PoolHeaderScanner(interfaces.layers.ScannerInterface):
 class PoolScanner(plugins.PluginInterface):
     """A generic pool scanner plugin."""
 
-    _version = (1, 0, 0)
+    _version = (1, 1, 1)
     _required_framework_version = (2, 0, 0)
 
     @classmethod
@@ -356,6 +387,41 @@ class PoolScanner(plugins.PluginInterface):
         Returns:
             Iterable of tuples, containing the constraint that matched, the object from memory, the object header used to determine the object
         """
+        for _index, constraint, mem_object, header in cls.generate_pool_scan_multiple(
+            context, layer_name, symbol_table, [constraints]
+        ):
+            yield constraint, mem_object, header
+
+    @classmethod
+    def generate_pool_scan_multiple(
+        cls,
+        context: interfaces.context.ContextInterface,
+        layer_name: str,
+        symbol_table: str,
+        constraint_sets: List[List[PoolConstraint]],
+    ) -> Generator[
+        Tuple[
+            int,
+            PoolConstraint,
+            interfaces.objects.ObjectInterface,
+            interfaces.objects.ObjectInterface,
+        ],
+        None,
+        None,
+    ]:
+        """Carries out the same pool scan as :meth:`generate_pool_scan` for
+        several independent sets of constraints, reading the memory only once.
+
+        Args:
+            context: The context to retrieve required elements (layers, symbol tables) from
+            layer_name: The name of the layer on which to operate
+            symbol_table: The name of the table containing the kernel symbols
+            constraint_sets: A list of lists of pool constraints, one for each consumer of the scan
+
+        Returns:
+            Iterable of tuples, containing the index of the constraint set that matched, the constraint that matched,
+            the object from memory, the object header used to determine the object
+        """
 
         # get the object type map
         type_map = handles.Handles.get_type_map(
@@ -381,8 +447,8 @@ class PoolScanner(plugins.PluginInterface):
         else:
             alignment = 8
 
-        for constraint, header in cls.pool_scan(
-            context, scan_layer, symbol_table, constraints, alignment=alignment
+        for index, constraint, header in cls.pool_scan_multiple(
+            context, scan_layer, symbol_table, constraint_sets, alignment=alignment
         ):
             mem_objects = header.get_object(
                 constraint=constraint,
@@ -415,7 +481,7 @@ class PoolScanner(plugins.PluginInterface):
                         )
                         continue
 
-                yield constraint, mem_object, header
+                yield index, constraint, mem_object, header
 
     @classmethod
     def pool_scan(
@@ -445,22 +511,72 @@ class PoolScanner(plugins.PluginInterface):
         Returns:
             An Iterable of pool constraints and the pool headers associated with them
         """
-        # Setup the pattern
-        constraint_lookup: Dict[bytes, PoolConstraint] = {}
-        for constraint in pool_constraints:
-            if constraint.tag in constraint_lookup:
-                raise ValueError(
-                    f"Constraint tag is used for more than one constraint: {repr(constraint.tag)}"
-                )
-            constraint_lookup[constraint.tag] = constraint
+        for _index, constraint, header in cls.pool_scan_multiple(
+            context,
+            layer_name,
+            symbol_table,
+            [pool_constraints],
+            alignment,
+            progress_callback,
+        ):
+            yield constraint, header
+
+    @classmethod
+    def pool_scan_multiple(
+        cls,
+        context: interfaces.context.ContextInterface,
+        layer_name: str,
+        symbol_table: str,
+        constraint_sets: List[List[PoolConstraint]],
+        alignment: int = 8,
+        progress_callback: Optional[constants.ProgressCallback] = None,
+    ) -> Generator[
+        Tuple[int, PoolConstraint, interfaces.objects.ObjectInterface], None, None
+    ]:
+        """Returns the _POOL_HEADER objects matching each of several sets of
+        constraints, using a single pass over layer_name.  Only one constraint
+        can be provided per tag within each set, but sets may share tags.
 
+        Args:
+            context: The context to retrieve required elements (layers, symbol tables) from
+            layer_name: The name of the layer on which to operate
+            symbol_table: The name of the table containing the kernel symbols
+            constraint_sets: A list of lists of pool constraints used to limit the scan results
+            alignment: An optional value that all pool headers will be aligned to
+            progress_callback: An optional function to provide progress feedback whilst scanning
+
+        Returns:
+            An Iterable of the index of the matching constraint set, the pool constraint and the pool header
+        """
         pool_header_table_name = cls.get_pool_header_table(context, symbol_table)
         module = context.module(pool_header_table_name, layer_name, offset=0)
 
+        # Setup a scanner for each set of constraints
+        pool_scanners = []
+        for pool_constraints in constraint_sets:
+            constraint_lookup: Dict[bytes, PoolConstraint] = {}
+            for constraint in pool_constraints:
+                if constraint.tag in constraint_lookup:
+                    raise ValueError(
+                        f"Constraint tag is used for more than one constraint: {repr(constraint.tag)}"
+                    )
+                constraint_lookup[constraint.tag] = constraint
+            pool_scanners.append(
+                PoolHeaderScanner(module, constraint_lookup, alignment)
+            )
+
         # Run the scan locating the offsets of a particular tag
         layer = context.layers[layer_name]
-        scanner = PoolHeaderScanner(module, constraint_lookup, alignment)
-        yield from layer.scan(context, scanner, progress_callback)
+        if len(pool_scanners) == 1:
+            for constraint, header in layer.scan(
+                context, pool_scanners[0], progress_callback
+            ):
+                yield 0, constraint, header
+        else:
+            for index, (constraint, header) in layer.scan_multiple(
+                context, pool_scanners, progress_callback
+            ):
+                yield index, constraint, header
 
     @classmethod
     def get_pool_header_table(
@@ -4,7 +4,7 @@
 
 import datetime
 import logging
-from typing import Iterable, Callable, Optional, Tuple
+from typing import Iterable, Callable, List, Optional, Tuple
 
 from volatility3.framework import renderers, interfaces, layers, exceptions
 from volatility3.framework.configuration import requirements
@@ -23,7 +23,7 @@ class PsScan(interfaces.plugins.PluginInterface, timeliner.TimeLinerInterface):
     """Scans for processes present in a particular windows memory image."""
 
     _required_framework_version = (2, 3, 1)
-    _version = (1, 1, 0)
+    _version = (1, 2, 0)
 
     @classmethod
     def get_requirements(cls):
@@ -128,6 +128,20 @@ class PsScan(interfaces.plugins.PluginInterface, timeliner.TimeLinerInterface):
 
         return filter_func
 
+    @classmethod
+    def pool_constraints(cls, symbol_table: str) -> List["poolscanner.PoolConstraint"]:
+        """Returns the pool constraints used to scan for processes.
+
+        Args:
+            symbol_table: The name of the table containing the kernel symbols
+
+        Returns:
+            The constraints matching the "Proc" / "Pro\\xE3" process pool tags
+        """
+        return poolscanner.PoolScanner.builtin_constraints(
+            symbol_table, [b"Pro\xe3", b"Proc"]
+        )
+
     @classmethod
     def scan_processes(
         cls,
@@ -149,9 +163,7 @@ class PsScan(interfaces.plugins.PluginInterface, timeliner.TimeLinerInterface):
             A list of processes found by scanning the `layer_name` layer for process pool signatures
         """
 
-        constraints = poolscanner.PoolScanner.builtin_constraints(
-            symbol_table, [b"Pro\xe3", b"Proc"]
-        )
+        constraints = cls.pool_constraints(symbol_table)
 
         for result in poolscanner.PoolScanner.generate_pool_scan(
             context, layer_name, symbol_table, constraints
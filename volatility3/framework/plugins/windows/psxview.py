@@ -2,7 +2,7 @@ import datetime
 import logging
 import string
 from itertools import chain
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable, List, Tuple
 
 from volatility3.framework import constants, exceptions
 from volatility3.framework.configuration import requirements
@@ -12,6 +12,7 @@ from volatility3.framework.symbols.windows import extensions
 from volatility3.plugins.windows import (
     handles,
     info,
+    poolscanner,
     pslist,
     psscan,
     sessions,
@@ -35,7 +36,7 @@ class PsXView(plugins.PluginInterface):
     # code I do have from it, and will happily share it if anyone else wants to add it.
 
     _required_framework_version = (2, 0, 0)
-    _version = (1, 0, 0)
+    _version = (1, 1, 0)
 
     valid_proc_name_chars = set(
         string.ascii_lowercase + string.ascii_uppercase + "." + " "
@@ -56,14 +57,19 @@ class PsXView(plugins.PluginInterface):
                 name="pslist", component=pslist.PsList, version=(2, 0, 0)
             ),
             requirements.VersionRequirement(
-                name="psscan", component=psscan.PsScan, version=(1, 0, 0)
+                name="psscan", component=psscan.PsScan, version=(1, 2, 0)
             ),
             requirements.VersionRequirement(
-                name="thrdscan", component=thrdscan.ThrdScan, version=(1, 0, 0)
+                name="thrdscan", component=thrdscan.ThrdScan, version=(1, 2, 0)
             ),
             requirements.VersionRequirement(
                 name="handles", component=handles.Handles, version=(1, 0, 0)
             ),
+            requirements.VersionRequirement(
+                name="poolscanner",
+                component=poolscanner.PoolScanner,
+                version=(1, 1, 0),
+            ),
             requirements.BooleanRequirement(
                 name="physical-offsets",
                 description="List processes with physical offsets instead of virtual offsets.",
@@ -113,21 +119,12 @@ class PsXView(plugins.PluginInterface):
     def _check_pslist(self, tasks):
         return self._proc_list_to_dict(tasks)
 
-    def _check_psscan(
-        self, layer_name: str, symbol_table: str
+    def _thread_list_to_dict(
+        self, threads: Iterable[extensions.ETHREAD]
     ) -> Dict[int, extensions.EPROCESS]:
-        res = psscan.PsScan.scan_processes(
-            context=self.context, layer_name=layer_name, symbol_table=symbol_table
-        )
-
-        return self._proc_list_to_dict(res)
-
-    def _check_thrdscan(self) -> Dict[int, extensions.EPROCESS]:
         ret = []
 
-        for ethread in thrdscan.ThrdScan.scan_threads(
-            self.context, module_name="kernel"
-        ):
+        for ethread in threads:
             process = None
             try:
                 process = ethread.owning_process()
@@ -143,6 +140,44 @@ class PsXView(plugins.PluginInterface):
 
         return self._proc_list_to_dict(ret)
 
+    def _check_psscan(
+        self, layer_name: str, symbol_table: str
+    ) -> Dict[int, extensions.EPROCESS]:
+        res = psscan.PsScan.scan_processes(
+            context=self.context, layer_name=layer_name, symbol_table=symbol_table
+        )
+
+        return self._proc_list_to_dict(res)
+
+    def _check_thrdscan(self) -> Dict[int, extensions.EPROCESS]:
+        return self._thread_list_to_dict(
+            thrdscan.ThrdScan.scan_threads(self.context, module_name="kernel")
+        )
+
+    def _check_pool_scans(
+        self, layer_name: str, symbol_table: str
+    ) -> Tuple[Dict[int, extensions.EPROCESS], Dict[int, extensions.EPROCESS]]:
+        """Carries out the psscan and thrdscan checks with a single pass over memory"""
+        process_constraints = psscan.PsScan.pool_constraints(symbol_table)
+        thread_constraints = thrdscan.ThrdScan.pool_constraints(symbol_table)
+
+        found: Tuple[List[extensions.EPROCESS], List[extensions.ETHREAD]] = ([], [])
+        for (
+            index,
+            _constraint,
+            mem_object,
+            _header,
+        ) in poolscanner.PoolScanner.generate_pool_scan_multiple(
+            self.context,
+            layer_name,
+            symbol_table,
+            [process_constraints, thread_constraints],
+        ):
+            found[index].append(mem_object)
+
+        processes, threads = found
+        return self._proc_list_to_dict(processes), self._thread_list_to_dict(threads)
+
     def _check_csrss_handles(
         self, tasks: Iterable[extensions.EPROCESS], layer_name: str, symbol_table: str
     ) -> Dict[int, extensions.EPROCESS]:
@@ -194,8 +229,9 @@ class PsXView(plugins.PluginInterface):
         processes: Dict[str, Dict[int, extensions.EPROCESS]] = {}
 
         processes["pslist"] = self._check_pslist(kdbg_list_processes)
-        processes["psscan"] = self._check_psscan(layer_name, symbol_table)
-        processes["thrdscan"] = self._check_thrdscan()
+        processes["psscan"], processes["thrdscan"] = self._check_pool_scans(
+            layer_name, symbol_table
+        )
         processes["csrss"] = self._check_csrss_handles(
             kdbg_list_processes, layer_name, symbol_table
         )
@@ -312,7 +312,7 @@ class Skeleton_Key_Check(interfaces.plugins.PluginInterface):
             cryptdll_base: the base address of cryptdll.dll
             crytpdll_size: the size of the VAD for cryptdll.dll
         """
-        for vad in lsass_proc.get_vad_root().traverse():
+        for vad in lsass_proc.get_vad_index().get_vads():
             filename = vad.get_file_name()
 
             if isinstance(filename, str) and filename.lower().endswith("cryptdll.dll"):
@@ -8,6 +8,7 @@ from volatility3.framework import renderers, interfaces
 from volatility3.framework.configuration import requirements
 from volatility3.framework.objects import utility
 from volatility3.framework.renderers import format_hints
+from volatility3.framework.symbols.windows import extensions
 from volatility3.plugins.windows import pslist, threads, vadinfo, thrdscan
 
 vollog = logging.getLogger(__name__)
@@ -17,7 +18,7 @@ class SuspiciousThreads(interfaces.plugins.PluginInterface):
     """Lists suspicious userland process threads"""
 
     _required_framework_version = (2, 4, 0)
-    _version = (2, 0, 1)
+    _version = (2, 0, 2)
 
     @classmethod
     def get_requirements(cls) -> List[interfaces.configuration.RequirementInterface]:
@@ -45,9 +46,9 @@ class SuspiciousThreads(interfaces.plugins.PluginInterface):
     def _get_ranges(
         self,
         kernel: interfaces.context.ModuleInterface,
-        all_ranges: Dict[int, List[Tuple[int, int, str, str]]],
+        all_ranges: Dict[int, extensions.VadIndex],
         proc,
-    ) -> Tuple[int, int, str, str]:
+    ) -> extensions.VadIndex:
         """
         Maintains a hash table so each process' VADs
         are only enumerated once per plugin run
@@ -55,40 +56,40 @@ class SuspiciousThreads(interfaces.plugins.PluginInterface):
         key = proc.vol.offset
 
         if key not in all_ranges:
-            all_ranges[key] = []
-
-            for vad in proc.get_vad_root().traverse():
-                fn = vad.get_file_name()
-                if not isinstance(fn, str) or not fn:
-                    fn = None
-
-                protection_string = vad.get_protection(
-                    vadinfo.VadInfo.protect_values(
-                        self.context, kernel.layer_name, kernel.symbol_table_name
-                    ),
-                    vadinfo.winnt_protections,
-                )
-
-                all_ranges[key].append(
-                    (vad.get_start(), vad.get_end(), protection_string, fn)
-                )
+            all_ranges[key] = proc.get_vad_index()
 
         return all_ranges[key]
 
     def _get_range(
-        self, ranges: Dict[int, List[Tuple[int, int, str, str]]], address: int
+        self, ranges: extensions.VadIndex, address: int
     ) -> Tuple[int, str, str]:
         """
-        Walks a process' VADs looking for the one
-        containing `address`
+        Looks up the VAD of a process containing `address`
 
         Returns its base address, protection string, and mapped file, if any
         """
-        for start, end, protection_string, fn in ranges:
-            if start <= address < end:
-                return start, protection_string, fn
+        record = ranges.find(address)
+        if record is None:
+            return None, None, None
+
+        key = (ranges, record.offset)
+        if key not in self._range_details:
+            kernel = self.context.modules[self.config["kernel"]]
+            vad = ranges.get_vad(record)
+
+            fn = vad.get_file_name()
+            if not isinstance(fn, str) or not fn:
+                fn = None
+
+            protection_string = vad.get_protection(
+                vadinfo.VadInfo.protect_values(
+                    self.context, kernel.layer_name, kernel.symbol_table_name
+                ),
+                vadinfo.winnt_protections,
+            )
+            self._range_details[key] = protection_string, fn
 
-        return None, None, None
+        return record.start, *self._range_details[key]
 
     def _check_thread_address(
         self, exe_path: str, ranges, thread_address: int
@@ -156,6 +157,8 @@ class SuspiciousThreads(interfaces.plugins.PluginInterface):
         kernel = self.context.modules[self.config["kernel"]]
 
         all_ranges = {}
+        # The protection string and mapped file of each VAD looked up
+        self._range_details: Dict[Tuple[extensions.VadIndex, int], Tuple[str, str]] = {}
 
         for proc, pid, proc_name, exe_path, ranges in self._enumerate_processes(
             kernel, all_ranges
@@ -18,7 +18,7 @@ vollog = logging.getLogger(__name__)
 class SvcList(svcscan.SvcScan):
     """Lists services contained with the services.exe doubly linked list of services"""
 
-    _version = (1, 0, 0)
+    _version = (1, 0, 1)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -45,8 +45,7 @@ class SvcList(svcscan.SvcScan):
         the VAD containing services.exe
         """
 
-        vad_root = proc.get_vad_root()
-        for vad in vad_root.traverse():
+        for vad in proc.get_vad_index().get_vads():
             filename = vad.get_file_name()
             if isinstance(filename, str) and filename.lower().endswith(
                 "\\services.exe"
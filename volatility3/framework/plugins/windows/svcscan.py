@@ -39,7 +39,7 @@ class SvcScan(interfaces.plugins.PluginInterface):
     """Scans for windows services."""
 
     _required_framework_version = (2, 0, 0)
-    _version = (3, 0, 1)
+    _version = (3, 0, 2)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -316,10 +316,9 @@ class SvcScan(interfaces.plugins.PluginInterface):
 
             # get process sections for scanning
             sections = []
-            for vad in task.get_vad_root().traverse():
-                base = vad.get_start()
-                if vad.get_size():
-                    sections.append((base, vad.get_size()))
+            for record in task.get_vad_index():
+                if record.start is not None and record.end is not None:
+                    sections.append((record.start, record.end - record.start + 1))
 
             for offset in layer.scan(
                 context=context,
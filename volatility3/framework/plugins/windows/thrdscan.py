@@ -3,7 +3,7 @@
 ##
 import logging
 import datetime
-from typing import Callable, Iterable
+from typing import Callable, Iterable, List
 
 from volatility3.framework import renderers, interfaces, exceptions
 from volatility3.framework.configuration import requirements
@@ -19,7 +19,7 @@ class ThrdScan(interfaces.plugins.PluginInterface, timeliner.TimeLinerInterface)
 
     # version 2.6.0 adds support for scanning for 'Ethread' structures by pool tags
     _required_framework_version = (2, 6, 0)
-    _version = (1, 1, 0)
+    _version = (1, 2, 0)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -38,6 +38,20 @@ class ThrdScan(interfaces.plugins.PluginInterface, timeliner.TimeLinerInterface)
             ),
         ]
 
+    @classmethod
+    def pool_constraints(cls, symbol_table: str) -> List["poolscanner.PoolConstraint"]:
+        """Returns the pool constraints used to scan for threads.
+
+        Args:
+            symbol_table: The name of the table containing the kernel symbols
+
+        Returns:
+            The constraints matching the "Thre" / "Thr\\xE5" thread pool tags
+        """
+        return poolscanner.PoolScanner.builtin_constraints(
+            symbol_table, [b"Thr\xe5", b"Thre"]
+        )
+
     @classmethod
     def scan_threads(
         cls,
@@ -58,9 +72,7 @@ class ThrdScan(interfaces.plugins.PluginInterface, timeliner.TimeLinerInterface)
         layer_name = module.layer_name
         symbol_table = module.symbol_table_name
 
-        constraints = poolscanner.PoolScanner.builtin_constraints(
-            symbol_table, [b"Thr\xe5", b"Thre"]
-        )
+        constraints = cls.pool_constraints(symbol_table)
 
         for result in poolscanner.PoolScanner.generate_pool_scan(
             context, layer_name, symbol_table, constraints
@@ -34,7 +34,7 @@ class VadInfo(interfaces.plugins.PluginInterface):
     """Lists process memory ranges."""
 
     _required_framework_version = (2, 4, 0)
-    _version = (2, 0, 0)
+    _version = (2, 0, 1)
     MAXSIZE_DEFAULT = 1024 * 1024 * 1024  # 1 Gb
 
     def __init__(self, *args, **kwargs):
@@ -124,7 +124,7 @@ class VadInfo(interfaces.plugins.PluginInterface):
         Returns:
             A list of virtual address descriptors based on the process and filtered based on the filter function
         """
-        for vad in proc.get_vad_root().traverse():
+        for vad in proc.get_vad_index().get_vads():
             if not filter_func(vad):
                 yield vad
 
@@ -20,7 +20,7 @@ class VadRegExScan(plugins.PluginInterface):
     """Scans all virtual memory areas for tasks using RegEx."""
 
     _required_framework_version = (2, 0, 0)
-    _version = (1, 0, 0)
+    _version = (1, 0, 1)
     MAXSIZE_DEFAULT = 128
 
     @classmethod
@@ -68,10 +68,9 @@ class VadRegExScan(plugins.PluginInterface):
 
             # get process sections for scanning
             sections = []
-            for vad in proc.get_vad_root().traverse():
-                base = vad.get_start()
-                if vad.get_size():
-                    sections.append((base, vad.get_size()))
+            for record in proc.get_vad_index():
+                if record.start is not None and record.end is not None:
+                    sections.append((record.start, record.end - record.start + 1))
 
             for offset in proc_layer.scan(
                 context=self.context,
@@ -18,7 +18,7 @@ class VadYaraScan(interfaces.plugins.PluginInterface):
     """Scans all the Virtual Address Descriptor memory maps using yara."""
 
     _required_framework_version = (2, 4, 0)
-    _version = (1, 1, 1)
+    _version = (1, 1, 2)
 
     @classmethod
     def get_requirements(cls) -> List[interfaces.configuration.RequirementInterface]:
@@ -117,9 +117,9 @@ class VadYaraScan(interfaces.plugins.PluginInterface):
         Returns:
             An iterable of tuples containing start and size for each descriptor
         """
-        vad_root = task.get_vad_root()
-        for vad in vad_root.traverse():
-            yield (vad.get_start(), vad.get_size())
+        for record in task.get_vad_index():
+            if record.start is not None and record.end is not None:
+                yield (record.start, record.end - record.start + 1)
 
     def run(self):
         return renderers.TreeGrid(
@@ -52,6 +52,8 @@ class SymbolSpace(interfaces.symbols.SymbolSpaceInterface):
         # Permanently cache all resolved symbols
         self._resolved: Dict[str, interfaces.objects.Template] = {}
         self._resolved_symbols: Dict[str, interfaces.objects.Template] = {}
+        # Compiled member access for resolved aggregate types
+        self._accessors: Dict[str, objects.MemberAccessor] = {}
 
     def clear_symbol_cache(self, table_name: str = None) -> None:
         """Clears the symbol cache for the specified table name. If no table
@@ -63,6 +65,7 @@ class SymbolSpace(interfaces.symbols.SymbolSpaceInterface):
             table_list.append(self._dict[table_name])
         for table in table_list:
             table.clear_symbol_cache()
+        self._accessors = {}
 
     def free_table_name(self, prefix: str = "layer") -> str:
         """Returns an unused table name to ensure no collision occurs when
@@ -122,6 +125,7 @@ class SymbolSpace(interfaces.symbols.SymbolSpaceInterface):
         """Removes a named symbol_list from the space."""
         # Reset the resolved list, since we're removing some symbols
         self._resolved = {}
+        self._accessors = {}
         del self._dict[key]
 
     def verify_table_versions(
@@ -262,6 +266,24 @@ class SymbolSpace(interfaces.symbols.SymbolSpaceInterface):
             )
         return self._resolved[type_name]
 
+    def get_type_accessor(self, type_name: str) -> objects.MemberAccessor:
+        """Returns the compiled member accessor for an aggregate type,
+        creating it the first time the type is requested.
+
+        Raises:
+            SymbolError: If the type cannot be resolved, or is not an aggregate type
+        """
+        if type_name not in self._accessors:
+            template = self.get_type(type_name)
+            if "members" not in template.vol:
+                raise exceptions.SymbolError(
+                    type_name, None, f"Type has no members: {type_name}"
+                )
+            self._accessors[type_name] = objects.MemberAccessor(
+                self, type_name, template.vol.members
+            )
+        return self._accessors[type_name]
+
     def get_symbol(self, symbol_name: str) -> interfaces.symbols.SymbolInterface:
         """Look-up a symbol name across all the contained symbol spaces."""
         retval = self._weak_resolve(SymbolType.SYMBOL, symbol_name)
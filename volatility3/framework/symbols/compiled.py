@@ -0,0 +1,278 @@
+# This file is Copyright 2024 Volatility Foundation and licensed under the Volatility Software License 1.0
+# which is available at https://www.volatilityfoundation.org/license/vsl-v1.0
+#
+"""Stores intermediate symbol format files in a pre-parsed form within the
+cache, so that large files need not be decompressed and parsed in full each
+time they are used.
+
+Each compiled file is keyed by the hash of the file's raw contents.  The
+sections that can be very large (user types, enumerations and symbols) are
+stored with one entry per name, which is only decoded when it is looked up.
+The remaining sections (such as the metadata and base types) are small and
+are decoded as soon as the compiled file is opened.
+"""
+
+import collections.abc
+import json
+import logging
+import os
+import sqlite3
+import threading
+import urllib.parse
+import urllib.request
+import zipfile
+import zlib
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+from volatility3.framework import constants
+
+vollog = logging.getLogger(__name__)
+
+COMPILED_SECTIONS = ("user_types", "enums", "symbols")
+"""The sections of an ISF file whose entries are only decoded when used"""
+
+_FORMAT_VERSION = 1
+"""Version of the compiled representation, included in each key"""
+
+
+def _connect() -> sqlite3.Connection:
+    database = sqlite3.connect(
+        os.path.join(constants.CACHE_PATH, constants.COMPILED_ISF_FILENAME),
+        timeout=30,
+        check_same_thread=False,
+    )
+    database.execute(
+        "CREATE TABLE IF NOT EXISTS isfs (id INTEGER PRIMARY KEY, key TEXT UNIQUE, header TEXT, cached DATETIME)"
+    )
+    database.execute(
+        "CREATE TABLE IF NOT EXISTS entries (isf INT, section INT, name TEXT, value BLOB)"
+    )
+    database.execute(
+        "CREATE INDEX IF NOT EXISTS entries_name ON entries (isf, section, name)"
+    )
+    return database
+
+
+def compiled_key(isf_url: str, file_hash: str) -> Optional[str]:
+    """Determines the key of the compiled form of an ISF file, given the hash
+    of the file's raw contents.
+
+    Only local files (or files within local zip files) at least
+    COMPILED_ISF_MINIMUM_SIZE bytes long are compiled, for any others
+    None is returned.
+    """
+    parsed = urllib.parse.urlparse(isf_url)
+    try:
+        if parsed.scheme == "file":
+            size = os.path.getsize(urllib.request.url2pathname(parsed.path))
+        elif parsed.scheme == "jar" and parsed.path.startswith("file:"):
+            zippath, _, member = parsed.path[len("file:") :].partition("!")
+            with zipfile.ZipFile(zippath) as archive:
+                size = archive.getinfo(member).file_size
+        else:
+            return None
+    except (OSError, KeyError, zipfile.BadZipFile) as excp:
+        vollog.log(
+            constants.LOGLEVEL_VVVV, f"Unable to find the size of {isf_url}: {excp}"
+        )
+        return None
+    if size < constants.COMPILED_ISF_MINIMUM_SIZE:
+        return None
+    return f"{file_hash}-{_FORMAT_VERSION}"
+
+
+class CompiledISF(collections.abc.Mapping):
+    """A read-only mapping that behaves like the parsed JSON of an ISF file,
+    but reads each entry of the compiled sections from the cache on demand."""
+
+    def __init__(self, isf_id: int, header: Dict[str, Any]) -> None:
+        self._id = isf_id
+        self._header = header
+        self._database: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._sections = {
+            section: CompiledSection(self, COMPILED_SECTIONS.index(section))
+            for section in header["compiled_sections"]
+        }
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._sections:
+            return self._sections[key]
+        return self._header["sections"][key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._header["sections"]
+        yield from self._sections
+
+    def __len__(self) -> int:
+        return len(self._header["sections"]) + len(self._sections)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Connections and locks cannot be copied, so each copy opens its own
+        state = self.__dict__.copy()
+        state["_database"] = None
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _query(self, statement: str, parameters: tuple) -> List[tuple]:
+        with self._lock:
+            if self._database is None:
+                self._database = _connect()
+            return self._database.execute(
+                statement, (self._id,) + parameters
+            ).fetchall()
+
+    @classmethod
+    def open(cls, key: str) -> Optional["CompiledISF"]:
+        """Opens the compiled file stored against key, or returns None if there is none"""
+        try:
+            database = _connect()
+            try:
+                row = database.execute(
+                    "SELECT id, header, cached < datetime('now', '-1 day') "
+                    "FROM isfs WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is not None and row[2]:
+                    # Only refresh the timestamp occasionally, to avoid a write on every use
+                    with database:
+                        database.execute(
+                            "UPDATE isfs SET cached = datetime('now') WHERE id = ?",
+                            (row[0],),
+                        )
+            finally:
+                database.close()
+        except sqlite3.Error as excp:
+            vollog.log(
+                constants.LOGLEVEL_VVVV, f"Unable to read compiled ISF cache: {excp}"
+            )
+            return None
+        if row is None:
+            return None
+        return cls(row[0], json.loads(row[1]))
+
+    @classmethod
+    def compile(cls, key: str, json_object: Dict[str, Any]) -> None:
+        """Stores the parsed JSON of an ISF file against key, removing any
+        compiled files that have not been used recently."""
+        header = {
+            "sections": {
+                section: value
+                for section, value in json_object.items()
+                if section not in COMPILED_SECTIONS
+            },
+            "compiled_sections": [
+                section for section in COMPILED_SECTIONS if section in json_object
+            ],
+        }
+        try:
+            database = _connect()
+            try:
+                with database:
+                    existing = database.execute(
+                        "SELECT id FROM isfs WHERE key = ?", (key,)
+                    ).fetchone()
+                    if existing is not None:
+                        return None
+                    expired = (
+                        f"cached < datetime('now', '{constants.SQLITE_CACHE_PERIOD}')"
+                    )
+                    database.execute(
+                        f"DELETE FROM entries WHERE isf IN (SELECT id FROM isfs WHERE {expired})"
+                    )
+                    database.execute(f"DELETE FROM isfs WHERE {expired}")
+                    # The file is only visible once every entry has been written, since this is a single transaction
+                    isf_id = database.execute(
+                        "INSERT INTO isfs (key, header, cached) VALUES (?, ?, datetime('now'))",
+                        (key, json.dumps(header)),
+                    ).lastrowid
+                    for section in header["compiled_sections"]:
+                        section_index = COMPILED_SECTIONS.index(section)
+                        database.executemany(
+                            "INSERT INTO entries VALUES (?, ?, ?, ?)",
+                            (
+                                (
+                                    isf_id,
+                                    section_index,
+                                    name,
+                                    zlib.compress(json.dumps(value).encode("utf-8")),
+                                )
+                                for name, value in json_object[section].items()
+                            ),
+                        )
+            finally:
+                database.close()
+        except (sqlite3.Error, TypeError, ValueError) as excp:
+            vollog.log(
+                constants.LOGLEVEL_VVVV, f"Unable to write compiled ISF cache: {excp}"
+            )
+
+
+class CompiledSection(collections.abc.Mapping):
+    """A read-only mapping of the entries within a compiled section, decoding
+    (and remembering) each entry only when it is looked up."""
+
+    def __init__(self, compiled_isf: CompiledISF, section: int) -> None:
+        self._compiled_isf = compiled_isf
+        self._section = section
+        self._entries: Dict[str, Any] = {}
+        self._names: Optional[List[str]] = None
+        self._name_set: Set[str] = set()
+
+    def __getitem__(self, name: str) -> Any:
+        if name in self._entries:
+            return self._entries[name]
+        if self._names is not None and name not in self._name_set:
+            raise KeyError(name)
+        rows = self._compiled_isf._query(
+            "SELECT value FROM entries WHERE isf = ? AND section = ? AND name = ?",
+            (self._section, name),
+        )
+        if not rows:
+            raise KeyError(name)
+        self._entries[name] = json.loads(zlib.decompress(rows[0][0]))
+        return self._entries[name]
+
+    def __contains__(self, name: object) -> bool:
+        try:
+            self[name]
+        except (KeyError, sqlite3.Error):
+            return False
+        return True
+
+    def _load_names(self) -> List[str]:
+        if self._names is None:
+            # Entries were written in the order of the original file
+            self._names = [
+                row[0]
+                for row in self._compiled_isf._query(
+                    "SELECT name FROM entries WHERE isf = ? AND section = ? ORDER BY rowid",
+                    (self._section,),
+                )
+            ]
+            self._name_set = set(self._names)
+        return self._names
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._load_names())
+
+    def __len__(self) -> int:
+        return len(self._load_names())
+
+    def items(self) -> collections.abc.ItemsView:
+        # Decode every entry with a single query, rather than one query per entry
+        if len(self._entries) < len(self._load_names()):
+            for name, value in self._compiled_isf._query(
+                "SELECT name, value FROM entries WHERE isf = ? AND section = ?",
+                (self._section,),
+            ):
+                if name not in self._entries:
+                    self._entries[name] = json.loads(zlib.decompress(value))
+        return collections.abc.ItemsView(self)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {COMPILED_SECTIONS[self._section]}>"
@@ -23,7 +23,7 @@ from volatility3.framework import (
 )
 from volatility3.framework.configuration import requirements
 from volatility3.framework.layers import resources
-from volatility3.framework.symbols import metadata, native
+from volatility3.framework.symbols import compiled, metadata, native, validations
 
 vollog = logging.getLogger(__name__)
 
@@ -112,15 +112,7 @@ class IntermediateSymbolTable(interfaces.symbols.SymbolTableInterface):
         # Check there are no obvious errors
         # Open the file and test the version
         self._versions = dict([(x.version, x) for x in class_subclasses(ISFormatTable)])
-        with resources.ResourceAccessor().open(isf_url) as fp:
-            reader = codecs.getreader("utf-8")
-            json_object = json.load(reader(fp))  # type: ignore
-
-        # Validation is expensive, but we cache to store the hashes of successfully validated json objects
-        if validate and not schemas.validate(json_object):
-            raise exceptions.SymbolSpaceError(
-                f"File does not pass version validation: {isf_url}"
-            )
+        json_object = self._load_json(isf_url, validate)
 
         metadata = json_object.get("metadata", None)
 
@@ -158,6 +150,48 @@ class IntermediateSymbolTable(interfaces.symbols.SymbolTableInterface):
         self.config["isf_url"] = isf_url
         self.config["symbol_mask"] = symbol_mask
 
+    @staticmethod
+    def _load_json(isf_url: str, validate: bool) -> Mapping[str, Any]:
+        """Reads (and validates) the JSON of an ISF file, using the compiled
+        form of the file from the cache where possible.
+
+        Files that can be hashed have their validation recorded against the
+        hash of their raw contents, so once validated they need neither be
+        parsed nor validated again.
+        """
+        file_hash = validations.get_file_hash(isf_url)
+        validated = not validate or (
+            file_hash is not None and validations.is_validated(file_hash)
+        )
+
+        key = None
+        if constants.CACHE_COMPILED_ISF and file_hash is not None:
+            key = compiled.compiled_key(isf_url, file_hash)
+        if key is not None and validated:
+            compiled_isf = compiled.CompiledISF.open(key)
+            if compiled_isf is not None:
+                vollog.log(constants.LOGLEVEL_VVVV, f"Using compiled ISF for {isf_url}")
+                schemas.check_producer(compiled_isf)
+                return compiled_isf
+
+        with resources.ResourceAccessor().open(isf_url) as fp:
+            reader = codecs.getreader("utf-8")
+            json_object = json.load(reader(fp))  # type: ignore
+
+        if not validated:
+            # Validation is expensive, so the result is cached against the file's hash,
+            # or failing that the hash of the json object
+            if not schemas.validate(json_object, use_cache=file_hash is None):
+                raise exceptions.SymbolSpaceError(
+                    f"File does not pass version validation: {isf_url}"
+                )
+            if file_hash is not None:
+                validations.record_validation(file_hash)
+
+        if key is not None and isinstance(json_object, dict):
+            compiled.CompiledISF.compile(key, json_object)
+        return json_object
+
     @staticmethod
     def _closest_version(
         version: str, versions: Dict[Tuple[int, int, int], Type["ISFormatTable"]]
@@ -187,6 +221,7 @@ class IntermediateSymbolTable(interfaces.symbols.SymbolTableInterface):
     clear_symbol_cache = _construct_delegate_function("clear_symbol_cache")
     get_type = _construct_delegate_function("get_type")
     get_symbol = _construct_delegate_function("get_symbol")
+    get_symbols_by_location = _construct_delegate_function("get_symbols_by_location")
     get_enumeration = _construct_delegate_function("get_enumeration")
     get_type_class = _construct_delegate_function("get_type_class")
     set_type_class = _construct_delegate_function("set_type_class")
@@ -383,8 +418,18 @@ class ISFormatTable(interfaces.symbols.SymbolTableInterface, metaclass=ABCMeta):
 
     def clear_symbol_cache(self) -> None:
         """Clears the symbol cache of the symbol table."""
+        super().clear_symbol_cache()
         self._symbol_cache.clear()
 
+    def _symbol_locations(self) -> Iterable[Tuple[int, str]]:
+        # Read the addresses directly, rather than constructing every symbol (and its type)
+        symbol_mask = self.config.get("symbol_mask", 0)
+        for name, symbol in self._json_object.get("symbols", {}).items():
+            address = symbol["address"]
+            if symbol_mask:
+                address = address & symbol_mask
+            yield address, name
+
 
 class Version1Format(ISFormatTable):
     """Class for storing intermediate debugging data as objects and classes."""
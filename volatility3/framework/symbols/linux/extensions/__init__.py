@@ -1198,25 +1198,27 @@ class list_head(objects.StructType, collections.abc.Iterable):
         if forward:
             direction = "next"
         try:
-            link = getattr(self, direction).dereference()
+            link = getattr(self, direction)
         except exceptions.InvalidAddressException:
             return None
         if not sentinel:
             yield self._context.object(
                 symbol_type, layer, offset=self.vol.offset - relative_offset
             )
-        seen = {self.vol.offset}
-        while link.vol.offset not in seen:
-            obj = self._context.object(
-                symbol_type, layer, offset=link.vol.offset - relative_offset
+        # Walk the raw links first, and only construct the entries as they're requested
+        length, byteorder, _ = link.vol.data_format
+        link_offsets = self._context.layers.walk_pointers(
+            link.vol.native_layer_name,
+            int(link),
+            pointer_offset=self.vol.members[direction][0],
+            pointer_size=length,
+            byteorder=byteorder,
+            stop=[self.vol.offset],
+        )
+        for link_offset in link_offsets:
+            yield self._context.object(
+                symbol_type, layer, offset=link_offset - relative_offset
             )
-            yield obj
-
-            seen.add(link.vol.offset)
-            try:
-                link = getattr(link, direction).dereference()
-            except exceptions.InvalidAddressException:
-                break
 
     def __iter__(self) -> Iterator[interfaces.objects.ObjectInterface]:
         return self.to_list(self.vol.parent.vol.type_name, self.vol.member_name)
@@ -0,0 +1,159 @@
+# This file is Copyright 2024 Volatility Foundation and licensed under the Volatility Software License 1.0
+# which is available at https://www.volatilityfoundation.org/license/vsl-v1.0
+#
+"""Reads selected parts of an intermediate symbol format file without
+parsing the whole file.
+
+The file is read incrementally, one entry at a time, so only the entries that
+are wanted are kept and memory use does not grow with the size of the file.
+Reading stops as soon as everything wanted has been found, unless the number
+of entries in each section is also required.
+"""
+
+import codecs
+import json
+import re
+from typing import IO, Any, Collection, Dict, Iterator, Mapping, Optional, Tuple
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+_LOOKAHEAD = 64
+
+
+class JSONStream:
+    """Tokenizes a JSON document read incrementally from a binary file"""
+
+    def __init__(self, fp: IO[bytes], chunk_size: int = 0x100000) -> None:
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._index = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Reads more of the file into the buffer, returning False if the end of the file has been reached"""
+        if self._eof:
+            return False
+        # Read at least as much as is already buffered, so large values are not reparsed many times
+        data = self._fp.read(max(self._chunk_size, len(self._buffer) - self._index))
+        self._eof = not data
+        self._buffer = self._buffer[self._index :] + self._text_decoder.decode(
+            data, final=self._eof
+        )
+        self._index = 0
+        return True
+
+    def peek(self) -> str:
+        """Returns the next character that is not whitespace, or an empty string at the end of the file"""
+        while True:
+            self._index = _WHITESPACE.match(self._buffer, self._index).end()
+            if self._index < len(self._buffer) or not self._fill():
+                return self._buffer[self._index : self._index + 1]
+
+    def expect(self, characters: str) -> str:
+        """Consumes the next character, which must be one of characters"""
+        char = self.peek()
+        if not char or char not in characters:
+            raise ValueError(
+                f"Expected one of {characters!r} but found {char!r} in JSON stream"
+            )
+        self._index += 1
+        return char
+
+    def read_value(self) -> Any:
+        """Reads and returns the next complete value"""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buffer, self._index)
+                # A number close to the end of the buffer may continue into the next chunk
+                if len(self._buffer) - end > _LOOKAHEAD or self._eof:
+                    self._index = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            self._fill()
+
+    def read_string(self) -> str:
+        """Reads and returns the next string"""
+        self.expect('"')
+        while True:
+            try:
+                value, self._index = json.decoder.scanstring(self._buffer, self._index)
+                return value
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+
+    def members(self) -> Iterator[str]:
+        """Yields the name of each member of the next object.
+
+        The value of each member must be read (or skipped with
+        :meth:`read_value`) before the next name is requested.
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self._index += 1
+            return None
+        while True:
+            name = self.read_string()
+            self.expect(":")
+            yield name
+            if self.expect(",}") == "}":
+                return None
+
+
+def read_sections(
+    fp: IO[bytes],
+    wanted: Mapping[str, Optional[Collection[str]]],
+    count_entries: bool = False,
+) -> Tuple[Dict[str, Any], Dict[str, int]]:
+    """Reads the wanted sections of an ISF file, or the wanted entries within them.
+
+    Args:
+        fp: The (decompressed) binary file to read
+        wanted: A mapping of each top level section to the names of the entries wanted within it, or None for the whole section
+        count_entries: Whether to count the entries within each section, which requires reading the whole file
+
+    Returns:
+        A dictionary in the form of the parsed file, containing only the wanted sections and entries that were found,
+        and the number of entries within each section (if they were counted)
+    """
+    stream = JSONStream(fp)
+    result: Dict[str, Any] = {}
+    counts: Dict[str, int] = {}
+    pending = {
+        section: set(names) if names is not None else None
+        for section, names in wanted.items()
+    }
+
+    for section in stream.members():
+        entry_names = pending.pop(section, set())
+        if entry_names is None:
+            result[section] = stream.read_value()
+            if count_entries and isinstance(result[section], (dict, list)):
+                counts[section] = len(result[section])
+        elif stream.peek() == "{" and (entry_names or count_entries):
+            entries = result[section] = {}
+            count = 0
+            for name in stream.members():
+                count += 1
+                if name in entry_names:
+                    entries[name] = stream.read_value()
+                    entry_names.discard(name)
+                    if not (entry_names or pending or count_entries):
+                        return result, counts
+                else:
+                    stream.read_value()
+            counts[section] = count
+            if section not in wanted:
+                del result[section]
+        else:
+            value = stream.read_value()
+            if count_entries and isinstance(value, (dict, list)):
+                counts[section] = len(value)
+        if not (pending or count_entries):
+            break
+    return result, counts
@@ -0,0 +1,191 @@
+# This file is Copyright 2024 Volatility Foundation and licensed under the Volatility Software License 1.0
+# which is available at https://www.volatilityfoundation.org/license/vsl-v1.0
+#
+"""Records which ISF files have passed schema validation, keyed by the hash
+of each file's raw contents, within the identifiers cache.
+
+The identifiers cache is populated by the symbol cache automagic, but the
+lookups here are needed whenever a symbol table is loaded, so they live
+alongside the symbol tables and share a single connection per process.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import urllib.parse
+import urllib.request
+import zipfile
+from typing import Optional, Tuple
+
+from volatility3 import schemas
+from volatility3.framework import constants
+
+vollog = logging.getLogger(__name__)
+
+_connection: Optional[Tuple[int, str, sqlite3.Connection]] = None
+_connection_lock = threading.Lock()
+
+
+def _database() -> sqlite3.Connection:
+    """Returns this process's connection to the identifiers cache, opening it
+    if the process (or the location of the cache) has changed since it was
+    last opened"""
+    global _connection
+    path = os.path.join(constants.CACHE_PATH, constants.IDENTIFIERS_FILENAME)
+    with _connection_lock:
+        if _connection is None or _connection[:2] != (os.getpid(), path):
+            database = sqlite3.connect(path, timeout=30, check_same_thread=False)
+            create_tables(database)
+            _connection = (os.getpid(), path, database)
+        return _connection[2]
+
+
+def create_tables(database: sqlite3.Connection) -> None:
+    """Creates the tables used to record validations (and the hashes of files
+    that are not otherwise cached) within a connection to the identifiers
+    cache, if they do not already exist"""
+    database.execute(
+        "CREATE TABLE IF NOT EXISTS validations (hash TEXT, version TEXT, validated DATETIME, checked BOOLEAN, PRIMARY KEY (hash, version))"
+    )
+    database.execute(
+        "CREATE TABLE IF NOT EXISTS file_hashes (location TEXT PRIMARY KEY, size INT, mtime INT, hash TEXT)"
+    )
+    database.commit()
+
+
+def local_path(location: str) -> Optional[str]:
+    """Returns the path of the local file holding a location, or None if the
+    location is not a local file or within a local zip file"""
+    parsed = urllib.parse.urlparse(location)
+    if parsed.scheme == "file":
+        return urllib.request.url2pathname(parsed.path)
+    if parsed.scheme == "jar":
+        inner_url = urllib.parse.urlparse(parsed.path)
+        if inner_url.scheme == "file":
+            return inner_url.path.split("!")[0]
+    return None
+
+
+def hash_file(location: str) -> Optional[str]:
+    """Hashes the raw (possibly compressed) contents of a local file, or a
+    file within a local zip file, returning None for any other location"""
+    parsed = urllib.parse.urlparse(location)
+    hasher = hashlib.sha256()
+    try:
+        if parsed.scheme == "file":
+            fp = open(urllib.request.url2pathname(parsed.path), "rb")
+        elif parsed.scheme == "jar" and parsed.path.startswith("file:"):
+            zippath, _, member = parsed.path[len("file:") :].partition("!")
+            with zipfile.ZipFile(zippath) as archive:
+                fp = archive.open(member)
+        else:
+            return None
+        with fp:
+            for block in iter(lambda: fp.read(0x100000), b""):
+                hasher.update(block)
+    except (OSError, KeyError, zipfile.BadZipFile) as excp:
+        vollog.log(constants.LOGLEVEL_VVVV, f"Unable to hash {location}: {excp}")
+        return None
+    return hasher.hexdigest()
+
+
+def get_file_hash(
+    location: str, database: Optional[sqlite3.Connection] = None
+) -> Optional[str]:
+    """Returns the hash of the raw contents of a local file, using the hash
+    recorded in the identifiers cache if the file has not changed since
+
+    Files that the symbol cache has not identified have their hashes recorded
+    separately, so that they are not rehashed each time they are loaded.
+
+    Args:
+        location: The URL of the file to hash
+        database: The connection to the identifiers cache, defaulting to this process's connection
+    """
+    pathname = local_path(location)
+    if pathname is None:
+        return None
+    try:
+        stat_result = os.stat(pathname)
+    except OSError:
+        return None
+    database = database or _database()
+    # The size and modification time are checked first, to avoid rehashing unchanged files
+    for table in ["cache", "file_hashes"]:
+        try:
+            row = database.execute(
+                f"SELECT hash, size, mtime FROM {table} WHERE location = ?",
+                (location,),
+            ).fetchone()
+        except sqlite3.Error as excp:
+            vollog.log(
+                constants.LOGLEVEL_VVVV,
+                f"Unable to look up the hash of {location}: {excp}",
+            )
+            continue
+        if (
+            row is not None
+            and row[0]
+            and row[1] == stat_result.st_size
+            and row[2] == stat_result.st_mtime_ns
+        ):
+            return row[0]
+    file_hash = hash_file(location)
+    if file_hash is not None:
+        try:
+            database.execute(
+                "INSERT OR REPLACE INTO file_hashes VALUES (?, ?, ?, ?)",
+                (location, stat_result.st_size, stat_result.st_mtime_ns, file_hash),
+            )
+            database.commit()
+        except sqlite3.Error as excp:
+            vollog.log(
+                constants.LOGLEVEL_VVVV,
+                f"Unable to record the hash of {location}: {excp}",
+            )
+    return file_hash
+
+
+def is_validated(file_hash: str, database: Optional[sqlite3.Connection] = None) -> bool:
+    """Determines whether the file with a particular hash has passed
+    validation with this version of the framework
+
+    Files accepted while validation was unavailable are only treated as
+    validated for as long as validation remains unavailable.
+    """
+    try:
+        row = (
+            (database or _database())
+            .execute(
+                "SELECT checked FROM validations WHERE hash = ? AND version = ?",
+                (file_hash, constants.PACKAGE_VERSION),
+            )
+            .fetchone()
+        )
+    except sqlite3.Error as excp:
+        vollog.log(
+            constants.LOGLEVEL_VVVV, f"Unable to look up validation record: {excp}"
+        )
+        return False
+    if row is None:
+        return False
+    return bool(row[0]) or not schemas.validation_available()
+
+
+def record_validation(
+    file_hash: str, database: Optional[sqlite3.Connection] = None
+) -> None:
+    """Records that the file with a particular hash has passed validation,
+    or was accepted without being checked if validation is unavailable"""
+    # Schemas ship with the framework, so validations are only trusted for the version that made them
+    database = database or _database()
+    try:
+        database.execute(
+            "INSERT OR REPLACE INTO validations VALUES (?, ?, datetime('now'), ?)",
+            (file_hash, constants.PACKAGE_VERSION, schemas.validation_available()),
+        )
+        database.commit()
+    except sqlite3.Error as excp:
+        vollog.log(constants.LOGLEVEL_VVVV, f"Unable to record validation: {excp}")
@@ -2,13 +2,24 @@
 # which is available at https://www.volatilityfoundation.org/license/vsl-v1.0
 #
 
+import bisect
 import collections.abc
 import contextlib
 import datetime
 import functools
 import logging
 import math
-from typing import Generator, Iterable, Iterator, List, Optional, Tuple, Union
+import weakref
+from typing import (
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from volatility3.framework import (
     constants,
@@ -76,69 +87,92 @@ class MMVAD_SHORT(objects.StructType):
     def traverse(self, visited=None, depth=0):
         """Traverse the VAD tree, determining each underlying VAD node type by
         looking up the pool tag for the structure and then casting into a new
-        object."""
-
-        # TODO: this is an arbitrary limit chosen based on past observations
-        if depth > 100:
-            vollog.log(
-                constants.LOGLEVEL_VVV, "Vad tree is too deep, something went wrong!"
-            )
-            raise RuntimeError("Vad tree is too deep")
+        object.
 
+        Nodes are yielded in the same order as a recursive, depth-first walk
+        (each node, then its left subtree, then its right subtree), but the
+        walk is made with an explicit stack.
+        """
         if visited is None:
             visited = set()
 
-        vad_address = self.vol.offset
+        stack: List[Tuple[MMVAD_SHORT, int]] = [(self, depth)]
+        while stack:
+            node, node_depth = stack.pop()
 
-        if vad_address in visited:
-            vollog.log(constants.LOGLEVEL_VVV, "VAD node already seen!")
-            return None
+            # TODO: this is an arbitrary limit chosen based on past observations
+            if node_depth > 100:
+                vollog.log(
+                    constants.LOGLEVEL_VVV,
+                    f"Vad tree is too deep at {node.vol.offset:#x}, skipping the subtree",
+                )
+                continue
 
-        visited.add(vad_address)
-        tag = self.get_tag()
-
-        if tag in ["VadS", "VadF"]:
-            target = "_MMVAD_SHORT"
-        elif tag is not None and tag.startswith("Vad"):
-            target = "_MMVAD"
-        elif depth == 0:
-            # the root node at depth 0 is allowed to not have a tag
-            # but we still want to continue and access its right & left child
-            target = None
-        else:
-            # any node other than the root that doesn't have a recognized tag
-            # is just garbage and we skip the node entirely
-            vollog.log(
-                constants.LOGLEVEL_VVV,
-                f"Skipping VAD at {self.vol.offset} depth {depth} with tag {tag}",
-            )
-            return None
+            vad_address = node.vol.offset
 
-        if target:
-            vad_object = self.cast(target)
-            yield vad_object
+            if vad_address in visited:
+                vollog.log(constants.LOGLEVEL_VVV, "VAD node already seen!")
+                continue
 
-        try:
-            for vad_node in (
-                self.get_left_child().dereference().traverse(visited, depth + 1)
-            ):
-                yield vad_node
-        except exceptions.InvalidAddressException as excp:
-            vollog.log(
-                constants.LOGLEVEL_VVV,
-                f"Invalid address on LeftChild: {excp.invalid_address:#x}",
-            )
+            visited.add(vad_address)
+            tag = node.get_tag()
+
+            if tag in ["VadS", "VadF"]:
+                target = "_MMVAD_SHORT"
+            elif tag is not None and tag.startswith("Vad"):
+                target = "_MMVAD"
+            elif node_depth == depth:
+                # the root node is allowed to not have a tag
+                # but we still want to continue and access its right & left child
+                target = None
+            else:
+                # any node other than the root that doesn't have a recognized tag
+                # is just garbage and we skip the node entirely
+                vollog.log(
+                    constants.LOGLEVEL_VVV,
+                    f"Skipping VAD at {node.vol.offset} depth {node_depth} with tag {tag}",
+                )
+                continue
 
-        try:
-            for vad_node in (
-                self.get_right_child().dereference().traverse(visited, depth + 1)
-            ):
-                yield vad_node
-        except exceptions.InvalidAddressException as excp:
-            vollog.log(
-                constants.LOGLEVEL_VVV,
-                f"Invalid address on RightChild: {excp.invalid_address:#x}",
-            )
+            if target:
+                vad_object = node.cast(target)
+                yield vad_object
+
+            # Push the right child first, so that the left subtree is walked first
+            children = []
+            for name, get_child in [
+                ("LeftChild", node.get_left_child),
+                ("RightChild", node.get_right_child),
+            ]:
+                try:
+                    children.append((get_child().dereference(), node_depth + 1))
+                except exceptions.InvalidAddressException as excp:
+                    vollog.log(
+                        constants.LOGLEVEL_VVV,
+                        f"Invalid address on {name}: {excp.invalid_address:#x}",
+                    )
+            stack.extend(reversed(children))
+
+    def get_record(self) -> "VadRecord":
+        """Returns a compact summary of the VAD, with None for any value that
+        could not be read."""
+
+        def attempt(method):
+            try:
+                return method()
+            except (exceptions.InvalidAddressException, AttributeError):
+                return None
+
+        return VadRecord(
+            offset=self.vol.offset,
+            type_name=self.vol.type_name,
+            start=attempt(self.get_start),
+            end=attempt(self.get_end),
+            protection=attempt(lambda: self.Protection),
+            tag=self.get_tag(),
+            file_pointer=attempt(self.get_file_pointer),
+            commit_charge=attempt(self.get_commit_charge),
+        )
 
     def get_right_child(self):
         """Get the right child member."""
@@ -338,6 +372,109 @@ class MMVAD_SHORT(objects.StructType):
         """Only long(er) vads have mapped files."""
         return renderers.NotApplicableValue()
 
+    def get_file_pointer(self) -> int:
+        """Only long(er) vads have mapped files."""
+        return 0
+
+
+class VadRecord(NamedTuple):
+    """A compact summary of a single node of a VAD tree."""
+
+    offset: int
+    """The offset of the VAD structure"""
+    type_name: str
+    """The type of the VAD structure (_MMVAD_SHORT or _MMVAD)"""
+    start: Optional[int]
+    """The first accessible address of the range"""
+    end: Optional[int]
+    """The last accessible address of the range"""
+    protection: Optional[int]
+    """The protection value (an index into MmProtectToValue)"""
+    tag: Optional[str]
+    """The pool tag of the VAD structure"""
+    file_pointer: Optional[int]
+    """The offset of the _FILE_OBJECT mapped into the range (or 0 if there is none)"""
+    commit_charge: Optional[int]
+    """The number of committed pages"""
+
+
+class VadIndex:
+    """The VADs of a process, as records, with an interval index for
+    finding the VAD containing an address.
+
+    Indices are built once for each process (see
+    :meth:`EPROCESS.get_vad_index`) and shared by everything that walks the
+    process's VADs.  Only a weak reference to the context is held, since the
+    indices are cached against layers that the context itself holds.
+    """
+
+    def __init__(
+        self,
+        context: interfaces.context.ContextInterface,
+        layer_name: str,
+        native_layer_name: str,
+        records: List[VadRecord],
+    ) -> None:
+        self._context_ref = weakref.ref(context)
+        self._layer_name = layer_name
+        self._native_layer_name = native_layer_name
+        self.records = records
+        """The records of every VAD, in the order the tree was walked"""
+
+        # Ranges sorted by start, with the greatest end seen so far so that lookups
+        # can stop walking backwards once no earlier range could reach the address
+        ranges = sorted(
+            (record.start, record.end, position)
+            for position, record in enumerate(records)
+            if record.start is not None and record.end is not None
+        )
+        self._starts = [start for start, _, _ in ranges]
+        self._ends = [end for _, end, _ in ranges]
+        self._positions = [position for _, _, position in ranges]
+        self._max_ends = []
+        max_end = -1
+        for end in self._ends:
+            max_end = max(max_end, end)
+            self._max_ends.append(max_end)
+
+    def __iter__(self) -> Iterator[VadRecord]:
+        return iter(self.records)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @property
+    def _context(self) -> interfaces.context.ContextInterface:
+        context = self._context_ref()
+        if context is None:
+            raise ReferenceError("The context of the VAD index no longer exists")
+        return context
+
+    def find(self, address: int) -> Optional[VadRecord]:
+        """Returns the record of the VAD containing address (the one starting
+        closest below it, should VADs overlap), or None if no VAD contains
+        it."""
+        index = bisect.bisect_right(self._starts, address) - 1
+        while index >= 0 and self._max_ends[index] >= address:
+            if self._ends[index] >= address:
+                return self.records[self._positions[index]]
+            index -= 1
+        return None
+
+    def get_vad(self, record: VadRecord) -> "MMVAD_SHORT":
+        """Constructs the VAD object a record summarises."""
+        return self._context.object(
+            record.type_name,
+            layer_name=self._layer_name,
+            offset=record.offset,
+            native_layer_name=self._native_layer_name,
+        )
+
+    def get_vads(self) -> Iterator["MMVAD_SHORT"]:
+        """Constructs each VAD object, in the order the tree was walked."""
+        for record in self.records:
+            yield self.get_vad(record)
+
 
 class MMVAD(MMVAD_SHORT):
     """A version of the process virtual memory range structure that contains
@@ -366,6 +503,20 @@ class MMVAD(MMVAD_SHORT):
 
         return file_name
 
+    def get_file_pointer(self) -> int:
+        """Get the offset of the file object mapped into the memory range (or 0
+        if there is none)"""
+
+        with contextlib.suppress(exceptions.InvalidAddressException):
+            # this is for xp and 2003
+            if self.has_member("ControlArea"):
+                return int(self.ControlArea.FilePointer)
+
+            # this is for vista through windows 7
+            return self.Subsection.ControlArea.FilePointer.dereference().vol.offset
+
+        return 0
+
 
 class EX_FAST_REF(objects.StructType):
     """This is a standard Windows structure that stores a pointer to an object
@@ -859,6 +1010,29 @@ class EPROCESS(generic.GenericIntelProcess, pool.ExecutiveObject):
 
         return False
 
+    # The VAD indices of each process, by the type and offset of the process, for each layer
+    _vad_indices: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def get_vad_index(self) -> VadIndex:
+        """Returns the records of the process's VADs, with an index for
+        finding the VAD containing an address.
+
+        The tree is walked once per process, and the index is kept for as
+        long as the layer the process lives in.
+        """
+        layer = self._context.layers[self.vol.layer_name]
+        indices = self._vad_indices.setdefault(layer, {})
+        key = (self.vol.type_name, self.vol.offset)
+        if key not in indices:
+            vad_root = self.get_vad_root()
+            indices[key] = VadIndex(
+                self._context,
+                vad_root.vol.layer_name,
+                vad_root.vol.native_layer_name,
+                [vad.get_record() for vad in vad_root.traverse()],
+            )
+        return indices[key]
+
     def get_vad_root(self):
         # windows 8 and 2012 (_MM_AVL_TABLE)
         if self.VadRoot.has_member("BalancedRoot"):
@@ -938,7 +1112,7 @@ class LIST_ENTRY(objects.StructType, collections.abc.Iterable):
             if not is_valid:
                 return None
 
-            link = getattr(self, direction).dereference()
+            link = getattr(self, direction)
         except exceptions.InvalidAddressException:
             return None
 
@@ -950,9 +1124,18 @@ class LIST_ENTRY(objects.StructType, collections.abc.Iterable):
                 native_layer_name=layer or self.vol.native_layer_name,
             )
 
-        seen = {self.vol.offset}
-        while link.vol.offset not in seen:
-            obj_offset = link.vol.offset - relative_offset
+        # Walk the raw links first, and only construct the entries as they're requested
+        length, byteorder, _ = link.vol.data_format
+        link_offsets = self._context.layers.walk_pointers(
+            link.vol.native_layer_name,
+            int(link),
+            pointer_offset=self.vol.members[direction][0],
+            pointer_size=length,
+            byteorder=byteorder,
+            stop=[self.vol.offset],
+        )
+        for link_offset in link_offsets:
+            obj_offset = link_offset - relative_offset
 
             if not trans_layer.is_valid(obj_offset):
                 return None
@@ -965,13 +1148,6 @@ class LIST_ENTRY(objects.StructType, collections.abc.Iterable):
             )
             yield obj
 
-            seen.add(link.vol.offset)
-
-            try:
-                link = getattr(link, direction).dereference()
-            except exceptions.InvalidAddressException:
-                return None
-
     def __iter__(self) -> Iterator[interfaces.objects.ObjectInterface]:
         return self.to_list(self.vol.parent.vol.type_name, self.vol.member_name)
 
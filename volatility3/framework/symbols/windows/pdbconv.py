@@ -1,20 +1,42 @@
 # This file is Copyright 2019 Volatility Foundation and licensed under the Volatility Software License 1.0
 # which is available at https://www.volatilityfoundation.org/license/vsl-v1.0
 #
+import array
 import binascii
 import bz2
 import datetime
+import enum
 import gzip
+import io
 import json
 import logging
 import lzma
+import math
+import mmap
 import os
+import struct
 from bisect import bisect
-from typing import Tuple, Dict, Any, Optional, Union, List
+from typing import (
+    IO,
+    Any,
+    Collection,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 from urllib import request, error, parse
 
-from volatility3.framework import contexts, interfaces, constants
+from volatility3 import schemas
+from volatility3.framework import contexts, interfaces, constants, exceptions
 from volatility3.framework.layers import physical, msf, resources
+from volatility3.framework.symbols import compiled, validations
 
 vollog = logging.getLogger(__name__)
 
@@ -91,10 +113,377 @@ indirections = {
 }
 
 
-class ForwardArrayCount:
-    def __init__(self, size, element_type):
-        self.element_type = element_type
-        self.size = size
+class LeafType(enum.IntEnum):
+    """The kinds of CodeView type record that are read when converting a PDB
+    file (the full list is the LEAF_TYPE enumeration within pdb.json)"""
+
+    LF_MODIFIER = 0x1001
+    LF_POINTER = 0x1002
+    LF_ARRAY_ST = 0x1003
+    LF_CLASS_ST = 0x1004
+    LF_STRUCTURE_ST = 0x1005
+    LF_PROCEDURE = 0x1008
+    LF_ARGLIST = 0x1201
+    LF_FIELDLIST = 0x1203
+    LF_BITFIELD = 0x1205
+    LF_INDEX = 0x1404
+    LF_MEMBER_ST = 0x1405
+    LF_ST_MAX = 0x1500
+    LF_ENUMERATE = 0x1502
+    LF_ARRAY = 0x1503
+    LF_CLASS = 0x1504
+    LF_STRUCTURE = 0x1505
+    LF_UNION = 0x1506
+    LF_ENUM = 0x1507
+    LF_MEMBER = 0x150D
+    LF_STRIDED_ARRAY = 0x1516
+    LF_INTERFACE = 0x1519
+    LF_FUNC_ID = 0x1601
+    LF_STRING_ID = 0x1605
+    LF_CLASS_VS19 = 0x1608
+    LF_STRUCTURE_VS19 = 0x1609
+    LF_CHAR = 0x8000
+    LF_SHORT = 0x8001
+    LF_USHORT = 0x8002
+    LF_LONG = 0x8003
+    LF_ULONG = 0x8004
+
+
+STRUCTURE_LEAVES = {
+    LeafType.LF_CLASS,
+    LeafType.LF_CLASS_ST,
+    LeafType.LF_STRUCTURE,
+    LeafType.LF_STRUCTURE_ST,
+    LeafType.LF_INTERFACE,
+}
+STRUCTURE_VS19_LEAVES = {LeafType.LF_CLASS_VS19, LeafType.LF_STRUCTURE_VS19}
+ARRAY_LEAVES = {LeafType.LF_ARRAY, LeafType.LF_ARRAY_ST, LeafType.LF_STRIDED_ARRAY}
+NAMED_LEAVES = (
+    STRUCTURE_LEAVES
+    | STRUCTURE_VS19_LEAVES
+    | ARRAY_LEAVES
+    | {LeafType.LF_UNION, LeafType.LF_ENUM}
+)
+"""Type records whose names can be referred to by other type records"""
+
+NUMERIC_LEAVES = {
+    LeafType.LF_CHAR: struct.Struct("<b"),
+    LeafType.LF_SHORT: struct.Struct("<h"),
+    LeafType.LF_USHORT: struct.Struct("<H"),
+    LeafType.LF_LONG: struct.Struct("<i"),
+    LeafType.LF_ULONG: struct.Struct("<I"),
+}
+"""Formats of the values that follow a numeric leaf, when the value does not fit in the leaf itself"""
+
+FORWARD_REFERENCE = 0x80
+"""The property flag marking a user type record as a forward reference"""
+
+
+class UserType(NamedTuple):
+    forward_reference: bool
+    fields: int
+    size: int
+
+
+class EnumType(NamedTuple):
+    forward_reference: bool
+    subtype_index: int
+    fields: int
+
+
+class ArrayType(NamedTuple):
+    element_type: int
+    size: int
+
+
+class ModifierType(NamedTuple):
+    subtype_index: int
+
+
+class PointerType(NamedTuple):
+    subtype_index: int
+    pointer_type: int
+    size: int
+
+
+class BitfieldType(NamedTuple):
+    underlying_type: int
+    length: int
+    position: int
+
+
+class Member(NamedTuple):
+    field_type: int
+    offset: int
+
+
+class Enumerate(NamedTuple):
+    value: int
+
+
+class DbiHeader(NamedTuple):
+    age: int
+    symrec_stream: int
+    machine: int
+
+
+TypeRecord = Tuple[int, Optional[str], Any]
+
+
+class MultiStreamFile:
+    """Reads the streams of a MultiStream Format (MSF) file, such as a PDB
+    file, from the (usually memory mapped) contents of the file.
+
+    Only the pages of the streams that are requested are read, and each
+    stream is returned as a single contiguous block of bytes.
+    """
+
+    _headers = [
+        # Magic, offset of the page size, offset of the stream directory size, size of the header
+        (b"Microsoft C/C++ program database 2.00\r\n\x1a\x4a\x47", 44, 52, 60),
+        (b"Microsoft C/C++ MSF 7.00\r\n\x1a\x44\x53", 32, 44, 52),
+    ]
+
+    def __init__(self, name: str, data: Union[bytes, mmap.mmap]) -> None:
+        self._data = data
+        for magic, page_size_offset, directory_offset, header_size in self._headers:
+            if data[: len(magic)] == magic:
+                (self._page_size,) = struct.unpack_from("<l", data, page_size_offset)
+                if 0x100 <= self._page_size <= 128 * 0x10000:
+                    break
+        else:
+            raise msf.PDBFormatException(name, "Could not find a suitable header")
+
+        (directory_size,) = struct.unpack_from("<l", data, directory_offset)
+        directory_pages = math.ceil(directory_size / self._page_size)
+        index_pages = math.ceil(directory_pages * 4 / self._page_size)
+        # The header lists the pages holding the list of the stream directory's pages
+        index = struct.unpack_from(f"<{index_pages}I", data, header_size)
+        pages = struct.unpack_from(
+            f"<{directory_pages}I", self._read_pages(index, directory_pages * 4)
+        )
+        directory = self._read_pages(pages, directory_size)
+
+        (stream_count,) = struct.unpack_from("<I", directory, 0)
+        self._streams: List[Optional[Tuple[int, Tuple[int, ...]]]] = []
+        offset = (stream_count + 1) * 4
+        for size in struct.unpack_from(f"<{stream_count}I", directory, 4):
+            page_count = math.ceil(size / self._page_size)
+            if page_count == 0 or size == 0xFFFFFFFF:
+                self._streams.append(None)
+            else:
+                pages = struct.unpack_from(f"<{page_count}I", directory, offset)
+                offset += page_count * 4
+                self._streams.append((size, pages))
+
+    def _read_pages(self, pages: Sequence[int], size: int) -> bytes:
+        page_size = self._page_size
+        if all(second - first == 1 for first, second in zip(pages, pages[1:])):
+            # Contiguous pages (common for larger streams) can be read in one go
+            start = pages[0] * page_size if pages else 0
+            return self._data[start : start + size]
+        return b"".join(
+            self._data[page * page_size : (page + 1) * page_size] for page in pages
+        )[:size]
+
+    def __len__(self) -> int:
+        return len(self._streams)
+
+    def stream(self, index: int) -> Optional[bytes]:
+        """Returns the contents of a stream, or None if the stream is not present"""
+        if not 0 <= index < len(self._streams) or self._streams[index] is None:
+            return None
+        size, pages = self._streams[index]
+        return self._read_pages(pages, size)
+
+
+class TypeStream:
+    """The records of a type (TPI) or item (IPI) stream.
+
+    Only the position and kind of each record is read up front, each record
+    is decoded the first time it is used.  Records are referred to by their
+    position within the stream (their type index less 0x1000).
+    """
+
+    _unnamed_tags = {
+        "<unnamed-tag>": "unnamed",
+        "__unnamed": "unnamed",
+        "<anonymous-tag>": "anonymous",
+        "__anonymous": "anonymous",
+    }
+
+    def __init__(
+        self,
+        data: bytes,
+        stream_name: str,
+        progress_callback: constants.ProgressCallback = None,
+    ) -> None:
+        _, header_size, index_min, index_max = struct.unpack_from("<4I", data, 0)
+        # Check the header
+        if not (56 <= header_size < 1024):
+            raise ValueError(f"{stream_name} Stream Header size outside normal bounds")
+        if index_min < 4096:
+            raise ValueError(f"Minimum {stream_name} index is 4096, found: {index_min}")
+        if index_max < index_min:
+            raise ValueError(
+                "Maximum {} index is smaller than minimum TPI index, found: {} < {} ".format(
+                    stream_name, index_max, index_min
+                )
+            )
+
+        self._data = data
+        self._records: Dict[int, TypeRecord] = {}
+        # The offset of each record's leaf type, and the leaf type itself
+        self._offsets = array.array("L")
+        self._leaf_types = array.array("H")
+        offset = header_size
+        maximum_address = len(data)
+        while offset + 4 <= maximum_address:
+            if progress_callback and not len(self._offsets) & 0x3FFF:
+                progress_callback(
+                    offset * 100 / maximum_address, f"Reading {stream_name} layer"
+                )
+            length, leaf_type = struct.unpack_from("<HH", data, offset)
+            self._offsets.append(offset + 2)
+            self._leaf_types.append(leaf_type)
+            offset += length + 2
+        if maximum_address - offset != 0:
+            raise ValueError(
+                f"Type values did not fill the {stream_name} stream correctly"
+            )
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def leaf_type(self, position: int) -> int:
+        return self._leaf_types[position]
+
+    def __getitem__(self, position: int) -> TypeRecord:
+        """Returns the (leaf_type, name, value) of the record at a position"""
+        record = self._records.get(position, None)
+        if record is None:
+            if position < 0:
+                raise IndexError(position)
+            offset = self._offsets[position]
+            (length,) = struct.unpack_from("<H", self._data, offset - 2)
+            record = self._decode(
+                self._leaf_types[position], offset + 2, offset + length
+            )
+            leaf_type, name, value = record
+            tag_type = self._unnamed_tags.get(name, None)
+            if tag_type:
+                record = leaf_type, f"__{tag_type}_{position + 0x1000:x}", value
+            # Field lists are only used once, so need not be kept
+            if leaf_type != LeafType.LF_FIELDLIST:
+                self._records[position] = record
+        return record
+
+    def _decode(self, leaf_type: int, offset: int, end: int) -> TypeRecord:
+        """Decodes the body of a record, found between offset and end"""
+        data = self._data
+        pascal = leaf_type < LeafType.LF_ST_MAX
+        name: Optional[str] = None
+        value: Any = None
+        if leaf_type in STRUCTURE_LEAVES:
+            properties, fields = struct.unpack_from("<2xHI", data, offset)
+            size, name, _ = self._read_value(offset + 16, end, pascal)
+            value = UserType(bool(properties & FORWARD_REFERENCE), fields, size)
+        elif leaf_type in STRUCTURE_VS19_LEAVES:
+            properties, fields = struct.unpack_from("<H2xI", data, offset)
+            size, name, _ = self._read_value(offset + 18, end, pascal)
+            value = UserType(bool(properties & FORWARD_REFERENCE), fields, size)
+        elif leaf_type == LeafType.LF_UNION:
+            # The size of a union is not read as a numeric leaf
+            properties, fields, size = struct.unpack_from("<2xHIH", data, offset)
+            name, _ = self._read_name(offset + 10, end, pascal)
+            value = UserType(bool(properties & FORWARD_REFERENCE), fields, size)
+        elif leaf_type == LeafType.LF_ENUM:
+            properties, subtype_index, fields = struct.unpack_from(
+                "<2xHII", data, offset
+            )
+            name, _ = self._read_name(offset + 12, end, pascal)
+            value = EnumType(
+                bool(properties & FORWARD_REFERENCE), subtype_index, fields
+            )
+        elif leaf_type in ARRAY_LEAVES:
+            (element_type,) = struct.unpack_from("<I", data, offset)
+            size, name, _ = self._read_value(offset + 8, end, pascal)
+            value = ArrayType(element_type, size)
+        elif leaf_type == LeafType.LF_MODIFIER:
+            value = ModifierType(*struct.unpack_from("<I", data, offset))
+        elif leaf_type == LeafType.LF_POINTER:
+            subtype_index, attributes = struct.unpack_from("<II", data, offset)
+            value = PointerType(
+                subtype_index, attributes & 0x1F, (attributes >> 13) & 0x3F
+            )
+        elif leaf_type == LeafType.LF_BITFIELD:
+            value = BitfieldType(*struct.unpack_from("<IBB", data, offset))
+        elif leaf_type == LeafType.LF_FIELDLIST:
+            value = self._decode_fields(offset, end)
+        elif leaf_type == LeafType.LF_STRING_ID:
+            name, _ = self._read_name(offset + 4, end, pascal)
+        elif leaf_type == LeafType.LF_FUNC_ID:
+            name, _ = self._read_name(offset + 8, end, pascal)
+        return leaf_type, name, value
+
+    def _decode_fields(self, offset: int, end: int) -> List[TypeRecord]:
+        """Decodes the members of a field list"""
+        data = self._data
+        fields: List[TypeRecord] = []
+        while offset < end:
+            (leaf_type,) = struct.unpack_from("<H", data, offset)
+            pascal = leaf_type < LeafType.LF_ST_MAX
+            if leaf_type in [LeafType.LF_MEMBER, LeafType.LF_MEMBER_ST]:
+                (field_type,) = struct.unpack_from("<I", data, offset + 4)
+                member_offset, name, offset = self._read_value(offset + 8, end, pascal)
+                fields.append((leaf_type, name, Member(field_type, member_offset)))
+            elif leaf_type == LeafType.LF_ENUMERATE:
+                enum_value, name, offset = self._read_value(offset + 4, end, pascal)
+                fields.append((leaf_type, name, Enumerate(enum_value)))
+            elif leaf_type == LeafType.LF_INDEX:
+                # Long field lists continue in another record
+                (continuation,) = struct.unpack_from("<I", data, offset + 4)
+                fields.extend(self[continuation - 0x1000][2])
+                offset += 8
+            else:
+                raise TypeError(f"Unhandled leaf_type: {leaf_type:#x}")
+            # Skip any padding between fields
+            if offset < end and data[offset] & 0xF0 == 0xF0:
+                offset += data[offset] & 0x0F
+        return fields
+
+    def _read_value(self, offset: int, end: int, pascal: bool) -> Tuple[int, str, int]:
+        """Reads a numeric leaf and the name that follows it, returning the
+        value, the name and the offset after the name."""
+        (value,) = struct.unpack_from("<H", self._data, offset)
+        offset += 2
+        if value >= LeafType.LF_CHAR:
+            value_format = NUMERIC_LEAVES.get(value, None)
+            if value_format is None:
+                raise TypeError("Unexpected extended value type")
+            (value,) = value_format.unpack_from(self._data, offset)
+            offset += value_format.size
+        name, offset = self._read_name(offset, end, pascal)
+        return value, name, offset
+
+    def _read_name(self, offset: int, end: int, pascal: bool) -> Tuple[str, int]:
+        """Reads either a pascal string or a c-string, returning the string
+        and the offset after it."""
+        start = offset
+        if pascal:
+            start += 1
+            end = start + self._data[offset]
+        terminator = self._data.find(b"\x00", start, end)
+        name = self._data[start : end if terminator < 0 else terminator]
+        return name.decode("latin-1"), offset + len(name) + 1
+
+    def names(self, leaf_types: Collection[int]) -> Iterator[Tuple[int, str]]:
+        """Yields the position and name of each named record of the given leaf types"""
+        for position, leaf_type in enumerate(self._leaf_types):
+            if leaf_type in leaf_types:
+                name = self[position][1]
+                if name:
+                    yield position, name
 
 
 class PdbReader:
@@ -109,13 +498,12 @@ class PdbReader:
     https://github.com/Microsoft/microsoft-pdb/
 
     In order to generate ISF files, we need the type stream (2), and the symbols stream (variable).
-    The MultiStream Format wrapper is handled as a volatility layer, which constructs sublayers for each stream.
-    The streams can then be read contiguously allowing the data to be accessed.
+    The file is memory mapped (where possible) and the MultiStream Format wrapper is read directly,
+    copying out only the streams that are needed.
 
-    Volatility's type system is strong when everything must be laid out in advance, but PDB data is reasonably dynamic,
-    particularly when it comes to names.  We must therefore parse it after we've collected other information already.
-    This is in comparison to something such as Construct/pdbparse which can use just-parsed data to determine dynamically
-    sized data following.
+    Type records are indexed when the type stream is read, but are only decoded once they are
+    reached from the types being converted (every named user type and enumeration, unless
+    particular types are requested), so records that are not needed are never decoded.
     """
 
     def __init__(
@@ -124,25 +512,26 @@ class PdbReader:
         location: str,
         database_name: Optional[str] = None,
         progress_callback: constants.ProgressCallback = None,
+        type_names: Optional[Iterable[str]] = None,
     ) -> None:
-        self._layer_name, self._context = self.load_pdb_layer(context, location)
-        self._dbiheader: Optional[interfaces.objects.ObjectInterface] = None
+        self._context = context
+        self._location = location
+        self._layer_name: Optional[str] = None
+        self._file = MultiStreamFile(location, self._map_file(location))
+        self._dbiheader: Optional[DbiHeader] = None
         if not progress_callback:
             progress_callback = lambda x, y: None
         self._progress_callback = progress_callback
-        self.types: List[
-            Tuple[
-                interfaces.objects.ObjectInterface,
-                Optional[str],
-                interfaces.objects.ObjectInterface,
-            ]
-        ] = []
+        self._type_names = set(type_names) if type_names is not None else None
+        self.types: Optional[TypeStream] = None
         self.bases: Dict[str, Any] = {}
         self.user_types: Dict[str, Any] = {}
         self.enumerations: Dict[str, Any] = {}
         self.symbols: Dict[str, Any] = {}
+        self._type_references: Dict[str, int] = {}
+        self._required_types: Optional[List[Tuple[str, str]]] = None
         self._omap_mapping: List[Tuple[int, int]] = []
-        self._sections: List[interfaces.objects.ObjectInterface] = []
+        self._sections: List[int] = []
         self.metadata = {"format": "6.1.0", "windows": {}}
         self._database_name = database_name
 
@@ -152,6 +541,12 @@ class PdbReader:
 
     @property
     def pdb_layer_name(self):
+        """The name of a layer presenting the PDB file within the context,
+        which is only constructed when first requested"""
+        if self._layer_name is None:
+            self._layer_name, self._context = self.load_pdb_layer(
+                self._context, self._location
+            )
         return self._layer_name
 
     @classmethod
@@ -197,11 +592,29 @@ class PdbReader:
 
         return msf_layer_name, new_context
 
+    @staticmethod
+    def _map_file(location: str) -> Union[bytes, mmap.mmap]:
+        """Memory maps the file at location, or reads it into memory if it
+        cannot be mapped (such as when it is compressed)"""
+        with resources.ResourceAccessor().open(location) as fp:
+            # Local files are returned wrapped in a response object
+            raw_file = getattr(fp, "fp", fp)
+            if isinstance(raw_file, io.BufferedReader):
+                try:
+                    return mmap.mmap(raw_file.fileno(), 0, access=mmap.ACCESS_READ)
+                except (OSError, ValueError) as excp:
+                    vollog.debug(f"Unable to memory map {location}: {excp}")
+            if fp.seekable():
+                fp.seek(0)
+            return fp.read()
+
     def reset(self):
+        self.types = None
         self.bases = {}
         self.user_types = {}
         self.enumerations = {}
         self.symbols = {}
+        self._type_references = {}
         self._sections = []
         self._omap_mapping = []
 
@@ -215,170 +628,94 @@ class PdbReader:
         if not self.symbols:
             self.read_symbol_stream()
 
+    def _read_stream(self, stream_number: int, stream_name: str) -> bytes:
+        data = self._file.stream(stream_number)
+        if data is None:
+            raise ValueError(f"No {stream_name} stream available")
+        return data
+
     def read_tpi_stream(self) -> None:
         """Reads the TPI type steam."""
-        self.types = []
-
-        type_references = self._read_info_stream(2, "TPI", self.types)
-
-        self.process_types(type_references)
+        vollog.debug("Reading TPI")
+        self.types = TypeStream(
+            self._read_stream(2, "TPI"), "TPI", self._progress_callback
+        )
+        self.process_types()
 
     def read_ipi_stream(self):
-        """"""
+        """Reads the IPI stream, to find the name of the database"""
         if not self._dbiheader:
             self.read_dbi_stream()
 
         vollog.debug("Reading IPI layer")
 
-        ipi_list = []
-
         try:
-            type_references = self._read_info_stream(4, "IPI", ipi_list)
-            for name in type_references.keys():
-                # This doesn't break, because we want to use the last string/pdbname in the list
-                if name.endswith(".pdb"):
-                    self._database_name = name.split("\\")[-1]
+            items = TypeStream(self._read_stream(4, "IPI"), "IPI")
         except ValueError:
             return None
-
-    def _read_info_stream(self, stream_number, stream_name, info_list):
-        vollog.debug(f"Reading {stream_name}")
-        info_layer = self._context.layers.get(
-            self._layer_name + "_stream" + str(stream_number), None
+        names = dict.fromkeys(
+            name
+            for _, name in items.names([LeafType.LF_STRING_ID, LeafType.LF_FUNC_ID])
         )
-        if not info_layer:
-            raise ValueError(f"No {stream_name} stream available")
-        module = self._context.module(
-            module_name=info_layer.pdb_symbol_table,
-            layer_name=info_layer.name,
-            offset=0,
-        )
-        header = module.object(object_type="TPI_HEADER", offset=0)
-        # Check the header
-        if not (56 <= header.header_size < 1024):
-            raise ValueError(f"{stream_name} Stream Header size outside normal bounds")
-        if header.index_min < 4096:
-            raise ValueError(
-                f"Minimum {stream_name} index is 4096, found: {header.index_min}"
-            )
-        if header.index_max < header.index_min:
-            raise ValueError(
-                "Maximum {} index is smaller than minimum TPI index, found: {} < {} ".format(
-                    stream_name, header.index_max, header.index_min
-                )
-            )
-        # Reset the state
-        info_references: Dict[str, int] = {}
-        offset = header.header_size
-        # Ensure we use the same type everywhere
-        length_type = "unsigned short"
-        length_len = module.get_type(length_type).size
-        info_index = 1
-        while info_layer.maximum_address - offset > 0:
-            self._progress_callback(
-                offset * 100 / info_layer.maximum_address, "Reading TPI layer"
-            )
-            length = module.object(object_type=length_type, offset=offset)
-            if not isinstance(length, int):
-                raise TypeError("Non-integer length provided")
-            offset += length_len
-            output, consumed = self.consume_type(module, offset, length)
-            leaf_type, name, value = output
-            for tag_type in ["unnamed", "anonymous"]:
-                if name == f"<{tag_type}-tag>" or name == f"__{tag_type}":
-                    name = f"__{tag_type}_" + hex(len(info_list) + 0x1000)[2:]
-            if name:
-                info_references[name] = len(info_list)
-            info_list.append((leaf_type, name, value))
-            offset += length
-            info_index += 1
-            # Since types can only refer to earlier types, assigning the name at this point is fine
-        if info_layer.maximum_address - offset != 0:
-            raise ValueError("Type values did not fill the TPI stream correctly")
-        return info_references
+        for name in names:
+            # This doesn't break, because we want to use the last string/pdbname in the list
+            if name.endswith(".pdb"):
+                self._database_name = name.split("\\")[-1]
 
     def read_dbi_stream(self) -> None:
         """Reads the DBI Stream."""
         vollog.debug("Reading DBI stream")
-        dbi_layer = self._context.layers.get(self._layer_name + "_stream3", None)
-        if not dbi_layer:
-            raise ValueError("No DBI stream available")
-        module = self._context.module(
-            module_name=dbi_layer.pdb_symbol_table, layer_name=dbi_layer.name, offset=0
-        )
-        self._dbiheader = module.object(object_type="DBI_HEADER", offset=0)
-
-        if not self._dbiheader:
+        data = self._read_stream(3, "DBI")
+        if len(data) < 64:
             raise ValueError("DBI Header could not be read")
+        age, symrec_stream, machine = struct.unpack_from("<8xI8xH36xH", data, 0)
+        self._dbiheader = DbiHeader(age, symrec_stream, machine)
 
         # Skip past sections we don't care about to get to the DBG header
+        module_size, seccon_size, secmap_size, filinf_size, tsmap_size = (
+            struct.unpack_from("<5I", data, 24)
+        )
+        (ecinfo_size,) = struct.unpack_from("<I", data, 52)
         dbg_hdr_offset = (
-            self._dbiheader.vol.size
-            + self._dbiheader.module_size
-            + self._dbiheader.secconSize
-            + self._dbiheader.secmapSize
-            + self._dbiheader.filinfSize
-            + self._dbiheader.tsmapSize
-            + self._dbiheader.ecinfoSize
+            64
+            + module_size
+            + seccon_size
+            + secmap_size
+            + filinf_size
+            + tsmap_size
+            + ecinfo_size
         )
-        self._dbidbgheader = module.object(
-            object_type="DBI_DBG_HEADER", offset=dbg_hdr_offset
+        # The DBI_DBG_HEADER holds the numbers of the streams of debugging data
+        dbg_header = struct.unpack_from("<11h", data, dbg_hdr_offset)
+        omap_from_src, section_hdr, section_hdr_orig = (
+            dbg_header[4],
+            dbg_header[5],
+            dbg_header[10],
         )
 
         self._sections = []
         self._omap_mapping = []
 
-        if self._dbidbgheader.snSectionHdrOrig != -1:
-            section_orig_layer_name = (
-                self._layer_name + "_stream" + str(self._dbidbgheader.snSectionHdrOrig)
-            )
-            consumed, length = (
-                0,
-                self.context.layers[section_orig_layer_name].maximum_address,
-            )
-            while consumed < length:
-                section = self.context.object(
-                    dbi_layer.pdb_symbol_table
-                    + constants.BANG
-                    + "IMAGE_SECTION_HEADER",
-                    offset=consumed,
-                    layer_name=section_orig_layer_name,
-                )
-                self._sections.append(section)
-                consumed += section.vol.size
-
-            if self._dbidbgheader.snOmapFromSrc != -1:
-                omap_layer_name = (
-                    self._layer_name + "_stream" + str(self._dbidbgheader.snOmapFromSrc)
+        if section_hdr_orig != -1:
+            self._sections = self._read_sections(section_hdr_orig)
+            if omap_from_src != -1:
+                # Each omap record is a source and target address
+                self._omap_mapping = list(
+                    struct.iter_unpack("<II", self._read_stream(omap_from_src, "OMAP"))
                 )
-                length = self.context.layers[omap_layer_name].maximum_address
-                data = self.context.layers[omap_layer_name].read(0, length)
-                # For speed we don't use the framework to read this (usually sizeable) data
-                for i in range(0, length, 8):
-                    self._omap_mapping.append(
-                        (
-                            int.from_bytes(data[i : i + 4], byteorder="little"),
-                            int.from_bytes(data[i + 4 : i + 8], byteorder="little"),
-                        )
-                    )
-        elif self._dbidbgheader.snSectionHdr != -1:
-            section_layer_name = (
-                self._layer_name + "_stream" + str(self._dbidbgheader.snSectionHdr)
-            )
-            consumed, length = (
-                0,
-                self.context.layers[section_layer_name].maximum_address,
+        elif section_hdr != -1:
+            self._sections = self._read_sections(section_hdr)
+
+    def _read_sections(self, stream_number: int) -> List[int]:
+        """Returns the virtual address of each section header within a stream"""
+        data = self._file.stream(stream_number) or b""
+        # The virtual address is the fourth field of each IMAGE_SECTION_HEADER
+        return [
+            virtual_address
+            for _, virtual_address, _ in struct.iter_unpack(
+                "<12sI24s", data[: len(data) - len(data) % 40]
             )
-            while consumed < length:
-                section = self.context.object(
-                    dbi_layer.pdb_symbol_table
-                    + constants.BANG
-                    + "IMAGE_SECTION_HEADER",
-                    offset=consumed,
-                    layer_name=section_layer_name,
-                )
-                self._sections.append(section)
-                consumed += section.vol.size
+        ]
 
     def read_symbol_stream(self):
         """Reads in the symbol stream."""
@@ -389,55 +726,50 @@ class PdbReader:
 
         vollog.debug("Reading Symbols")
 
-        symrec_layer = self._context.layers.get(
-            self._layer_name + "_stream" + str(self._dbiheader.symrecStream), None
-        )
-        if not symrec_layer:
+        data = self._file.stream(self._dbiheader.symrec_stream)
+        if data is None:
             raise ValueError("No SymRec stream available")
-        module = self._context.module(
-            module_name=symrec_layer.pdb_symbol_table,
-            layer_name=symrec_layer.name,
-            offset=0,
-        )
 
         offset = 0
-        max_address = symrec_layer.maximum_address
+        max_address = len(data)
+        count = 0
 
-        while offset < max_address:
-            self._progress_callback(offset * 100 / max_address, "Reading Symbol layer")
-            sym = module.object(object_type="GLOBAL_SYMBOL", offset=offset)
-            leaf_type = module.object(
-                object_type="unsigned short", offset=sym.leaf_type.vol.offset
+        while offset + 14 <= max_address:
+            if not count & 0x3FFF:
+                self._progress_callback(
+                    offset * 100 / max_address, "Reading Symbol layer"
+                )
+            count += 1
+            length, leaf_type, _, sym_offset, segment = struct.unpack_from(
+                "<HHIIH", data, offset
             )
             name = None
             address = None
-            if sym.segment < len(self._sections):
+            # Segments are numbered from one, so the last section is included
+            if segment <= len(self._sections) and self._sections:
+                end = offset + length + 2
                 if leaf_type == 0x1009:
                     # v2 symbol (pascal-string)
-                    name = self.parse_string(
-                        sym.name, True, sym.length - sym.vol.size + 2
-                    )
-                    address = (
-                        self._sections[sym.segment - 1].VirtualAddress + sym.offset
-                    )
+                    name = data[offset + 15 : offset + 15 + data[offset + 14]]
                 elif leaf_type == 0x110E or leaf_type == 0x1127:
                     # v3 symbol (c-string)
-                    name = self.parse_string(
-                        sym.name, False, sym.length - sym.vol.size + 2
-                    )
-                    address = (
-                        self._sections[sym.segment - 1].VirtualAddress + sym.offset
-                    )
+                    name = data[offset + 14 : end]
                 else:
                     vollog.debug(f"Only v2 and v3 symbols are supported: {leaf_type:x}")
+                if name is not None:
+                    terminator = name.find(b"\x00")
+                    if terminator >= 0:
+                        name = name[:terminator]
+                    name = name.decode("latin-1")
+                    address = self._sections[segment - 1] + sym_offset
             if name:
                 if self._omap_mapping:
                     address = self.omap_lookup(address)
                 stripped_name = self.name_strip(name)
                 self.symbols[stripped_name] = {"address": address}
-                if name != self.name_strip(name):
+                if name != stripped_name:
                     self.symbols[stripped_name]["linkage_name"] = name
-            offset += sym.length + 2  # Add on length itself
+            offset += length + 2  # Add on length itself
 
     def read_pdb_info_stream(self):
         """Reads in the pdb information stream."""
@@ -447,18 +779,12 @@ class PdbReader:
             self.read_ipi_stream()
 
         vollog.debug("Reading PDB Info")
-        pdb_info_layer = self._context.layers.get(self._layer_name + "_stream1", None)
-        if not pdb_info_layer:
+        data = self._file.stream(1)
+        if data is None:
             raise ValueError("No PDB Info Stream available")
-        module = self._context.module(
-            module_name=pdb_info_layer.pdb_symbol_table,
-            layer_name=pdb_info_layer.name,
-            offset=0,
-        )
-        pdb_info = module.object(object_type="PDB_INFORMATION", offset=0)
 
         self.metadata["windows"]["pdb"] = {
-            "GUID": self.convert_bytes_to_guid(pdb_info.GUID),
+            "GUID": self.convert_bytes_to_guid(data[12:28]),
             "age": self._dbiheader.age,
             "database": self._database_name or "unknown.pdb",
             "machine_type": self._dbiheader.machine,
@@ -547,26 +873,22 @@ class PdbReader:
         else:
             leaf_type, name, value = self.types[index - 0x1000]
             result = {"kind": "struct", "name": name}
-            if leaf_type in [leaf_type.LF_MODIFIER]:
+            if leaf_type == LeafType.LF_MODIFIER:
                 result = self.get_type_from_index(value.subtype_index)
-            elif leaf_type in [
-                leaf_type.LF_ARRAY,
-                leaf_type.LF_ARRAY_ST,
-                leaf_type.LF_STRIDED_ARRAY,
-            ]:
+            elif leaf_type in ARRAY_LEAVES:
                 result = {
-                    "count": ForwardArrayCount(value.size, value.element_type),
+                    "count": self._array_count(value.size, value.element_type),
                     "kind": "array",
                     "subtype": self.get_type_from_index(value.element_type),
                 }
-            elif leaf_type in [leaf_type.LF_BITFIELD]:
+            elif leaf_type == LeafType.LF_BITFIELD:
                 result = {
                     "kind": "bitfield",
                     "type": self.get_type_from_index(value.underlying_type),
                     "bit_length": value.length,
                     "bit_position": value.position,
                 }
-            elif leaf_type in [leaf_type.LF_POINTER]:
+            elif leaf_type == LeafType.LF_POINTER:
                 # Since we use the base['pointer'] to set the size for pointers, update it and check we don't get conflicts
                 size = self.get_size_from_index(index)
                 if self.bases.get("pointer", None) is None:
@@ -583,16 +905,22 @@ class PdbReader:
                     "kind": "pointer",
                     "subtype": self.get_type_from_index(value.subtype_index),
                 }
-            elif leaf_type in [leaf_type.LF_PROCEDURE]:
+            elif leaf_type == LeafType.LF_PROCEDURE:
                 return {"kind": "function"}
-            elif leaf_type in [leaf_type.LF_UNION]:
+            elif leaf_type == LeafType.LF_UNION:
                 result = {"kind": "union", "name": name}
-            elif leaf_type in [leaf_type.LF_ENUM]:
+            elif leaf_type == LeafType.LF_ENUM:
                 result = {"kind": "enum", "name": name}
-            elif leaf_type in [leaf_type.LF_FIELDLIST]:
+            elif leaf_type == LeafType.LF_FIELDLIST:
                 result = value
             elif not name:
                 raise ValueError("No name for structure that should be named")
+            if self._required_types is not None and isinstance(result, dict):
+                # Note the user types this type depends upon, so they can be included too
+                if result["kind"] in ["struct", "union"]:
+                    self._required_types.append(("user_types", result["name"]))
+                elif result["kind"] == "enum":
+                    self._required_types.append(("enums", result["name"]))
             return result
 
     def get_size_from_index(self, index: int) -> int:
@@ -608,35 +936,19 @@ class PdbReader:
             result = base["size"]
         else:
             leaf_type, name, value = self.types[index - 0x1000]
-            if leaf_type in [
-                leaf_type.LF_UNION,
-                leaf_type.LF_CLASS,
-                leaf_type.LF_CLASS_ST,
-                leaf_type.LF_STRUCTURE,
-                leaf_type.LF_STRUCTURE_ST,
-                leaf_type.LF_INTERFACE,
-                leaf_type.LF_CLASS_VS19,
-                leaf_type.LF_STRUCTURE_VS19,
-            ]:
-                if not value.properties.forward_reference:
+            if leaf_type in STRUCTURE_LEAVES or leaf_type in STRUCTURE_VS19_LEAVES:
+                if not value.forward_reference:
                     result = value.size
-            elif leaf_type in [
-                leaf_type.LF_ARRAY,
-                leaf_type.LF_ARRAY_ST,
-                leaf_type.LF_STRIDED_ARRAY,
-            ]:
+            elif leaf_type == LeafType.LF_UNION:
+                if not value.forward_reference:
+                    result = value.size
+            elif leaf_type in ARRAY_LEAVES:
                 result = value.size
-            elif leaf_type in [
-                leaf_type.LF_MODIFIER,
-                leaf_type.LF_ENUM,
-                leaf_type.LF_ARGLIST,
-            ]:
+            elif leaf_type in [LeafType.LF_MODIFIER, LeafType.LF_ENUM]:
                 result = self.get_size_from_index(value.subtype_index)
-            elif leaf_type in [leaf_type.LF_MEMBER]:
-                result = self.get_size_from_index(value.field_type)
-            elif leaf_type in [leaf_type.LF_BITFIELD]:
+            elif leaf_type == LeafType.LF_BITFIELD:
                 result = self.get_size_from_index(value.underlying_type)
-            elif leaf_type in [leaf_type.LF_POINTER]:
+            elif leaf_type == LeafType.LF_POINTER:
                 result = value.size
                 if not result:
                     if value.pointer_type == 0x0A:
@@ -645,11 +957,11 @@ class PdbReader:
                         return 8
                     else:
                         raise ValueError("Pointer size could not be determined")
-            elif leaf_type in [leaf_type.LF_PROCEDURE]:
+            elif leaf_type == LeafType.LF_PROCEDURE:
                 raise ValueError("LF_PROCEDURE size could not be identified")
             else:
                 raise ValueError(
-                    f"Unable to determine size of leaf_type {leaf_type.lookup()}"
+                    f"Unable to determine size of leaf_type {leaf_type:#x}"
                 )
         if result <= 0:
             raise ValueError(f"Invalid size identified: {index} ({name})")
@@ -657,182 +969,86 @@ class PdbReader:
 
     ### TYPE HANDLING CODE
 
-    def process_types(self, type_references: Dict[str, int]) -> None:
-        """Reads the TPI and symbol streams to populate the reader's
-        variables."""
+    def process_types(self) -> None:
+        """Converts the user types and enumerations (either all of them, or
+        those requested and the types they depend upon) from the type
+        stream."""
 
         self.bases = {}
         self.user_types = {}
         self.enumerations = {}
 
-        max_len = len(self.types)
-        for index in range(max_len):
-            self._progress_callback(index * 100 / max_len, "Processing types")
-            leaf_type, name, value = self.types[index]
-            if leaf_type in [
-                leaf_type.LF_CLASS,
-                leaf_type.LF_CLASS_ST,
-                leaf_type.LF_STRUCTURE,
-                leaf_type.LF_STRUCTURE_ST,
-                leaf_type.LF_INTERFACE,
-                leaf_type.LF_CLASS_VS19,
-                leaf_type.LF_STRUCTURE_VS19,
-            ]:
-                if not value.properties.forward_reference and name:
-                    self.user_types[name] = {
-                        "kind": "struct",
-                        "size": value.size,
-                        "fields": self.convert_fields(value.fields - 0x1000),
-                    }
-            elif leaf_type in [leaf_type.LF_UNION]:
-                if not value.properties.forward_reference and name:
-                    # Deal with UNION types
-                    self.user_types[name] = {
-                        "kind": "union",
-                        "size": value.size,
-                        "fields": self.convert_fields(value.fields - 0x1000),
-                    }
-            elif leaf_type in [leaf_type.LF_ENUM]:
-                if not value.properties.forward_reference and name:
-                    base = self.get_type_from_index(value.subtype_index)
-                    if not isinstance(base, Dict):
-                        raise ValueError("Invalid base type returned for Enumeration")
-                    constants = self.get_type_from_index(value.fields)
-                    if not isinstance(constants, list):
-                        raise ValueError("Enumeration fields type not a list")
-                    self.enumerations[name] = {
-                        "base": base["name"],
-                        "size": self.get_size_from_index(value.subtype_index),
-                        "constants": dict(
-                            [(name, enum.value) for _, name, enum in constants]
-                        ),
-                    }
-
-        # Re-run through for ForwardSizeReferences
-        self.user_types = self.replace_forward_references(
-            self.user_types, type_references
-        )
-
-    type_handlers = {
-        # Leaf_type: ('Structure', has_name, value_attribute)
-        "LF_CLASS": ("LF_STRUCTURE", True, "size"),
-        "LF_CLASS_ST": ("LF_STRUCTURE", True, "size"),
-        "LF_STRUCTURE": ("LF_STRUCTURE", True, "size"),
-        "LF_STRUCTURE_ST": ("LF_STRUCTURE", True, "size"),
-        "LF_INTERFACE": ("LF_STRUCTURE", True, "size"),
-        "LF_CLASS_VS19": ("LF_STRUCTURE_VS19", True, "size"),
-        "LF_STRUCTURE_VS19": ("LF_STRUCTURE_VS19", True, "size"),
-        "LF_MEMBER": ("LF_MEMBER", True, "offset"),
-        "LF_MEMBER_ST": ("LF_MEMBER", True, "offset"),
-        "LF_ARRAY": ("LF_ARRAY", True, "size"),
-        "LF_ARRAY_ST": ("LF_ARRAY", True, "size"),
-        "LF_STRIDED_ARRAY": ("LF_ARRAY", True, "size"),
-        "LF_ENUMERATE": ("LF_ENUMERATE", True, "value"),
-        "LF_ARGLIST": ("LF_ENUM", True, None),
-        "LF_ENUM": ("LF_ENUM", True, None),
-        "LF_UNION": ("LF_UNION", True, None),
-        "LF_STRING_ID": ("LF_STRING_ID", True, None),
-        "LF_FUNC_ID": ("LF_FUNC_ID", True, None),
-        "LF_MODIFIER": ("LF_MODIFIER", False, None),
-        "LF_POINTER": ("LF_POINTER", False, None),
-        "LF_PROCEDURE": ("LF_PROCEDURE", False, None),
-        "LF_FIELDLIST": ("LF_FIELDLIST", False, None),
-        "LF_BITFIELD": ("LF_BITFIELD", False, None),
-        "LF_UDT_SRC_LINE": ("LF_UDT_SRC_LINE", False, None),
-        "LF_UDT_MOD_SRC_LINE": ("LF_UDT_MOD_SRC_LINE", False, None),
-        "LF_BUILDINFO": ("LF_BUILDINFO", False, None),
-    }
-
-    def consume_type(
-        self, module: interfaces.context.ModuleInterface, offset: int, length: int
-    ) -> Tuple[
-        Tuple[
-            Optional[interfaces.objects.ObjectInterface],
-            Optional[str],
-            Union[None, List, interfaces.objects.ObjectInterface],
-        ],
-        int,
-    ]:
-        """Returns a (leaf_type, name, object) Tuple for a type, and the number
-        of bytes consumed."""
-        leaf_type = self.context.object(
-            module.get_enumeration("LEAF_TYPE"),
-            layer_name=module._layer_name,
-            offset=offset,
-        )
-        consumed = leaf_type.vol.base_type.size
-        remaining = length - consumed
-
-        type_handler, has_name, value_attribute = self.type_handlers.get(
-            leaf_type.lookup(), ("LF_UNKNOWN", False, None)
-        )
-
-        if type_handler in ["LF_FIELDLIST"]:
-            sub_length = remaining
-            sub_offset = offset + consumed
-            fields = []
-            while length > consumed:
-                subfield, sub_consumed = self.consume_type(
-                    module, sub_offset, sub_length
+        # Index the names of the types that can be referred to, the last of each name taking precedence
+        definitions: Dict[str, Dict[str, int]] = {"user_types": {}, "enums": {}}
+        every_definition: List[Tuple[str, str, int]] = []
+        self._type_references = {}
+        for position, name in self.types.names(NAMED_LEAVES):
+            self._type_references[name] = position
+            leaf_type, _, value = self.types[position]
+            if leaf_type in ARRAY_LEAVES or value.forward_reference:
+                continue
+            section = "enums" if leaf_type == LeafType.LF_ENUM else "user_types"
+            definitions[section][name] = position
+            every_definition.append((section, name, position))
+
+        if self._type_names is None:
+            # Convert in the order of the stream, so later definitions of a name replace earlier ones
+            for count, (section, name, position) in enumerate(every_definition):
+                self._progress_callback(
+                    count * 100 / len(every_definition), "Processing types"
                 )
-                sub_consumed += self.consume_padding(
-                    module.layer_name, sub_offset + sub_consumed
+                self._convert_definition(section, name, position)
+            return None
+
+        missing = self._type_names.difference(*definitions.values())
+        if missing:
+            vollog.warning(f"Types not found: {', '.join(sorted(missing))}")
+        # Types that are reached whilst converting are appended, and converted in turn
+        self._required_types = [
+            (section, name)
+            for name in sorted(self._type_names)
+            for section in definitions
+            if name in definitions[section]
+        ]
+        converted: Set[Tuple[str, str]] = set()
+        try:
+            for count, (section, name) in enumerate(self._required_types):
+                if (section, name) in converted or name not in definitions[section]:
+                    continue
+                converted.add((section, name))
+                self._progress_callback(
+                    count * 100 / len(self._required_types), "Processing types"
                 )
-                sub_length -= sub_consumed
-                sub_offset += sub_consumed
-                consumed += sub_consumed
-                fields.append(subfield)
-            result = leaf_type, None, fields
-        elif type_handler in ["LF_BUILDINFO"]:
-            parsed_obj = module.object(
-                object_type=type_handler, offset=offset + consumed
-            )
-            parsed_obj.arguments.count = parsed_obj.count
-            consumed += parsed_obj.arguments.vol.size
-            result = leaf_type, None, parsed_obj
-        elif type_handler in self.type_handlers:
-            parsed_obj = module.object(
-                object_type=type_handler, offset=offset + consumed
-            )
-            current_consumed = remaining
-            if has_name:
-                name_offset = parsed_obj.name.vol.offset - parsed_obj.vol.offset
-                if value_attribute:
-                    name, value, excess = self.determine_extended_value(
-                        leaf_type,
-                        getattr(parsed_obj, value_attribute),
-                        module,
-                        remaining - name_offset,
-                    )
-                    setattr(parsed_obj, value_attribute, value)
-                    current_consumed = parsed_obj.vol.size + len(name) + 1 + excess
-                else:
-                    name = self.parse_string(
-                        parsed_obj.name,
-                        leaf_type < leaf_type.LF_ST_MAX,
-                        size=remaining - name_offset,
-                    )
-                parsed_obj.name = name
-            else:
-                name = None
-            result = leaf_type, name, parsed_obj
-            consumed += current_consumed
+                self._convert_definition(section, name, definitions[section][name])
+        finally:
+            self._required_types = None
+
+    def _convert_definition(self, section: str, name: str, position: int) -> None:
+        """Converts the definition of a user type or enumeration"""
+        leaf_type, _, value = self.types[position]
+        if section == "enums":
+            base = self.get_type_from_index(value.subtype_index)
+            if not isinstance(base, Dict):
+                raise ValueError("Invalid base type returned for Enumeration")
+            constants = self.get_type_from_index(value.fields)
+            if not isinstance(constants, list):
+                raise ValueError("Enumeration fields type not a list")
+            self.enumerations[name] = {
+                "base": base["name"],
+                "size": self.get_size_from_index(value.subtype_index),
+                "constants": dict([(name, enum.value) for _, name, enum in constants]),
+            }
         else:
-            raise TypeError(f"Unhandled leaf_type: {leaf_type}")
-
-        return result, consumed
-
-    def consume_padding(self, layer_name: str, offset: int) -> int:
-        """Returns the amount of padding used between fields."""
-        val = self.context.layers[layer_name].read(offset, 1)
-        if not ((val[0] & 0xF0) == 0xF0):
-            return 0
-        return int(val[0]) & 0x0F
+            self.user_types[name] = {
+                "kind": "union" if leaf_type == LeafType.LF_UNION else "struct",
+                "size": value.size,
+                "fields": self.convert_fields(value.fields - 0x1000),
+            }
 
     def convert_fields(self, fields: int) -> Dict[Optional[str], Dict[str, Any]]:
         """Converts a field list into a list of fields."""
         result: Dict[Optional[str], Dict[str, Any]] = {}
-        _, _, fields_struct = self.types[fields]
+        fields_struct = self.types[fields][2] if fields >= 0 else None
         if not isinstance(fields_struct, list):
             vollog.warning("Fields structure did not contain a list of fields")
             return result
@@ -844,100 +1060,50 @@ class PdbReader:
             }
         return result
 
-    def replace_forward_references(self, types, type_references):
-        """Finds all ForwardArrayCounts and calculates them once
-        ForwardReferences have been resolved."""
-        if isinstance(types, dict):
-            for k, v in types.items():
-                types[k] = self.replace_forward_references(v, type_references)
-        elif isinstance(types, list):
-            new_types = []
-            for v in types:
-                new_types.append(self.replace_forward_references(v, type_references))
-            types = new_types
-        elif isinstance(types, ForwardArrayCount):
-            element_type = types.element_type
-            # If we're a forward array count, we need to do the calculation now after all the types have been processed
-            loop = True
-            while loop:
-                loop = False
-                if element_type > 0x1000:
-                    _, name, toplevel_type = self.types[element_type - 0x1000]
-                    # If there's no name, the original size is probably fine as long as we're not indirect (LF_MODIFIER)
-                    if (
-                        not name
-                        and isinstance(
-                            toplevel_type, interfaces.objects.ObjectInterface
-                        )
-                        and toplevel_type.vol.type_name.endswith("LF_MODIFIER")
-                    ):
-                        # We have check they don't point to a forward reference, so we go round again with the subtype
-                        element_type = toplevel_type.subtype_index
-                        loop = True
-                    elif name:
-                        # If there is a name, look it up so we're not using a reference but the real thing
-                        element_type = type_references[name] + 0x1000
-            return types.size // self.get_size_from_index(element_type)
-        return types
-
-    # COMMON CODE
+    def _array_count(self, size: int, element_type: int) -> int:
+        """Determines the number of elements in an array, looking through any
+        forward references to find the size of its elements."""
+        while element_type >= 0x1000:
+            leaf_type, name, toplevel_type = self.types[element_type - 0x1000]
+            # If there's no name, the original size is probably fine as long as we're not indirect (LF_MODIFIER)
+            if not name and leaf_type == LeafType.LF_MODIFIER:
+                element_type = toplevel_type.subtype_index
+                continue
+            if name:
+                # If there is a name, look it up so we're not using a reference but the real thing
+                element_type = self._type_references[name] + 0x1000
+            break
+        return size // self.get_size_from_index(element_type)
 
-    @staticmethod
-    def parse_string(
-        structure: interfaces.objects.ObjectInterface,
-        parse_as_pascal: bool = False,
-        size: int = 0,
-    ) -> str:
-        """Consumes either a c-string or a pascal string depending on the
-        leaf_type."""
-        if not parse_as_pascal:
-            name = structure.cast("string", max_length=size, encoding="latin-1")
-        else:
-            name = structure.cast("pascal_string")
-            name = name.string.cast(
-                "string", max_length=name.length, encoding="latin-1"
-            )
-        return str(name)
 
-    def determine_extended_value(
-        self,
-        leaf_type: interfaces.objects.ObjectInterface,
-        value: interfaces.objects.ObjectInterface,
-        module: interfaces.context.ModuleInterface,
-        length: int,
-    ) -> Tuple[str, interfaces.objects.ObjectInterface, int]:
-        """Reads a value and potentially consumes more data to construct the
-        value."""
-        excess = 0
-        if value >= leaf_type.LF_CHAR:
-            sub_leaf_type = self.context.object(
-                self.context.symbol_space.get_enumeration(leaf_type.vol.type_name),
-                layer_name=leaf_type.vol.layer_name,
-                offset=value.vol.offset,
-            )
-            # Set the offset at just after the previous size type
-            offset = value.vol.offset + value.vol.data_format.length
-            if sub_leaf_type in [leaf_type.LF_CHAR]:
-                value = module.object(object_type="char", offset=offset)
-            elif sub_leaf_type in [leaf_type.LF_SHORT]:
-                value = module.object(object_type="short", offset=offset)
-            elif sub_leaf_type in [leaf_type.LF_USHORT]:
-                value = module.object(object_type="unsigned short", offset=offset)
-            elif sub_leaf_type in [leaf_type.LF_LONG]:
-                value = module.object(object_type="long", offset=offset)
-            elif sub_leaf_type in [leaf_type.LF_ULONG]:
-                value = module.object(object_type="unsigned long", offset=offset)
-            else:
-                raise TypeError("Unexpected extended value type")
-            excess = value.vol.data_format.length
-            # Updated the consume/offset counters
-        name = module.object(
-            object_type="string", offset=value.vol.offset + value.vol.data_format.length
-        )
-        name_str = self.parse_string(
-            name, leaf_type < leaf_type.LF_ST_MAX, size=length - excess
-        )
-        return name_str, value, excess
+def write_json(json_output: Dict[str, Any], fp: IO[bytes]) -> None:
+    """Writes the JSON produced by :class:`PdbReader` to a binary file, encoding it as it is written."""
+    text_file = io.TextIOWrapper(fp, encoding="utf-8")
+    try:
+        json.dump(json_output, text_file, indent=2, sort_keys=True)
+    finally:
+        text_file.detach()
+
+
+def compile_isf(isf_url: str, json_output: Dict[str, Any]) -> bool:
+    """Stores the JSON produced by :class:`PdbReader` in the compiled ISF
+    cache against the ISF file it was written to, so that the file need not
+    be parsed (or validated) when it is first used.
+
+    Returns whether the compiled form was stored.
+    """
+    if not constants.CACHE_COMPILED_ISF:
+        return False
+    file_hash = validations.get_file_hash(isf_url)
+    key = compiled.compiled_key(isf_url, file_hash) if file_hash else None
+    if key is None:
+        return False
+    if not schemas.validate(json_output, use_cache=False):
+        vollog.debug(f"Converted ISF does not pass validation: {isf_url}")
+        return False
+    validations.record_validation(file_hash)
+    compiled.CompiledISF.compile(key, json_output)
+    return True
 
 
 class PdbRetreiver:
@@ -949,10 +1115,11 @@ class PdbRetreiver:
     ) -> Optional[str]:
         vollog.info("Download PDB file...")
         file_name = ".".join(file_name.split(".")[:-1] + ["pdb"])
-        for sym_url in ["http://msdl.microsoft.com/download/symbols"]:
-            url = sym_url + f"/{file_name}/{guid}/"
+        result = None
+        url = suffix = ""
+        for sym_url in constants.WINDOWS_SYMBOL_SERVERS:
+            url = sym_url.rstrip("/") + f"/{file_name}/{guid}/"
 
-            result = None
             for suffix in [file_name, file_name[:-1] + "_"]:
                 try:
                     vollog.debug(f"Attempting to retrieve {url + suffix}")
@@ -964,8 +1131,12 @@ class PdbRetreiver:
                         result = True
                 except (error.HTTPError, error.URLError) as excp:
                     vollog.debug(f"Failed with {excp}")
+                except exceptions.OfflineException:
+                    vollog.debug(f"Not retrieving {url + suffix} in offline mode")
                 if result:
                     break
+            if result:
+                break
         if progress_callback is not None:
             progress_callback(100, f"Downloading {url + suffix}")
         if not result:
@@ -1006,6 +1177,21 @@ if __name__ == "__main__":
         help="Filename for data output",
         default=None,
     )
+    parser.add_argument(
+        "-t",
+        "--types",
+        metavar="TYPE",
+        nargs="+",
+        help="Only output these types (and the types they depend upon)",
+        default=None,
+    )
+    parser.add_argument(
+        "-c",
+        "--compile",
+        action="store_true",
+        default=False,
+        help="Also store the output in the compiled ISF cache",
+    )
     file_group = parser.add_argument_group(
         "file", description="File-based conversion of PDB to ISF"
     )
@@ -1067,7 +1253,11 @@ if __name__ == "__main__":
         location = filename
 
     convertor = PdbReader(
-        ctx, location, database_name=args.pattern, progress_callback=pg_cb
+        ctx,
+        location,
+        database_name=args.pattern,
+        progress_callback=pg_cb,
+        type_names=args.types,
     )
 
     converted_json = convertor.get_json()
@@ -1091,8 +1281,12 @@ if __name__ == "__main__":
         open_method = lzma.open
 
     with open_method(output_url, "wb") as f:
-        json_string = json.dumps(converted_json, indent=2, sort_keys=True)
-        f.write(bytes(json_string, "latin-1"))
+        write_json(converted_json, f)
+
+    if args.compile and not compile_isf(
+        "file:" + request.pathname2url(output_url), converted_json
+    ):
+        print("Output could not be stored in the compiled ISF cache")
 
     if args.keep:
         print(f"Temporary PDB file: {filename}")
@@ -2,14 +2,14 @@
 # which is available at https://www.volatilityfoundation.org/license/vsl-v1.0
 #
 
-import json
 import logging
 import lzma
+import multiprocessing
 import os
 import re
 import struct
 from pathlib import PureWindowsPath
-from typing import Any, Dict, Generator, List, Optional, Tuple, Union
+from typing import Any, Dict, Generator, Iterable, List, Optional, Tuple, Union
 from urllib import parse, request
 
 from volatility3 import symbols
@@ -22,11 +22,40 @@ from volatility3.framework.symbols.windows import pdbconv
 
 vollog = logging.getLogger(__name__)
 
+PdbIdentifier = Tuple[str, int, str]
+"""The GUID, age and name of a PDB file"""
+
+
+def _download_settings() -> Dict[str, Any]:
+    """Returns the settings a worker process needs to download and convert PDB
+    files, since processes that are spawned rather than forked do not inherit
+    any changes made to them at runtime"""
+    return {
+        "symbol_servers": list(constants.WINDOWS_SYMBOL_SERVERS),
+        "offline": constants.OFFLINE,
+        "cache_path": constants.CACHE_PATH,
+        "symbol_paths": list(symbols.__path__),
+    }
+
+
+def _download_pdb_isf_initializer(settings: Dict[str, Any]) -> None:
+    """Applies the settings from the parent process within a worker process"""
+    constants.WINDOWS_SYMBOL_SERVERS = settings["symbol_servers"]
+    constants.OFFLINE = settings["offline"]
+    constants.CACHE_PATH = settings["cache_path"]
+    symbols.__path__ = settings["symbol_paths"]
+
+
+def _download_pdb_isf_worker(pdb: PdbIdentifier) -> Tuple[PdbIdentifier, bool]:
+    """Downloads and converts a single PDB file within a worker process"""
+    guid, age, pdb_name = pdb
+    return pdb, PDBUtility.download_pdb_isf(contexts.Context(), guid, age, pdb_name)
+
 
 class PDBUtility(interfaces.configuration.VersionableInterface):
     """Class to handle and manage all getting symbols based on MZ header"""
 
-    _version = (1, 0, 1)
+    _version = (1, 1, 1)
     _required_framework_version = (2, 0, 0)
 
     @classmethod
@@ -89,7 +118,6 @@ class PDBUtility(interfaces.configuration.VersionableInterface):
             pdb_name.strip("\x00"), guid.upper() + "-" + str(age)
         )
 
-        isf_path = None
         # Take the first result of search for the intermediate file
         if not requirements.VersionRequirement.matches_required(
             (1, 0, 0), symbol_cache.SqliteCache.version
@@ -97,29 +125,14 @@ class PDBUtility(interfaces.configuration.VersionableInterface):
             vollog.debug(f"Required version of SQLiteCache not found")
             return None
 
-        identifiers_path = os.path.join(
-            constants.CACHE_PATH, constants.IDENTIFIERS_FILENAME
-        )
-        value = symbol_cache.SqliteCache(identifiers_path).find_location(
-            symbol_cache.WindowsIdentifier.generate(
-                pdb_name.strip("\x00"), guid.upper(), age
-            ),
-            "windows",
-        )
-
-        if value:
-            isf_path = value
-        else:
+        pdb = (guid.upper(), age, pdb_name.strip("\x00"))
+        isf_path = cls._find_isf(cls._open_cache(), pdb)
+        if not isf_path:
             # If none are found, attempt to download the pdb, convert it and try again
-            cls.download_pdb_isf(
+            if cls.download_pdb_isf(
                 context, guid.upper(), age, pdb_name, progress_callback
-            )
-            # Try again
-            for value in intermed.IntermediateSymbolTable.file_symbol_url(
-                "windows", filter_string
             ):
-                isf_path = value
-                break
+                isf_path = cls._find_isf(None, pdb)
 
         if not isf_path:
             vollog.debug(f"Required symbol library path not found: {filter_string}")
@@ -146,6 +159,87 @@ class PDBUtility(interfaces.configuration.VersionableInterface):
         requirement.construct(context, parent_config_path)
         return context.config[config_path]
 
+    @classmethod
+    def _open_cache(cls) -> symbol_cache.SqliteCache:
+        return symbol_cache.SqliteCache(
+            os.path.join(constants.CACHE_PATH, constants.IDENTIFIERS_FILENAME)
+        )
+
+    @classmethod
+    def _find_isf(
+        cls, cache: Optional[symbol_cache.SqliteCache], pdb: PdbIdentifier
+    ) -> Optional[str]:
+        """Returns the location of the ISF file for a PDB, looking first in the
+        symbol cache (if provided) and then for files that have been written
+        since the cache was last updated"""
+        guid, age, pdb_name = pdb
+        if cache is not None:
+            value = cache.find_location(
+                symbol_cache.WindowsIdentifier.generate(pdb_name, guid, age),
+                "windows",
+            )
+            if value:
+                return value
+        for value in intermed.IntermediateSymbolTable.file_symbol_url(
+            "windows", os.path.join(pdb_name, guid + "-" + str(age))
+        ):
+            return value
+        return None
+
+    @classmethod
+    def download_pdb_isfs(
+        cls,
+        context: interfaces.context.ContextInterface,
+        pdbs: Iterable[PdbIdentifier],
+        progress_callback: constants.ProgressCallback = None,
+    ) -> Dict[PdbIdentifier, Optional[str]]:
+        """Ensures ISF files are available for a batch of PDB files, downloading
+        and converting any that are missing at the same time.
+
+        The symbol cache is opened once for the whole batch, and each PDB file
+        is only requested once, however many times it appears.
+
+        Args:
+            context: The context on which to operate
+            pdbs: The GUID, age and name of each PDB file required
+            progress_callback: Callable called to update ongoing progress
+
+        Returns:
+            A dictionary of the location of the ISF file for each PDB file (or None if it could not be found)
+        """
+        cache = cls._open_cache()
+        locations: Dict[PdbIdentifier, Optional[str]] = {}
+        for guid, age, pdb_name in pdbs:
+            pdb = (guid.upper(), age, pdb_name.strip("\x00"))
+            if pdb not in locations:
+                locations[pdb] = cls._find_isf(cache, pdb)
+
+        missing = [pdb for pdb, location in locations.items() if location is None]
+        processes = min(constants.PDB_DOWNLOAD_PROCESSES, len(missing))
+        if processes > 1:
+            with multiprocessing.Pool(
+                processes,
+                initializer=_download_pdb_isf_initializer,
+                initargs=(_download_settings(),),
+            ) as pool:
+                results = pool.imap_unordered(_download_pdb_isf_worker, missing)
+                for count, (pdb, written) in enumerate(results):
+                    if progress_callback:
+                        progress_callback(
+                            (count + 1) * 100 / len(missing),
+                            f"Downloading and converting {pdb[2]}",
+                        )
+                    if written:
+                        locations[pdb] = cls._find_isf(None, pdb)
+        else:
+            for pdb in missing:
+                guid, age, pdb_name = pdb
+                if cls.download_pdb_isf(
+                    context, guid, age, pdb_name, progress_callback
+                ):
+                    locations[pdb] = cls._find_isf(None, pdb)
+        return locations
+
     @classmethod
     def get_guid_from_mz(
         cls, context: interfaces.context.ContextInterface, layer_name: str, offset: int
@@ -242,9 +336,12 @@ class PDBUtility(interfaces.configuration.VersionableInterface):
         age: int,
         pdb_name: str,
         progress_callback: constants.ProgressCallback = None,
-    ) -> None:
+    ) -> bool:
         """Attempts to download the PDB file, convert it to an ISF file and
-        save it to one of the symbol locations."""
+        save it to one of the symbol locations.
+
+        Returns whether the ISF file was written.
+        """
         # Check for writability
         filter_string = os.path.join(pdb_name, guid + "-" + str(age))
         for path in symbols.__path__:
@@ -275,12 +372,7 @@ class PDBUtility(interfaces.configuration.VersionableInterface):
                         json_output = pdbconv.PdbReader(
                             context, location, pdb_name, progress_callback
                         ).get_json()
-                        of.write(
-                            bytes(
-                                json.dumps(json_output, indent=2, sort_keys=True),
-                                "utf-8",
-                            )
-                        )
+                        pdbconv.write_json(json_output, of)
                         # After we've successfully written it out, record the fact so we don't clear it out
                         data_written = True
                     else:
@@ -288,7 +380,13 @@ class PDBUtility(interfaces.configuration.VersionableInterface):
                             "Symbol file could not be downloaded from remote server"
                             + (" " * 100)
                         )
-                break
+                if data_written:
+                    # Compile the new file now, while the converted data is still to hand
+                    pdbconv.compile_isf(
+                        "file:" + request.pathname2url(potential_output_filename),
+                        json_output,
+                    )
+                return data_written
             except PermissionError:
                 vollog.warning(
                     "Cannot write necessary symbol file, please check permissions on {}".format(
@@ -313,6 +411,7 @@ class PDBUtility(interfaces.configuration.VersionableInterface):
                 "Cannot write downloaded symbols, please add the appropriate symbols"
                 " or add/modify a symbols directory that is writable"
             )
+        return False
 
     @classmethod
     def pdbname_scan(
@@ -533,6 +632,10 @@ class PdbSignatureScanner(interfaces.layers.ScannerInterface):
         super().__init__()
         self._pdb_names = pdb_names
 
+    @property
+    def cache_key(self) -> Optional[Tuple]:
+        return tuple(self._pdb_names)
+
     def __call__(
         self, data: bytes, data_offset: int
     ) -> Generator[Tuple[str, Any, bytes, int], None, None]:
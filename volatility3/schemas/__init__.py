@@ -3,11 +3,12 @@
 #
 
 import hashlib
+import importlib.util
 import json
 import logging
 import os
 import re
-from typing import Any, Dict, Optional, Set, Tuple
+from typing import Any, Dict, Mapping, Optional, Set, Tuple
 from volatility3.framework import constants
 
 vollog = logging.getLogger(__name__)
@@ -77,20 +78,13 @@ def valid(
     input: Dict[str, Any], schema: Dict[str, Any], use_cache: bool = True
 ) -> bool:
     """Validates a json schema."""
-    producer = input.get("metadata", {}).get("producer", {})
-    if producer and producer.get("name") == "dwarf2json":
-        dwarf2json_version = parse_producer_version(producer.get("version", ""))
-        # No warnings if version couldn't be parsed, as it's not our role here
-        # to validate the schema.
-        if dwarf2json_version:
-            if dwarf2json_check_rust_type_confusion(input, dwarf2json_version):
-                vollog.warning(
-                    "This ISF was generated by dwarf2json < 0.9.0, which is known to produce inaccurate results (see dwarf2json GitHub issue #63)."
-                )
+    check_producer(input)
 
-    input_hash = create_json_hash(input, schema)
-    if input_hash in cached_validations and use_cache:
-        return True
+    input_hash = None
+    if use_cache:
+        input_hash = create_json_hash(input, schema)
+        if input_hash in cached_validations:
+            return True
     try:
         import jsonschema
     except ImportError:
@@ -101,16 +95,38 @@ def valid(
     try:
         vollog.debug("Validating JSON against schema...")
         jsonschema.validate(input, schema)
-        cached_validations.add(input_hash)
-        vollog.debug("JSON validated against schema (result cached)")
+        vollog.debug("JSON validated against schema")
     except jsonschema.exceptions.SchemaError:
         vollog.debug("Schema validation error", exc_info=True)
         return False
 
-    record_cached_validations(cached_validations)
+    if input_hash is not None:
+        cached_validations.add(input_hash)
+        record_cached_validations(cached_validations)
+        vollog.debug("JSON validation result cached")
     return True
 
 
+def validation_available() -> bool:
+    """Determines whether the dependency needed to validate JSON is
+    available, since validation otherwise always reports success."""
+    return importlib.util.find_spec("jsonschema") is not None
+
+
+def check_producer(input: Mapping[str, Any]) -> None:
+    """Warns about any known problems with the producer of a JSON file."""
+    producer = input.get("metadata", {}).get("producer", {})
+    if producer and producer.get("name") == "dwarf2json":
+        dwarf2json_version = parse_producer_version(producer.get("version", ""))
+        # No warnings if version couldn't be parsed, as it's not our role here
+        # to validate the schema.
+        if dwarf2json_version:
+            if dwarf2json_check_rust_type_confusion(input, dwarf2json_version):
+                vollog.warning(
+                    "This ISF was generated by dwarf2json < 0.9.0, which is known to produce inaccurate results (see dwarf2json GitHub issue #63)."
+                )
+
+
 def parse_producer_version(version_string: str) -> Optional[Tuple[int]]:
     """Parses a producer version and returns a tuple of identifiers.
 
@@ -130,7 +146,7 @@ def parse_producer_version(version_string: str) -> Optional[Tuple[int]]:
 
 # dwarf2json sanity checks #
 def dwarf2json_check_rust_type_confusion(
-    input: Dict[str, Any], dwarf2json_version: Tuple[int]
+    input: Mapping[str, Any], dwarf2json_version: Tuple[int]
 ) -> bool:
     """dwarf2json sanity check for Rust and C types confusion:
      - dwarf2json #63